@@ -0,0 +1,480 @@
+"""Concurrent load generator for the Watchlist / Iskra intake API.
+
+Replays realistic, signed extension traffic (economist-response dispatch,
+single and batch verify, problem-log dispatch and query, source materials,
+runner heartbeat + job submit/claim/event) against a base URL and reports
+per-scenario p50/p95/p99 latency, status codes and requests per second.
+
+Typical offline run against the local stand-in::
+
+    python backend/watchlist_stub.py --latency-ms 30 --jitter-ms 30 --materialization-delay-ms 2000 &
+    python backend/loadtest.py --scenario mixed --concurrency 16 --requests 2000
+
+Only the standard library is used, so the generator can also be pointed at a
+staging host with ``--base-url``/``--key-id``/``--secret``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import collections
+import concurrent.futures
+import json
+import random
+import threading
+import time
+import urllib.error
+import urllib.request
+import uuid
+
+from watchlist_protocol import (
+    INTAKE_PATH,
+    INTAKE_STATUS_PATH,
+    INTAKE_VERIFY_PATH,
+    ISKRA_JOBS_CLAIM_PATH,
+    ISKRA_JOBS_PATH,
+    ISKRA_RUNNERS_HEARTBEAT_PATH,
+    PROBLEM_LOG_SCHEMA,
+    PROBLEM_LOGS_QUERY_PATH,
+    SECTOR_MEMORY_PATH,
+    SOURCE_MATERIALS_PATH,
+    build_signed_headers,
+)
+
+COMPANIES = [
+    "Alpha Corp", "Beta Industries", "Gamma Software", "Delta Energy", "Epsilon Bank",
+    "Zeta Logistics", "Eta Retail", "Theta Biotech", "Iota Materials", "Kappa Media",
+]
+SECTORS = ["Technology", "Energy", "Financials", "Industrials", "Healthcare", "Consumer"]
+ANALYSIS_TYPES = ["company", "portfolio", "market"]
+PROBLEM_REASONS = ["inject_timeout", "generation_stalled", "copy_failed", "rate_limited", "tab_closed"]
+
+SCENARIO_WEIGHTS = {
+    "dispatch": {"dispatch": 1},
+    "verify": {"verify": 1},
+    "verify-batch": {"verify_batch": 1},
+    "problem-logs": {"problem_log": 3, "problem_log_query": 1},
+    "runner": {"heartbeat": 1, "job_submit": 2, "job_claim": 2},
+    "mixed": {
+        "dispatch": 30,
+        "verify": 15,
+        "verify_batch": 10,
+        "problem_log": 15,
+        "problem_log_query": 5,
+        "source_material": 5,
+        "sector_memory": 3,
+        "heartbeat": 5,
+        "job_submit": 6,
+        "job_claim": 6,
+        "status": 2,
+    },
+}
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * (len(sorted_values) - 1)))))
+    return sorted_values[index]
+
+
+class PayloadFactory:
+    """Seeded generator of extension-shaped payloads."""
+
+    def __init__(self, seed, runner_count):
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.dispatched = collections.deque(maxlen=5000)
+        self.runner_ids = [f"load-runner-{index + 1}" for index in range(max(1, runner_count))]
+        self.support_id = f"support-{uuid.UUID(int=self.rng.getrandbits(128)).hex[:12]}"
+
+    def _decision_line(self, role, company):
+        rng = self.rng
+        bear, base, bull = sorted(rng.randint(-40, 120) for _ in range(3))
+        return "; ".join([
+            time.strftime("%Y-%m-%d"),
+            rng.choice(["BUY", "WATCH", "HOLD"]),
+            role,
+            company,
+            "THESIS_SOURCE podcast episode",
+            f"{company} compounding thesis with pricing power and backlog growth",
+            f"Bear_TOTAL: {bear}",
+            f"Base_TOTAL: {base}",
+            f"Bull_TOTAL: {bull}",
+            "VOI: backlog > 10%, Fals: churn > 5%, Primary risk: pricing reset, Composite: 4.2/5.0",
+            rng.choice(SECTORS),
+            "Compounder",
+            "Software",
+            "Subscription",
+            rng.choice(["USA", "EU", "PL"]),
+            rng.choice(["USD", "EUR", "PLN"]),
+            "FQ:8,TE:7,CM:9,VS:6,TQ:7,PP:8,CP:5,CD:7,NO:8,MR:6",
+        ])
+
+    def economist_response(self):
+        with self.lock:
+            rng = self.rng
+            run_id = f"run-{uuid.UUID(int=rng.getrandbits(128)).hex[:16]}"
+            response_id = f"resp-{uuid.UUID(int=rng.getrandbits(128)).hex}"
+            primary, secondary = rng.sample(COMPANIES, 2)
+            text = "\n".join([self._decision_line("PRIMARY", primary), self._decision_line("SECONDARY", secondary)])
+            log_count = rng.randint(4, 18)
+            payload = {
+                "schema": "economist.response.v1",
+                "responseId": response_id,
+                "runId": run_id,
+                "text": text,
+                "source": f"Podcast: {primary} deep dive",
+                "analysisType": rng.choice(ANALYSIS_TYPES),
+                "timestamp": int(time.time() * 1000),
+                "conversationUrl": f"https://chatgpt.com/c/{uuid.UUID(int=rng.getrandbits(128))}",
+                "stage": {"stageIndex": 15, "stageName": "Stage 15", "currentPrompt": 16, "totalPrompts": 16},
+                "conversationLogCount": log_count,
+            }
+        return payload
+
+    def problem_log(self):
+        with self.lock:
+            rng = self.rng
+            level = rng.choice(["warn", "error", "info"])
+            reason = rng.choice(PROBLEM_REASONS)
+            run_id = f"run-{uuid.UUID(int=rng.getrandbits(128)).hex[:16]}"
+            return {
+                "schema": PROBLEM_LOG_SCHEMA,
+                "responseId": f"plog-{uuid.UUID(int=rng.getrandbits(128)).hex}",
+                "runId": run_id,
+                "supportId": self.support_id,
+                "text": f"[{level}] {reason} in prompt {rng.randint(1, 16)}/16",
+                "source": f"analysis-queue|support:{self.support_id}",
+                "analysisType": f"problem_log:{level}",
+                "timestamp": int(time.time() * 1000),
+                "stage": {"level": level, "reason": reason, "status": "failed", "stageName": "Prompt chain"},
+            }
+
+    def remember_dispatch(self, payload, event_id):
+        with self.lock:
+            self.dispatched.append((payload, event_id))
+
+    def verify_item(self, payload, event_id=None):
+        item = {
+            "responseId": payload["responseId"],
+            "expected": {
+                "runId": payload["runId"],
+                "source": payload["source"],
+                "analysisType": payload["analysisType"],
+                "conversationUrl": payload["conversationUrl"],
+                "expectStage": True,
+                "expectText": True,
+                "expectTimestamp": True,
+                "conversationLogCount": payload["conversationLogCount"],
+            },
+        }
+        if event_id:
+            item["eventId"] = event_id
+        return item
+
+    def recent_dispatches(self, count):
+        with self.lock:
+            if not self.dispatched:
+                return []
+            pool = list(self.dispatched)
+            return [self.rng.choice(pool) for _ in range(count)]
+
+    def runner_id(self):
+        with self.lock:
+            return self.rng.choice(self.runner_ids)
+
+    def source_material(self):
+        with self.lock:
+            company = self.rng.choice(COMPANIES)
+            paragraphs = self.rng.randint(20, 80)
+        return {
+            "text": "\n\n".join(f"{company} transcript paragraph {index}: " + "lorem ipsum " * 40 for index in range(paragraphs)),
+            "title": f"{company} earnings call",
+            "sourceKind": "transcript",
+            "sourceUrl": f"https://example.invalid/{company.replace(' ', '-').lower()}",
+            "metadata": {"loadtest": True},
+        }
+
+    def sector_memory(self):
+        with self.lock:
+            sector = self.rng.choice(SECTORS)
+            count = self.rng.randint(3, 12)
+        return {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "stage": "stage_15",
+            "generatedBy": "chatgpt",
+            "status": "active",
+            "validationStatus": "valid",
+            "items": [{"sektor": sector, "opis": f"{sector} memory row {index} " + "x" * 140} for index in range(count)],
+        }
+
+
+class LoadClient:
+    def __init__(self, base_url, key_id, secret, timeout_s):
+        self.base_url = base_url.rstrip("/")
+        self.key_id = key_id
+        self.secret = secret
+        self.timeout_s = timeout_s
+
+    def request(self, method, path, payload=None, query=""):
+        body = b"" if method == "GET" else json.dumps(payload or {}).encode("utf-8")
+        headers = build_signed_headers(self.key_id, self.secret, method, path, body)
+        url = f"{self.base_url}{path}{'?' + query if query else ''}"
+        req = urllib.request.Request(url, data=None if method == "GET" else body, headers=headers, method=method)
+        started = time.perf_counter()
+        try:
+            with urllib.request.urlopen(req, timeout=self.timeout_s) as response:
+                raw = response.read()
+                status = response.status
+        except urllib.error.HTTPError as error:
+            raw = error.read()
+            status = error.code
+        except (urllib.error.URLError, TimeoutError, ConnectionError) as error:
+            return None, None, (time.perf_counter() - started) * 1000, type(error).__name__
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        try:
+            data = json.loads(raw.decode("utf-8")) if raw else {}
+        except ValueError:
+            data = {}
+        return status, data, elapsed_ms, ""
+
+
+class LoadRunner:
+    def __init__(self, client, factory, verify_batch_size):
+        self.client = client
+        self.factory = factory
+        self.verify_batch_size = verify_batch_size
+        self.lock = threading.Lock()
+        self.latencies = collections.defaultdict(list)
+        self.statuses = collections.defaultdict(collections.Counter)
+        self.outcomes = collections.defaultdict(collections.Counter)
+        self.claimed = collections.deque()
+
+    def record(self, op, status, elapsed_ms, error, outcome=""):
+        with self.lock:
+            self.latencies[op].append(elapsed_ms)
+            self.statuses[op][str(status) if status is not None else error or "error"] += 1
+            if outcome:
+                self.outcomes[op][outcome] += 1
+
+    def op_dispatch(self):
+        payload = self.factory.economist_response()
+        status, data, elapsed_ms, error = self.client.request("POST", INTAKE_PATH, payload)
+        if status == 200 and data.get("event_id"):
+            self.factory.remember_dispatch(payload, data["event_id"])
+        self.record("dispatch", status, elapsed_ms, error, (data or {}).get("status", ""))
+
+    def op_verify(self):
+        picked = self.factory.recent_dispatches(1)
+        if not picked:
+            return self.op_dispatch()
+        payload, event_id = picked[0]
+        status, data, elapsed_ms, error = self.client.request(
+            "POST", INTAKE_VERIFY_PATH, self.factory.verify_item(payload, event_id)
+        )
+        self.record("verify", status, elapsed_ms, error, (data or {}).get("state", ""))
+
+    def op_verify_batch(self):
+        picked = self.factory.recent_dispatches(self.verify_batch_size)
+        if not picked:
+            return self.op_dispatch()
+        items = [self.factory.verify_item(payload, event_id) for payload, event_id in picked]
+        status, data, elapsed_ms, error = self.client.request("POST", INTAKE_VERIFY_PATH, {"items": items})
+        states = [result.get("state", "") for result in (data or {}).get("results", [])]
+        verified = sum(1 for state in states if state == "verified")
+        self.record("verify_batch", status, elapsed_ms, error, f"{verified}/{len(items)} verified" if states else "")
+
+    def op_problem_log(self):
+        status, data, elapsed_ms, error = self.client.request("POST", INTAKE_PATH, self.factory.problem_log())
+        self.record("problem_log", status, elapsed_ms, error)
+
+    def op_problem_log_query(self):
+        status, data, elapsed_ms, error = self.client.request(
+            "POST", PROBLEM_LOGS_QUERY_PATH, {"limit": 250, "minutes": 1440, "supportId": self.factory.support_id}
+        )
+        self.record("problem_log_query", status, elapsed_ms, error)
+
+    def op_source_material(self):
+        status, data, elapsed_ms, error = self.client.request("POST", SOURCE_MATERIALS_PATH, self.factory.source_material())
+        self.record("source_material", status, elapsed_ms, error)
+
+    def op_sector_memory(self):
+        status, data, elapsed_ms, error = self.client.request("POST", SECTOR_MEMORY_PATH, self.factory.sector_memory())
+        self.record("sector_memory", status, elapsed_ms, error)
+
+    def op_heartbeat(self, runner_id=None):
+        payload = {
+            "runnerId": runner_id or self.factory.runner_id(),
+            "runnerName": "load generator",
+            "enabled": True,
+            "promptsLoaded": True,
+            "promptHash": "loadtest",
+            "chatgptReady": True,
+            "localBusy": False,
+            "localQueueSize": 0,
+            "extensionVersion": "loadtest",
+            "activeJobId": "",
+            "capabilities": {"remoteJobs": True},
+        }
+        status, data, elapsed_ms, error = self.client.request("POST", ISKRA_RUNNERS_HEARTBEAT_PATH, payload)
+        self.record("heartbeat", status, elapsed_ms, error)
+
+    def op_job_submit(self):
+        response = self.factory.economist_response()
+        payload = {
+            "jobId": f"lt-{uuid.uuid4().hex[:16]}",
+            "runId": response["runId"],
+            "runnerId": self.factory.runner_id(),
+            "text": response["text"],
+            "submittedTitle": response["source"],
+            "sourceKind": "transcript",
+            "analysisType": response["analysisType"],
+            "batchId": "loadtest",
+        }
+        status, data, elapsed_ms, error = self.client.request("POST", ISKRA_JOBS_PATH, payload)
+        self.record("job_submit", status, elapsed_ms, error)
+
+    def op_job_claim(self):
+        runner_id = self.factory.runner_id()
+        status, data, elapsed_ms, error = self.client.request("POST", ISKRA_JOBS_CLAIM_PATH, {"runnerId": runner_id})
+        data = data or {}
+        self.record("job_claim", status, elapsed_ms, error, "claimed" if data.get("claimed") else data.get("reason", ""))
+        job = data.get("job") if data.get("claimed") else None
+        if not job:
+            return
+        for event_type in ("received", "started", "completed"):
+            status, _, elapsed_ms, error = self.client.request(
+                "POST",
+                f"{ISKRA_JOBS_PATH}/{job['jobId']}/event",
+                {"eventType": event_type, "attemptId": job["attemptId"], "runnerId": runner_id},
+            )
+            self.record("job_event", status, elapsed_ms, error)
+
+    def op_status(self):
+        status, data, elapsed_ms, error = self.client.request("GET", INTAKE_STATUS_PATH)
+        self.record("status", status, elapsed_ms, error)
+
+    def warm_up(self):
+        for runner_id in self.factory.runner_ids:
+            self.op_heartbeat(runner_id)
+        for _ in range(min(20, self.verify_batch_size)):
+            self.op_dispatch()
+
+    def run(self, weights, total_requests, concurrency, duration_s, seed):
+        ops = list(weights)
+        op_weights = [weights[name] for name in ops]
+        rng = random.Random(seed)
+        plan_lock = threading.Lock()
+        issued = [0]
+        deadline = time.perf_counter() + duration_s if duration_s else None
+
+        def next_op():
+            with plan_lock:
+                if deadline is None and issued[0] >= total_requests:
+                    return None
+                if deadline is not None and time.perf_counter() >= deadline:
+                    return None
+                issued[0] += 1
+                return rng.choices(ops, op_weights)[0]
+
+        def worker():
+            while True:
+                op = next_op()
+                if op is None:
+                    return
+                getattr(self, f"op_{op}")()
+
+        started = time.perf_counter()
+        with concurrent.futures.ThreadPoolExecutor(max_workers=concurrency) as pool:
+            for future in [pool.submit(worker) for _ in range(concurrency)]:
+                future.result()
+        return time.perf_counter() - started
+
+    def report(self, elapsed_s):
+        rows = {}
+        all_latencies = []
+        for op, values in sorted(self.latencies.items()):
+            ordered = sorted(values)
+            all_latencies.extend(values)
+            rows[op] = {
+                "count": len(values),
+                "rps": round(len(values) / elapsed_s, 1) if elapsed_s else 0.0,
+                "p50_ms": round(percentile(ordered, 0.50), 2),
+                "p95_ms": round(percentile(ordered, 0.95), 2),
+                "p99_ms": round(percentile(ordered, 0.99), 2),
+                "max_ms": round(ordered[-1], 2) if ordered else 0.0,
+                "statuses": dict(self.statuses[op]),
+                "outcomes": dict(self.outcomes[op].most_common(6)),
+            }
+        ordered = sorted(all_latencies)
+        return {
+            "elapsed_s": round(elapsed_s, 3),
+            "requests": len(ordered),
+            "rps": round(len(ordered) / elapsed_s, 1) if elapsed_s else 0.0,
+            "p50_ms": round(percentile(ordered, 0.50), 2),
+            "p99_ms": round(percentile(ordered, 0.99), 2),
+            "operations": rows,
+        }
+
+
+def print_report(report):
+    print(
+        f"total: {report['requests']} requests in {report['elapsed_s']}s "
+        f"-> {report['rps']} req/s, p50 {report['p50_ms']} ms, p99 {report['p99_ms']} ms"
+    )
+    header = f"{'operation':<18}{'count':>8}{'req/s':>9}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}  statuses / outcomes"
+    print(header)
+    print("-" * len(header))
+    for op, row in report["operations"].items():
+        statuses = ",".join(f"{key}:{value}" for key, value in sorted(row["statuses"].items()))
+        outcomes = ",".join(f"{key}:{value}" for key, value in row["outcomes"].items())
+        print(
+            f"{op:<18}{row['count']:>8}{row['rps']:>9}{row['p50_ms']:>9}{row['p95_ms']:>9}"
+            f"{row['p99_ms']:>9}{row['max_ms']:>9}  {statuses}{' | ' + outcomes if outcomes else ''}"
+        )
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Replay signed extension traffic and report latency percentiles.")
+    parser.add_argument("--base-url", default="http://127.0.0.1:8787")
+    parser.add_argument("--key-id", default="local")
+    parser.add_argument("--secret", default="dev-secret")
+    parser.add_argument("--scenario", choices=sorted(SCENARIO_WEIGHTS), default="mixed")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=1000, help="total operations (ignored with --duration)")
+    parser.add_argument("--duration", type=float, default=0.0, help="run for N seconds instead of a fixed count")
+    parser.add_argument("--verify-batch-size", type=int, default=25)
+    parser.add_argument("--runners", type=int, default=2)
+    parser.add_argument("--timeout", type=float, default=20.0)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--json", dest="json_path", default="", help="also write the report as JSON to this path")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    client = LoadClient(args.base_url, args.key_id, args.secret, args.timeout)
+    factory = PayloadFactory(args.seed, args.runners)
+    runner = LoadRunner(client, factory, max(1, args.verify_batch_size))
+    runner.warm_up()
+    runner.latencies.clear()
+    runner.statuses.clear()
+    runner.outcomes.clear()
+    elapsed_s = runner.run(
+        SCENARIO_WEIGHTS[args.scenario],
+        max(1, args.requests),
+        max(1, args.concurrency),
+        max(0.0, args.duration),
+        args.seed,
+    )
+    report = runner.report(elapsed_s)
+    report.update({"scenario": args.scenario, "concurrency": args.concurrency, "base_url": args.base_url})
+    print_report(report)
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=2)
+
+
+if __name__ == "__main__":
+    main()
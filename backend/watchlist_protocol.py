@@ -0,0 +1,57 @@
+"""Watchlist / Iskra intake protocol shared by the local stand-in and the load generator.
+
+Holds the API paths and the HMAC request signing used by watchlist-api.js:
+
+    METHOD \\n path \\n timestamp \\n nonce \\n sha256(body)
+
+signed with HMAC-SHA256. Standard library only, so ``loadtest.py`` can run
+without the stand-in's Flask dependency.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import time
+import uuid
+
+INTAKE_PATH = "/api/v1/intake/economist-response"
+INTAKE_VERIFY_PATH = "/api/v1/intake/economist-response/verify"
+INTAKE_STATUS_PATH = "/api/v1/intake/status"
+PROBLEM_LOGS_PATH = "/api/v1/intake/problem-logs"
+PROBLEM_LOGS_QUERY_PATH = "/api/v1/intake/problem-logs/query"
+SECTOR_MEMORY_PATH = "/api/v1/intake/sector-memory-rows"
+SOURCE_MATERIALS_PATH = "/api/v1/source-materials"
+ISKRA_RUNNERS_PATH = "/api/v1/iskra/runners"
+ISKRA_RUNNERS_HEARTBEAT_PATH = "/api/v1/iskra/runners/heartbeat"
+ISKRA_JOBS_PATH = "/api/v1/iskra/jobs"
+ISKRA_JOBS_CLAIM_PATH = "/api/v1/iskra/jobs/claim"
+
+PROBLEM_LOG_SCHEMA = "iskra.problem_log.v1"
+
+
+def sha256_hex(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def build_canonical_string(method, path, timestamp, nonce, body_hash):
+    return "\n".join([str(method or "POST").upper(), str(path or "/"), str(timestamp), str(nonce), str(body_hash)])
+
+
+def sign_request(secret, method, path, timestamp, nonce, body):
+    canonical = build_canonical_string(method, path, timestamp, nonce, sha256_hex(body))
+    return hmac.new(secret.encode("utf-8"), canonical.encode("utf-8"), hashlib.sha256).hexdigest()
+
+
+def build_signed_headers(key_id, secret, method, path, body=b"", timestamp=None, nonce=None):
+    timestamp = str(int(time.time()) if timestamp is None else timestamp)
+    nonce = nonce or f"n-{uuid.uuid4().hex}"
+    headers = {
+        "X-Watchlist-Key-Id": key_id,
+        "X-Watchlist-Timestamp": timestamp,
+        "X-Watchlist-Nonce": nonce,
+        "X-Watchlist-Signature": sign_request(secret, method, path, timestamp, nonce, body),
+    }
+    if method.upper() != "GET":
+        headers["Content-Type"] = "application/json"
+    return headers
@@ -0,0 +1,853 @@
+"""Local stand-in for the Watchlist / Iskra intake API.
+
+Implements the endpoints the extension talks to (intake dispatch + verify,
+problem-log query, sector-memory rows, source materials, remote runner and
+job claim/event paths, intake status) on top of an in-process store, so that
+outbox flush, verify and remote-runner throughput can be measured without the
+production host.
+
+Requests are authenticated with the same HMAC scheme as watchlist-api.js:
+
+    METHOD \\n path \\n timestamp \\n nonce \\n sha256(body)
+
+signed with HMAC-SHA256 and sent as ``X-Watchlist-Key-Id``,
+``X-Watchlist-Timestamp``, ``X-Watchlist-Nonce`` and
+``X-Watchlist-Signature``.
+
+Run::
+
+    python backend/watchlist_stub.py --port 8787 --key-id local --secret dev-secret \\
+        --latency-ms 40 --jitter-ms 20 --error-rate 0.02 --materialization-delay-ms 3000
+
+and point the extension intake URL at
+``http://127.0.0.1:8787/api/v1/intake/economist-response`` (plain HTTP is
+accepted for loopback hosts only).
+"""
+
+from __future__ import annotations
+
+import argparse
+import collections
+import dataclasses
+import hmac
+import itertools
+import json
+import os
+import random
+import threading
+import time
+import uuid
+
+from flask import Flask, g, jsonify, request
+
+from watchlist_protocol import (
+    INTAKE_PATH,
+    INTAKE_STATUS_PATH,
+    INTAKE_VERIFY_PATH,
+    ISKRA_JOBS_CLAIM_PATH,
+    ISKRA_JOBS_PATH,
+    ISKRA_RUNNERS_HEARTBEAT_PATH,
+    ISKRA_RUNNERS_PATH,
+    PROBLEM_LOG_SCHEMA,
+    PROBLEM_LOGS_PATH,
+    PROBLEM_LOGS_QUERY_PATH,
+    SECTOR_MEMORY_PATH,
+    SOURCE_MATERIALS_PATH,
+    sha256_hex,
+    sign_request,
+)
+
+STUB_ADMIN_PREFIX = "/__stub"
+
+JOB_TERMINAL_STATUSES = frozenset({"completed", "failed", "cancelled"})
+JOB_EVENT_STATUS = {
+    "received": "received",
+    "started": "running",
+    "heartbeat": None,
+    "completed": "completed",
+    "failed": "failed",
+}
+
+
+@dataclasses.dataclass
+class StubConfig:
+    key_id: str = "local"
+    secret: str = "dev-secret"
+    require_signature: bool = True
+    max_clock_skew_s: int = 300
+    latency_ms: int = 0
+    jitter_ms: int = 0
+    error_rate: float = 0.0
+    error_status: int = 503
+    error_paths: tuple = ()
+    materialization_delay_ms: int = 0
+    partial_materialization: bool = True
+    runner_stale_s: int = 120
+    claim_lease_s: int = 300
+    claim_batch_max: int = 10
+    claim_max_wait_ms: int = 25000
+    seed: int | None = None
+
+    @classmethod
+    def from_env(cls, environ=None):
+        env = os.environ if environ is None else environ
+        config = cls()
+        config.key_id = env.get("WATCHLIST_STUB_KEY_ID", config.key_id)
+        config.secret = env.get("WATCHLIST_STUB_SECRET", config.secret)
+        config.require_signature = env.get("WATCHLIST_STUB_REQUIRE_SIGNATURE", "1") not in ("0", "false", "no")
+        config.latency_ms = int(env.get("WATCHLIST_STUB_LATENCY_MS", config.latency_ms))
+        config.jitter_ms = int(env.get("WATCHLIST_STUB_JITTER_MS", config.jitter_ms))
+        config.error_rate = float(env.get("WATCHLIST_STUB_ERROR_RATE", config.error_rate))
+        config.error_status = int(env.get("WATCHLIST_STUB_ERROR_STATUS", config.error_status))
+        config.materialization_delay_ms = int(
+            env.get("WATCHLIST_STUB_MATERIALIZATION_DELAY_MS", config.materialization_delay_ms)
+        )
+        error_paths = env.get("WATCHLIST_STUB_ERROR_PATHS", "")
+        config.error_paths = tuple(part.strip() for part in error_paths.split(",") if part.strip())
+        return config
+
+    def to_dict(self):
+        payload = dataclasses.asdict(self)
+        payload.pop("secret", None)
+        payload["error_paths"] = list(self.error_paths)
+        return payload
+
+    def update(self, patch):
+        if not isinstance(patch, dict):
+            return
+        numeric = {
+            "latency_ms": int,
+            "jitter_ms": int,
+            "error_rate": float,
+            "error_status": int,
+            "materialization_delay_ms": int,
+            "runner_stale_s": int,
+            "claim_lease_s": int,
+            "claim_batch_max": int,
+            "claim_max_wait_ms": int,
+        }
+        for key, cast in numeric.items():
+            if key in patch:
+                setattr(self, key, cast(patch[key]))
+        if "partial_materialization" in patch:
+            self.partial_materialization = bool(patch["partial_materialization"])
+        if "require_signature" in patch:
+            self.require_signature = bool(patch["require_signature"])
+        if "error_paths" in patch and isinstance(patch["error_paths"], (list, tuple)):
+            self.error_paths = tuple(str(item) for item in patch["error_paths"] if str(item).strip())
+
+
+class StubStore:
+    """Thread-safe in-process state shared by all request handlers."""
+
+    def __init__(self, nonce_window=50000):
+        self.lock = threading.RLock()
+        self.job_available = threading.Condition(self.lock)
+        self.nonce_window = nonce_window
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.event_ids = itertools.count(1)
+            self.events = {}
+            self.events_by_response = {}
+            self.problem_logs = []
+            self.sector_memory = []
+            self.source_materials = {}
+            self.source_materials_by_hash = {}
+            self.runners = {}
+            self.jobs = collections.OrderedDict()
+            self.nonces = set()
+            self.nonce_order = collections.deque()
+            self.stats = collections.Counter()
+
+    def remember_nonce(self, key_id, nonce):
+        token = f"{key_id}:{nonce}"
+        with self.lock:
+            if token in self.nonces:
+                return False
+            self.nonces.add(token)
+            self.nonce_order.append(token)
+            while len(self.nonce_order) > self.nonce_window:
+                self.nonces.discard(self.nonce_order.popleft())
+            return True
+
+    def next_event_id(self):
+        with self.lock:
+            return next(self.event_ids)
+
+    def snapshot(self):
+        with self.lock:
+            job_states = collections.Counter(job["status"] for job in self.jobs.values())
+            return {
+                "events": len(self.events),
+                "problemLogs": len(self.problem_logs),
+                "sectorMemoryRows": len(self.sector_memory),
+                "sourceMaterials": len(self.source_materials),
+                "runners": len(self.runners),
+                "jobs": dict(job_states),
+                "requests": dict(self.stats),
+            }
+
+
+def now_ms():
+    return int(time.time() * 1000)
+
+
+def iso_timestamp(ms):
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(ms / 1000)) + f".{int(ms % 1000):03d}Z"
+
+
+def text_value(value, limit=None):
+    if value is None:
+        return ""
+    text = value.strip() if isinstance(value, str) else str(value).strip()
+    return text[:limit] if limit else text
+
+
+def int_value(value, default, minimum=None, maximum=None):
+    try:
+        number = int(value)
+    except (TypeError, ValueError):
+        return default
+    if minimum is not None:
+        number = max(minimum, number)
+    if maximum is not None:
+        number = min(maximum, number)
+    return number
+
+
+def error_response(status, detail, **extra):
+    payload = {"success": False, "detail": detail, "reason": detail}
+    payload.update(extra)
+    return jsonify(payload), status
+
+
+def count_expected_rows(payload):
+    records = payload.get("records")
+    if isinstance(records, list) and records:
+        return len([record for record in records if isinstance(record, dict)]) or 1
+    text = payload.get("text") if isinstance(payload.get("text"), str) else ""
+    lines = [line for line in text.splitlines() if line.count(";") >= 10]
+    return max(1, len(lines))
+
+
+def runner_public_view(runner, jobs, config, at_ms):
+    stale = at_ms - runner["lastHeartbeatAt"] > config.runner_stale_s * 1000
+    assigned_job_ids = [
+        job["jobId"] for job in jobs.values()
+        if job.get("runnerId") == runner["runnerId"] and job["status"] in ("claimed", "received", "running")
+    ]
+    active_job_id = assigned_job_ids[0] if assigned_job_ids else ""
+    if stale:
+        state = "offline"
+    elif not runner.get("enabled", True):
+        state = "disabled"
+    elif runner.get("localBusy") or active_job_id:
+        state = "busy"
+    elif not runner.get("promptsLoaded") or not runner.get("chatgptReady"):
+        state = "not_ready"
+    else:
+        state = "ready"
+    view = dict(runner)
+    view.update({
+        "state": state,
+        "queueable": state in ("ready", "busy"),
+        "activeRemoteJobId": active_job_id,
+        "assignedRemoteJobIds": assigned_job_ids,
+        "lastHeartbeatAt": iso_timestamp(runner["lastHeartbeatAt"]),
+    })
+    return view
+
+
+def create_app(config=None, store=None):
+    config = config or StubConfig.from_env()
+    store = store or StubStore()
+    rng = random.Random(config.seed)
+    rng_lock = threading.Lock()
+    app = Flask(__name__)
+    app.config["STUB_CONFIG"] = config
+    app.config["STUB_STORE"] = store
+
+    def draw():
+        with rng_lock:
+            return rng.random()
+
+    @app.before_request
+    def simulate_and_authenticate():
+        g.request_id = uuid.uuid4().hex[:16]
+        path = request.path
+        if path.startswith(STUB_ADMIN_PREFIX):
+            return None
+        with store.lock:
+            store.stats[f"{request.method} {request.url_rule.rule if request.url_rule else path}"] += 1
+
+        delay_ms = config.latency_ms
+        if config.jitter_ms > 0:
+            delay_ms += int(draw() * config.jitter_ms)
+        if delay_ms > 0:
+            time.sleep(delay_ms / 1000)
+
+        if config.require_signature:
+            failure = verify_signature(request)
+            if failure:
+                with store.lock:
+                    store.stats["auth_failed"] += 1
+                return error_response(401, failure)
+
+        if config.error_rate > 0:
+            targeted = not config.error_paths or any(path.startswith(prefix) for prefix in config.error_paths)
+            if targeted and draw() < config.error_rate:
+                with store.lock:
+                    store.stats["injected_errors"] += 1
+                return error_response(config.error_status, "injected_failure")
+        return None
+
+    @app.after_request
+    def attach_request_id(response):
+        response.headers["X-Request-Id"] = getattr(g, "request_id", "")
+        return response
+
+    def verify_signature(req):
+        key_id = req.headers.get("X-Watchlist-Key-Id", "")
+        timestamp = req.headers.get("X-Watchlist-Timestamp", "")
+        nonce = req.headers.get("X-Watchlist-Nonce", "")
+        signature = req.headers.get("X-Watchlist-Signature", "")
+        if not (key_id and timestamp and nonce and signature):
+            return "missing_signature_headers"
+        if key_id != config.key_id:
+            return "unknown_key_id"
+        try:
+            skew = abs(int(time.time()) - int(timestamp))
+        except ValueError:
+            return "invalid_timestamp"
+        if skew > config.max_clock_skew_s:
+            return "timestamp_out_of_window"
+        body = b"" if req.method == "GET" else req.get_data(cache=True)
+        expected = sign_request(config.secret, req.method, req.path, timestamp, nonce, body)
+        if not hmac.compare_digest(expected, signature.strip().lower()):
+            return "invalid_signature"
+        if not store.remember_nonce(key_id, nonce):
+            return "nonce_replayed"
+        return ""
+
+    def json_body():
+        payload = request.get_json(silent=True)
+        return payload if isinstance(payload, dict) else None
+
+    # -- intake -----------------------------------------------------------
+
+    def store_problem_log(payload, event_id, at_ms):
+        stage = payload.get("stage") if isinstance(payload.get("stage"), dict) else {}
+        item = {
+            "event_id": event_id,
+            "timestamp": iso_timestamp(int_value(payload.get("timestamp"), at_ms)),
+            "received_at": iso_timestamp(at_ms),
+            "support_id": text_value(payload.get("supportId"), 120),
+            "run_id": text_value(payload.get("runId"), 160),
+            "source": text_value(payload.get("source"), 240),
+            "analysis_type": text_value(payload.get("analysisType"), 80),
+            "level": text_value(stage.get("level")) or text_value(payload.get("analysisType")).split(":")[-1] or "info",
+            "message": text_value(payload.get("text"), 2000),
+            "stage": stage,
+        }
+        store.problem_logs.append(item)
+
+    @app.post(INTAKE_PATH)
+    def intake_economist_response():
+        payload = json_body()
+        if payload is None:
+            return error_response(400, "invalid_json")
+        response_id = text_value(payload.get("responseId"))
+        text = payload.get("text") if isinstance(payload.get("text"), str) else ""
+        if not response_id:
+            return error_response(422, "missing_response_id")
+        if not text.strip() and not payload.get("records"):
+            return error_response(422, "missing_text")
+        at_ms = now_ms()
+        with store.lock:
+            existing = store.events_by_response.get(response_id)
+            if existing is not None:
+                return jsonify({
+                    "success": True,
+                    "status": "duplicate",
+                    "event_id": existing["event_id"],
+                    "request_id": g.request_id,
+                })
+            event_id = store.next_event_id()
+            event = {
+                "event_id": event_id,
+                "response_id": response_id,
+                "schema": text_value(payload.get("schema")) or "economist.response.v1",
+                "run_id": text_value(payload.get("runId")),
+                "source": text_value(payload.get("source")),
+                "analysis_type": text_value(payload.get("analysisType")),
+                "conversation_url": text_value(payload.get("conversationUrl")),
+                "has_stage": isinstance(payload.get("stage"), dict),
+                "has_text": bool(text.strip()),
+                "has_timestamp": payload.get("timestamp") is not None,
+                "conversation_log_count": len(payload["conversationLogs"])
+                if isinstance(payload.get("conversationLogs"), list)
+                else int_value(payload.get("conversationLogCount"), 0, minimum=0),
+                "expected_rows": count_expected_rows(payload),
+                "received_at": at_ms,
+                "materialize_at": at_ms + max(0, config.materialization_delay_ms),
+            }
+            store.events[event_id] = event
+            store.events_by_response[response_id] = event
+            if event["schema"] == PROBLEM_LOG_SCHEMA:
+                store_problem_log(payload, event_id, at_ms)
+        return jsonify({"success": True, "status": "accepted", "event_id": event_id, "request_id": g.request_id})
+
+    def evaluate_verify(item, at_ms):
+        if not isinstance(item, dict):
+            return {"success": False, "state": "missing_fields", "reason": "invalid_item"}
+        response_id = text_value(item.get("responseId"))
+        if not response_id:
+            return {"success": False, "state": "missing_fields", "reason": "missing_response_id"}
+        base = {"response_id": response_id}
+        event = store.events_by_response.get(response_id)
+        if event is None:
+            return {**base, "success": False, "state": "not_found", "reason": "event_not_found"}
+        base["event_id"] = event["event_id"]
+        requested_event_id = int_value(item.get("eventId"), 0)
+        if requested_event_id and requested_event_id != event["event_id"]:
+            return {**base, "success": False, "state": "mismatch", "reason": "event_id_mismatch"}
+        expected = item.get("expected") if isinstance(item.get("expected"), dict) else {}
+        for field, key in (("runId", "run_id"), ("analysisType", "analysis_type"), ("source", "source")):
+            wanted = text_value(expected.get(field))
+            if wanted and event[key] and wanted != event[key]:
+                return {**base, "success": False, "state": "mismatch", "reason": f"{field}_mismatch"}
+        if expected.get("expectText") and not event["has_text"]:
+            return {**base, "success": False, "state": "missing_fields", "reason": "text_missing"}
+        expected_rows = event["expected_rows"]
+        base["expected_materialized_row_count"] = expected_rows
+        remaining_ms = event["materialize_at"] - at_ms
+        if remaining_ms > 0:
+            delay_ms = max(1, config.materialization_delay_ms)
+            done = expected_rows - (expected_rows * remaining_ms + delay_ms - 1) // delay_ms
+            if config.partial_materialization and expected_rows > 1 and done > 0:
+                return {
+                    **base,
+                    "success": False,
+                    "state": "materialization_partial",
+                    "reason": "materialization_in_progress",
+                    "materialized_row_count": int(done),
+                }
+            return {
+                **base,
+                "success": False,
+                "state": "materialization_pending",
+                "reason": "materialization_pending",
+                "materialized_row_count": 0,
+            }
+        return {
+            **base,
+            "success": True,
+            "state": "verified",
+            "reason": "verified",
+            "materialized_row_count": expected_rows,
+        }
+
+    @app.post(INTAKE_VERIFY_PATH)
+    def intake_verify():
+        payload = json_body()
+        if payload is None:
+            return error_response(400, "invalid_json")
+        at_ms = now_ms()
+        if isinstance(payload.get("items"), list):
+            items = payload["items"]
+            if len(items) > 200:
+                return error_response(413, "too_many_items")
+            with store.lock:
+                results = [evaluate_verify(item, at_ms) for item in items]
+            return jsonify({"success": True, "results": results, "request_id": g.request_id})
+        with store.lock:
+            result = evaluate_verify(payload, at_ms)
+        result["request_id"] = g.request_id
+        return jsonify(result)
+
+    @app.get(INTAKE_STATUS_PATH)
+    def intake_status():
+        started = time.perf_counter()
+        with store.lock:
+            counts = store.snapshot()
+        return jsonify({
+            "success": True,
+            "status": "ok",
+            "database": {"ok": True, "latency_ms": int((time.perf_counter() - started) * 1000)},
+            "counts": counts,
+        })
+
+    def query_problem_logs(options):
+        limit = int_value(options.get("limit"), 250, minimum=1, maximum=500)
+        minutes = int_value(options.get("minutes"), 24 * 60, minimum=1, maximum=14 * 24 * 60)
+        since_event_id = int_value(options.get("sinceEventId"), 0, minimum=0)
+        support_id = text_value(options.get("supportId"))
+        cutoff_ms = now_ms() - minutes * 60 * 1000
+        with store.lock:
+            matched = [
+                item for item in reversed(store.problem_logs)
+                if item["event_id"] > since_event_id
+                and (not support_id or item["support_id"] == support_id)
+                and store.events[item["event_id"]]["received_at"] >= cutoff_ms
+            ]
+        return jsonify({"success": True, "count": len(matched), "items": matched[:limit]})
+
+    @app.post(PROBLEM_LOGS_QUERY_PATH)
+    def problem_logs_query():
+        payload = json_body()
+        if payload is None:
+            return error_response(400, "invalid_json")
+        return query_problem_logs(payload)
+
+    @app.get(PROBLEM_LOGS_PATH)
+    def problem_logs_list():
+        return query_problem_logs(request.args)
+
+    @app.post(SECTOR_MEMORY_PATH)
+    def sector_memory_rows():
+        payload = json_body()
+        if payload is None:
+            return error_response(400, "invalid_json")
+        items = payload.get("items")
+        if not isinstance(items, list) or not items:
+            return error_response(422, "missing_items")
+        accepted = [item for item in items if isinstance(item, dict)]
+        raw_output_id = f"smr-{uuid.uuid4().hex[:12]}"
+        with store.lock:
+            for item in accepted:
+                store.sector_memory.append({"raw_output_id": raw_output_id, "source_run_id": payload.get("sourceRunId"), **item})
+        return jsonify({"success": True, "accepted_count": len(accepted), "raw_output_id": raw_output_id})
+
+    @app.post(SOURCE_MATERIALS_PATH)
+    def source_materials():
+        payload = json_body()
+        if payload is None:
+            return error_response(400, "invalid_json")
+        text = payload.get("text") if isinstance(payload.get("text"), str) else ""
+        if not text.strip():
+            return error_response(422, "source_material_text_empty")
+        material_hash = sha256_hex(text.encode("utf-8"))
+        with store.lock:
+            material_id = store.source_materials_by_hash.get(material_hash)
+            created = material_id is None
+            if created:
+                material_id = f"sm-{uuid.uuid4().hex[:16]}"
+                store.source_materials_by_hash[material_hash] = material_id
+                store.source_materials[material_id] = {
+                    "sourceMaterialId": material_id,
+                    "sourceMaterialHash": material_hash,
+                    "sourceMaterialLength": len(text),
+                    "title": text_value(payload.get("title"), 300),
+                    "sourceKind": text_value(payload.get("sourceKind"), 80),
+                    "sourceUrl": text_value(payload.get("sourceUrl"), 2000),
+                    "processes": [],
+                }
+            if isinstance(payload.get("process"), dict):
+                store.source_materials[material_id]["processes"].append(payload["process"])
+        return jsonify({
+            "success": True,
+            "created": created,
+            "sourceMaterialId": material_id,
+            "sourceMaterialHash": material_hash,
+            "sourceMaterialLength": len(text),
+        })
+
+    # -- remote runners and jobs ------------------------------------------
+
+    def release_expired_claims(at_ms):
+        lease_ms = config.claim_lease_s * 1000
+        for job in store.jobs.values():
+            if job["status"] == "claimed" and at_ms - job["updatedAtMs"] > lease_ms:
+                job.update({"status": "queued", "attemptId": "", "updatedAtMs": at_ms})
+
+    def claim_support():
+        return {
+            "maxJobs": max(1, config.claim_batch_max),
+            "maxWaitMs": max(0, config.claim_max_wait_ms),
+            "heartbeat": True,
+            "jobHeartbeats": True,
+        }
+
+    def apply_runner_heartbeat(runner_id, payload, at_ms):
+        runner = store.runners.setdefault(runner_id, {"runnerId": runner_id})
+        for key in (
+            "runnerName", "enabled", "promptsLoaded", "promptHash", "chatgptReady", "localBusy",
+            "localQueueSize", "freeSlots", "extensionVersion", "activeJobId", "capabilities",
+        ):
+            if key in payload:
+                runner[key] = payload[key]
+        runner["lastHeartbeatAt"] = at_ms
+        job_heartbeats = payload.get("jobHeartbeats")
+        for item in job_heartbeats if isinstance(job_heartbeats, list) else ():
+            if not isinstance(item, dict):
+                continue
+            job = store.jobs.get(text_value(item.get("jobId"), 160))
+            if (
+                job is None
+                or job["runnerId"] != runner_id
+                or job["attemptId"] != text_value(item.get("attemptId"))
+                or job["status"] in JOB_TERMINAL_STATUSES
+            ):
+                continue
+            job["events"] = (job["events"] + [{"eventType": "heartbeat", "at": iso_timestamp(at_ms)}])[-20:]
+            job["updatedAtMs"] = at_ms
+        return runner
+
+    def claim_queued_jobs(runner_id, max_jobs, at_ms):
+        claimed = []
+        for job in store.jobs.values():
+            if len(claimed) >= max_jobs:
+                break
+            if job["status"] != "queued" or job["runnerId"] != runner_id:
+                continue
+            job.update({
+                "status": "claimed",
+                "attemptId": f"att-{uuid.uuid4().hex[:12]}",
+                "attemptCount": job["attemptCount"] + 1,
+                "updatedAtMs": at_ms,
+            })
+            claimed.append(job_public_view(job))
+        return claimed
+
+    def job_public_view(job):
+        view = {key: value for key, value in job.items() if not key.endswith("AtMs")}
+        view["createdAt"] = iso_timestamp(job["createdAtMs"])
+        view["updatedAt"] = iso_timestamp(job["updatedAtMs"])
+        return view
+
+    @app.get(ISKRA_RUNNERS_PATH)
+    def list_runners():
+        limit = int_value(request.args.get("limit"), 50, minimum=1, maximum=500)
+        at_ms = now_ms()
+        with store.lock:
+            items = [runner_public_view(runner, store.jobs, config, at_ms) for runner in store.runners.values()]
+        items.sort(key=lambda item: item["lastHeartbeatAt"], reverse=True)
+        return jsonify({"success": True, "count": len(items), "items": items[:limit]})
+
+    @app.post(ISKRA_RUNNERS_HEARTBEAT_PATH)
+    def runner_heartbeat():
+        payload = json_body()
+        if payload is None:
+            return error_response(400, "invalid_json")
+        runner_id = text_value(payload.get("runnerId"), 160)
+        if not runner_id:
+            return error_response(422, "missing_runner_id")
+        at_ms = now_ms()
+        with store.lock:
+            runner = apply_runner_heartbeat(runner_id, payload, at_ms)
+            view = runner_public_view(runner, store.jobs, config, at_ms)
+        return jsonify({"success": True, "runner": view, "claimSupport": claim_support()})
+
+    @app.get(f"{ISKRA_RUNNERS_PATH}/<runner_id>/status")
+    def runner_status(runner_id):
+        at_ms = now_ms()
+        with store.lock:
+            runner = store.runners.get(runner_id)
+            if runner is None:
+                return error_response(404, "runner_not_found")
+            view = runner_public_view(runner, store.jobs, config, at_ms)
+        return jsonify({"success": True, "runner": view})
+
+    @app.post(ISKRA_JOBS_PATH)
+    def submit_job():
+        payload = json_body()
+        if payload is None:
+            return error_response(400, "invalid_json")
+        runner_id = text_value(payload.get("runnerId"), 160)
+        text = payload.get("text") if isinstance(payload.get("text"), str) else ""
+        if not runner_id:
+            return error_response(422, "missing_runner_id")
+        if not text.strip() and not text_value(payload.get("sourceMaterialId")):
+            return error_response(422, "missing_text")
+        job_id = text_value(payload.get("jobId"), 160) or f"rj-{uuid.uuid4().hex[:16]}"
+        at_ms = now_ms()
+        with store.lock:
+            existing = store.jobs.get(job_id)
+            if existing is not None:
+                return jsonify({"success": True, "job": job_public_view(existing), "created": False, "idempotent": True})
+            job = {
+                key: payload[key]
+                for key in (
+                    "runId", "text", "submittedTitle", "sourceKind", "sourceUrl", "analysisType", "chatUrl",
+                    "batchId", "submissionId", "controllerId", "promptHash", "promptChainSnapshot",
+                    "sourceMaterialId", "sourceMaterialHash", "sourceMaterialLength",
+                )
+                if key in payload
+            }
+            job.update({
+                "jobId": job_id,
+                "runId": text_value(payload.get("runId")) or job_id,
+                "runnerId": runner_id,
+                "status": "queued",
+                "attemptId": "",
+                "attemptCount": 0,
+                "events": [],
+                "createdAtMs": at_ms,
+                "updatedAtMs": at_ms,
+            })
+            store.jobs[job_id] = job
+            store.job_available.notify_all()
+            view = job_public_view(job)
+        return jsonify({"success": True, "job": view, "created": True, "idempotent": False}), 201
+
+    @app.post(ISKRA_JOBS_CLAIM_PATH)
+    def claim_job():
+        payload = json_body()
+        if payload is None:
+            return error_response(400, "invalid_json")
+        runner_id = text_value(payload.get("runnerId"), 160)
+        if not runner_id:
+            return error_response(422, "missing_runner_id")
+        max_jobs = int_value(payload.get("maxJobs"), 1, minimum=1, maximum=max(1, config.claim_batch_max))
+        wait_ms = int_value(payload.get("waitMs"), 0, minimum=0, maximum=max(0, config.claim_max_wait_ms))
+        heartbeat = payload.get("heartbeat") if isinstance(payload.get("heartbeat"), dict) else None
+        at_ms = now_ms()
+        deadline = time.monotonic() + wait_ms / 1000
+        with store.lock:
+            if heartbeat is not None:
+                apply_runner_heartbeat(runner_id, heartbeat, at_ms)
+            release_expired_claims(at_ms)
+            if runner_id not in store.runners:
+                return jsonify({
+                    "success": True,
+                    "claimed": False,
+                    "reason": "runner_not_registered",
+                    "heartbeatApplied": False,
+                    "claimSupport": claim_support(),
+                })
+            # Long-poll: park on the condition until a job for this runner is submitted.
+            jobs = claim_queued_jobs(runner_id, max_jobs, at_ms)
+            while not jobs:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                store.job_available.wait(remaining)
+                at_ms = now_ms()
+                release_expired_claims(at_ms)
+                jobs = claim_queued_jobs(runner_id, max_jobs, at_ms)
+        response = {"success": True, "heartbeatApplied": heartbeat is not None, "claimSupport": claim_support()}
+        if not jobs:
+            response.update({"claimed": False, "reason": "queue_empty"})
+        else:
+            response.update({"claimed": True, "job": jobs[0], "jobs": jobs})
+        return jsonify(response)
+
+    @app.get(ISKRA_JOBS_PATH)
+    def list_jobs():
+        runner_id = text_value(request.args.get("runnerId"))
+        status = text_value(request.args.get("status"))
+        batch_id = text_value(request.args.get("batchId"))
+        limit = int_value(request.args.get("limit"), 50, minimum=1, maximum=500)
+        with store.lock:
+            items = [
+                job_public_view(job) for job in reversed(store.jobs.values())
+                if (not runner_id or job["runnerId"] == runner_id)
+                and (not status or job["status"] == status)
+                and (not batch_id or job.get("batchId") == batch_id)
+            ]
+        return jsonify({"success": True, "count": len(items), "items": items[:limit]})
+
+    @app.get(f"{ISKRA_JOBS_PATH}/<job_id>")
+    def get_job(job_id):
+        with store.lock:
+            job = store.jobs.get(job_id)
+            if job is None:
+                return error_response(404, "job_not_found")
+            view = job_public_view(job)
+        return jsonify({"success": True, "job": view})
+
+    @app.post(f"{ISKRA_JOBS_PATH}/<job_id>/event")
+    def job_event(job_id):
+        payload = json_body()
+        if payload is None:
+            return error_response(400, "invalid_json")
+        event_type = text_value(payload.get("eventType")).lower()
+        if event_type not in JOB_EVENT_STATUS:
+            return error_response(422, "unknown_event_type")
+        at_ms = now_ms()
+        with store.lock:
+            job = store.jobs.get(job_id)
+            if job is None:
+                return error_response(404, "job_not_found")
+            if text_value(payload.get("attemptId")) != job["attemptId"]:
+                return error_response(409, "attempt_mismatch")
+            if job["status"] in JOB_TERMINAL_STATUSES:
+                return error_response(409, f"job_already_{job['status']}")
+            next_status = JOB_EVENT_STATUS[event_type]
+            if next_status:
+                job["status"] = next_status
+            if isinstance(payload.get("result"), dict):
+                job["result"] = payload["result"]
+            if text_value(payload.get("error")):
+                job["error"] = text_value(payload.get("error"), 500)
+            job["events"] = (job["events"] + [{"eventType": event_type, "at": iso_timestamp(at_ms)}])[-20:]
+            job["updatedAtMs"] = at_ms
+            view = job_public_view(job)
+        return jsonify({"success": True, "job": view})
+
+    # -- stub administration (unsigned, never exposed by the real API) -----
+
+    @app.get(f"{STUB_ADMIN_PREFIX}/stats")
+    def admin_stats():
+        return jsonify({"success": True, "config": config.to_dict(), "store": store.snapshot()})
+
+    @app.post(f"{STUB_ADMIN_PREFIX}/config")
+    def admin_config():
+        config.update(request.get_json(silent=True) or {})
+        return jsonify({"success": True, "config": config.to_dict()})
+
+    @app.post(f"{STUB_ADMIN_PREFIX}/reset")
+    def admin_reset():
+        store.reset()
+        return jsonify({"success": True})
+
+    return app
+
+
+def parse_args(argv=None):
+    defaults = StubConfig.from_env()
+    parser = argparse.ArgumentParser(description="Local Watchlist/Iskra intake API stand-in.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8787)
+    parser.add_argument("--key-id", default=defaults.key_id)
+    parser.add_argument("--secret", default=defaults.secret)
+    parser.add_argument("--no-signature", action="store_true", help="accept unsigned requests")
+    parser.add_argument("--latency-ms", type=int, default=defaults.latency_ms)
+    parser.add_argument("--jitter-ms", type=int, default=defaults.jitter_ms)
+    parser.add_argument("--error-rate", type=float, default=defaults.error_rate)
+    parser.add_argument("--error-status", type=int, default=defaults.error_status)
+    parser.add_argument("--error-path", action="append", default=list(defaults.error_paths),
+                        help="limit error injection to paths with this prefix (repeatable)")
+    parser.add_argument("--materialization-delay-ms", type=int, default=defaults.materialization_delay_ms)
+    parser.add_argument("--claim-batch-max", type=int, default=defaults.claim_batch_max,
+                        help="most jobs a single claim request may return")
+    parser.add_argument("--claim-max-wait-ms", type=int, default=defaults.claim_max_wait_ms,
+                        help="longest a claim request may long-poll for new jobs (0 disables)")
+    parser.add_argument("--seed", type=int, default=None)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    config = StubConfig(
+        key_id=args.key_id,
+        secret=args.secret,
+        require_signature=not args.no_signature,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        error_paths=tuple(args.error_path),
+        materialization_delay_ms=args.materialization_delay_ms,
+        claim_batch_max=args.claim_batch_max,
+        claim_max_wait_ms=args.claim_max_wait_ms,
+        seed=args.seed,
+    )
+    app = create_app(config)
+    app.run(host=args.host, port=args.port, threaded=True)
+
+
+if __name__ == "__main__":
+    main()
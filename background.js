@@ -35,6 +35,20 @@ const MANUAL_PDF_PROVIDER_TIMEOUT_MS = 20000;
 const MANUAL_PDF_QUEUE_MAX_CONCURRENCY = 3;
 const ANALYSIS_QUEUE_STORAGE_KEY = 'analysis_queue_state';
 const ANALYSIS_QUEUE_MAX_CONCURRENT = 7;
+const ANALYSIS_QUEUE_CONCURRENCY_STORAGE_KEY = 'analysis_queue_concurrency_state';
+// Adaptive slot target: halve on ChatGPT rate limits, probe back up one slot at a time while healthy.
+const ANALYSIS_QUEUE_CONCURRENCY = {
+  minSlots: 1,
+  maxSlots: 10,
+  backoffFactor: 0.5,
+  decreaseCooldownMs: 60 * 1000,
+  rateLimitHoldMs: 10 * 60 * 1000,
+  probeIntervalMs: 5 * 60 * 1000,
+  latencyAlpha: 0.2,
+  latencyDegradeRatio: 1.75,
+  latencyMinSamples: 5,
+  completionWindowMs: 60 * 60 * 1000
+};
 const ANALYSIS_QUEUE_DISPATCH_CONFIRM_TIMEOUT_MS = 5 * 60 * 1000;
 const ANALYSIS_QUEUE_LOCAL_CONTEXT_GRACE_MS = 45 * 1000;
 const PROCESS_WINDOW_AUTO_MINIMIZE_ENABLED = true;
@@ -51,6 +65,20 @@ const EXECUTE_SCRIPT_TRANSIENT_MAX_ATTEMPTS = 3;
 const EXECUTE_SCRIPT_TRANSIENT_RETRY_DELAY_MS = 700;
 const EXECUTE_SCRIPT_TRANSIENT_WAIT_TIMEOUT_MS = 8000;
 const INJECT_SHARED_HELPER_FILES = ['decision-contract.js', 'response-storage.js'];
+const RUNTIME_PROFILER_STORAGE_KEY = 'runtime_profiler_enabled';
+const RUNTIME_PROFILER_SAMPLE_LIMIT = 256;
+// [owner global, function name]; an empty owner means a top-level worker function.
+const RUNTIME_PROFILER_HOT_PATHS = [
+  ['DecisionContractUtils', 'validateDecisionContractText'],
+  ['ResponseStorageUtils', 'readCanonicalResponses'],
+  ['ResponseStorageUtils', 'upsertCanonicalResponse'],
+  ['', 'normalizeProcessRecord'],
+  ['', 'pruneProcessRecords'],
+  ['', 'sanitizeWatchlistOutbox'],
+  ['', 'sortWatchlistOutboxForFlush'],
+  ['', 'resolveCompanyPromptAssignments'],
+  ['', 'sanitizeProblemLogEntry']
+];
 
 // Intake transport config: keep the HMAC secret local-only; non-secret routing
 // config may still use sync as a convenience fallback.
@@ -111,9 +139,15 @@ const WATCHLIST_DISPATCH = {
   verifyEnabled: true,
   verifyBackoffMs: 20 * 1000,
   verifyTimeoutMs: 12000,
+  // Item budget is per concurrency slot, so one flush handles flushMaxItemsPerRun * flushConcurrency items.
   flushMaxItemsPerRun: 8,
   flushMaxRuntimeMs: 25 * 1000,
+  flushConcurrency: 4,
+  flushMaxInFlightPerHost: 4,
   flushStaleLockMs: 6 * 60 * 1000,
+  verifyBatchEnabled: true,
+  verifyBatchMaxItems: 25,
+  verifyBatchUnsupportedTtlMs: 30 * 60 * 1000,
   outboxStorageKey: "watchlist_dispatch_outbox",
   outboxMaxItems: 5000,
   historyStorageKey: "watchlist_dispatch_history",
@@ -167,7 +201,11 @@ const ISKRA_REMOTE_RUNNER = {
   requestTimeoutMs: 20000,
   retryCount: 2,
   backoffMs: 1500,
-  rescueRetryMs: 15000
+  rescueRetryMs: 15000,
+  claimBatchMax: ANALYSIS_QUEUE_CONCURRENCY.maxSlots,
+  // Long-poll claims stay below the ~30s service-worker idle window.
+  claimWaitMs: 20000,
+  recoveryIntervalMs: 60000
 };
 
 const AUTO_RESTORE_WINDOWS = {
@@ -230,6 +268,10 @@ const RESPONSE_CONVERSATION_LOG_MAX_ITEMS = 40;
 const RESPONSE_CONVERSATION_LOG_MESSAGE_MAX_LENGTH = 420;
 
 const PROCESS_MONITOR_STORAGE_KEY = 'process_monitor_state';
+const PROCESS_MONITOR_DELTA_STORAGE_KEY = 'process_monitor_delta';
+// Flushes write only records changed since the last compaction into the delta key;
+// once it holds more than this many records the full snapshot is rewritten instead.
+const PROCESS_REGISTRY_DELTA_COMPACT_LIMIT = 12;
 const PROCESS_HISTORY_LIMIT = 30;
 const PROCESS_CONVERSATION_URL_HISTORY_LIMIT = 12;
 const PROCESS_UPDATE_DEBOUNCE_MS = 300;
@@ -248,6 +290,14 @@ const manualPdfProviderPorts = new Map();
 let processRegistryReady = null;
 let processRegistryVersion = 0;
 let processSnapshotVersion = 0;
+// Per-worker identity of the registry version sequence; monitors holding another epoch resync fully.
+const processRegistryEpoch = `${Date.now().toString(36)}-${Math.random().toString(36).slice(2, 10)}`;
+const processRegistryChangeVersionById = new Map();
+const processRegistryPublishedById = new Map();
+const processRegistryStoredDeltaIds = new Set();
+let processRegistryDeltaFloorVersion = 0;
+let processRegistryPersistedVersion = 0;
+let processRegistryCompactedVersion = 0;
 let processRegistryFlushTimer = null;
 let processRegistryFlushPromise = Promise.resolve([]);
 let processRegistryDirty = false;
@@ -260,6 +310,9 @@ let watchlistDispatchFlushPendingReason = '';
 let watchlistDispatchFlushStartedAt = 0;
 let watchlistDispatchFlushStartedReason = '';
 let watchlistOutboxMutationQueue = Promise.resolve();
+let watchlistDispatchHistoryWriteQueue = Promise.resolve();
+let watchlistDispatchHistoryPendingEntries = [];
+let watchlistVerifyBatchUnsupportedUntil = 0;
 let responseStorageMutationQueue = Promise.resolve();
 let canonicalResponseStorageReady = null;
 let analysisQueueMutationQueue = Promise.resolve();
@@ -278,6 +331,14 @@ let analysisQueueState = null;
 let analysisQueueReady = null;
 let analysisQueuePaused = false;
 let analysisQueuePauseReady = null;
+let analysisQueueConcurrencyState = null;
+let analysisQueueConcurrencyReady = null;
+let runtimeProfilerEnabled = false;
+let runtimeProfilerReady = null;
+let runtimeProfilerStartedAt = null;
+const runtimeProfilerTimings = new Map();
+const runtimeProfilerStorage = new Map();
+const runtimeProfilerRestoreHooks = [];
 let remoteJobSuppressions = new Map();
 let remoteJobSuppressionsReady = null;
 let remoteJobSuppressionMutationQueue = Promise.resolve();
@@ -311,6 +372,13 @@ let processMonitorHeartbeatSweepInProgress = false;
 let remoteRunnerCycleInProgress = false;
 let remoteRunnerCycleRequested = false;
 let remoteRunnerRescueTimer = null;
+let remoteRunnerClaimSupport = {
+  maxJobs: 1,
+  maxWaitMs: 0,
+  heartbeat: false,
+  jobHeartbeats: false
+};
+let remoteRunnerLastRecoveryAt = 0;
 
 function extractManualPdfProviderIdFromPort(port) {
   const name = typeof port?.name === 'string' ? port.name.trim() : '';
@@ -1584,10 +1652,14 @@ function pruneProcessRecords(records) {
     }
   });
 
-  const deduped = Array.from(byId.values());
+  return orderProcessRecords(Array.from(byId.values()));
+}
+
+// Orders already-normalized records (active by start, newest history first) and trims history.
+function orderProcessRecords(records) {
   const active = [];
   const closed = [];
-  for (const process of deduped) {
+  for (const process of (Array.isArray(records) ? records : [])) {
     if (isClosedProcessStatus(process.status)) {
       closed.push(process);
     } else {
@@ -1630,8 +1702,16 @@ async function ensureProcessRegistryReady() {
   if (!processRegistryReady) {
     processRegistryReady = (async () => {
       try {
-        const stored = await chrome.storage.local.get([PROCESS_MONITOR_STORAGE_KEY]);
-        const records = pruneProcessRecords(stored?.[PROCESS_MONITOR_STORAGE_KEY]);
+        const stored = await chrome.storage.local.get([
+          PROCESS_MONITOR_STORAGE_KEY,
+          PROCESS_MONITOR_DELTA_STORAGE_KEY
+        ]);
+        const storedDelta = stored?.[PROCESS_MONITOR_DELTA_STORAGE_KEY] && typeof stored[PROCESS_MONITOR_DELTA_STORAGE_KEY] === 'object'
+          ? stored[PROCESS_MONITOR_DELTA_STORAGE_KEY]
+          : null;
+        const records = pruneProcessRecords(
+          mergeStoredProcessRegistryDelta(stored?.[PROCESS_MONITOR_STORAGE_KEY], storedDelta)
+        );
         processRegistry.clear();
         records.forEach((record) => {
           processRegistry.set(record.id, record);
@@ -1639,8 +1719,23 @@ async function ensureProcessRegistryReady() {
         processRegistryVersion = records.reduce((maxValue, record) => {
           const version = Number.isInteger(record?.version) ? record.version : 0;
           return Math.max(maxValue, version);
-        }, 0);
+        }, Number.isInteger(storedDelta?.version) ? storedDelta.version : 0);
         processSnapshotVersion = processRegistryVersion;
+        processRegistryDeltaFloorVersion = processRegistryVersion;
+        processRegistryPersistedVersion = processRegistryVersion;
+        processRegistryCompactedVersion = Number.isInteger(storedDelta?.baseVersion)
+          ? storedDelta.baseVersion
+          : processRegistryVersion;
+        processRegistryChangeVersionById.clear();
+        processRegistryPublishedById.clear();
+        processRegistryStoredDeltaIds.clear();
+        records.forEach((record) => {
+          processRegistryPublishedById.set(record.id, record);
+        });
+        Object.keys(storedDelta?.records && typeof storedDelta.records === 'object' ? storedDelta.records : {})
+          .forEach((id) => {
+            if (processRegistry.has(id)) processRegistryStoredDeltaIds.add(id);
+          });
         rehydrateProcessProblemLogState(records);
         scheduleCompletedProcessPersistenceRetriesForSnapshot(records, 'process_registry_ready');
         scheduleProcessWindowCloseRetriesForSnapshot(records, 'process_registry_ready');
@@ -1668,13 +1763,80 @@ async function ensureProcessRegistryReady() {
   return processRegistryReady;
 }
 
-async function persistProcessRegistry() {
-  const records = pruneProcessRecords(Array.from(processRegistry.values()));
-  processRegistry.clear();
+function mergeStoredProcessRegistryDelta(baseRecords, storedDelta) {
+  const records = Array.isArray(baseRecords) ? baseRecords : [];
+  const deltaRecords = storedDelta?.records && typeof storedDelta.records === 'object'
+    ? storedDelta.records
+    : null;
+  if (!deltaRecords) return records;
+  const byId = new Map();
   records.forEach((record) => {
-    processRegistry.set(record.id, record);
+    if (record && typeof record === 'object' && record.id) byId.set(String(record.id), record);
+  });
+  Object.entries(deltaRecords).forEach(([id, record]) => {
+    if (record && typeof record === 'object') byId.set(id, record);
   });
-  await chrome.storage.local.set({ [PROCESS_MONITOR_STORAGE_KEY]: records });
+  if (!Array.isArray(storedDelta.order)) {
+    return Array.from(byId.values());
+  }
+  const keptIds = new Set(storedDelta.order.map((id) => String(id || '')));
+  return Array.from(byId.values()).filter((record) => keptIds.has(String(record.id)));
+}
+
+function markProcessRegistryChanged(runId) {
+  processRegistryVersion += 1;
+  if (runId) processRegistryChangeVersionById.set(runId, processRegistryVersion);
+  return processRegistryVersion;
+}
+
+// Registry records are normalized on write (upsertProcess / ensureProcessRegistryReady), so a flush
+// only orders and trims them, then stores the records changed since the last compaction under the
+// delta key. The full snapshot is rewritten once the delta grows past the compaction limit.
+async function persistProcessRegistry(options = {}) {
+  const records = orderProcessRecords(Array.from(processRegistry.values()));
+  if (records.length !== processRegistry.size) {
+    const keptIds = new Set(records.map((record) => record.id));
+    Array.from(processRegistry.keys()).forEach((id) => {
+      if (keptIds.has(id)) return;
+      processRegistry.delete(id);
+      processRegistryChangeVersionById.delete(id);
+      processRegistryStoredDeltaIds.delete(id);
+    });
+  }
+  processRegistryChangeVersionById.forEach((changeVersion, id) => {
+    if (changeVersion > processRegistryPersistedVersion) processRegistryStoredDeltaIds.add(id);
+  });
+
+  const compact = options?.compact === true
+    || processRegistryStoredDeltaIds.size > PROCESS_REGISTRY_DELTA_COMPACT_LIMIT;
+  if (compact) {
+    await chrome.storage.local.set({
+      [PROCESS_MONITOR_STORAGE_KEY]: records,
+      [PROCESS_MONITOR_DELTA_STORAGE_KEY]: {
+        version: processRegistryVersion,
+        baseVersion: processRegistryVersion,
+        records: {},
+        order: null
+      }
+    });
+    processRegistryStoredDeltaIds.clear();
+    processRegistryCompactedVersion = processRegistryVersion;
+  } else {
+    const deltaRecords = {};
+    processRegistryStoredDeltaIds.forEach((id) => {
+      const record = processRegistry.get(id);
+      if (record) deltaRecords[id] = record;
+    });
+    await chrome.storage.local.set({
+      [PROCESS_MONITOR_DELTA_STORAGE_KEY]: {
+        version: processRegistryVersion,
+        baseVersion: processRegistryCompactedVersion,
+        records: deltaRecords,
+        order: records.map((record) => record.id)
+      }
+    });
+  }
+  processRegistryPersistedVersion = processRegistryVersion;
   return records;
 }
 
@@ -1722,16 +1884,15 @@ function clearScheduledProcessRegistryFlush() {
 async function flushScheduledProcessRegistry(reason = 'scheduled') {
   clearScheduledProcessRegistryFlush();
   if (!processRegistryDirty) {
-    return pruneProcessRecords(Array.from(processRegistry.values()));
+    return orderProcessRecords(Array.from(processRegistry.values()));
   }
   processRegistryDirty = false;
   processRegistryFlushReason = '';
-  processSnapshotVersion = processRegistryVersion;
+  const baseVersion = processSnapshotVersion;
   const records = await persistProcessRegistry();
   await broadcastProcessUpdate({
-    processes: records,
     reason,
-    version: processSnapshotVersion
+    baseVersion
   });
   return records;
 }
@@ -1764,8 +1925,7 @@ function scheduleProcessRegistryFlush(reason = 'scheduled', options = {}) {
   return processRegistryFlushPromise;
 }
 
-function applyQueuePositionsToProcesses(records = [], queueState = null) {
-  const sourceRecords = Array.isArray(records) ? records : [];
+function buildProcessQueuePositionMap(queueState = null) {
   const state = queueState && typeof queueState === 'object' ? queueState : analysisQueueState;
   const waitingJobs = Array.isArray(state?.waitingJobs) ? state.waitingJobs : [];
   const queuePositionByRunId = new Map();
@@ -1774,6 +1934,12 @@ function applyQueuePositionsToProcesses(records = [], queueState = null) {
     if (!runId || queuePositionByRunId.has(runId)) return;
     queuePositionByRunId.set(runId, index + 1);
   });
+  return queuePositionByRunId;
+}
+
+function applyQueuePositionsToProcesses(records = [], queueState = null) {
+  const sourceRecords = Array.isArray(records) ? records : [];
+  const queuePositionByRunId = buildProcessQueuePositionMap(queueState);
   return sourceRecords.map((record) => {
     const runId = typeof record?.id === 'string' ? record.id.trim() : '';
     const queuePosition = queuePositionByRunId.get(runId) || null;
@@ -1790,11 +1956,62 @@ function applyQueuePositionsToProcesses(records = [], queueState = null) {
   });
 }
 
-async function getProcessSnapshot() {
+async function getProcessSnapshot(options = {}) {
+  await ensureProcessRegistryReady();
+  await ensureAnalysisQueueReady().catch(() => null);
+  const records = orderProcessRecords(Array.from(processRegistry.values()));
+  const processes = applyQueuePositionsToProcesses(records);
+  // The version is read in the same tick as the records so delta pulls never skip a change.
+  return options?.withVersion === true
+    ? { processes, version: processRegistryVersion }
+    : processes;
+}
+
+// Builds a PROCESSES_UPDATE delta for records changed after sinceVersion. With `published`
+// (records as last broadcast) changed records are sent as field patches; otherwise whole records.
+// Returns null when the caller's version cannot be served incrementally.
+function buildProcessRegistryDelta(records = [], sinceVersion = 0, options = {}) {
+  if (!Number.isInteger(sinceVersion) || sinceVersion < processRegistryDeltaFloorVersion || sinceVersion > processRegistryVersion) {
+    return null;
+  }
+  const published = options?.published instanceof Map ? options.published : null;
+  const sourceRecords = Array.isArray(records) ? records : [];
+  const changedRecords = [];
+  const patches = [];
+  for (const record of sourceRecords) {
+    const changeVersion = processRegistryChangeVersionById.get(record.id) || 0;
+    if (changeVersion <= sinceVersion) continue;
+    const previous = published ? published.get(record.id) : null;
+    if (!previous) {
+      changedRecords.push(record);
+      continue;
+    }
+    const patch = ProcessContractUtils.buildProcessRecordPatch(previous, record);
+    if (!patch) continue;
+    patches.push({
+      id: record.id,
+      baseRecordVersion: Number.isInteger(previous.version) ? previous.version : 0,
+      recordVersion: Number.isInteger(record.version) ? record.version : 0,
+      ...patch
+    });
+  }
+  return {
+    epoch: processRegistryEpoch,
+    baseVersion: sinceVersion,
+    version: processRegistryVersion,
+    order: sourceRecords.map((record) => record.id),
+    records: changedRecords,
+    patches,
+    queuePositions: Object.fromEntries(buildProcessQueuePositionMap())
+  };
+}
+
+async function getProcessSnapshotDelta(sinceVersion, epoch = '') {
   await ensureProcessRegistryReady();
   await ensureAnalysisQueueReady().catch(() => null);
-  const records = pruneProcessRecords(Array.from(processRegistry.values()));
-  return applyQueuePositionsToProcesses(records);
+  if (typeof epoch !== 'string' || epoch !== processRegistryEpoch) return null;
+  const records = orderProcessRecords(Array.from(processRegistry.values()));
+  return buildProcessRegistryDelta(records, sinceVersion);
 }
 
 function sanitizeManualPdfAttachmentContext(rawAttachment) {
@@ -2107,6 +2324,9 @@ function sanitizeAnalysisQueueJob(rawJob) {
     if (Number.isInteger(rawJob.minStartIndex)) {
       sanitized.minStartIndex = rawJob.minStartIndex;
     }
+    if (Number.isInteger(rawJob.totalPrompts) && rawJob.totalPrompts > 0) {
+      sanitized.totalPrompts = rawJob.totalPrompts;
+    }
     if (Number.isInteger(rawJob.stagePlanMaxWaitMs)) {
       sanitized.stagePlanMaxWaitMs = rawJob.stagePlanMaxWaitMs;
     }
@@ -2130,10 +2350,25 @@ function getAnalysisQueueJobPriority(job) {
   return job?.kind === ANALYSIS_QUEUE_KIND_RESUME_STAGE ? 0 : 1;
 }
 
+function getAnalysisQueueJobRemainingPrompts(job) {
+  if (!Number.isInteger(job?.totalPrompts) || job.totalPrompts <= 0) return null;
+  const startIndex = job?.kind === ANALYSIS_QUEUE_KIND_RESUME_STAGE && Number.isInteger(job?.resumeStartIndex)
+    ? job.resumeStartIndex
+    : 0;
+  return Math.max(0, job.totalPrompts - startIndex);
+}
+
 function compareAnalysisQueueJobs(left, right) {
   const priorityDiff = getAnalysisQueueJobPriority(left) - getAnalysisQueueJobPriority(right);
   if (priorityDiff !== 0) return priorityDiff;
 
+  // Jobs closest to completion free their slot soonest and turn into finished chains first.
+  const leftRemaining = getAnalysisQueueJobRemainingPrompts(left);
+  const rightRemaining = getAnalysisQueueJobRemainingPrompts(right);
+  if (leftRemaining !== null && rightRemaining !== null && leftRemaining !== rightRemaining) {
+    return leftRemaining - rightRemaining;
+  }
+
   const leftSequence = Number.isInteger(left?.sequence) && left.sequence > 0 ? left.sequence : null;
   const rightSequence = Number.isInteger(right?.sequence) && right.sequence > 0 ? right.sequence : null;
   if (leftSequence !== null && rightSequence !== null && leftSequence !== rightSequence) {
@@ -2210,6 +2445,284 @@ async function setAnalysisQueuePaused(paused, options = {}) {
   };
 }
 
+function createAnalysisQueueConcurrencyState() {
+  return {
+    target: ANALYSIS_QUEUE_MAX_CONCURRENT,
+    lastRateLimitAt: null,
+    lastDecreaseAt: null,
+    lastIncreaseAt: null,
+    rateLimitCount: 0,
+    promptGapEwmaMs: null,
+    promptGapBaselineMs: null,
+    promptGapSamples: 0,
+    chainDurationEwmaMs: null,
+    recentCompletions: [],
+    lastReason: 'initial',
+    updatedAt: null
+  };
+}
+
+function sanitizeAnalysisQueueConcurrencyState(rawState, nowTs = Date.now()) {
+  const source = rawState && typeof rawState === 'object' ? rawState : {};
+  const defaults = createAnalysisQueueConcurrencyState();
+  const positiveIntegerOrNull = (value) => (Number.isInteger(value) && value > 0 ? value : null);
+  const positiveNumberOrNull = (value) => (Number.isFinite(value) && value > 0 ? value : null);
+  const target = Number.isInteger(source.target)
+    ? Math.max(ANALYSIS_QUEUE_CONCURRENCY.minSlots, Math.min(ANALYSIS_QUEUE_CONCURRENCY.maxSlots, source.target))
+    : defaults.target;
+  const completionFloor = nowTs - ANALYSIS_QUEUE_CONCURRENCY.completionWindowMs;
+  return {
+    target,
+    lastRateLimitAt: positiveIntegerOrNull(source.lastRateLimitAt),
+    lastDecreaseAt: positiveIntegerOrNull(source.lastDecreaseAt),
+    lastIncreaseAt: positiveIntegerOrNull(source.lastIncreaseAt),
+    rateLimitCount: Number.isInteger(source.rateLimitCount) && source.rateLimitCount > 0 ? source.rateLimitCount : 0,
+    promptGapEwmaMs: positiveNumberOrNull(source.promptGapEwmaMs),
+    promptGapBaselineMs: positiveNumberOrNull(source.promptGapBaselineMs),
+    promptGapSamples: Number.isInteger(source.promptGapSamples) && source.promptGapSamples > 0 ? source.promptGapSamples : 0,
+    chainDurationEwmaMs: positiveNumberOrNull(source.chainDurationEwmaMs),
+    recentCompletions: (Array.isArray(source.recentCompletions) ? source.recentCompletions : [])
+      .filter((value) => Number.isInteger(value) && value > completionFloor)
+      .slice(-200),
+    lastReason: typeof source.lastReason === 'string' ? source.lastReason : defaults.lastReason,
+    updatedAt: positiveIntegerOrNull(source.updatedAt)
+  };
+}
+
+function recordAnalysisQueueRateLimit(state, nowTs = Date.now()) {
+  const next = sanitizeAnalysisQueueConcurrencyState(state, nowTs);
+  next.lastRateLimitAt = nowTs;
+  next.rateLimitCount += 1;
+  next.updatedAt = nowTs;
+  // Parallel tabs tend to hit the same limit together; back off once per burst, not once per tab.
+  if (Number.isInteger(next.lastDecreaseAt) && nowTs - next.lastDecreaseAt < ANALYSIS_QUEUE_CONCURRENCY.decreaseCooldownMs) {
+    return next;
+  }
+  next.target = Math.max(
+    ANALYSIS_QUEUE_CONCURRENCY.minSlots,
+    Math.floor(next.target * ANALYSIS_QUEUE_CONCURRENCY.backoffFactor)
+  );
+  next.lastDecreaseAt = nowTs;
+  next.lastReason = 'rate_limit';
+  return next;
+}
+
+function recordAnalysisQueuePromptGap(state, gapMs, nowTs = Date.now()) {
+  const next = sanitizeAnalysisQueueConcurrencyState(state, nowTs);
+  if (!Number.isFinite(gapMs) || gapMs <= 0) return next;
+  const alpha = ANALYSIS_QUEUE_CONCURRENCY.latencyAlpha;
+  next.promptGapEwmaMs = next.promptGapEwmaMs === null
+    ? gapMs
+    : Math.round(next.promptGapEwmaMs + alpha * (gapMs - next.promptGapEwmaMs));
+  // The baseline follows improvements immediately but creeps up slowly, so a sustained slowdown stands out.
+  next.promptGapBaselineMs = next.promptGapBaselineMs === null || next.promptGapEwmaMs < next.promptGapBaselineMs
+    ? next.promptGapEwmaMs
+    : Math.round(next.promptGapBaselineMs + (next.promptGapEwmaMs - next.promptGapBaselineMs) * 0.02);
+  next.promptGapSamples += 1;
+  next.updatedAt = nowTs;
+  return next;
+}
+
+function recordAnalysisQueueChainCompletion(state, durationMs, nowTs = Date.now()) {
+  const next = sanitizeAnalysisQueueConcurrencyState(state, nowTs);
+  if (Number.isFinite(durationMs) && durationMs > 0) {
+    const alpha = ANALYSIS_QUEUE_CONCURRENCY.latencyAlpha;
+    next.chainDurationEwmaMs = next.chainDurationEwmaMs === null
+      ? durationMs
+      : Math.round(next.chainDurationEwmaMs + alpha * (durationMs - next.chainDurationEwmaMs));
+  }
+  next.recentCompletions = next.recentCompletions.concat(nowTs).slice(-200);
+  next.updatedAt = nowTs;
+  return next;
+}
+
+function isAnalysisQueuePromptLatencyDegraded(state) {
+  return !!(
+    state
+    && state.promptGapSamples >= ANALYSIS_QUEUE_CONCURRENCY.latencyMinSamples
+    && state.promptGapBaselineMs > 0
+    && state.promptGapEwmaMs > state.promptGapBaselineMs * ANALYSIS_QUEUE_CONCURRENCY.latencyDegradeRatio
+  );
+}
+
+function resolveAnalysisQueueSlotTarget(state, signals = {}, nowTs = Date.now()) {
+  const next = sanitizeAnalysisQueueConcurrencyState(state, nowTs);
+  const config = ANALYSIS_QUEUE_CONCURRENCY;
+  const waitingCount = Number.isInteger(signals?.waitingCount) ? signals.waitingCount : 0;
+  const occupiedSlots = Number.isInteger(signals?.occupiedSlots) ? signals.occupiedSlots : 0;
+  const overdueDispatchCount = Number.isInteger(signals?.overdueDispatchCount) ? signals.overdueDispatchCount : 0;
+  const lastChangeAt = Math.max(next.lastIncreaseAt || 0, next.lastDecreaseAt || 0);
+  const stepDue = nowTs - lastChangeAt >= config.probeIntervalMs;
+  const rateLimitHeld = Number.isInteger(next.lastRateLimitAt) && nowTs - next.lastRateLimitAt < config.rateLimitHoldMs;
+  const latencyDegraded = isAnalysisQueuePromptLatencyDegraded(next);
+
+  if (latencyDegraded && stepDue && next.target > config.minSlots) {
+    next.target -= 1;
+    next.lastDecreaseAt = nowTs;
+    next.lastReason = 'latency_degraded';
+    next.updatedAt = nowTs;
+    return { state: next, changed: true, reason: next.lastReason };
+  }
+  const saturated = waitingCount > 0 && occupiedSlots >= next.target;
+  if (saturated && stepDue && !rateLimitHeld && !latencyDegraded && overdueDispatchCount === 0 && next.target < config.maxSlots) {
+    next.target += 1;
+    next.lastIncreaseAt = nowTs;
+    next.lastReason = 'probe';
+    next.updatedAt = nowTs;
+    return { state: next, changed: true, reason: next.lastReason };
+  }
+  return { state: next, changed: false, reason: '' };
+}
+
+async function ensureAnalysisQueueConcurrencyReady() {
+  if (!analysisQueueConcurrencyReady) {
+    analysisQueueConcurrencyReady = (async () => {
+      try {
+        const stored = await chrome.storage.local.get([ANALYSIS_QUEUE_CONCURRENCY_STORAGE_KEY]);
+        analysisQueueConcurrencyState = sanitizeAnalysisQueueConcurrencyState(stored?.[ANALYSIS_QUEUE_CONCURRENCY_STORAGE_KEY]);
+      } catch (error) {
+        console.warn('[analysis-queue] Failed to read concurrency state:', error?.message || String(error));
+        analysisQueueConcurrencyState = createAnalysisQueueConcurrencyState();
+      }
+      return analysisQueueConcurrencyState;
+    })();
+  }
+  return analysisQueueConcurrencyReady;
+}
+
+function getAnalysisQueueSlotTarget() {
+  return Number.isInteger(analysisQueueConcurrencyState?.target)
+    ? analysisQueueConcurrencyState.target
+    : ANALYSIS_QUEUE_MAX_CONCURRENT;
+}
+
+function commitAnalysisQueueConcurrencyState(nextState) {
+  const previousTarget = getAnalysisQueueSlotTarget();
+  analysisQueueConcurrencyState = nextState;
+  chrome.storage.local.set({ [ANALYSIS_QUEUE_CONCURRENCY_STORAGE_KEY]: nextState }).catch((error) => {
+    console.warn('[analysis-queue] Failed to persist concurrency state:', error?.message || String(error));
+  });
+  if (nextState.target !== previousTarget) {
+    console.log(`[analysis-queue] slot target ${previousTarget} -> ${nextState.target} (${nextState.lastReason})`);
+    if (nextState.target > previousTarget) {
+      requestAnalysisQueueReconcile(`slot_target_${nextState.lastReason}`);
+    }
+  }
+  return nextState;
+}
+
+async function observeAnalysisQueueConcurrencySignals(previousProcess, nextProcess, nowTs = Date.now()) {
+  if (!nextProcess || typeof nextProcess !== 'object') return;
+  const previous = previousProcess && typeof previousProcess === 'object' ? previousProcess : {};
+  const rateLimited = nextProcess.actionRequired === 'rate_limit' && previous.actionRequired !== 'rate_limit';
+  const previousGapCount = Number.isInteger(previous.performanceTelemetry?.promptTimings?.gapCount)
+    ? previous.performanceTelemetry.promptTimings.gapCount
+    : 0;
+  const nextPromptTimings = nextProcess.performanceTelemetry?.promptTimings || null;
+  const promptGapRecorded = Number.isInteger(nextPromptTimings?.gapCount) && nextPromptTimings.gapCount > previousGapCount;
+  const chainCompleted = normalizeProcessLifecycleStatus(nextProcess.lifecycleStatus || nextProcess.status) === 'completed'
+    && !isClosedProcessStatus(previous.lifecycleStatus || previous.status || 'running');
+  if (!rateLimited && !promptGapRecorded && !chainCompleted) return;
+
+  await ensureAnalysisQueueConcurrencyReady();
+  let nextState = analysisQueueConcurrencyState;
+  if (rateLimited) {
+    nextState = recordAnalysisQueueRateLimit(nextState, nowTs);
+  }
+  if (promptGapRecorded) {
+    nextState = recordAnalysisQueuePromptGap(nextState, nextPromptTimings.lastGapMs, nowTs);
+  }
+  if (chainCompleted) {
+    const startedAt = Number.isInteger(nextProcess.startedAt) ? nextProcess.startedAt : null;
+    nextState = recordAnalysisQueueChainCompletion(nextState, startedAt ? nowTs - startedAt : null, nowTs);
+  }
+  commitAnalysisQueueConcurrencyState(nextState);
+}
+
+function estimateAnalysisQueuePromptMs(process, concurrencyState) {
+  const promptTimings = process?.performanceTelemetry?.promptTimings;
+  if (Number.isInteger(promptTimings?.gapCount) && promptTimings.gapCount > 0 && promptTimings.totalGapMs > 0) {
+    return Math.round(promptTimings.totalGapMs / promptTimings.gapCount);
+  }
+  return concurrencyState?.promptGapEwmaMs > 0 ? concurrencyState.promptGapEwmaMs : null;
+}
+
+function estimateAnalysisQueueJobEtas(queueSnapshot, processes, concurrencyState, slotTarget, nowTs = Date.now()) {
+  const snapshot = queueSnapshot && typeof queueSnapshot === 'object' ? queueSnapshot : {};
+  const processById = processes instanceof Map ? processes : new Map();
+  const promptMsFallback = estimateAnalysisQueuePromptMs(null, concurrencyState);
+  const chainMsFallback = concurrencyState?.chainDurationEwmaMs > 0 ? concurrencyState.chainDurationEwmaMs : null;
+  const estimateJobMs = (remainingPrompts, promptMs) => {
+    if (Number.isInteger(remainingPrompts) && Number.isFinite(promptMs)) return remainingPrompts * promptMs;
+    return chainMsFallback;
+  };
+  const etas = [];
+  const slotFreeAt = [];
+
+  (Array.isArray(snapshot.activeJobs) ? snapshot.activeJobs : []).forEach((job) => {
+    const process = processById.get(job?.runId) || null;
+    const totalPrompts = Number.isInteger(process?.totalPrompts) && process.totalPrompts > 0 ? process.totalPrompts : null;
+    const currentPrompt = Number.isInteger(process?.currentPrompt) && process.currentPrompt > 0 ? process.currentPrompt : 0;
+    const remainingPrompts = totalPrompts !== null ? Math.max(0, totalPrompts - currentPrompt + 1) : null;
+    const etaMs = estimateJobMs(remainingPrompts, estimateAnalysisQueuePromptMs(process, concurrencyState));
+    slotFreeAt.push(Number.isFinite(etaMs) ? etaMs : null);
+    etas.push({
+      jobId: job?.jobId || '',
+      runId: job?.runId || '',
+      state: 'active',
+      position: null,
+      remainingPrompts,
+      etaMs: Number.isFinite(etaMs) ? Math.round(etaMs) : null,
+      etaAt: Number.isFinite(etaMs) ? nowTs + Math.round(etaMs) : null
+    });
+  });
+
+  // Simulate the slot pool: each waiting job takes the slot that frees up first.
+  const slots = Math.max(1, Number.isInteger(slotTarget) ? slotTarget : ANALYSIS_QUEUE_MAX_CONCURRENT);
+  while (slotFreeAt.length < slots) slotFreeAt.push(0);
+  (Array.isArray(snapshot.waitingJobs) ? snapshot.waitingJobs : []).forEach((job, index) => {
+    const remainingPrompts = getAnalysisQueueJobRemainingPrompts(job);
+    const jobMs = estimateJobMs(remainingPrompts, promptMsFallback);
+    let slotIndex = -1;
+    slotFreeAt.forEach((freeAt, candidateIndex) => {
+      if (freeAt === null) return;
+      if (slotIndex < 0 || freeAt < slotFreeAt[slotIndex]) slotIndex = candidateIndex;
+    });
+    const etaMs = slotIndex >= 0 && Number.isFinite(jobMs) ? slotFreeAt[slotIndex] + jobMs : null;
+    if (slotIndex >= 0) slotFreeAt[slotIndex] = etaMs;
+    etas.push({
+      jobId: job?.jobId || '',
+      runId: job?.runId || '',
+      state: 'waiting',
+      position: index + 1,
+      remainingPrompts,
+      etaMs: Number.isFinite(etaMs) ? Math.round(etaMs) : null,
+      etaAt: Number.isFinite(etaMs) ? nowTs + Math.round(etaMs) : null
+    });
+  });
+  return etas;
+}
+
+function buildAnalysisQueueConcurrencySnapshot(state, nowTs = Date.now()) {
+  const current = sanitizeAnalysisQueueConcurrencyState(state, nowTs);
+  return {
+    target: current.target,
+    minSlots: ANALYSIS_QUEUE_CONCURRENCY.minSlots,
+    maxSlots: ANALYSIS_QUEUE_CONCURRENCY.maxSlots,
+    lastReason: current.lastReason,
+    rateLimitCount: current.rateLimitCount,
+    lastRateLimitAt: current.lastRateLimitAt,
+    probeHeldUntil: Number.isInteger(current.lastRateLimitAt)
+      ? current.lastRateLimitAt + ANALYSIS_QUEUE_CONCURRENCY.rateLimitHoldMs
+      : null,
+    latencyDegraded: isAnalysisQueuePromptLatencyDegraded(current),
+    promptGapEwmaMs: current.promptGapEwmaMs,
+    promptGapBaselineMs: current.promptGapBaselineMs,
+    chainDurationEwmaMs: current.chainDurationEwmaMs,
+    completedLastHour: current.recentCompletions.length
+  };
+}
+
 function cloneRemoteJobSuppressionValue(value) {
   if (!value || typeof value !== 'object') return null;
   try {
@@ -2572,7 +3085,7 @@ function sanitizeAnalysisQueueState(rawState) {
     waitingJobs,
     activeJobs,
     manualTextSources,
-    maxConcurrent: ANALYSIS_QUEUE_MAX_CONCURRENT,
+    maxConcurrent: getAnalysisQueueSlotTarget(),
     lastSequence: Math.max(storedLastSequence, maxSeenSequence)
   };
 }
@@ -2895,11 +3408,17 @@ async function getAnalysisQueueStatusSnapshot() {
   const reservedSlots = snapshot.activeJobs.length;
   const liveSlots = activeProcesses.filter((entry) => entry?.activity?.live === true).length;
   const startingSlots = Math.max(0, reservedSlots - liveSlots);
+  await ensureAnalysisQueueConcurrencyReady();
+  const slotTarget = getAnalysisQueueSlotTarget();
+  const nowTs = Date.now();
   return {
     success: true,
     paused,
     version: analysisQueueVersion,
     maxConcurrent: snapshot.maxConcurrent,
+    slotTarget,
+    concurrency: buildAnalysisQueueConcurrencySnapshot(analysisQueueConcurrencyState, nowTs),
+    jobEtas: estimateAnalysisQueueJobEtas(snapshot, processRegistry, analysisQueueConcurrencyState, slotTarget, nowTs),
     activeSlots,
     reservedSlots,
     liveSlots,
@@ -2912,30 +3431,44 @@ async function getAnalysisQueueStatusSnapshot() {
   };
 }
 
+// Broadcasts the live registry (not the records handed over by the flush, which may already be
+// stale) so the version in the message always matches the records it describes.
 async function broadcastProcessUpdate(options = {}) {
-  const providedProcesses = Array.isArray(options?.processes) ? options.processes : null;
-  const processes = applyQueuePositionsToProcesses(
-    providedProcesses || await getProcessSnapshot()
-  );
+  const records = orderProcessRecords(Array.from(processRegistry.values()));
+  const delta = Number.isInteger(options?.baseVersion)
+    ? buildProcessRegistryDelta(records, options.baseVersion, { published: processRegistryPublishedById })
+    : null;
+  const version = delta ? delta.version : processRegistryVersion;
+  processSnapshotVersion = version;
+  processRegistryPublishedById.clear();
+  records.forEach((record) => {
+    if (record?.id) processRegistryPublishedById.set(record.id, record);
+  });
   let queue = null;
   try {
     queue = await getAnalysisQueueStatusSnapshot();
   } catch {
     queue = null;
   }
+  const message = {
+    type: 'PROCESSES_UPDATE',
+    epoch: processRegistryEpoch,
+    queue,
+    version,
+    queueVersion: Number.isInteger(queue?.version) ? queue.version : analysisQueueVersion,
+    reason: typeof options?.reason === 'string' ? options.reason : ''
+  };
+  if (delta) {
+    message.delta = delta;
+  } else {
+    message.processes = applyQueuePositionsToProcesses(records);
+  }
   try {
-    await chrome.runtime.sendMessage({
-      type: 'PROCESSES_UPDATE',
-      processes,
-      queue,
-      version: Number.isInteger(options?.version) ? options.version : processSnapshotVersion,
-      queueVersion: Number.isInteger(queue?.version) ? queue.version : analysisQueueVersion,
-      reason: typeof options?.reason === 'string' ? options.reason : ''
-    });
+    await chrome.runtime.sendMessage(message);
   } catch (error) {
     // Ignore: no listeners currently connected.
   }
-  return processes;
+  return records;
 }
 
 function requestAnalysisQueueReconcile(reason = 'manual') {
@@ -3409,11 +3942,22 @@ async function createRemoteJobViaApi(payload) {
   });
 }
 
-async function claimRemoteJobViaApi(runnerId) {
+async function claimRemoteJobViaApi(runnerId, options = {}) {
+  const payload = { runnerId };
+  if (Number.isInteger(options?.maxJobs) && options.maxJobs > 1) {
+    payload.maxJobs = options.maxJobs;
+  }
+  if (Number.isInteger(options?.waitMs) && options.waitMs > 0) {
+    payload.waitMs = options.waitMs;
+  }
+  if (options?.heartbeat && typeof options.heartbeat === 'object') {
+    payload.heartbeat = options.heartbeat;
+  }
   return performSignedIskraApiRequest({
     method: 'POST',
     path: getIskraApiPath('claim'),
-    payload: { runnerId }
+    payload,
+    ...(Number.isInteger(options?.timeoutMs) ? { timeoutMs: options.timeoutMs } : {})
   });
 }
 
@@ -3453,6 +3997,22 @@ function findRemoteAnalysisQueueJob(jobs = []) {
   }) || null;
 }
 
+function collectLocalRemoteJobIds(queueState) {
+  const remoteJobIds = new Set();
+  const addRemoteJobId = (remote) => {
+    const remoteJobId = typeof remote?.remoteJobId === 'string' ? remote.remoteJobId.trim() : '';
+    if (remoteJobId) remoteJobIds.add(remoteJobId);
+  };
+  [queueState?.activeJobs, queueState?.waitingJobs].forEach((jobs) => {
+    (Array.isArray(jobs) ? jobs : []).forEach((job) => addRemoteJobId(job?.remote));
+  });
+  for (const process of processRegistry.values()) {
+    if (!process || isClosedProcessStatus(process.status)) continue;
+    addRemoteJobId(process?.remote);
+  }
+  return Array.from(remoteJobIds);
+}
+
 function findActiveRemoteProcessRecord() {
   for (const process of processRegistry.values()) {
     if (!process || isClosedProcessStatus(process.status)) continue;
@@ -3659,6 +4219,11 @@ async function getRemoteRunnerLocalState() {
   const queuedWaitingRemoteJob = findRemoteAnalysisQueueJob(queueState?.waitingJobs);
   const activeRemoteProcess = findActiveRemoteProcessRecord();
   const processBackedRemoteJob = buildRemoteQueueJobLikeFromProcess(activeRemoteProcess);
+  const activeRemoteJobs = (Array.isArray(queueState?.activeJobs) ? queueState.activeJobs : [])
+    .filter((job) => typeof job?.remote?.remoteJobId === 'string' && job.remote.remoteJobId.trim());
+  if (processBackedRemoteJob && !activeRemoteJob) {
+    activeRemoteJobs.push(processBackedRemoteJob);
+  }
   const queuedRemoteJob = activeRemoteJob || queuedWaitingRemoteJob || processBackedRemoteJob;
   const totalJobs = Number.isInteger(queueSnapshot?.totalJobs)
     ? queueSnapshot.totalJobs
@@ -3673,9 +4238,11 @@ async function getRemoteRunnerLocalState() {
     queueSnapshot,
     queueState,
     activeRemoteJob: activeRemoteJob || processBackedRemoteJob,
+    activeRemoteJobs,
     activeRemoteProcess,
     activeLocalProcesses,
     queuedRemoteJob,
+    localRemoteJobIds: collectLocalRemoteJobIds(queueState),
     localBusy: totalJobsWithProcess > 0,
     localQueueSize: totalJobsWithProcess
   };
@@ -3928,49 +4495,8 @@ async function enqueueClaimedRemoteJob(job) {
   };
 }
 
-async function recoverAssignedRemoteJob(options = {}) {
-  const [runnerEnabled, queuePaused, identity] = await Promise.all([
-    getStoredRemoteRunnerEnabled(),
-    getAnalysisQueuePaused(),
-    getConfiguredRemoteRunnerIdentity()
-  ]);
-  if (!runnerEnabled) {
-    return { success: true, skipped: true, reason: 'runner_disabled' };
-  }
-  if (queuePaused) {
-    return { success: true, skipped: true, reason: 'queue_paused' };
-  }
-  const localState = await getRemoteRunnerLocalState();
-  if (localState?.queuedRemoteJob || localState?.activeRemoteProcess) {
-    return {
-      success: true,
-      skipped: true,
-      reason: localState?.queuedRemoteJob ? 'local_remote_job_present' : 'local_remote_process_present'
-    };
-  }
-
-  const statusResult = await getRemoteRunnerStatusViaApi(identity.runnerId, {
-    timeoutMs: Math.max(30000, ISKRA_REMOTE_RUNNER.requestTimeoutMs),
-    retryCount: 1
-  });
-  if (!statusResult?.success) {
-    return {
-      success: false,
-      skipped: true,
-      reason: statusResult?.error || 'remote_runner_status_failed',
-      status: statusResult?.status || null
-    };
-  }
-
-  const runner = statusResult?.payload?.runner && typeof statusResult.payload.runner === 'object'
-    ? statusResult.payload.runner
-    : null;
-  const activeRemoteJobId = typeof runner?.activeRemoteJobId === 'string' ? runner.activeRemoteJobId.trim() : '';
-  if (!activeRemoteJobId) {
-    return { success: true, skipped: true, reason: 'no_assigned_remote_job' };
-  }
-
-  const jobResult = await getRemoteJobViaApi(activeRemoteJobId);
+async function recoverAssignedRemoteJobById(remoteJobId, identity, options = {}) {
+  const jobResult = await getRemoteJobViaApi(remoteJobId);
   if (!jobResult?.success) {
     return {
       success: false,
@@ -4060,11 +4586,156 @@ async function recoverAssignedRemoteJob(options = {}) {
   }
 }
 
-async function sendRemoteRunnerHeartbeat(options = {}) {
-  const [runnerEnabled, identity, localState, promptsReady] = await Promise.all([
+async function recoverAssignedRemoteJob(options = {}) {
+  const cycleContext = options?.context && typeof options.context === 'object' ? options.context : null;
+  const [runnerEnabled, queuePaused, identity] = cycleContext
+    ? [cycleContext.runnerEnabled, cycleContext.queuePaused, cycleContext.identity]
+    : await Promise.all([
+      getStoredRemoteRunnerEnabled(),
+      getAnalysisQueuePaused(),
+      getConfiguredRemoteRunnerIdentity()
+    ]);
+  if (!runnerEnabled) {
+    return { success: true, skipped: true, reason: 'runner_disabled' };
+  }
+  if (queuePaused) {
+    return { success: true, skipped: true, reason: 'queue_paused' };
+  }
+  const localState = cycleContext?.localState || await getRemoteRunnerLocalState();
+  const localRemoteJobIds = new Set(Array.isArray(localState?.localRemoteJobIds) ? localState.localRemoteJobIds : []);
+
+  const statusResult = await getRemoteRunnerStatusViaApi(identity.runnerId, {
+    timeoutMs: Math.max(30000, ISKRA_REMOTE_RUNNER.requestTimeoutMs),
+    retryCount: 1
+  });
+  if (!statusResult?.success) {
+    return {
+      success: false,
+      skipped: true,
+      reason: statusResult?.error || 'remote_runner_status_failed',
+      status: statusResult?.status || null
+    };
+  }
+
+  const runner = statusResult?.payload?.runner && typeof statusResult.payload.runner === 'object'
+    ? statusResult.payload.runner
+    : null;
+  // Batch-claiming servers list every job assigned to this runner; older ones expose only one.
+  const assignedRemoteJobIds = Array.from(new Set(
+    (Array.isArray(runner?.assignedRemoteJobIds) ? runner.assignedRemoteJobIds : [runner?.activeRemoteJobId])
+      .map((remoteJobId) => (typeof remoteJobId === 'string' ? remoteJobId.trim() : ''))
+      .filter(Boolean)
+  ));
+  if (assignedRemoteJobIds.length === 0) {
+    return { success: true, skipped: true, reason: 'no_assigned_remote_job' };
+  }
+  const missingRemoteJobIds = assignedRemoteJobIds.filter((remoteJobId) => !localRemoteJobIds.has(remoteJobId));
+  if (missingRemoteJobIds.length === 0) {
+    return { success: true, skipped: true, reason: 'local_remote_job_present' };
+  }
+
+  const results = [];
+  for (const remoteJobId of missingRemoteJobIds) {
+    const result = await recoverAssignedRemoteJobById(remoteJobId, identity, options);
+    results.push(result);
+    if (result?.reason === 'runner_disabled' || result?.reason === 'queue_paused') break;
+  }
+  const recoveredResults = results.filter((result) => result?.recovered === true);
+  if (recoveredResults.length === 0) {
+    return results[0];
+  }
+  return {
+    ...recoveredResults[0],
+    recoveredCount: recoveredResults.length,
+    jobs: recoveredResults.map((result) => result.job)
+  };
+}
+
+function rememberRemoteRunnerClaimSupport(payload) {
+  const support = payload?.claimSupport && typeof payload.claimSupport === 'object'
+    ? payload.claimSupport
+    : null;
+  remoteRunnerClaimSupport = {
+    maxJobs: Number.isInteger(support?.maxJobs) && support.maxJobs > 0 ? support.maxJobs : 1,
+    maxWaitMs: Number.isInteger(support?.maxWaitMs) && support.maxWaitMs > 0 ? support.maxWaitMs : 0,
+    heartbeat: support?.heartbeat === true,
+    jobHeartbeats: support?.jobHeartbeats === true
+  };
+  return remoteRunnerClaimSupport;
+}
+
+function resolveRemoteRunnerClaimCapacity(localState) {
+  const localQueueSize = Number.isInteger(localState?.localQueueSize) ? Math.max(0, localState.localQueueSize) : 0;
+  return Math.max(0, Math.min(ISKRA_REMOTE_RUNNER.claimBatchMax, getAnalysisQueueSlotTarget() - localQueueSize));
+}
+
+function resolveRemoteRunnerClaimWaitMs(options = {}) {
+  if (options?.wait === false) return 0;
+  return Math.max(0, Math.min(ISKRA_REMOTE_RUNNER.claimWaitMs, remoteRunnerClaimSupport.maxWaitMs));
+}
+
+async function readRemoteRunnerCycleContext() {
+  const [runnerEnabled, queuePaused, identity, localState] = await Promise.all([
     getStoredRemoteRunnerEnabled(),
+    getAnalysisQueuePaused(),
     getConfiguredRemoteRunnerIdentity(),
-    getRemoteRunnerLocalState(),
+    getRemoteRunnerLocalState()
+  ]);
+  return {
+    runnerEnabled,
+    queuePaused,
+    identity,
+    localState
+  };
+}
+
+function buildRemoteJobHeartbeatItems(localState) {
+  const activeRemoteJobs = Array.isArray(localState?.activeRemoteJobs)
+    ? localState.activeRemoteJobs
+    : (localState?.activeRemoteJob ? [localState.activeRemoteJob] : []);
+  return activeRemoteJobs
+    .filter((job) => job?.remote?.remoteJobId && job?.remote?.remoteAttemptId)
+    .map((job) => {
+      const activeProcess = processRegistry.get(job.runId) || null;
+      const delivery = activeProcess ? getProcessQueueDeliveryState(activeProcess) : null;
+      return {
+        jobId: job.remote.remoteJobId,
+        attemptId: job.remote.remoteAttemptId,
+        queueState: typeof activeProcess?.queueState === 'string' ? activeProcess.queueState : 'running',
+        phase: typeof activeProcess?.phase === 'string' ? activeProcess.phase : '',
+        dispatchState: delivery?.state || '',
+        runId: job.runId,
+        localJobId: job.jobId
+      };
+    });
+}
+
+async function sendRemoteJobHeartbeatEvents(items) {
+  await Promise.all((Array.isArray(items) ? items : []).map((item) => reportRemoteJobEvent(
+    item.jobId,
+    'heartbeat',
+    item.attemptId,
+    {
+      queueState: item.queueState,
+      phase: item.phase,
+      dispatchState: item.dispatchState,
+      runId: item.runId,
+      jobId: item.localJobId
+    }
+  ).catch((error) => {
+    console.warn('[remote-runner] remote job heartbeat failed:', {
+      jobId: item.jobId,
+      attemptId: item.attemptId,
+      error: error?.message || String(error)
+    });
+  })));
+}
+
+async function buildRemoteRunnerHeartbeatPayload(cycleContext = null) {
+  const [runnerEnabled, identity, localState, promptsReady] = await Promise.all([
+    cycleContext ? cycleContext.runnerEnabled : getStoredRemoteRunnerEnabled(),
+    cycleContext ? cycleContext.identity : getConfiguredRemoteRunnerIdentity(),
+    cycleContext ? cycleContext.localState : getRemoteRunnerLocalState(),
     ensureCompanyPromptsReady().catch(() => false)
   ]);
   const promptHash = promptsReady ? await getCompanyPromptHash().catch(() => '') : '';
@@ -4077,104 +4748,193 @@ async function sendRemoteRunnerHeartbeat(options = {}) {
   const queueSnapshot = localState?.queueSnapshot && typeof localState.queueSnapshot === 'object'
     ? localState.queueSnapshot
     : {};
-  return performSignedIskraApiRequest({
+  const payload = {
+    runnerId: identity.runnerId,
+    runnerName: identity.runnerName,
+    enabled: runnerEnabled,
+    promptsLoaded: promptsReady === true,
+    promptHash,
+    chatgptReady: promptsReady === true,
+    localBusy: localState?.localBusy === true,
+    localQueueSize: Number.isInteger(localState?.localQueueSize) ? localState.localQueueSize : 0,
+    freeSlots: resolveRemoteRunnerClaimCapacity(localState),
+    extensionVersion: typeof chrome?.runtime?.getManifest === 'function'
+      ? (chrome.runtime.getManifest()?.version || '')
+      : '',
+    activeJobId: activeRemoteJobId || undefined,
+    capabilities: {
+      remoteManualTextV1: true,
+      promptChainSnapshotV1: true,
+      localProcessSnapshotV1: true,
+      batchClaimV1: true,
+      claimWaitV1: true,
+      jobHeartbeatsV1: true,
+      localProcesses: localProcessSnapshot,
+      localQueueSnapshot: {
+        totalJobs: Number.isInteger(queueSnapshot?.totalJobs) ? queueSnapshot.totalJobs : localProcessSnapshot.length,
+        queueSize: Number.isInteger(queueSnapshot?.queueSize) ? queueSnapshot.queueSize : 0,
+        activeSlots: Number.isInteger(queueSnapshot?.activeSlots) ? queueSnapshot.activeSlots : 0,
+        reservedSlots: Number.isInteger(queueSnapshot?.reservedSlots) ? queueSnapshot.reservedSlots : 0,
+        liveSlots: Number.isInteger(queueSnapshot?.liveSlots) ? queueSnapshot.liveSlots : 0,
+        updatedAt: Date.now()
+      }
+    }
+  };
+  if (remoteRunnerClaimSupport.jobHeartbeats) {
+    payload.jobHeartbeats = buildRemoteJobHeartbeatItems(localState);
+  }
+  return payload;
+}
+
+async function sendRemoteRunnerHeartbeat(options = {}) {
+  const payload = options?.payload && typeof options.payload === 'object'
+    ? options.payload
+    : await buildRemoteRunnerHeartbeatPayload(options?.context || null);
+  const result = await performSignedIskraApiRequest({
     method: 'POST',
     path: getIskraApiPath('runnerHeartbeat'),
-    payload: {
-      runnerId: identity.runnerId,
-      runnerName: identity.runnerName,
-      enabled: runnerEnabled,
-      promptsLoaded: promptsReady === true,
-      promptHash,
-      chatgptReady: promptsReady === true,
-      localBusy: localState?.localBusy === true,
-      localQueueSize: Number.isInteger(localState?.localQueueSize) ? localState.localQueueSize : 0,
-      extensionVersion: typeof chrome?.runtime?.getManifest === 'function'
-        ? (chrome.runtime.getManifest()?.version || '')
-        : '',
-      activeJobId: activeRemoteJobId || undefined,
-      capabilities: {
-        remoteManualTextV1: true,
-        promptChainSnapshotV1: true,
-        localProcessSnapshotV1: true,
-        localProcesses: localProcessSnapshot,
-        localQueueSnapshot: {
-          totalJobs: Number.isInteger(queueSnapshot?.totalJobs) ? queueSnapshot.totalJobs : localProcessSnapshot.length,
-          queueSize: Number.isInteger(queueSnapshot?.queueSize) ? queueSnapshot.queueSize : 0,
-          activeSlots: Number.isInteger(queueSnapshot?.activeSlots) ? queueSnapshot.activeSlots : 0,
-          reservedSlots: Number.isInteger(queueSnapshot?.reservedSlots) ? queueSnapshot.reservedSlots : 0,
-          liveSlots: Number.isInteger(queueSnapshot?.liveSlots) ? queueSnapshot.liveSlots : 0,
-          updatedAt: Date.now()
-        }
-      }
-    },
+    payload,
     timeoutMs: options?.timeoutMs
   });
+  if (result?.success && result.payload && typeof result.payload === 'object') {
+    rememberRemoteRunnerClaimSupport(result.payload);
+  }
+  return result;
+}
+
+function extractClaimedRemoteJobs(claimPayload) {
+  if (claimPayload?.claimed !== true) return [];
+  const jobs = Array.isArray(claimPayload.jobs) && claimPayload.jobs.length > 0
+    ? claimPayload.jobs
+    : [claimPayload.job];
+  const seen = new Set();
+  return jobs.filter((job) => {
+    if (!job || typeof job !== 'object') return false;
+    const jobId = typeof job.jobId === 'string' ? job.jobId.trim() : '';
+    if (!jobId || seen.has(jobId)) return false;
+    seen.add(jobId);
+    return true;
+  });
 }
 
 async function pollAndClaimRemoteJob(options = {}) {
-  const [runnerEnabled, identity, localState, queuePaused] = await Promise.all([
-    getStoredRemoteRunnerEnabled(),
-    getConfiguredRemoteRunnerIdentity(),
-    getRemoteRunnerLocalState(),
-    getAnalysisQueuePaused()
-  ]);
+  const cycleContext = options?.context && typeof options.context === 'object' ? options.context : null;
+  const [runnerEnabled, identity, localState, queuePaused] = cycleContext
+    ? [cycleContext.runnerEnabled, cycleContext.identity, cycleContext.localState, cycleContext.queuePaused]
+    : await Promise.all([
+      getStoredRemoteRunnerEnabled(),
+      getConfiguredRemoteRunnerIdentity(),
+      getRemoteRunnerLocalState(),
+      getAnalysisQueuePaused()
+    ]);
   if (!runnerEnabled) {
     return { success: true, skipped: true, reason: 'runner_disabled' };
   }
   if (queuePaused) {
     return { success: true, skipped: true, reason: 'queue_paused' };
   }
-  if (localState?.localBusy === true || localState?.queuedRemoteJob) {
-    return {
-      success: true,
-      skipped: true,
-      reason: localState?.queuedRemoteJob ? 'remote_job_already_present' : 'local_busy'
-    };
-  }
   if (await getAnalysisQueuePaused()) {
     return { success: true, skipped: true, reason: 'queue_paused' };
   }
+  const claimCapacity = resolveRemoteRunnerClaimCapacity(localState);
+  if (claimCapacity < 1) {
+    return { success: true, skipped: true, reason: 'local_busy', freeSlots: 0 };
+  }
 
-  const claimResult = await claimRemoteJobViaApi(identity.runnerId);
-  if (!claimResult?.success) {
-    return {
-      success: false,
-      claimed: false,
-      reason: claimResult?.error || 'remote_claim_failed',
-      status: claimResult?.status || null
-    };
+  const waitMs = resolveRemoteRunnerClaimWaitMs(options);
+  const heartbeatPayload = options?.heartbeat && typeof options.heartbeat === 'object' ? options.heartbeat : null;
+  const claimedJobs = [];
+  const enqueueResults = [];
+  const failures = [];
+  let freeSlots = claimCapacity;
+  let heartbeatApplied = false;
+  let longPolled = false;
+  let reason = 'queue_empty';
+  let lastFailure = null;
+
+  // Servers that batch fill every free slot in one request; older ones get one claim per slot.
+  while (freeSlots > 0) {
+    const requestWaitMs = claimedJobs.length === 0 && !longPolled ? waitMs : 0;
+    const startedAt = Date.now();
+    const claimResult = await claimRemoteJobViaApi(identity.runnerId, {
+      maxJobs: Math.min(freeSlots, remoteRunnerClaimSupport.maxJobs > 1 ? remoteRunnerClaimSupport.maxJobs : freeSlots),
+      waitMs: requestWaitMs,
+      heartbeat: heartbeatPayload && !heartbeatApplied ? heartbeatPayload : null,
+      ...(requestWaitMs > 0 ? { timeoutMs: requestWaitMs + ISKRA_REMOTE_RUNNER.requestTimeoutMs } : {})
+    });
+    if (!claimResult?.success) {
+      lastFailure = claimResult;
+      break;
+    }
+
+    const claimPayload = claimResult.payload && typeof claimResult.payload === 'object'
+      ? claimResult.payload
+      : {};
+    rememberRemoteRunnerClaimSupport(claimPayload);
+    if (claimPayload.heartbeatApplied === true) heartbeatApplied = true;
+    // A server that answers an empty long-poll immediately must not turn the cycle into a busy loop.
+    if (requestWaitMs > 0 && Date.now() - startedAt >= requestWaitMs / 2) longPolled = true;
+
+    const jobs = extractClaimedRemoteJobs(claimPayload);
+    if (jobs.length === 0) {
+      reason = typeof claimPayload.reason === 'string' ? claimPayload.reason : 'queue_empty';
+      break;
+    }
+    freeSlots = Math.max(0, freeSlots - jobs.length);
+    for (const job of jobs) {
+      claimedJobs.push(job);
+      try {
+        enqueueResults.push(await enqueueClaimedRemoteJob(job));
+      } catch (error) {
+        failures.push(await reportRemoteJobEnqueueFailure(job, error));
+      }
+    }
+    if (failures.length > 0) break;
   }
 
-  const claimPayload = claimResult.payload && typeof claimResult.payload === 'object'
-    ? claimResult.payload
-    : {};
-  if (claimPayload.claimed !== true || !claimPayload.job || typeof claimPayload.job !== 'object') {
+  if (claimedJobs.length === 0) {
+    if (lastFailure) {
+      return {
+        success: false,
+        claimed: false,
+        reason: lastFailure?.error || 'remote_claim_failed',
+        status: lastFailure?.status || null,
+        heartbeatApplied
+      };
+    }
     return {
       success: true,
       claimed: false,
-      reason: typeof claimPayload.reason === 'string' ? claimPayload.reason : 'queue_empty'
+      reason,
+      freeSlots,
+      longPolled,
+      heartbeatApplied
     };
   }
 
-  try {
-    const enqueueResult = await enqueueClaimedRemoteJob(claimPayload.job);
-    return {
-      success: true,
-      claimed: true,
-      reason: 'claimed',
-      job: claimPayload.job,
-      enqueueResult
-    };
-  } catch (error) {
-    const failure = await reportRemoteJobEnqueueFailure(claimPayload.job, error);
+  if (enqueueResults.length === 0) {
     return {
       success: false,
       claimed: true,
-      reason: failure.error,
-      job: claimPayload.job
+      reason: failures[0]?.error || 'remote_job_enqueue_failed',
+      job: claimedJobs[0],
+      jobs: claimedJobs,
+      heartbeatApplied
     };
   }
+  return {
+    success: failures.length === 0,
+    claimed: true,
+    reason: failures.length === 0 ? 'claimed' : (failures[0]?.error || 'remote_job_enqueue_failed'),
+    job: claimedJobs[0],
+    jobs: claimedJobs,
+    claimedCount: claimedJobs.length,
+    failedCount: failures.length,
+    enqueueResult: enqueueResults[0],
+    freeSlots,
+    longPolled,
+    heartbeatApplied
+  };
 }
 
 function requestRemoteRunnerCycle(reason = 'manual') {
@@ -4239,50 +4999,64 @@ async function runRemoteRunnerCycle(reason = 'manual') {
       });
     }
 
-    await sendRemoteRunnerHeartbeat().catch((error) => {
-      console.warn('[remote-runner] heartbeat failed:', {
-        reason: normalizedReason,
-        error: error?.message || String(error)
-      });
-    });
-
-    const localState = await getRemoteRunnerLocalState();
-    if (localState?.activeRemoteJob?.remote?.remoteJobId && localState?.activeRemoteJob?.remote?.remoteAttemptId) {
-      const activeProcess = processRegistry.get(localState.activeRemoteJob.runId) || null;
-      const delivery = activeProcess ? getProcessQueueDeliveryState(activeProcess) : null;
-      await reportRemoteJobEvent(
-        localState.activeRemoteJob.remote.remoteJobId,
-        'heartbeat',
-        localState.activeRemoteJob.remote.remoteAttemptId,
-        {
-          queueState: typeof activeProcess?.queueState === 'string' ? activeProcess.queueState : 'running',
-          phase: typeof activeProcess?.phase === 'string' ? activeProcess.phase : '',
-          dispatchState: delivery?.state || '',
-          runId: localState.activeRemoteJob.runId,
-          jobId: localState.activeRemoteJob.jobId
-        }
-      ).catch((error) => {
-        console.warn('[remote-runner] remote job heartbeat failed:', {
-          jobId: localState.activeRemoteJob.remote.remoteJobId,
-          attemptId: localState.activeRemoteJob.remote.remoteAttemptId,
+    let cycleContext = await readRemoteRunnerCycleContext();
+    const heartbeatPayload = await buildRemoteRunnerHeartbeatPayload(cycleContext);
+    const sendStandaloneHeartbeat = async () => {
+      await sendRemoteRunnerHeartbeat({ payload: heartbeatPayload }).catch((error) => {
+        console.warn('[remote-runner] heartbeat failed:', {
+          reason: normalizedReason,
           error: error?.message || String(error)
         });
       });
+      if (!Array.isArray(heartbeatPayload.jobHeartbeats)) {
+        await sendRemoteJobHeartbeatEvents(buildRemoteJobHeartbeatItems(cycleContext.localState));
+      }
+    };
+    // Servers that accept a heartbeat inside the claim request save one round trip per cycle.
+    const coalesceHeartbeat = remoteRunnerClaimSupport.heartbeat === true
+      && !cycleContext.queuePaused
+      && resolveRemoteRunnerClaimCapacity(cycleContext.localState) > 0;
+    if (!coalesceHeartbeat) {
+      await sendStandaloneHeartbeat();
     }
 
-    const recoveryResult = await recoverAssignedRemoteJob({
-      origin: normalizedReason
-    });
-    if (recoveryResult?.recovered === true) {
-      return recoveryResult;
-    }
-    if (recoveryResult?.reason && recoveryResult.reason !== 'no_assigned_remote_job') {
-      return recoveryResult;
+    const now = Date.now();
+    if (now - remoteRunnerLastRecoveryAt >= ISKRA_REMOTE_RUNNER.recoveryIntervalMs) {
+      remoteRunnerLastRecoveryAt = now;
+      const recoveryResult = await recoverAssignedRemoteJob({
+        origin: normalizedReason,
+        context: cycleContext
+      });
+      if (recoveryResult?.success === false
+        || recoveryResult?.reason === 'runner_disabled'
+        || recoveryResult?.reason === 'queue_paused') {
+        if (coalesceHeartbeat) await sendStandaloneHeartbeat();
+        return recoveryResult;
+      }
+      if (recoveryResult?.recovered === true) {
+        cycleContext = {
+          ...cycleContext,
+          localState: await getRemoteRunnerLocalState()
+        };
+      }
     }
 
-    return pollAndClaimRemoteJob({
-      origin: normalizedReason
+    const claimResult = await pollAndClaimRemoteJob({
+      origin: normalizedReason,
+      context: cycleContext,
+      heartbeat: coalesceHeartbeat ? heartbeatPayload : null
     });
+    if (coalesceHeartbeat && claimResult?.heartbeatApplied !== true) {
+      await sendStandaloneHeartbeat();
+    } else if (coalesceHeartbeat && !Array.isArray(heartbeatPayload.jobHeartbeats)) {
+      await sendRemoteJobHeartbeatEvents(buildRemoteJobHeartbeatItems(cycleContext.localState));
+    }
+    if (claimResult?.success === true
+      && claimResult?.freeSlots > 0
+      && (claimResult?.claimed === true || claimResult?.longPolled === true)) {
+      remoteRunnerCycleRequested = true;
+    }
+    return claimResult;
   } catch (error) {
     console.warn('[remote-runner] cycle failed:', {
       reason: normalizedReason,
@@ -8293,7 +9067,6 @@ async function upsertProcess(runId, patch = {}) {
 
   if (!next) return null;
   mergeProcessConversationUrls(existing, next);
-  processRegistryVersion = Math.max(processRegistryVersion, Number.isInteger(next.version) ? next.version : 0);
   const problemEntry = buildProcessProblemLogEntry(runId, next);
   const knownSignature = problemLogLastSignatureByRunId.get(runId) || '';
   const signatureChanged = !!(problemEntry?.signature && problemEntry.signature !== knownSignature);
@@ -8317,7 +9090,13 @@ async function upsertProcess(runId, patch = {}) {
     finalPromptRecoveryLastAttemptAtByRunId.delete(runId);
     finalPromptRecoveryInFlight.delete(runId);
   }
+  // Mark only once the record is stored: a flush that runs during the awaits above must not
+  // advance the snapshot version past a change whose record it cannot see yet.
   processRegistry.set(runId, next);
+  markProcessRegistryChanged(runId);
+  await observeAnalysisQueueConcurrencySignals(existing, next, nowTs).catch((error) => {
+    console.warn('[analysis-queue] concurrency signal failed:', error?.message || String(error));
+  });
   logger.event({
     level: isClosedProcessStatus(next.lifecycleStatus || next.status)
       ? (normalizeProcessLifecycleStatus(next.lifecycleStatus || next.status) === 'failed' ? 'warn' : 'info')
@@ -11797,6 +12576,7 @@ async function reconcileAnalysisQueueState(reason = 'manual') {
   try {
     await ensureAnalysisQueueReady();
     await ensureAnalysisQueuePauseReady();
+    await ensureAnalysisQueueConcurrencyReady();
     await ensureProcessRegistryReady();
 
     while (true) {
@@ -11954,6 +12734,17 @@ async function reconcileAnalysisQueueState(reason = 'manual') {
           excludedRunIds: releasedRunIds
         });
         let reservedSlots = occupiedSlots.length;
+        const slotTargetResult = resolveAnalysisQueueSlotTarget(analysisQueueConcurrencyState, {
+          waitingCount: state.waitingJobs.length,
+          occupiedSlots: reservedSlots,
+          overdueDispatchCount: state.activeJobs.filter((job) => (
+            Number.isInteger(job?.dispatchDeadlineAt) && job.dispatchDeadlineAt <= now
+          )).length
+        }, now);
+        if (slotTargetResult.changed) {
+          commitAnalysisQueueConcurrencyState(slotTargetResult.state);
+        }
+        state.maxConcurrent = slotTargetResult.state.target;
         sortAnalysisQueueWaitingJobs(state.waitingJobs);
         let manualPdfReservedSlots = state.activeJobs.filter((job) => job?.sourceKind === 'manual_pdf').length;
         while (reservedSlots < state.maxConcurrent && state.waitingJobs.length > 0) {
@@ -13482,11 +14273,15 @@ async function resetTrackedProcessesForBulkRun(options = {}) {
   }
 
   processRegistry.clear();
+  processRegistryChangeVersionById.clear();
   nextRecords.forEach((record) => {
-    if (record?.id) processRegistry.set(record.id, record);
+    if (!record?.id) return;
+    processRegistry.set(record.id, record);
+    markProcessRegistryChanged(record.id);
   });
+  processRegistryDeltaFloorVersion = processRegistryVersion;
 
-  await persistProcessRegistry();
+  await persistProcessRegistry({ compact: true });
   await broadcastProcessUpdate();
 
   return {
@@ -13876,6 +14671,8 @@ let PROMPTS_COMPANY = [];
 let PROMPTS_PORTFOLIO = [];
 let promptsCompanyHashCache = '';
 let promptsCompanyHashCacheKey = '';
+let companyPromptMatchCatalogCache = null;
+const companyConversationAuditCache = new Map();
 
 // Jedno źródło prawdy dla etapów company chain.
 // Kolejność musi być zsynchronizowana z prompts-company.txt (po separatorze).
@@ -14318,6 +15115,9 @@ async function readFullConversationFromTab(tabId, options = {}) {
     : 320;
   const hardForce = options?.hardForce !== false;
   const restoreScroll = options?.restoreScroll !== false;
+  const cursor = options?.cursor && typeof options.cursor === 'object' && Array.isArray(options.cursor.anchor)
+    ? options.cursor
+    : null;
 
   try {
     const result = await chrome.scripting.executeScript({
@@ -14349,6 +15149,56 @@ async function readFullConversationFromTab(tabId, options = {}) {
           && typeof node.nodeType === 'number'
           && node.nodeType === 1
         );
+        const fingerprintText = (text) => {
+          const value = compact(text);
+          let hash = 2166136261;
+          for (let i = 0; i < value.length; i += 1) {
+            hash ^= value.charCodeAt(i);
+            hash = Math.imul(hash, 16777619) >>> 0;
+          }
+          return `${value.length}:${hash.toString(36)}`;
+        };
+
+        // Cursor = fingerprints of the last few user messages plus counts before them.
+        // A later scan that still finds the anchor can skip scrolling to the top.
+        function buildConversationCursor(conversation, base) {
+          const userPositions = [];
+          conversation.forEach((entry, index) => {
+            if (entry.role === 'user') userPositions.push(index);
+          });
+          if (userPositions.length === 0) return null;
+          const anchorSize = Math.min(cfg.cursorAnchorSize, userPositions.length);
+          const anchorPositions = userPositions.slice(-anchorSize);
+          const anchorEntryIndex = anchorPositions[0];
+          let assistantsBefore = 0;
+          for (let i = 0; i < anchorEntryIndex; i += 1) {
+            if (conversation[i].role === 'assistant') assistantsBefore += 1;
+          }
+          return {
+            usersBefore: base.users + (userPositions.length - anchorSize),
+            assistantsBefore: base.assistants + assistantsBefore,
+            messagesBefore: base.messages + anchorEntryIndex,
+            anchor: anchorPositions.map((position) => fingerprintText(conversation[position].text))
+          };
+        }
+
+        function locateConversationCursor(conversation, scanCursor) {
+          const anchor = Array.isArray(scanCursor?.anchor) ? scanCursor.anchor : [];
+          if (anchor.length === 0) return -1;
+          const userPositions = [];
+          const userFingerprints = [];
+          conversation.forEach((entry, index) => {
+            if (entry.role !== 'user') return;
+            userPositions.push(index);
+            userFingerprints.push(fingerprintText(entry.text));
+          });
+          for (let i = userPositions.length - anchor.length; i >= 0; i -= 1) {
+            if (anchor.every((fingerprint, offset) => userFingerprints[i + offset] === fingerprint)) {
+              return userPositions[i];
+            }
+          }
+          return -1;
+        }
 
         function readConversationEntries() {
           const nodes = Array.from(
@@ -14502,13 +15352,27 @@ async function readFullConversationFromTab(tabId, options = {}) {
           }
         }
 
-        let bestConversation = latestConversation.length > 0
-          ? latestConversation
-          : readConversationEntries();
+        const cursorEntryIndex = cfg.cursor ? locateConversationCursor(latestConversation, cfg.cursor) : -1;
+        const cursorMatched = cursorEntryIndex >= 0;
+        const conversationBase = cursorMatched
+          ? {
+            users: Number.isInteger(cfg.cursor.usersBefore) ? cfg.cursor.usersBefore : 0,
+            assistants: Number.isInteger(cfg.cursor.assistantsBefore) ? cfg.cursor.assistantsBefore : 0,
+            messages: Number.isInteger(cfg.cursor.messagesBefore) ? cfg.cursor.messagesBefore : 0
+          }
+          : { users: 0, assistants: 0, messages: 0 };
+
+        let bestConversation = cursorMatched
+          ? latestConversation.slice(cursorEntryIndex)
+          : (latestConversation.length > 0 ? latestConversation : readConversationEntries());
         let bestCount = bestConversation.length;
         let bestUserCount = bestConversation.filter((entry) => entry.role === 'user').length;
 
-        if (cfg.hardForce) {
+        if (cursorMatched) {
+          if (cfg.hardForce && cfg.restoreScroll) {
+            setScrollTop(scrollRef, initialScrollTop);
+          }
+        } else if (cfg.hardForce) {
           let stableIterations = 0;
           let prevCount = bestConversation.length;
           let prevTop = getScrollTop(scrollRef);
@@ -14557,14 +15421,14 @@ async function readFullConversationFromTab(tabId, options = {}) {
         const allUserMeta = buildUserMessageMeta(finalConversation);
         const latestUserMeta = buildUserMessageMeta(latestConversationFinal);
         const allMessages = allUserMeta.map((entry) => entry.text);
-        const userCountTotal = allUserMeta.length;
-        const assistantCountTotal = finalConversation.reduce((sum, entry) => (
+        const userCountTotal = conversationBase.users + allUserMeta.length;
+        const assistantCountTotal = conversationBase.assistants + finalConversation.reduce((sum, entry) => (
           sum + (entry.role === 'assistant' ? 1 : 0)
         ), 0);
-        const totalMessages = finalConversation.length;
+        const totalMessages = conversationBase.messages + finalConversation.length;
         const lastUserMessageText = latestUserMeta.length > 0
           ? latestUserMeta[latestUserMeta.length - 1].text
-          : (userCountTotal > 0 ? allUserMeta[userCountTotal - 1].text : '');
+          : (allUserMeta.length > 0 ? allUserMeta[allUserMeta.length - 1].text : '');
 
         const transferLimit = Number.isInteger(cfg.transferUserMetaLimit) && cfg.transferUserMetaLimit > 0
           ? cfg.transferUserMetaLimit
@@ -14600,8 +15464,11 @@ async function readFullConversationFromTab(tabId, options = {}) {
           latestTotalMessages,
           hardForceApplied: !!cfg.hardForce,
           scanDurationMs: Date.now() - startedAt,
-          userMetaTotal: allUserMeta.length,
-          userMetaTruncated: allUserMeta.length > transferLimit,
+          userMetaTotal: userCountTotal,
+          userMetaTruncated: userCountTotal > messages.length,
+          cursorMatched,
+          messageOffset: userCountTotal - messages.length,
+          cursor: buildConversationCursor(finalConversation, conversationBase),
           lastAssistantText,
           messages,
           messageMeta: userMeta
@@ -14613,7 +15480,9 @@ async function readFullConversationFromTab(tabId, options = {}) {
         maxCharsPerMessage,
         transferUserMetaLimit,
         hardForce,
-        restoreScroll
+        restoreScroll,
+        cursor,
+        cursorAnchorSize: COMPANY_CONVERSATION_CURSOR_ANCHOR_SIZE
       }]
     });
 
@@ -20038,6 +20907,10 @@ async function extractRecentUserPromptsFromTab(tabId, maxWaitMs = 12000) {
 
 const COMPANY_PROMPT_MATCH_MIN_SCORE = 180;
 const COMPANY_PROMPT_MATCH_MAX_TOKENS = 1800;
+const COMPANY_PROMPT_MATCH_PREFIX_KEY_LENGTH = 70;
+const COMPANY_PROMPT_MATCH_SUFFIX_KEY_LENGTH = 50;
+const COMPANY_CONVERSATION_CURSOR_ANCHOR_SIZE = 3;
+const COMPANY_CONVERSATION_AUDIT_CACHE_LIMIT = 64;
 
 function extractSentenceWindowSignature(text, startIndex = 0, count = 2) {
   const safeStart = Number.isInteger(startIndex) ? Math.max(startIndex, 0) : 0;
@@ -20115,6 +20988,84 @@ function buildCompanyPromptMatchRecords(prompts) {
   return records;
 }
 
+// Inverted index over the catalog: distinctive tokens plus exact signature/prefix/suffix keys.
+// These cover the token, exact-signature and shared prefix/suffix points of the score; the
+// remaining signals (signature overlap, anchors) are checked directly for non-candidates.
+function buildCompanyPromptMatchIndex(records) {
+  const source = Array.isArray(records) ? records : [];
+  const index = {
+    byToken: new Map(),
+    bySignature: new Map(),
+    byPrefix: new Map(),
+    bySuffix: new Map(),
+    size: source.length
+  };
+  const add = (map, key, position) => {
+    if (!key) return;
+    const positions = map.get(key);
+    if (positions) {
+      if (positions[positions.length - 1] !== position) positions.push(position);
+    } else {
+      map.set(key, [position]);
+    }
+  };
+  source.forEach((record, position) => {
+    (Array.isArray(record?.distinctiveTokens) ? record.distinctiveTokens : [])
+      .forEach((token) => add(index.byToken, token, position));
+    [record?.headSignature, record?.bodySignature, record?.tailSignature]
+      .forEach((signature) => add(index.bySignature, signature, position));
+    if (typeof record?.prefix === 'string' && record.prefix.length >= COMPANY_PROMPT_MATCH_PREFIX_KEY_LENGTH) {
+      add(index.byPrefix, record.prefix.slice(0, COMPANY_PROMPT_MATCH_PREFIX_KEY_LENGTH), position);
+    }
+    if (typeof record?.suffix === 'string' && record.suffix.length >= COMPANY_PROMPT_MATCH_SUFFIX_KEY_LENGTH) {
+      add(index.bySuffix, record.suffix.slice(0, COMPANY_PROMPT_MATCH_SUFFIX_KEY_LENGTH), position);
+    }
+  });
+  return index;
+}
+
+function collectCompanyPromptMatchCandidates(messageFeatures, matchIndex) {
+  const features = messageFeatures && typeof messageFeatures === 'object' ? messageFeatures : {};
+  const candidates = new Set();
+  if (!matchIndex || typeof matchIndex !== 'object') return candidates;
+  const addAll = (positions) => {
+    if (Array.isArray(positions)) positions.forEach((position) => candidates.add(position));
+  };
+  if (features.tokenSet instanceof Set) {
+    features.tokenSet.forEach((token) => addAll(matchIndex.byToken.get(token)));
+  }
+  [features.headSignature, features.bodySignature, features.tailSignature]
+    .forEach((signature) => {
+      if (signature) addAll(matchIndex.bySignature.get(signature));
+    });
+  if (typeof features.prefix === 'string' && features.prefix.length >= COMPANY_PROMPT_MATCH_PREFIX_KEY_LENGTH) {
+    addAll(matchIndex.byPrefix.get(features.prefix.slice(0, COMPANY_PROMPT_MATCH_PREFIX_KEY_LENGTH)));
+  }
+  if (typeof features.suffix === 'string' && features.suffix.length >= COMPANY_PROMPT_MATCH_SUFFIX_KEY_LENGTH) {
+    addAll(matchIndex.bySuffix.get(features.suffix.slice(0, COMPANY_PROMPT_MATCH_SUFFIX_KEY_LENGTH)));
+  }
+  return candidates;
+}
+
+function getCompanyPromptMatchCatalog(prompts = PROMPTS_COMPANY, promptHash = '') {
+  const source = Array.isArray(prompts) ? prompts : [];
+  const stageNames = Array.isArray(STAGE_NAMES_COMPANY) ? STAGE_NAMES_COMPANY : [];
+  const cacheKey = [
+    typeof promptHash === 'string' && promptHash ? promptHash : buildPromptChainHashKey(source),
+    stageNames.join('\u0001')
+  ].join('|');
+  if (companyPromptMatchCatalogCache && companyPromptMatchCatalogCache.key === cacheKey) {
+    return companyPromptMatchCatalogCache;
+  }
+  const records = buildCompanyPromptMatchRecords(source);
+  companyPromptMatchCatalogCache = {
+    key: cacheKey,
+    records,
+    index: buildCompanyPromptMatchIndex(records)
+  };
+  return companyPromptMatchCatalogCache;
+}
+
 function buildConversationMessageMatchFeatures(text) {
   const rawText = typeof text === 'string' ? text : '';
   const normalized = normalizeSentenceSignature(rawText);
@@ -20246,13 +21197,65 @@ function hasStrongCompanyPromptSignal(scoreInfo) {
   return false;
 }
 
-function resolveCompanyPromptAssignments(userMessages, promptRecords) {
-  const messages = Array.isArray(userMessages) ? userMessages : [];
+// True when a prompt can score through a signal the match index does not key on: head/body/tail
+// signature overlap or a prefix/suffix anchor found anywhere in the message.
+function hasUnindexedCompanyPromptSignal(messageFeatures, promptRecord) {
+  const features = messageFeatures && typeof messageFeatures === 'object' ? messageFeatures : {};
+  const record = promptRecord && typeof promptRecord === 'object' ? promptRecord : {};
+  if (
+    signaturesOverlap(features.headSignature, record.headSignature)
+    || signaturesOverlap(features.bodySignature, record.bodySignature)
+    || signaturesOverlap(features.tailSignature, record.tailSignature)
+  ) {
+    return true;
+  }
+  if (typeof features.normalized !== 'string' || !features.normalized) return false;
+  if (
+    typeof record.prefix === 'string'
+    && record.prefix.length >= 140
+    && features.normalized.includes(record.prefix.slice(0, 140))
+  ) {
+    return true;
+  }
+  return typeof record.suffix === 'string'
+    && record.suffix.length >= 140
+    && features.normalized.includes(record.suffix.slice(Math.max(0, record.suffix.length - 140)));
+}
+
+// Index candidates are scored in full. Every other prompt shares no token, exact signature or
+// prefix/suffix key with the message, so its score is provably 0 unless an unindexed signal hits;
+// rows therefore carry the same scores as full-catalog scoring.
+function scoreCompanyPromptMatchRow(messageFeatures, promptRecords, matchIndex = null) {
   const prompts = Array.isArray(promptRecords) ? promptRecords : [];
-  const messageFeatures = messages.map((text) => buildConversationMessageMatchFeatures(text));
-  const scoreMatrix = messageFeatures.map((features) => (
-    prompts.map((record) => computeCompanyPromptMatchScore(features, record))
+  if (!matchIndex) {
+    return prompts.map((record) => computeCompanyPromptMatchScore(messageFeatures, record));
+  }
+  const candidates = collectCompanyPromptMatchCandidates(messageFeatures, matchIndex);
+  return prompts.map((record, position) => (
+    candidates.has(position) || hasUnindexedCompanyPromptSignal(messageFeatures, record)
+      ? computeCompanyPromptMatchScore(messageFeatures, record)
+      : { score: 0, signals: [], primarySignal: 'score_only', tokenHits: 0, prefixLen: 0, suffixLen: 0 }
   ));
+}
+
+function resolveCompanyPromptAssignments(userMessages, promptRecords, options = {}) {
+  const messages = Array.isArray(userMessages) ? userMessages : [];
+  const prompts = Array.isArray(promptRecords) ? promptRecords : [];
+  const matchIndex = options?.index && typeof options.index === 'object' ? options.index : null;
+  const knownScoreRows = Array.isArray(options?.scoreRows) ? options.scoreRows : [];
+  // Rows cached from an earlier audit of the same conversation are reused as-is.
+  const scoreRows = messages.map((text, i) => {
+    const known = knownScoreRows[i];
+    if (known && Array.isArray(known.row) && known.row.length === prompts.length) {
+      return known;
+    }
+    const features = buildConversationMessageMatchFeatures(text);
+    return {
+      hasText: !!features.normalized,
+      row: scoreCompanyPromptMatchRow(features, prompts, matchIndex)
+    };
+  });
+  const scoreMatrix = scoreRows.map((entry) => entry.row);
 
   if (prompts.length === 0) {
     return {
@@ -20260,7 +21263,8 @@ function resolveCompanyPromptAssignments(userMessages, promptRecords) {
         matched: false,
         reason: 'prompt_catalog_empty'
       })),
-      scoreMatrix
+      scoreMatrix,
+      scoreRows
     };
   }
 
@@ -20275,7 +21279,7 @@ function resolveCompanyPromptAssignments(userMessages, promptRecords) {
       const baseScore = prevScores[state];
       if (!Number.isFinite(baseScore)) continue;
 
-      const unmatchedPenalty = messageFeatures[i]?.normalized ? 75 : 40;
+      const unmatchedPenalty = scoreRows[i]?.hasText ? 75 : 40;
       const unmatchedScore = baseScore - unmatchedPenalty;
       if (unmatchedScore > nextScores[state]) {
         nextScores[state] = unmatchedScore;
@@ -20419,7 +21423,123 @@ function resolveCompanyPromptAssignments(userMessages, promptRecords) {
 
   return {
     assignments,
-    scoreMatrix
+    scoreMatrix,
+    scoreRows
+  };
+}
+
+function getCompanyConversationAuditCacheKey(tabId, conversationUrl) {
+  const normalizedUrl = normalizeChatConversationUrl(conversationUrl);
+  if (!Number.isInteger(tabId) || !normalizedUrl) return '';
+  return `${tabId}|${normalizedUrl}`;
+}
+
+function rememberCompanyConversationAudit(cacheKey, entry) {
+  if (!cacheKey || !entry || typeof entry !== 'object') return;
+  companyConversationAuditCache.delete(cacheKey);
+  companyConversationAuditCache.set(cacheKey, entry);
+  while (companyConversationAuditCache.size > COMPANY_CONVERSATION_AUDIT_CACHE_LIMIT) {
+    const oldestKey = companyConversationAuditCache.keys().next().value;
+    companyConversationAuditCache.delete(oldestKey);
+  }
+}
+
+// Reads the conversation for an audit, reusing the previous audit of the same conversation:
+// the page only scrolls/transfers messages from the cursor anchor onward and cached score rows
+// are kept for everything before it.
+async function scanCompanyConversationForAudit(tabId, conversationUrl, options = {}) {
+  const catalogKey = typeof options?.catalogKey === 'string' ? options.catalogKey : '';
+  const transferUserMetaLimit = Number.isInteger(options?.transferUserMetaLimit) && options.transferUserMetaLimit > 0
+    ? options.transferUserMetaLimit
+    : 1200;
+  const cacheKey = getCompanyConversationAuditCacheKey(tabId, conversationUrl);
+  const cached = cacheKey ? companyConversationAuditCache.get(cacheKey) : null;
+  const cursorUsable = !!(
+    cached
+    && cached.catalogKey === catalogKey
+    && cached.cursor
+    && (cached.messageOffset === 0 || cached.transferUserMetaLimit >= transferUserMetaLimit)
+  );
+  const scanOptions = {
+    maxWaitMs: options?.maxWaitMs,
+    transferUserMetaLimit,
+    hardForce: true,
+    restoreScroll: true
+  };
+
+  let scanned = await readFullConversationFromTab(tabId, {
+    ...scanOptions,
+    cursor: cursorUsable ? cached.cursor : null
+  });
+  if (!scanned?.success) {
+    return { scanned, scoreRows: [], cacheKey, cursorReused: false };
+  }
+
+  const toEntries = (payload) => {
+    const texts = Array.isArray(payload?.messages) ? payload.messages : [];
+    const meta = Array.isArray(payload?.messageMeta) ? payload.messageMeta : [];
+    return texts.map((text, i) => ({
+      text: typeof text === 'string' ? text : '',
+      meta: meta[i] && typeof meta[i] === 'object' ? meta[i] : {},
+      score: null
+    }));
+  };
+
+  let entries = toEntries(scanned);
+  let messageOffset = Number.isInteger(scanned.messageOffset)
+    ? scanned.messageOffset
+    : Math.max(0, (Number.isInteger(scanned.count) ? scanned.count : entries.length) - entries.length);
+  let cursorReused = false;
+  if (scanned.cursorMatched === true && cursorUsable) {
+    const keepCount = messageOffset - cached.messageOffset;
+    const keptEntries = keepCount >= 0 && keepCount <= cached.entries.length
+      ? cached.entries.slice(0, keepCount)
+      : null;
+    if (keptEntries && keptEntries.every((entry) => entry.score)) {
+      entries = keptEntries.concat(entries);
+      messageOffset = cached.messageOffset;
+      cursorReused = true;
+    } else {
+      scanned = await readFullConversationFromTab(tabId, scanOptions);
+      if (!scanned?.success) {
+        return { scanned, scoreRows: [], cacheKey, cursorReused: false };
+      }
+      entries = toEntries(scanned);
+      messageOffset = Number.isInteger(scanned.messageOffset) ? scanned.messageOffset : 0;
+    }
+  }
+  if (entries.length > transferUserMetaLimit) {
+    messageOffset += entries.length - transferUserMetaLimit;
+    entries = entries.slice(-transferUserMetaLimit);
+  }
+
+  return {
+    scanned: {
+      ...scanned,
+      messages: entries.map((entry) => entry.text),
+      messageMeta: entries.map((entry) => entry.meta),
+      userMetaTruncated: messageOffset > 0
+    },
+    scoreRows: entries.map((entry) => entry.score),
+    cacheKey,
+    cursorReused,
+    remember(scoreRows) {
+      if (!cacheKey || !scanned.cursor) return;
+      const rows = Array.isArray(scoreRows) ? scoreRows : [];
+      rememberCompanyConversationAudit(cacheKey, {
+        catalogKey,
+        cursor: scanned.cursor,
+        messageOffset,
+        transferUserMetaLimit,
+        updatedAt: Date.now(),
+        // Only the preview-sized prefix of each message is needed once its score row is known.
+        entries: entries.map((entry, i) => ({
+          text: compactWhitespace(entry.text).slice(0, 181),
+          meta: entry.meta,
+          score: rows[i] && Array.isArray(rows[i].row) ? rows[i] : null
+        }))
+      });
+    }
   };
 }
 
@@ -20451,12 +21571,13 @@ async function countCompanyConversationMessages(tabId, options = {}) {
   const maxWaitMs = Number.isInteger(options?.maxWaitMs) && options.maxWaitMs >= 6000
     ? Math.min(options.maxWaitMs, 45000)
     : 18000;
-  const scanned = await readFullConversationFromTab(tabId, {
+  const promptCatalog = getCompanyPromptMatchCatalog(PROMPTS_COMPANY, await getCompanyPromptHash());
+  const conversationScan = await scanCompanyConversationForAudit(tabId, targetUrl, {
     maxWaitMs,
     transferUserMetaLimit: 1200,
-    hardForce: true,
-    restoreScroll: true
+    catalogKey: promptCatalog.key
   });
+  const scanned = conversationScan.scanned;
   if (!scanned?.success) {
     return {
       success: false,
@@ -20482,7 +21603,7 @@ async function countCompanyConversationMessages(tabId, options = {}) {
       return rightTs - leftTs;
     })[0] || null;
 
-  const promptRecords = buildCompanyPromptMatchRecords(PROMPTS_COMPANY);
+  const promptRecords = promptCatalog.records;
   const promptStats = new Map();
   promptRecords.forEach((entry) => {
     if (!Number.isInteger(entry?.promptNumber) || entry.promptNumber <= 0) return;
@@ -20500,7 +21621,11 @@ async function countCompanyConversationMessages(tabId, options = {}) {
 
   const userMessages = Array.isArray(scanned?.messages) ? scanned.messages : [];
   const userMeta = Array.isArray(scanned?.messageMeta) ? scanned.messageMeta : [];
-  const assignmentResult = resolveCompanyPromptAssignments(userMessages, promptRecords);
+  const assignmentResult = resolveCompanyPromptAssignments(userMessages, promptRecords, {
+    index: promptCatalog.index,
+    scoreRows: conversationScan.scoreRows
+  });
+  conversationScan.remember(assignmentResult?.scoreRows);
   const assignments = Array.isArray(assignmentResult?.assignments)
     ? assignmentResult.assignments
     : [];
@@ -24480,7 +25605,7 @@ function ensureCanonicalResponseStorageReady() {
       canonicalResponseStorageReady = null;
       console.warn('[storage] Canonical response migration failed:', error?.message || error);
       return {
-        responses: [],
+        responseCount: 0,
         rewritten: false,
         migratedSessionCount: 0
       };
@@ -24494,6 +25619,11 @@ async function readCanonicalResponsesFromStorage() {
   return ResponseStorageUtils.readCanonicalResponses(getResponseStorageAreas(), DecisionContractUtils);
 }
 
+async function readCanonicalResponseCountFromStorage() {
+  await ensureCanonicalResponseStorageReady();
+  return ResponseStorageUtils.readCanonicalResponseCount(getResponseStorageAreas());
+}
+
 async function upsertCanonicalResponseToStorage(responseRecord, options = {}) {
   return withResponseStorageMutationLock(async () => {
     return ResponseStorageUtils.upsertCanonicalResponse(
@@ -24556,15 +25686,25 @@ async function readWatchlistDispatchHistory() {
 async function appendWatchlistDispatchHistory(entry) {
   const storageKey = WATCHLIST_DISPATCH.historyStorageKey;
   if (!storageKey || !chrome?.storage?.local?.get || !chrome?.storage?.local?.set) return;
-  try {
-    const snapshot = await chrome.storage.local.get([storageKey]);
-    const current = sanitizeWatchlistDispatchHistory(snapshot?.[storageKey]);
-    const normalizedEntry = sanitizeWatchlistDispatchHistory([entry])[0];
-    const next = sanitizeWatchlistDispatchHistory([...current, normalizedEntry]);
-    await chrome.storage.local.set({ [storageKey]: next });
-  } catch (error) {
-    console.warn('[copy-flow] [dispatch:history-write-failed]', error);
-  }
+  // Concurrent flush workers append in bursts; entries queued while a write is running
+  // are coalesced into the next read-modify-write instead of racing each other.
+  watchlistDispatchHistoryPendingEntries.push(entry);
+  const write = watchlistDispatchHistoryWriteQueue.then(async () => {
+    const entries = watchlistDispatchHistoryPendingEntries;
+    watchlistDispatchHistoryPendingEntries = [];
+    if (entries.length === 0) return;
+    try {
+      const snapshot = await chrome.storage.local.get([storageKey]);
+      const current = sanitizeWatchlistDispatchHistory(snapshot?.[storageKey]);
+      const normalizedEntries = sanitizeWatchlistDispatchHistory(entries);
+      const next = sanitizeWatchlistDispatchHistory([...current, ...normalizedEntries]);
+      await chrome.storage.local.set({ [storageKey]: next });
+    } catch (error) {
+      console.warn('[copy-flow] [dispatch:history-write-failed]', error);
+    }
+  });
+  watchlistDispatchHistoryWriteQueue = write.catch(() => {});
+  return write;
 }
 
 function normalizeWatchlistDispatchProcessLogLevel(rawLevel) {
@@ -26270,6 +27410,200 @@ function summarizeWatchlistVerifyResult(result) {
   };
 }
 
+// Signs `body` with the dispatch HMAC headers and POSTs it to one verify URL, aborting after
+// timeoutMs. Single-item and batch verify both go through here so their signing stays identical.
+async function postSignedWatchlistVerifyRequest(url, body, dispatchConfig, timeoutMs) {
+  const urlObject = new URL(url);
+  const timestamp = Math.floor(Date.now() / 1000).toString();
+  const nonce = generateWatchlistNonce();
+  const bodyHash = await sha256HexForDispatch(body);
+  const canonical = buildWatchlistCanonicalString({
+    method: 'POST',
+    path: urlObject.pathname || '/',
+    timestamp,
+    nonce,
+    bodyHash,
+  });
+  const signature = await hmacSha256Hex(dispatchConfig.secret, canonical);
+  const controller = new AbortController();
+  let timeoutId = null;
+  try {
+    return await Promise.race([
+      fetch(url, {
+        method: 'POST',
+        headers: {
+          'Content-Type': 'application/json',
+          'X-Watchlist-Key-Id': dispatchConfig.keyId,
+          'X-Watchlist-Timestamp': timestamp,
+          'X-Watchlist-Nonce': nonce,
+          'X-Watchlist-Signature': signature,
+        },
+        body,
+        signal: controller.signal
+      }),
+      new Promise((_, reject) => {
+        timeoutId = setTimeout(() => {
+          try {
+            controller.abort();
+          } catch {
+            // Ignore abort exceptions in timeout branch.
+          }
+          reject(createDispatchTimeoutError(timeoutMs));
+        }, timeoutMs);
+      })
+    ]);
+  } finally {
+    if (timeoutId) {
+      clearTimeout(timeoutId);
+    }
+  }
+}
+
+// Settles one verify answer (single-item response body or one `results[]` entry of a batch) into
+// the flush result shape, logging and recording history the same way for both paths.
+async function settleWatchlistVerifyPayload(item, copyTrace, resultJson, meta = {}) {
+  const payload = item?.payload && typeof item.payload === 'object' ? item.payload : {};
+  const responseId = typeof meta.responseId === 'string' && meta.responseId.trim()
+    ? meta.responseId.trim()
+    : (typeof payload?.responseId === 'string' ? payload.responseId.trim() : '');
+  const runId = typeof payload?.runId === 'string' ? payload.runId.trim() : '';
+  const traceForHistory = (typeof copyTrace === 'string' && copyTrace.trim())
+    ? copyTrace.trim()
+    : buildCopyTrace(runId, responseId);
+  const state = normalizeWatchlistVerifyState(resultJson?.state);
+  const reason = typeof resultJson?.reason === 'string' && resultJson.reason.trim()
+    ? resultJson.reason.trim()
+    : state;
+  const eventId = normalizeWatchlistEventId(resultJson?.event_id || meta.eventId || item?.deliveryEventId);
+  const requestId = meta.requestId || '';
+  const intakeUrl = meta.url || '';
+  const status = Number.isInteger(meta.status) ? meta.status : null;
+  const materializedRowCount = Number.isInteger(resultJson?.materialized_row_count)
+    ? resultJson.materialized_row_count
+    : null;
+  const expectedMaterializedRowCount = Number.isInteger(resultJson?.expected_materialized_row_count)
+    ? resultJson.expected_materialized_row_count
+    : null;
+  const logDetails = {
+    trace: copyTrace,
+    intakeUrl,
+    responseId,
+    eventId,
+    requestId
+  };
+  if (meta.batch === true) {
+    logDetails.batch = true;
+  }
+  const base = {
+    eventId,
+    requestId,
+    intakeUrl,
+    status,
+    materializedRowCount,
+    expectedMaterializedRowCount
+  };
+
+  if (resultJson?.success === true && state === 'verified') {
+    emitWatchlistDispatchProcessLog('info', 'verify_attempt_ok', 'Dispatch verification succeeded', {
+      ...logDetails,
+      materializedRowCount,
+      expectedMaterializedRowCount
+    });
+    appendWatchlistDispatchHistory({
+      ts: Date.now(),
+      kind: 'verify',
+      reason: 'verified',
+      success: true,
+      queued: 0,
+      sent: 1,
+      failed: 0,
+      deferred: 0,
+      remaining: 0,
+      trace: traceForHistory,
+      runId,
+      responseId,
+      eventId,
+      requestId,
+      intakeUrl,
+      status
+    }).catch(() => {});
+    await updateProcessDispatchAfterSendSuccess(runId, responseId, {
+      status,
+      eventId,
+      requestId,
+      intakeUrl
+    }).catch((error) => {
+      console.warn('[copy-flow] [dispatch:process-update-failed]', {
+        runId,
+        responseId,
+        error: error?.message || String(error)
+      });
+    });
+    return {
+      ...base,
+      success: true,
+      pending: false,
+      state,
+      reason: reason || 'verified',
+      stage: 'verify_state'
+    };
+  }
+
+  if (isWatchlistVerificationPendingState(state)) {
+    emitWatchlistDispatchProcessLog('info', 'verify_attempt_pending', 'Dispatch verification pending materialization', {
+      ...logDetails,
+      state,
+      reason,
+      materializedRowCount,
+      expectedMaterializedRowCount
+    });
+    return {
+      ...base,
+      success: false,
+      pending: true,
+      state: state || 'materialization_pending',
+      reason: reason || state || 'materialization_pending',
+      stage: 'verify_state'
+    };
+  }
+
+  const failureReason = reason || state || 'verify_failed';
+  emitWatchlistDispatchProcessLog('error', 'verify_attempt_failed', 'Dispatch verification failed', {
+    ...logDetails,
+    state: state || '',
+    reason: failureReason,
+    materializedRowCount,
+    expectedMaterializedRowCount
+  });
+  appendWatchlistDispatchHistory({
+    ts: Date.now(),
+    kind: 'verify',
+    reason: failureReason,
+    success: false,
+    queued: 0,
+    sent: 0,
+    failed: 1,
+    deferred: 0,
+    remaining: 0,
+    trace: traceForHistory,
+    runId,
+    responseId,
+    eventId,
+    requestId,
+    intakeUrl,
+    status
+  }).catch(() => {});
+  return {
+    ...base,
+    success: false,
+    pending: false,
+    state: state || '',
+    reason: failureReason,
+    error: failureReason,
+    stage: isWatchlistVerificationTerminalState(state) ? 'verify_state' : 'verify_http'
+  };
+}
+
 async function verifyWatchlistDispatchDelivery(item, copyTrace = 'no-run/no-response', options = {}) {
   const payload = item?.payload && typeof item.payload === 'object' ? item.payload : null;
   if (!payload) {
@@ -26281,12 +27615,9 @@ async function verifyWatchlistDispatchDelivery(item, copyTrace = 'no-run/no-resp
     };
   }
 
-  const problemLogSchema = typeof PROBLEM_LOG_REMOTE_SCHEMA === 'string'
-    ? PROBLEM_LOG_REMOTE_SCHEMA.trim().toLowerCase()
-    : 'iskra.problem_log.v1';
-  const normalizedSchema = typeof payload?.schema === 'string' ? payload.schema.trim().toLowerCase() : '';
-  const normalizedAnalysisType = typeof payload?.analysisType === 'string' ? payload.analysisType.trim().toLowerCase() : '';
-  if (normalizedSchema === problemLogSchema || normalizedAnalysisType.startsWith('problem_log')) {
+  if (isWatchlistProblemLogPayload(payload)) {
+    const normalizedSchema = typeof payload?.schema === 'string' ? payload.schema.trim().toLowerCase() : '';
+    const normalizedAnalysisType = typeof payload?.analysisType === 'string' ? payload.analysisType.trim().toLowerCase() : '';
     const responseId = typeof payload?.responseId === 'string' ? payload.responseId.trim() : '';
     const runId = typeof payload?.runId === 'string' ? payload.runId.trim() : '';
     const traceForHistory = (typeof copyTrace === 'string' && copyTrace.trim())
@@ -26302,7 +27633,7 @@ async function verifyWatchlistDispatchDelivery(item, copyTrace = 'no-run/no-resp
       eventId,
       requestId,
       intakeUrl,
-      schema: normalizedSchema || problemLogSchema,
+      schema: normalizedSchema || PROBLEM_LOG_REMOTE_SCHEMA,
       analysisType: normalizedAnalysisType || ''
     });
     appendWatchlistDispatchHistory({
@@ -26413,55 +27744,14 @@ async function verifyWatchlistDispatchDelivery(item, copyTrace = 'no-run/no-resp
   };
 
   for (const url of urlCandidates) {
-    const urlObject = new URL(url);
-    const controller = new AbortController();
-    let timeoutId = null;
     try {
-      const timestamp = Math.floor(Date.now() / 1000).toString();
-      const nonce = generateWatchlistNonce();
-      const bodyHash = await sha256HexForDispatch(body);
-      const canonical = buildWatchlistCanonicalString({
-        method: 'POST',
-        path: urlObject.pathname || '/',
-        timestamp,
-        nonce,
-        bodyHash,
-      });
-      const signature = await hmacSha256Hex(dispatchConfig.secret, canonical);
       emitWatchlistDispatchProcessLog('info', 'verify_attempt_start', 'Dispatch verification attempt started', {
         trace: copyTrace,
         intakeUrl: url,
         responseId,
         eventId: bodyPayload.eventId || ''
       });
-      const response = await Promise.race([
-        fetch(url, {
-          method: 'POST',
-          headers: {
-            'Content-Type': 'application/json',
-            'X-Watchlist-Key-Id': dispatchConfig.keyId,
-            'X-Watchlist-Timestamp': timestamp,
-            'X-Watchlist-Nonce': nonce,
-            'X-Watchlist-Signature': signature,
-          },
-          body,
-          signal: controller.signal
-        }),
-        new Promise((_, reject) => {
-          timeoutId = setTimeout(() => {
-            try {
-              controller.abort();
-            } catch {
-              // Ignore abort exceptions in timeout branch.
-            }
-            reject(createDispatchTimeoutError(timeoutMs));
-          }, timeoutMs);
-        })
-      ]);
-      if (timeoutId) {
-        clearTimeout(timeoutId);
-        timeoutId = null;
-      }
+      const response = await postSignedWatchlistVerifyRequest(url, body, dispatchConfig, timeoutMs);
 
       if (!response.ok) {
         const errorText = await response.text().catch(() => '');
@@ -26481,149 +27771,14 @@ async function verifyWatchlistDispatchDelivery(item, copyTrace = 'no-run/no-resp
 
       const requestId = response.headers?.get?.('x-request-id') || response.headers?.get?.('x-correlation-id') || '';
       const responseJson = await response.json().catch(() => ({}));
-      const state = normalizeWatchlistVerifyState(responseJson?.state);
-      const reason = typeof responseJson?.reason === 'string' && responseJson.reason.trim()
-        ? responseJson.reason.trim()
-        : state;
-      const eventId = normalizeWatchlistEventId(responseJson?.event_id || bodyPayload.eventId || item?.deliveryEventId);
-      const materializedRowCount = Number.isInteger(responseJson?.materialized_row_count)
-        ? responseJson.materialized_row_count
-        : null;
-      const expectedMaterializedRowCount = Number.isInteger(responseJson?.expected_materialized_row_count)
-        ? responseJson.expected_materialized_row_count
-        : null;
-
-      if (responseJson?.success === true && state === 'verified') {
-        emitWatchlistDispatchProcessLog('info', 'verify_attempt_ok', 'Dispatch verification succeeded', {
-          trace: copyTrace,
-          intakeUrl: url,
-          responseId,
-          eventId,
-          requestId,
-          materializedRowCount,
-          expectedMaterializedRowCount
-        });
-        appendWatchlistDispatchHistory({
-          ts: Date.now(),
-          kind: 'verify',
-          reason: 'verified',
-          success: true,
-          queued: 0,
-          sent: 1,
-          failed: 0,
-          deferred: 0,
-          remaining: 0,
-          trace: traceForHistory,
-          runId,
-          responseId,
-          eventId,
-          requestId,
-          intakeUrl: url,
-          status: response.status
-        }).catch(() => {});
-        await updateProcessDispatchAfterSendSuccess(runId, responseId, {
-          status: response.status,
-          eventId,
-          requestId,
-          intakeUrl: url
-        }).catch((error) => {
-          console.warn('[copy-flow] [dispatch:process-update-failed]', {
-            runId,
-            responseId,
-            error: error?.message || String(error)
-          });
-        });
-        return {
-          success: true,
-          pending: false,
-          state,
-          reason: reason || 'verified',
-          eventId,
-          requestId,
-          intakeUrl: url,
-          status: response.status,
-          stage: 'verify_state',
-          materializedRowCount,
-          expectedMaterializedRowCount
-        };
-      }
-
-      if (isWatchlistVerificationPendingState(state)) {
-        emitWatchlistDispatchProcessLog('info', 'verify_attempt_pending', 'Dispatch verification pending materialization', {
-          trace: copyTrace,
-          intakeUrl: url,
-          responseId,
-          eventId,
-          requestId,
-          state,
-          reason,
-          materializedRowCount,
-          expectedMaterializedRowCount
-        });
-        return {
-          success: false,
-          pending: true,
-          state: state || 'materialization_pending',
-          reason: reason || state || 'materialization_pending',
-          eventId,
-          requestId,
-          intakeUrl: url,
-          status: response.status,
-          stage: 'verify_state',
-          materializedRowCount,
-          expectedMaterializedRowCount
-        };
-      }
-
-      const failureReason = reason || state || 'verify_failed';
-      emitWatchlistDispatchProcessLog('error', 'verify_attempt_failed', 'Dispatch verification failed', {
-        trace: copyTrace,
-        intakeUrl: url,
-        responseId,
-        eventId,
+      return settleWatchlistVerifyPayload(item, copyTrace, responseJson, {
+        url,
         requestId,
-        state: state || '',
-        reason: failureReason,
-        materializedRowCount,
-        expectedMaterializedRowCount
-      });
-      appendWatchlistDispatchHistory({
-        ts: Date.now(),
-        kind: 'verify',
-        reason: failureReason,
-        success: false,
-        queued: 0,
-        sent: 0,
-        failed: 1,
-        deferred: 0,
-        remaining: 0,
-        trace: traceForHistory,
-        runId,
-        responseId,
-        eventId,
-        requestId,
-        intakeUrl: url,
-        status: response.status
-      }).catch(() => {});
-      return {
-        success: false,
-        pending: false,
-        state: state || '',
-        reason: failureReason,
-        error: failureReason,
-        eventId,
-        requestId,
-        intakeUrl: url,
         status: response.status,
-        stage: isWatchlistVerificationTerminalState(state) ? 'verify_state' : 'verify_http',
-        materializedRowCount,
-        expectedMaterializedRowCount
-      };
+        responseId,
+        eventId: bodyPayload.eventId
+      });
     } catch (error) {
-      if (timeoutId) {
-        clearTimeout(timeoutId);
-        timeoutId = null;
-      }
       const errorMessage = error?.message || String(error);
       const dispatchMeta = error?.dispatchMeta && typeof error.dispatchMeta === 'object'
         ? error.dispatchMeta
@@ -27142,6 +28297,341 @@ function normalizeWatchlistFlushReason(rawReason, fallback = 'manual') {
   return trimmed.slice(0, 80);
 }
 
+function resolveWatchlistFlushConcurrency() {
+  return Number.isInteger(WATCHLIST_DISPATCH.flushConcurrency) && WATCHLIST_DISPATCH.flushConcurrency > 0
+    ? WATCHLIST_DISPATCH.flushConcurrency
+    : 1;
+}
+
+function resolveWatchlistFlushHostKey(rawUrl) {
+  const value = typeof rawUrl === 'string' ? rawUrl.trim() : '';
+  if (!value) return '';
+  try {
+    return new URL(value).host.toLowerCase();
+  } catch {
+    return '';
+  }
+}
+
+// In-flight limits shared by every pool of one flush run, so overlapping send and verify
+// stages together stay within flushConcurrency and flushMaxInFlightPerHost.
+function createWatchlistFlushBudget(options = {}) {
+  const concurrency = Number.isInteger(options?.concurrency) && options.concurrency > 0
+    ? options.concurrency
+    : 1;
+  const maxPerHost = Number.isInteger(options?.maxPerHost) && options.maxPerHost > 0
+    ? options.maxPerHost
+    : concurrency;
+  return {
+    concurrency,
+    maxPerHost,
+    active: 0,
+    inFlightByHost: new Map(),
+    pumps: new Set()
+  };
+}
+
+async function runWatchlistFlushPool(entries, worker, options = {}) {
+  const queue = Array.isArray(entries) ? entries.slice() : [];
+  const budget = options?.budget && typeof options.budget === 'object'
+    ? options.budget
+    : createWatchlistFlushBudget(options);
+  const { inFlightByHost } = budget;
+  const getHost = typeof options?.getHost === 'function' ? options.getHost : () => '';
+  const shouldStart = typeof options?.shouldStart === 'function' ? options.shouldStart : () => true;
+  let running = 0;
+
+  if (queue.length === 0) return;
+  await new Promise((resolve) => {
+    const pump = () => {
+      while (budget.active < budget.concurrency && queue.length > 0) {
+        // Keep queue order, but skip past entries whose host is already saturated.
+        const nextIndex = queue.findIndex((entry) => (inFlightByHost.get(getHost(entry)) || 0) < budget.maxPerHost);
+        if (nextIndex < 0) break;
+        const [entry] = queue.splice(nextIndex, 1);
+        if (!shouldStart(entry)) {
+          entry.budgetSkipped = true;
+          continue;
+        }
+        const host = getHost(entry);
+        inFlightByHost.set(host, (inFlightByHost.get(host) || 0) + 1);
+        budget.active += 1;
+        running += 1;
+        Promise.resolve()
+          .then(() => worker(entry))
+          .catch((error) => {
+            entry.workerError = error;
+          })
+          .finally(() => {
+            inFlightByHost.set(host, Math.max(0, (inFlightByHost.get(host) || 1) - 1));
+            budget.active -= 1;
+            running -= 1;
+            // A freed slot may unblock any pool sharing this budget, not just this one.
+            Array.from(budget.pumps).forEach((sharedPump) => sharedPump());
+          });
+      }
+      if (running === 0 && queue.length === 0) {
+        budget.pumps.delete(pump);
+        resolve();
+      }
+    };
+    budget.pumps.add(pump);
+    pump();
+  });
+}
+
+function isWatchlistProblemLogPayload(payload) {
+  const problemLogSchema = typeof PROBLEM_LOG_REMOTE_SCHEMA === 'string'
+    ? PROBLEM_LOG_REMOTE_SCHEMA.trim().toLowerCase()
+    : 'iskra.problem_log.v1';
+  const normalizedSchema = typeof payload?.schema === 'string' ? payload.schema.trim().toLowerCase() : '';
+  const normalizedAnalysisType = typeof payload?.analysisType === 'string' ? payload.analysisType.trim().toLowerCase() : '';
+  return normalizedSchema === problemLogSchema || normalizedAnalysisType.startsWith('problem_log');
+}
+
+function getWatchlistVerifyEntryItem(entry) {
+  return entry?.acceptedItem || entry?.item || null;
+}
+
+function isWatchlistVerifyBatchUnsupportedStatus(status) {
+  return status === 400 || status === 404 || status === 405 || status === 413 || status === 415 || status === 422;
+}
+
+// Verifies several accepted deliveries with one signed POST of `{ items: [...] }` to the
+// verify endpoint. Returns null when the server does not speak the batch shape, so the
+// caller can fall back to per-item verification; missing per-item results are left null.
+async function verifyWatchlistDispatchDeliveryBatch(entries, options = {}) {
+  const batch = Array.isArray(entries) ? entries.filter((entry) => getWatchlistVerifyEntryItem(entry)?.payload) : [];
+  if (batch.length === 0) return [];
+  const dispatchConfig = options?.dispatchConfig && options.dispatchConfig.ok
+    ? options.dispatchConfig
+    : await resolveWatchlistDispatchConfiguration();
+  if (!dispatchConfig.ok) {
+    return {
+      success: false,
+      pending: true,
+      reason: dispatchConfig.reason || 'missing_dispatch_credentials',
+      stage: 'verify_config'
+    };
+  }
+
+  const firstItem = getWatchlistVerifyEntryItem(batch[0]);
+  const verifyBaseUrl = typeof firstItem?.deliveryIntakeUrl === 'string' && firstItem.deliveryIntakeUrl.trim()
+    ? firstItem.deliveryIntakeUrl.trim()
+    : dispatchConfig.intakeUrl;
+  const urlCandidates = buildWatchlistVerifyUrlCandidates(verifyBaseUrl);
+  if (urlCandidates.length === 0) {
+    return {
+      success: false,
+      pending: true,
+      reason: 'missing_verify_url',
+      error: 'missing_verify_url',
+      stage: 'verify_config'
+    };
+  }
+
+  const bodyItems = batch.map((entry) => {
+    const item = getWatchlistVerifyEntryItem(entry);
+    return buildWatchlistVerifyPayload(item.payload, item);
+  });
+  const body = JSON.stringify({ items: bodyItems });
+  const timeoutMs = Number.isInteger(options?.timeoutMs) && options.timeoutMs > 0
+    ? Math.max(1000, options.timeoutMs)
+    : Math.max(1000, Number(WATCHLIST_DISPATCH.verifyTimeoutMs || 0) || 12000);
+  let lastFailure = {
+    success: false,
+    pending: true,
+    reason: 'verify_failed',
+    error: 'verify_failed',
+    stage: 'verify_http',
+    status: null,
+    intakeUrl: ''
+  };
+
+  for (const url of urlCandidates) {
+    try {
+      const response = await postSignedWatchlistVerifyRequest(url, body, dispatchConfig, timeoutMs);
+
+      if (!response.ok) {
+        if (isWatchlistVerifyBatchUnsupportedStatus(response.status)) {
+          emitWatchlistDispatchProcessLog('warn', 'verify_batch_unsupported', 'Batch verify rejected; falling back to per-item verify', {
+            intakeUrl: url,
+            status: response.status,
+            items: batch.length
+          });
+          return { unsupported: true };
+        }
+        lastFailure = {
+          success: false,
+          pending: true,
+          reason: 'http_error',
+          error: `HTTP ${response.status}`,
+          stage: 'verify_http',
+          status: response.status,
+          intakeUrl: url
+        };
+        continue;
+      }
+
+      const requestId = response.headers?.get?.('x-request-id') || response.headers?.get?.('x-correlation-id') || '';
+      const responseJson = await response.json().catch(() => ({}));
+      if (!Array.isArray(responseJson?.results)) {
+        emitWatchlistDispatchProcessLog('warn', 'verify_batch_unsupported', 'Batch verify returned no results; falling back to per-item verify', {
+          intakeUrl: url,
+          status: response.status,
+          items: batch.length
+        });
+        return { unsupported: true };
+      }
+      const resultByResponseId = new Map();
+      responseJson.results.forEach((result) => {
+        const responseId = typeof result?.response_id === 'string'
+          ? result.response_id.trim()
+          : (typeof result?.responseId === 'string' ? result.responseId.trim() : '');
+        if (responseId) resultByResponseId.set(responseId, result);
+      });
+      emitWatchlistDispatchProcessLog('info', 'verify_batch_ok', 'Batch dispatch verification returned', {
+        intakeUrl: url,
+        requestId,
+        items: batch.length,
+        results: resultByResponseId.size
+      });
+      return Promise.all(batch.map((entry, index) => {
+        const result = resultByResponseId.get(bodyItems[index].responseId);
+        if (!result) return null;
+        return settleWatchlistVerifyPayload(getWatchlistVerifyEntryItem(entry), entry.trace, result, {
+          url,
+          requestId,
+          status: response.status,
+          responseId: bodyItems[index].responseId,
+          eventId: bodyItems[index].eventId,
+          batch: true
+        });
+      }));
+    } catch (error) {
+      const errorMessage = error?.message || String(error);
+      lastFailure = {
+        success: false,
+        pending: true,
+        reason: error?.dispatchMeta?.reason || (
+          error?.name === 'AbortError' || error?.name === 'TimeoutError' ? 'timeout' : 'dispatch_error'
+        ),
+        error: errorMessage,
+        stage: 'verify_http',
+        status: null,
+        intakeUrl: url
+      };
+      emitWatchlistDispatchProcessLog('warn', 'verify_batch_retry', 'Batch dispatch verification failed on candidate URL', {
+        intakeUrl: url,
+        items: batch.length,
+        error: truncateDispatchLogText(errorMessage, 400)
+      });
+    }
+  }
+  return lastFailure;
+}
+
+// Verification stage of the flush: problem-log payloads and single leftovers go through
+// verifyWatchlistDispatchDelivery; everything else is grouped per verify host into batches.
+async function verifyWatchlistOutboxEntries(entries, options = {}) {
+  const pending = Array.isArray(entries) ? entries.filter(Boolean) : [];
+  if (pending.length === 0) return;
+  const timeoutMs = Math.max(1000, Number(WATCHLIST_DISPATCH.verifyTimeoutMs || 0) || 12000);
+  const batchMaxItems = Number.isInteger(WATCHLIST_DISPATCH.verifyBatchMaxItems) && WATCHLIST_DISPATCH.verifyBatchMaxItems > 1
+    ? WATCHLIST_DISPATCH.verifyBatchMaxItems
+    : 1;
+  const batchEnabled = WATCHLIST_DISPATCH.verifyBatchEnabled === true
+    && batchMaxItems > 1
+    && watchlistVerifyBatchUnsupportedUntil <= Date.now();
+  const individual = [];
+  const groups = new Map();
+
+  pending.forEach((entry) => {
+    if (!batchEnabled || isWatchlistProblemLogPayload(getWatchlistVerifyEntryItem(entry)?.payload)) {
+      individual.push(entry);
+      return;
+    }
+    const host = resolveWatchlistFlushHostKey(getWatchlistVerifyEntryItem(entry)?.deliveryIntakeUrl);
+    if (!groups.has(host)) groups.set(host, []);
+    groups.get(host).push(entry);
+  });
+
+  const batches = [];
+  groups.forEach((groupEntries) => {
+    for (let offset = 0; offset < groupEntries.length; offset += batchMaxItems) {
+      const chunk = groupEntries.slice(offset, offset + batchMaxItems);
+      if (chunk.length === 1) {
+        individual.push(chunk[0]);
+      } else {
+        batches.push(chunk);
+      }
+    }
+  });
+
+  const dispatchConfig = batches.length > 0 ? await resolveWatchlistDispatchConfiguration() : null;
+  await runWatchlistFlushPool(batches, async (chunk) => {
+    const results = await verifyWatchlistDispatchDeliveryBatch(chunk, { timeoutMs, dispatchConfig });
+    if (results?.unsupported === true) {
+      watchlistVerifyBatchUnsupportedUntil = Date.now() + (
+        Number.isInteger(WATCHLIST_DISPATCH.verifyBatchUnsupportedTtlMs) ? WATCHLIST_DISPATCH.verifyBatchUnsupportedTtlMs : 0
+      );
+      individual.push(...chunk);
+      return;
+    }
+    if (!Array.isArray(results)) {
+      // Transient failure (5xx, timeout, network): keep batch verify on and let every item retry
+      // on its own verify backoff instead of bursting per-item requests at a failing server.
+      chunk.forEach((entry) => {
+        entry.verifyResult = {
+          ...(results || { success: false, pending: true, reason: 'verify_failed', stage: 'verify_http' }),
+          eventId: normalizeWatchlistEventId(getWatchlistVerifyEntryItem(entry)?.deliveryEventId)
+        };
+      });
+      return;
+    }
+    chunk.forEach((entry, index) => {
+      if (results[index]) {
+        entry.verifyResult = results[index];
+      } else {
+        individual.push(entry);
+      }
+    });
+  }, {
+    concurrency: resolveWatchlistFlushConcurrency(),
+    maxPerHost: WATCHLIST_DISPATCH.flushMaxInFlightPerHost,
+    budget: options.budget,
+    getHost: (chunk) => resolveWatchlistFlushHostKey(getWatchlistVerifyEntryItem(chunk[0])?.deliveryIntakeUrl),
+    shouldStart: options.shouldStart
+  });
+  batches.forEach((chunk) => {
+    if (chunk.budgetSkipped) {
+      chunk.forEach((entry) => {
+        entry.budgetSkipped = true;
+      });
+    }
+  });
+
+  await runWatchlistFlushPool(individual, async (entry) => {
+    try {
+      entry.verifyResult = await verifyWatchlistDispatchDelivery(getWatchlistVerifyEntryItem(entry), entry.trace, { timeoutMs });
+    } catch (error) {
+      entry.verifyResult = {
+        success: false,
+        pending: true,
+        reason: 'dispatch_error',
+        error: error?.message || String(error),
+        stage: 'verify_http'
+      };
+    }
+  }, {
+    concurrency: resolveWatchlistFlushConcurrency(),
+    maxPerHost: WATCHLIST_DISPATCH.flushMaxInFlightPerHost,
+    budget: options.budget,
+    getHost: (entry) => resolveWatchlistFlushHostKey(getWatchlistVerifyEntryItem(entry)?.deliveryIntakeUrl),
+    shouldStart: options.shouldStart
+  });
+}
+
 async function flushWatchlistDispatchOutbox(reason = 'manual', options = {}) {
   const normalizedReason = normalizeWatchlistFlushReason(reason, 'manual');
   const focus = normalizeWatchlistFlushFocus(
@@ -27304,15 +28794,19 @@ async function flushWatchlistDispatchOutbox(reason = 'manual', options = {}) {
     let conversationSnapshotSource = '';
     let budgetStopReason = '';
     const flushStartedAt = watchlistDispatchFlushStartedAt || Date.now();
-    const flushMaxItemsPerRun = Number.isInteger(WATCHLIST_DISPATCH.flushMaxItemsPerRun) && WATCHLIST_DISPATCH.flushMaxItemsPerRun > 0
-      ? WATCHLIST_DISPATCH.flushMaxItemsPerRun
-      : 8;
+    const flushConcurrency = resolveWatchlistFlushConcurrency();
+    const flushMaxItemsPerRun = (
+      Number.isInteger(WATCHLIST_DISPATCH.flushMaxItemsPerRun) && WATCHLIST_DISPATCH.flushMaxItemsPerRun > 0
+        ? WATCHLIST_DISPATCH.flushMaxItemsPerRun
+        : 8
+    ) * flushConcurrency;
     const flushMaxRuntimeMs = Number.isInteger(WATCHLIST_DISPATCH.flushMaxRuntimeMs) && WATCHLIST_DISPATCH.flushMaxRuntimeMs > 0
       ? WATCHLIST_DISPATCH.flushMaxRuntimeMs
       : (25 * 1000);
     const sendTimeoutMs = Math.max(1000, Number(WATCHLIST_DISPATCH.timeoutMs || 0) || 20000);
     let scannedInThisRun = 0;
     let attemptedInThisRun = 0;
+    const work = [];
 
     for (let index = 0; index < queued.length; index += 1) {
       const item = queued[index];
@@ -27381,17 +28875,89 @@ async function flushWatchlistDispatchOutbox(reason = 'manual', options = {}) {
       }
 
       attemptedInThisRun += 1;
-      const payload = item.payload;
-      const trace = buildCopyTrace(payload.runId || '', payload.responseId || '');
-      const inVerifyPhase = isWatchlistOutboxDeliveryAccepted(item);
-      const dispatchResult = inVerifyPhase
-        ? await verifyWatchlistDispatchDelivery(item, trace, {
-          timeoutMs: Math.max(1000, Number(WATCHLIST_DISPATCH.verifyTimeoutMs || 0) || 12000)
-        })
-        : await sendWatchlistDispatch(payload, trace, {
-          maxAttempts: 1,
-          timeoutMs: sendTimeoutMs
-        });
+      work.push({
+        item,
+        trace: buildCopyTrace(item.payload.runId || '', item.payload.responseId || ''),
+        inVerifyPhase: isWatchlistOutboxDeliveryAccepted(item),
+        dispatchResult: null,
+        acceptedItem: null,
+        verifyResult: null
+      });
+    }
+
+    // Send and verify run as overlapping stages: the verify backlog is checked in batches
+    // while new items are being sent, then freshly accepted items are verified together.
+    const withinRuntimeBudget = () => Date.now() - flushStartedAt < flushMaxRuntimeMs;
+    const sendConfig = work.some((entry) => !entry.inVerifyPhase)
+      ? await resolveWatchlistDispatchConfiguration()
+      : null;
+    const sendHost = resolveWatchlistFlushHostKey(sendConfig?.intakeUrl);
+    const acceptedForVerify = [];
+    const flushBudget = createWatchlistFlushBudget({
+      concurrency: flushConcurrency,
+      maxPerHost: WATCHLIST_DISPATCH.flushMaxInFlightPerHost
+    });
+    await Promise.all([
+      runWatchlistFlushPool(work.filter((entry) => !entry.inVerifyPhase), async (entry) => {
+        try {
+          entry.dispatchResult = await sendWatchlistDispatch(entry.item.payload, entry.trace, {
+            maxAttempts: 1,
+            timeoutMs: sendTimeoutMs
+          });
+        } catch (error) {
+          entry.dispatchResult = {
+            success: false,
+            reason: 'dispatch_error',
+            error: error?.message || String(error),
+            stage: 'send'
+          };
+        }
+        if (!entry.dispatchResult?.success) return;
+        const item = entry.item;
+        const dispatchResult = entry.dispatchResult;
+        entry.acceptedItem = {
+          ...item,
+          attemptCount: Number.isInteger(item.attemptCount) ? item.attemptCount : 0,
+          nextAttemptAt: 0,
+          lastError: '',
+          deliveryAcceptedAt: Date.now(),
+          deliveryEventId: normalizeWatchlistEventId(dispatchResult?.eventId),
+          deliveryRequestId: typeof dispatchResult?.requestId === 'string' ? dispatchResult.requestId.trim() : '',
+          deliveryIntakeUrl: typeof dispatchResult?.intakeUrl === 'string' ? dispatchResult.intakeUrl.trim() : '',
+          verifyState: 'http_accepted',
+          verifyReason: '',
+          verifyAttemptCount: Number.isInteger(item.verifyAttemptCount) ? item.verifyAttemptCount : 0,
+          verifyLastCheckedAt: 0,
+          verifyLastError: '',
+          verifiedAt: 0,
+          materializedRowCount: Number.isInteger(item.materializedRowCount) ? item.materializedRowCount : 0
+        };
+        acceptedForVerify.push(entry);
+      }, {
+        budget: flushBudget,
+        getHost: () => sendHost,
+        shouldStart: withinRuntimeBudget
+      }),
+      verifyWatchlistOutboxEntries(work.filter((entry) => entry.inVerifyPhase), {
+        budget: flushBudget,
+        shouldStart: withinRuntimeBudget
+      })
+    ]);
+    await verifyWatchlistOutboxEntries(acceptedForVerify, {
+      budget: flushBudget,
+      shouldStart: withinRuntimeBudget
+    });
+
+    let runtimeCarryOver = 0;
+    for (const entry of work) {
+      const { item, trace, inVerifyPhase } = entry;
+      const dispatchResult = inVerifyPhase ? entry.verifyResult : entry.dispatchResult;
+      if (!dispatchResult) {
+        runtimeCarryOver += 1;
+        deferred += 1;
+        remaining.push(item);
+        continue;
+      }
       if (Number.isInteger(dispatchResult?.conversationLogCount)) {
         const normalizedLogCount = Math.max(0, dispatchResult.conversationLogCount);
         conversationLogCount = normalizedLogCount;
@@ -27410,26 +28976,14 @@ async function flushWatchlistDispatchOutbox(reason = 'manual', options = {}) {
       let finalResult = dispatchResult;
       if (!inVerifyPhase && dispatchResult.success) {
         accepted += 1;
-        acceptedItem = {
-          ...item,
-          attemptCount: Number.isInteger(item.attemptCount) ? item.attemptCount : 0,
-          nextAttemptAt: 0,
-          lastError: '',
-          deliveryAcceptedAt: Date.now(),
-          deliveryEventId: normalizeWatchlistEventId(dispatchResult?.eventId),
-          deliveryRequestId: typeof dispatchResult?.requestId === 'string' ? dispatchResult.requestId.trim() : '',
-          deliveryIntakeUrl: typeof dispatchResult?.intakeUrl === 'string' ? dispatchResult.intakeUrl.trim() : '',
-          verifyState: 'http_accepted',
-          verifyReason: '',
-          verifyAttemptCount: Number.isInteger(item.verifyAttemptCount) ? item.verifyAttemptCount : 0,
-          verifyLastCheckedAt: 0,
-          verifyLastError: '',
-          verifiedAt: 0,
-          materializedRowCount: Number.isInteger(item.materializedRowCount) ? item.materializedRowCount : 0
-        };
-        finalResult = await verifyWatchlistDispatchDelivery(acceptedItem, trace, {
-          timeoutMs: Math.max(1000, Number(WATCHLIST_DISPATCH.verifyTimeoutMs || 0) || 12000)
-        });
+        acceptedItem = entry.acceptedItem;
+        finalResult = entry.verifyResult;
+        if (!finalResult) {
+          runtimeCarryOver += 1;
+          deferred += 1;
+          remaining.push(acceptedItem);
+          continue;
+        }
       }
 
       if (finalResult.success) {
@@ -27570,6 +29124,23 @@ async function flushWatchlistDispatchOutbox(reason = 'manual', options = {}) {
       }
     }
 
+    if (runtimeCarryOver > 0) {
+      budgetStopReason = budgetStopReason || `limit_runtime_${flushMaxRuntimeMs}ms`;
+      watchlistDispatchFlushPending = true;
+      if (!watchlistDispatchFlushPendingReason) {
+        watchlistDispatchFlushPendingReason = 'budget_limit';
+      }
+      emitWatchlistDispatchProcessLog('info', 'flush_budget_stop', 'Flush runtime budget reached before all started items finished', {
+        reason: normalizedReason,
+        budgetStopReason,
+        elapsedMs: Math.max(0, Date.now() - flushStartedAt),
+        attemptedInThisRun,
+        scannedInThisRun,
+        carryOver: runtimeCarryOver,
+        hasReadyUnprocessed: true
+      });
+    }
+
     const flushPersistResult = await withWatchlistOutboxMutationLock(async () => {
       const latestOutbox = await readWatchlistOutbox();
       const queuedKeys = new Set(
@@ -28568,6 +30139,230 @@ async function loadPrompts() {
   }
 }
 
+// Opt-in runtime profiler: wraps the worker's hot data paths and chrome.storage traffic while enabled,
+// so production slowdowns can be attributed from the problem-log panel.
+function createRuntimeProfilerTimingEntry(name) {
+  return {
+    name,
+    calls: 0,
+    errors: 0,
+    totalMs: 0,
+    maxMs: 0,
+    lastAt: null,
+    samples: []
+  };
+}
+
+function recordRuntimeProfilerTiming(name, durationMs, failed = false) {
+  let entry = runtimeProfilerTimings.get(name);
+  if (!entry) {
+    entry = createRuntimeProfilerTimingEntry(name);
+    runtimeProfilerTimings.set(name, entry);
+  }
+  const safeDurationMs = Number.isFinite(durationMs) && durationMs > 0 ? durationMs : 0;
+  entry.calls += 1;
+  if (failed) entry.errors += 1;
+  entry.totalMs += safeDurationMs;
+  entry.maxMs = Math.max(entry.maxMs, safeDurationMs);
+  entry.lastAt = Date.now();
+  entry.samples.push(safeDurationMs);
+  if (entry.samples.length > RUNTIME_PROFILER_SAMPLE_LIMIT) {
+    entry.samples.splice(0, entry.samples.length - RUNTIME_PROFILER_SAMPLE_LIMIT);
+  }
+  return entry;
+}
+
+function estimateRuntimeProfilerBytes(value) {
+  if (value === undefined) return 0;
+  try {
+    const text = JSON.stringify(value);
+    return typeof text === 'string' ? text.length : 0;
+  } catch {
+    return 0;
+  }
+}
+
+function recordRuntimeProfilerStorage(areaName, operation, values) {
+  const source = values && typeof values === 'object' && !Array.isArray(values) ? values : {};
+  Object.keys(source).forEach((key) => {
+    const statKey = `${areaName}:${key}`;
+    let entry = runtimeProfilerStorage.get(statKey);
+    if (!entry) {
+      entry = { area: areaName, key, reads: 0, readBytes: 0, writes: 0, writeBytes: 0 };
+      runtimeProfilerStorage.set(statKey, entry);
+    }
+    const bytes = estimateRuntimeProfilerBytes(source[key]);
+    if (operation === 'write') {
+      entry.writes += 1;
+      entry.writeBytes += bytes;
+    } else {
+      entry.reads += 1;
+      entry.readBytes += bytes;
+    }
+  });
+}
+
+function wrapRuntimeProfilerFunction(name, fn) {
+  const profiled = function profiledHotPath(...args) {
+    const startedAt = performance.now();
+    let result;
+    try {
+      result = fn.apply(this, args);
+    } catch (error) {
+      recordRuntimeProfilerTiming(name, performance.now() - startedAt, true);
+      throw error;
+    }
+    if (result && typeof result.then === 'function') {
+      return result.then((value) => {
+        recordRuntimeProfilerTiming(name, performance.now() - startedAt);
+        return value;
+      }, (error) => {
+        recordRuntimeProfilerTiming(name, performance.now() - startedAt, true);
+        throw error;
+      });
+    }
+    recordRuntimeProfilerTiming(name, performance.now() - startedAt);
+    return result;
+  };
+  return profiled;
+}
+
+function wrapRuntimeProfilerStorageArea(areaName, area) {
+  const originalGet = area.get;
+  const originalSet = area.set;
+  area.get = function profiledStorageGet(...args) {
+    const result = originalGet.apply(this, args);
+    if (result && typeof result.then === 'function') {
+      return result.then((values) => {
+        recordRuntimeProfilerStorage(areaName, 'read', values);
+        return values;
+      });
+    }
+    return result;
+  };
+  area.set = function profiledStorageSet(items, ...rest) {
+    recordRuntimeProfilerStorage(areaName, 'write', items);
+    return originalSet.call(this, items, ...rest);
+  };
+  return () => {
+    area.get = originalGet;
+    area.set = originalSet;
+  };
+}
+
+function installRuntimeProfilerHooks() {
+  if (runtimeProfilerRestoreHooks.length > 0) return;
+  RUNTIME_PROFILER_HOT_PATHS.forEach(([ownerName, functionName]) => {
+    const owner = ownerName ? globalThis[ownerName] : globalThis;
+    const original = owner?.[functionName];
+    if (typeof original !== 'function') return;
+    const label = ownerName ? `${ownerName}.${functionName}` : functionName;
+    owner[functionName] = wrapRuntimeProfilerFunction(label, original);
+    runtimeProfilerRestoreHooks.push(() => {
+      owner[functionName] = original;
+    });
+  });
+  ['local', 'session'].forEach((areaName) => {
+    const area = chrome?.storage?.[areaName];
+    if (!area || typeof area.get !== 'function' || typeof area.set !== 'function') return;
+    try {
+      runtimeProfilerRestoreHooks.push(wrapRuntimeProfilerStorageArea(areaName, area));
+    } catch (error) {
+      console.warn('[profiler] storage hook failed:', areaName, error?.message || String(error));
+    }
+  });
+}
+
+function uninstallRuntimeProfilerHooks() {
+  const restoreHooks = runtimeProfilerRestoreHooks.splice(0);
+  restoreHooks.reverse().forEach((restore) => {
+    try {
+      restore();
+    } catch {
+      // A hook that cannot be restored keeps recording into a disabled profiler; harmless.
+    }
+  });
+}
+
+function resetRuntimeProfiler() {
+  runtimeProfilerTimings.clear();
+  runtimeProfilerStorage.clear();
+  runtimeProfilerStartedAt = runtimeProfilerEnabled ? Date.now() : null;
+}
+
+async function setRuntimeProfilerEnabled(enabled, options = {}) {
+  const nextEnabled = enabled === true;
+  if (nextEnabled) {
+    installRuntimeProfilerHooks();
+  } else {
+    uninstallRuntimeProfilerHooks();
+  }
+  const changed = runtimeProfilerEnabled !== nextEnabled;
+  runtimeProfilerEnabled = nextEnabled;
+  if (changed || options?.reset === true) {
+    resetRuntimeProfiler();
+  }
+  if (options?.persist !== false) {
+    await chrome.storage.local.set({ [RUNTIME_PROFILER_STORAGE_KEY]: nextEnabled });
+  }
+  return buildRuntimeProfilerSnapshot();
+}
+
+async function ensureRuntimeProfilerReady() {
+  if (!runtimeProfilerReady) {
+    runtimeProfilerReady = (async () => {
+      try {
+        const stored = await chrome.storage.local.get([RUNTIME_PROFILER_STORAGE_KEY]);
+        if (stored?.[RUNTIME_PROFILER_STORAGE_KEY] === true) {
+          await setRuntimeProfilerEnabled(true, { persist: false });
+        }
+      } catch (error) {
+        console.warn('[profiler] Failed to read profiler state:', error?.message || String(error));
+      }
+      return runtimeProfilerEnabled;
+    })();
+  }
+  return runtimeProfilerReady;
+}
+
+function buildRuntimeProfilerSnapshot() {
+  const timings = Array.from(runtimeProfilerTimings.values())
+    .map((entry) => {
+      const sorted = entry.samples.slice().sort((left, right) => left - right);
+      const p95Ms = sorted.length > 0
+        ? sorted[Math.min(sorted.length - 1, Math.ceil(sorted.length * 0.95) - 1)]
+        : 0;
+      return {
+        name: entry.name,
+        calls: entry.calls,
+        errors: entry.errors,
+        totalMs: Math.round(entry.totalMs * 100) / 100,
+        avgMs: entry.calls > 0 ? Math.round((entry.totalMs / entry.calls) * 1000) / 1000 : 0,
+        p95Ms: Math.round(p95Ms * 1000) / 1000,
+        maxMs: Math.round(entry.maxMs * 1000) / 1000,
+        lastAt: entry.lastAt
+      };
+    })
+    .sort((left, right) => right.totalMs - left.totalMs);
+  const storage = Array.from(runtimeProfilerStorage.values())
+    .map((entry) => ({ ...entry }))
+    .sort((left, right) => (right.readBytes + right.writeBytes) - (left.readBytes + left.writeBytes));
+  return {
+    enabled: runtimeProfilerEnabled,
+    startedAt: runtimeProfilerStartedAt,
+    generatedAt: Date.now(),
+    timings,
+    storage,
+    totals: storage.reduce((totals, entry) => {
+      totals.reads += entry.reads;
+      totals.readBytes += entry.readBytes;
+      totals.writes += entry.writes;
+      totals.writeBytes += entry.writeBytes;
+      return totals;
+    }, { reads: 0, readBytes: 0, writes: 0, writeBytes: 0 })
+  };
+}
+
 // Wczytaj prompty przy starcie rozszerzenia
 loadPrompts();
 ensureProcessRegistryReady().catch((error) => {
@@ -28576,6 +30371,9 @@ ensureProcessRegistryReady().catch((error) => {
 ensureAnalysisQueueReady().catch((error) => {
   console.warn('[analysis-queue] Initial queue load failed:', error?.message || String(error));
 });
+ensureRuntimeProfilerReady().catch((error) => {
+  console.warn('[profiler] Initial profiler load failed:', error?.message || String(error));
+});
 markRunningUnfinishedResumeBatchInterruptedOnBoot().catch((error) => {
   console.warn('[unfinished-resume] initial state recovery failed:', error?.message || String(error));
 });
@@ -29323,9 +31121,9 @@ async function saveResponse(
     }
     
     await ensureCanonicalResponseStorageReady();
-    const storedResponses = await readCanonicalResponsesFromStorage();
+    const storedResponseCount = await readCanonicalResponseCountFromStorage();
     
-    console.log(`📦 Obecny stan storage: ${storedResponses.length} odpowiedzi`);
+    console.log(`📦 Obecny stan storage: ${storedResponseCount} odpowiedzi`);
     
     const normalizedRunId = typeof runId === 'string' && runId.trim()
       ? runId.trim()
@@ -29466,7 +31264,7 @@ async function saveResponse(
     
     const saveMaxAttempts = 4;
     const saveRetryDelayMs = 650;
-    let verifiedResponses = storedResponses;
+    let verifiedCount = storedResponseCount;
     let lastSaved = null;
     let saveAttemptOk = false;
 
@@ -29476,12 +31274,11 @@ async function saveResponse(
           mirrorToSession: false,
           clearSession: true
         });
-        verifiedResponses = Array.isArray(persistResult?.responses)
-          ? persistResult.responses
-          : await readCanonicalResponsesFromStorage();
+        verifiedCount = Number.isInteger(persistResult?.responseCount)
+          ? persistResult.responseCount
+          : await readCanonicalResponseCountFromStorage();
         lastSaved = persistResult?.savedResponse
-          || ResponseStorageUtils.findMatchingResponse(verifiedResponses, newResponse)
-          || verifiedResponses[verifiedResponses.length - 1]
+          || await ResponseStorageUtils.findCanonicalResponse(newResponse, getResponseStorageAreas())
           || null;
 
         const candidateText = typeof lastSaved?.text === 'string' ? lastSaved.text : '';
@@ -29489,7 +31286,7 @@ async function saveResponse(
         const textMatch = candidateText === responseText;
 
         console.log(
-          `[copy-flow] [save:verify-attempt] trace=${copyTrace} attempt=${attempt}/${saveMaxAttempts} count=${verifiedResponses.length} fp=${candidateFingerprint} textMatch=${textMatch}`
+          `[copy-flow] [save:verify-attempt] trace=${copyTrace} attempt=${attempt}/${saveMaxAttempts} count=${verifiedCount} fp=${candidateFingerprint} textMatch=${textMatch}`
         );
 
         if (lastSaved && textMatch) {
@@ -29777,7 +31574,7 @@ async function saveResponse(
         runId: normalizedRunId || '',
         responseId: normalizedResponseId,
         state: pipelineDispatchState,
-        verifiedCount: verifiedResponses.length,
+        verifiedCount,
         accepted: dispatchOutcome.accepted,
         sent: dispatchOutcome.sent,
         failed: dispatchOutcome.failed,
@@ -29831,14 +31628,14 @@ async function saveResponse(
     console.log(`\n${'*'.repeat(80)}`);
     console.log(`✅ ✅ ✅ [saveResponse] ZAPIS LOKALNY ZWERYFIKOWANY ✅ ✅ ✅`);
     console.log(`${'*'.repeat(80)}`);
-    console.log(`Nowy stan: ${verifiedResponses.length} odpowiedzi w storage (zweryfikowano lokalnie: ${verifiedResponses.length})`);
+    console.log(`Nowy stan: ${verifiedCount} odpowiedzi w storage (zweryfikowano lokalnie: ${verifiedCount})`);
     console.log(`Fingerprint: ${copyFingerprint}`);
     console.log(`${'*'.repeat(80)}\n`);
     if (normalizedRunId && !skipProcessPersistencePatch) {
       await upsertProcess(normalizedRunId, buildSaveResponseProcessPersistencePatch({
         responseId: normalizedResponseId,
         copyTrace,
-        verifiedCount: verifiedResponses.length,
+        verifiedCount,
         dispatch: dispatchOutcome,
         dispatchSummary: formatDispatchUiSummary(dispatchOutcome),
         dispatchProcessLog: dispatchProcessLog.slice(-16),
@@ -29854,7 +31651,7 @@ async function saveResponse(
       success: true,
       response: lastSaved || newResponse,
       copyTrace,
-      verifiedCount: verifiedResponses.length,
+      verifiedCount,
       dispatch: dispatchOutcome,
       dispatchProcessLog: dispatchProcessLog.slice(-16),
       conversationAnalysis,
@@ -30500,14 +32297,16 @@ chrome.runtime.onMessage.addListener((message, sender, sendResponse) => {
     return true;
   } else if (message.type === 'GET_PROCESSES') {
     (async () => {
-      const [processes, queue] = await Promise.all([
-        getProcessSnapshot(),
-        getAnalysisQueueStatusSnapshot()
-      ]);
+      const delta = Number.isInteger(message?.sinceVersion)
+        ? await getProcessSnapshotDelta(message.sinceVersion, message?.epoch)
+        : null;
+      const snapshot = delta ? null : await getProcessSnapshot({ withVersion: true });
+      const queue = await getAnalysisQueueStatusSnapshot();
       sendResponse({
-        processes,
+        ...(delta ? { delta } : { processes: snapshot.processes }),
         queue,
-        version: processSnapshotVersion,
+        epoch: processRegistryEpoch,
+        version: delta ? delta.version : snapshot.version,
         queueVersion: analysisQueueVersion
       });
     })().catch((error) => {
@@ -30515,6 +32314,7 @@ chrome.runtime.onMessage.addListener((message, sender, sendResponse) => {
       sendResponse({
         processes: [],
         queue: null,
+        epoch: '',
         version: processSnapshotVersion,
         queueVersion: analysisQueueVersion
       });
@@ -30705,6 +32505,29 @@ chrome.runtime.onMessage.addListener((message, sender, sendResponse) => {
         });
       });
     return true;
+  } else if (message.type === 'GET_RUNTIME_PROFILE') {
+    ensureRuntimeProfilerReady()
+      .then(() => sendResponse({ success: true, profile: buildRuntimeProfilerSnapshot() }))
+      .catch((error) => {
+        console.warn('[profiler] GET_RUNTIME_PROFILE failed:', error);
+        sendResponse({
+          success: false,
+          error: error?.message || String(error)
+        });
+      });
+    return true;
+  } else if (message.type === 'SET_RUNTIME_PROFILER_ENABLED') {
+    ensureRuntimeProfilerReady()
+      .then(() => setRuntimeProfilerEnabled(message?.enabled === true, { reset: message?.reset === true }))
+      .then((profile) => sendResponse({ success: true, profile }))
+      .catch((error) => {
+        console.warn('[profiler] SET_RUNTIME_PROFILER_ENABLED failed:', error);
+        sendResponse({
+          success: false,
+          error: error?.message || String(error)
+        });
+      });
+    return true;
   } else if (message.type === 'GET_EXTENSION_SUPPORT_ID') {
     ensureExtensionInstallationId()
       .then((supportId) => sendResponse({
@@ -31583,6 +33406,7 @@ async function resumeFromStage(startIndex, options = {}) {
       resumeTargetTabId: activeTab.id,
       resumeTargetWindowId: targetWindowId,
       resumeStartIndex: startIndex,
+      totalPrompts: PROMPTS_COMPANY.length,
       reloadBeforeResume,
       forceRepeatLastPrompt: options?.forceRepeatLastPrompt === true,
       bypassPause: options?.bypassPause !== false,
@@ -35982,7 +37806,7 @@ async function injectToChat(
           }
         );
         savedResponse = persistResult?.savedResponse || responseRecord;
-        responseCount = Array.isArray(persistResult?.responses) ? persistResult.responses.length : 0;
+        responseCount = Number.isInteger(persistResult?.responseCount) ? persistResult.responseCount : 0;
         responseStored = !!savedResponse;
       } else {
         const snapshot = await chrome.storage.local.get(['responses']);
@@ -39836,6 +41660,193 @@ async function injectToChat(
     }
   }
 
+  // Event-driven view of the chat DOM for the response wait loops. Streaming into an assistant
+  // message only bumps a version/timestamp (no innerText reads); other UI changes (composer,
+  // stop/send buttons, error banners) wake pending waiters so state transitions are seen at once.
+  function createChatResponseDomWatcher(options = {}) {
+    const assistantSelector = '[data-message-author-role="assistant"]';
+    const ignoreSelector = typeof options.ignoreSelector === 'string' && options.ignoreSelector
+      ? options.ignoreSelector
+      : '#economist-prompt-counter';
+    const idleDisconnectMs = Number.isFinite(options.idleDisconnectMs) && options.idleDisconnectMs > 0
+      ? options.idleDisconnectMs
+      : 5000;
+    const ObserverCtor = typeof MutationObserver === 'function' ? MutationObserver : null;
+    const observeRoot = typeof document !== 'undefined' ? (document.body || document.documentElement) : null;
+    const state = {
+      assistantVersion: 0,
+      lastAssistantMutationAt: 0,
+      appendedChars: 0,
+      uiMutationCount: 0,
+      lastUiMutationAt: 0
+    };
+    let observer = null;
+    let idleTimerId = null;
+    let waiters = [];
+
+    const wake = (assistantTouched, uiTouched) => {
+      if (waiters.length === 0) return;
+      const pending = [];
+      waiters.forEach((waiter) => {
+        if (uiTouched || (assistantTouched && waiter.wakeOnAssistant)) {
+          waiter.resolve();
+        } else {
+          pending.push(waiter);
+        }
+      });
+      waiters = pending;
+    };
+
+    const containsAssistantMessage = (record) => [record.addedNodes, record.removedNodes].some((nodes) => (
+      Array.from(nodes || []).some((node) => (
+        node
+        && node.nodeType === 1
+        && ((typeof node.matches === 'function' && node.matches(assistantSelector))
+          || (typeof node.querySelector === 'function' && !!node.querySelector(assistantSelector)))
+      ))
+    ));
+
+    const handleMutations = (records) => {
+      const now = Date.now();
+      let assistantTouched = false;
+      let uiTouched = false;
+      let cachedElement = null;
+      let cachedKind = '';
+      for (const record of records) {
+        const target = record.target;
+        const element = target && target.nodeType === 1 ? target : (target ? target.parentElement : null);
+        let kind = 'ui';
+        if (element && element === cachedElement) {
+          kind = cachedKind;
+        } else if (element && typeof element.closest === 'function') {
+          if (element.closest(ignoreSelector)) {
+            kind = 'ignored';
+          } else if (element.closest(assistantSelector)) {
+            kind = 'assistant';
+          }
+          cachedElement = element;
+          cachedKind = kind;
+        }
+        if (kind === 'ignored') continue;
+        if (kind !== 'assistant' || record.type === 'attributes') {
+          uiTouched = true;
+          // A whole assistant turn inserted or replaced from outside also changes the transcript.
+          if (record.type === 'childList' && containsAssistantMessage(record)) {
+            assistantTouched = true;
+          }
+          continue;
+        }
+        // Only mutations that touch text count as streaming; empty wrappers or icons do not.
+        if (record.type === 'characterData') {
+          const nextText = typeof target.data === 'string' ? target.data : '';
+          const previousText = typeof record.oldValue === 'string' ? record.oldValue : '';
+          if (nextText === previousText) continue;
+          state.appendedChars += Math.max(0, nextText.length - previousText.length);
+          assistantTouched = true;
+          continue;
+        }
+        let addedChars = 0;
+        let removedChars = 0;
+        Array.from(record.addedNodes || []).forEach((node) => {
+          addedChars += String(node?.textContent || '').length;
+        });
+        Array.from(record.removedNodes || []).forEach((node) => {
+          removedChars += String(node?.textContent || '').length;
+        });
+        if (addedChars === 0 && removedChars === 0) continue;
+        state.appendedChars += Math.max(0, addedChars - removedChars);
+        assistantTouched = true;
+      }
+      if (assistantTouched) {
+        state.assistantVersion += 1;
+        state.lastAssistantMutationAt = now;
+      }
+      if (uiTouched) {
+        state.uiMutationCount += 1;
+        state.lastUiMutationAt = now;
+      }
+      wake(assistantTouched, uiTouched);
+    };
+
+    const disconnect = () => {
+      if (idleTimerId !== null) {
+        clearTimeout(idleTimerId);
+        idleTimerId = null;
+      }
+      if (observer) {
+        observer.disconnect();
+        observer = null;
+      }
+      wake(true, true);
+    };
+
+    const connect = () => {
+      if (idleTimerId !== null) clearTimeout(idleTimerId);
+      // Exits from the wait loops do not have to release the observer explicitly.
+      idleTimerId = setTimeout(disconnect, idleDisconnectMs);
+      if (observer || !ObserverCtor || !observeRoot) return;
+      observer = new ObserverCtor(handleMutations);
+      observer.observe(observeRoot, {
+        childList: true,
+        subtree: true,
+        characterData: true,
+        characterDataOldValue: true,
+        attributes: true,
+        attributeFilter: ['disabled', 'aria-label', 'data-testid', 'contenteditable', 'aria-busy']
+      });
+      // Mutations may have been missed while disconnected, so treat the transcript as changed.
+      state.assistantVersion += 1;
+      state.lastAssistantMutationAt = Date.now();
+    };
+
+    const observing = !!(ObserverCtor && observeRoot);
+    if (observing) connect();
+
+    return {
+      observing,
+      getAssistantVersion() {
+        // Without an observer every read counts as a potential change (plain polling).
+        if (!observing) state.assistantVersion += 1;
+        return state.assistantVersion;
+      },
+      getLastAssistantMutationAt() {
+        return state.lastAssistantMutationAt;
+      },
+      getStats() {
+        return { ...state, observing };
+      },
+      waitForChange(maxWaitMs, waitOptions = {}) {
+        const safeMaxWaitMs = Number.isFinite(maxWaitMs) && maxWaitMs > 0 ? maxWaitMs : 500;
+        if (!observing) {
+          return new Promise((resolve) => setTimeout(resolve, Math.min(safeMaxWaitMs, 500)));
+        }
+        connect();
+        const minWaitMs = Number.isFinite(waitOptions.minWaitMs) && waitOptions.minWaitMs > 0
+          ? Math.min(waitOptions.minWaitMs, safeMaxWaitMs)
+          : 0;
+        const startedAt = Date.now();
+        return new Promise((resolve) => {
+          let settled = false;
+          let timeoutId = null;
+          const finish = () => {
+            if (settled) return;
+            settled = true;
+            if (timeoutId !== null) clearTimeout(timeoutId);
+            const remainingMinMs = minWaitMs - (Date.now() - startedAt);
+            if (remainingMinMs > 0) {
+              setTimeout(resolve, remainingMinMs);
+            } else {
+              resolve();
+            }
+          };
+          timeoutId = setTimeout(finish, safeMaxWaitMs);
+          waiters.push({ wakeOnAssistant: waitOptions.wakeOnAssistant === true, resolve: finish });
+        });
+      },
+      disconnect
+    };
+  }
+
   async function waitForChatGptGenerationFinishedBeforeNextPrompt(
     maxWaitMs,
     counter = null,
@@ -39853,10 +41864,13 @@ async function injectToChat(
     let stableReadyHits = 0;
     let clickedContinue = false;
     let lastHeartbeatAt = Date.now();
+    const guardTextStableMs = 3000;
+    const responseDomWatcher = createChatResponseDomWatcher();
     let lastAssistantText = (() => {
       const lastMsg = getLastAssistantMessageElement();
       return lastMsg ? compactText(lastMsg.innerText || lastMsg.textContent || '') : '';
     })();
+    let lastAssistantReadVersion = responseDomWatcher.getAssistantVersion();
     let lastAssistantChangeAt = Date.now();
 
     while (true) {
@@ -39892,15 +41906,31 @@ async function injectToChat(
                      document.querySelector('div[contenteditable="true"]') ||
                      document.querySelector('[data-testid="composer-input"][contenteditable="true"]');
       const editorReady = editor && editor.getAttribute('contenteditable') === 'true';
-      const lastMsg = getLastAssistantMessageElement();
-      const currentLastText = lastMsg ? compactText(lastMsg.innerText || lastMsg.textContent || '') : '';
-      if (currentLastText && currentLastText !== lastAssistantText) {
-        lastAssistantText = currentLastText;
-        lastAssistantChangeAt = Date.now();
-        stableReadyHits = 0;
+      const assistantVersion = responseDomWatcher.getAssistantVersion();
+      if (assistantVersion !== lastAssistantReadVersion) {
+        if (responseDomWatcher.observing) {
+          // The observer already timestamps streaming; read the text only once it settles.
+          const mutationAt = responseDomWatcher.getLastAssistantMutationAt();
+          if (mutationAt > lastAssistantChangeAt) {
+            lastAssistantChangeAt = mutationAt;
+            stableReadyHits = 0;
+          }
+        }
+        if (!responseDomWatcher.observing || Date.now() - lastAssistantChangeAt >= guardTextStableMs) {
+          lastAssistantReadVersion = assistantVersion;
+          const lastMsg = getLastAssistantMessageElement();
+          const currentLastText = lastMsg ? compactText(lastMsg.innerText || lastMsg.textContent || '') : '';
+          if (currentLastText && currentLastText !== lastAssistantText) {
+            lastAssistantText = currentLastText;
+            if (!responseDomWatcher.observing) {
+              lastAssistantChangeAt = Date.now();
+              stableReadyHits = 0;
+            }
+          }
+        }
       }
 
-      const textStable = Date.now() - lastAssistantChangeAt >= 3000;
+      const textStable = Date.now() - lastAssistantChangeAt >= guardTextStableMs;
       const generationFinished = !genStatus.generating && editorReady && textStable && !findChatGptContinueGeneratingButton();
       if (generationFinished) {
         stableReadyHits += 1;
@@ -39936,7 +41966,12 @@ async function injectToChat(
         return { finished: false, reason: 'timeout', clickedContinue };
       }
 
-      await new Promise((resolve) => setTimeout(resolve, 500));
+      // Sleep until the UI changes or the text-stability window can close, whichever is first.
+      const untilTextStableMs = lastAssistantChangeAt + guardTextStableMs - Date.now();
+      const guardTickMs = stableReadyHits > 0
+        ? 500
+        : Math.max(100, Math.min(1000, untilTextStableMs > 0 ? untilTextStableMs : 1000));
+      await responseDomWatcher.waitForChange(guardTickMs, { minWaitMs: 100 });
     }
   }
   
@@ -39976,6 +42011,7 @@ async function injectToChat(
     const initialAssistantText = initialSnapshot.lastText || '';
     const initialAssistantLength = initialAssistantText.length;
     const MIN_RESPONSE_DELTA = 10;
+    const responseDomWatcher = createChatResponseDomWatcher();
     let responseSeenInDOM = false;
     let lastObservedResponseCount = initialAssistantCount;
     let generationErrorRetryAttempts = 0;
@@ -40001,6 +42037,9 @@ async function injectToChat(
     let phase1IdleSince = Date.now();
     let responseStarted = false;
     let lastResponseWaitHeartbeatAt = Date.now();
+    let lastPhase1LogAt = Date.now();
+    let phase1AssistantReadVersion = null;
+    let phase1AssistantText = initialAssistantText;
 
     while (true) {
       if (shouldStopNow()) return false;
@@ -40021,8 +42060,13 @@ async function injectToChat(
       const genStatus = isGenerating();
       const phase1ResponseNodes = getResponseDomNodes().nodes;
       const hasNewContent = phase1ResponseNodes.length > initialAssistantCount;
-      const lastAssistantMsg = phase1ResponseNodes.length > 0 ? phase1ResponseNodes[phase1ResponseNodes.length - 1] : null;
-      const lastAssistantText = lastAssistantMsg ? compactText(lastAssistantMsg.innerText || lastAssistantMsg.textContent || '') : '';
+      const phase1AssistantVersion = responseDomWatcher.getAssistantVersion();
+      if (phase1AssistantVersion !== phase1AssistantReadVersion) {
+        phase1AssistantReadVersion = phase1AssistantVersion;
+        const lastAssistantMsg = phase1ResponseNodes.length > 0 ? phase1ResponseNodes[phase1ResponseNodes.length - 1] : null;
+        phase1AssistantText = lastAssistantMsg ? compactText(lastAssistantMsg.innerText || lastAssistantMsg.textContent || '') : '';
+      }
+      const lastAssistantText = phase1AssistantText;
       const lastTextChanged = lastAssistantText && lastAssistantText !== initialAssistantText;
       const lengthDelta = Math.abs(lastAssistantText.length - initialAssistantLength);
       const meaningfulTextChange = lastTextChanged && lengthDelta >= MIN_RESPONSE_DELTA;
@@ -40046,7 +42090,8 @@ async function injectToChat(
         return false;
       }
 
-      if ((Date.now() - phase1StartTime) % 30000 < 500) {
+      if (Date.now() - lastPhase1LogAt >= 30_000) {
+        lastPhase1LogAt = Date.now();
         const elapsed = Math.round((Date.now() - phase1StartTime) / 1000);
         console.log(`[FAZA 1] Czekam na start odpowiedzi... (${elapsed}s)`);
       }
@@ -40055,7 +42100,8 @@ async function injectToChat(
         emitResponseWaitHeartbeat('response_wait_phase1', Date.now() - phase1StartTime);
       }
 
-      await new Promise((resolve) => setTimeout(resolve, 500));
+      // Any DOM change may be the start of the response, so wake on assistant mutations too.
+      await responseDomWatcher.waitForChange(1000, { wakeOnAssistant: true, minWaitMs: 100 });
     }
 
     if (!responseStarted) {
@@ -40068,8 +42114,10 @@ async function injectToChat(
     let phase2IdleSince = Date.now();
     let consecutiveReady = 0;
     let logInterval = 0;
-    let lastAssistantText = initialAssistantText;
+    let lastAssistantText = phase1AssistantText || initialAssistantText;
     let lastAssistantChangeAt = Date.now();
+    let lastAssistantReadVersion = phase1AssistantReadVersion;
+    const phase2TextStableMs = 2500;
     let lastPhase2GeneratingActivityAt = Date.now();
     let lastPhase2GenerationSignature = '';
     let phase2StaleGenerationOverrideWarned = false;
@@ -40102,6 +42150,7 @@ async function injectToChat(
           consecutiveReady = 0;
           const retrySnapshot = getAssistantSnapshot();
           lastAssistantText = retrySnapshot.lastText || lastAssistantText;
+          lastAssistantReadVersion = responseDomWatcher.getAssistantVersion();
           continue;
         }
         console.error('[FAZA 2] Wykryto hard error na ostatnim turnie.');
@@ -40163,7 +42212,39 @@ async function injectToChat(
       const assistantMessages = responseNodes.nodes;
       const currentResponseCount = assistantMessages.length;
       const lastAssistantMsg = currentResponseCount > 0 ? assistantMessages[currentResponseCount - 1] : null;
-      const currentLastText = lastAssistantMsg ? compactText(lastAssistantMsg.innerText || lastAssistantMsg.textContent || '') : '';
+      const responseCountChanged = currentResponseCount !== lastObservedResponseCount;
+      if (responseCountChanged) {
+        lastObservedResponseCount = currentResponseCount;
+      }
+      let textChangedNow = false;
+      let currentLastText = lastAssistantText;
+      const assistantVersion = responseDomWatcher.getAssistantVersion();
+      if (assistantVersion !== lastAssistantReadVersion) {
+        if (responseDomWatcher.observing) {
+          const mutationAt = responseDomWatcher.getLastAssistantMutationAt();
+          if (mutationAt > lastAssistantChangeAt) {
+            lastAssistantChangeAt = mutationAt;
+            textChangedNow = true;
+          }
+        }
+        // While the observer reports streaming, innerText is read only when its value matters:
+        // before the response is confirmed, after a new turn appears, or once the text settles.
+        const shouldReadAssistantText = !responseDomWatcher.observing
+          || !responseSeenInDOM
+          || responseCountChanged
+          || Date.now() - lastAssistantChangeAt >= phase2TextStableMs;
+        if (shouldReadAssistantText) {
+          lastAssistantReadVersion = assistantVersion;
+          currentLastText = lastAssistantMsg ? compactText(lastAssistantMsg.innerText || lastAssistantMsg.textContent || '') : '';
+          if (currentLastText && currentLastText !== lastAssistantText) {
+            lastAssistantText = currentLastText;
+            textChangedNow = true;
+            if (!responseDomWatcher.observing) {
+              lastAssistantChangeAt = Date.now();
+            }
+          }
+        }
+      }
       const currentDataGapDirective = parseDataGapDirectiveResponse(currentLastText);
       if (logInterval % 10 === 1) {
         console.log('[FAZA 2] Snapshot odpowiedzi:', {
@@ -40173,19 +42254,12 @@ async function injectToChat(
           data_gap_stage: currentDataGapDirective ? currentDataGapDirective.stageId : ''
         });
       }
-      const textChangedNow = currentLastText && currentLastText !== lastAssistantText;
       if (textChangedNow) {
-        lastAssistantText = currentLastText;
-        lastAssistantChangeAt = Date.now();
         lastPhase2GeneratingActivityAt = Date.now();
         phase2StaleGenerationOverrideWarned = false;
       }
 
       const hasNewAssistantMessage = currentResponseCount > initialAssistantCount;
-      const responseCountChanged = currentResponseCount !== lastObservedResponseCount;
-      if (responseCountChanged) {
-        lastObservedResponseCount = currentResponseCount;
-      }
       const phase2TextChanged = currentLastText && currentLastText !== initialAssistantText;
       const phase2LengthDelta = Math.abs(currentLastText.length - initialAssistantLength);
       const meaningfulTextChange = phase2TextChanged && phase2LengthDelta >= MIN_RESPONSE_DELTA;
@@ -40196,7 +42270,7 @@ async function injectToChat(
       // DATA_GAP activation happens only after full response capture + validation.
       // Do not short-circuit waitForResponse on partial/still-streaming output.
 
-      const textStable = Date.now() - lastAssistantChangeAt >= 2500;
+      const textStable = Date.now() - lastAssistantChangeAt >= phase2TextStableMs;
       const hasThinkingInMessage = !!(lastAssistantMsg && lastAssistantMsg.querySelector('[class*="thinking"]'));
       const progressText = (currentLastText || '').toLowerCase();
       const hasProgressText = progressText.includes('research in progress') ||
@@ -40262,7 +42336,10 @@ async function injectToChat(
         return false;
       }
 
-      await new Promise((resolve) => setTimeout(resolve, 500));
+      // Wake on composer/button/error changes, or when the text-stability window can close.
+      const untilTextStableMs = lastAssistantChangeAt + phase2TextStableMs - Date.now();
+      const phase2TickMs = Math.max(100, Math.min(1000, untilTextStableMs > 0 ? untilTextStableMs : 1000));
+      await responseDomWatcher.waitForChange(phase2TickMs, { minWaitMs: 100 });
     }
   }
 
@@ -0,0 +1,392 @@
+#!/usr/bin/env node
+// Hot-path benchmark suite for the worker's pure data paths (decision contract parsing, canonical
+// response merging/storage, process registry normalization, watchlist outbox, prompt matching and
+// problem-log sanitization). Runs the real background.js code in a vm on deterministic synthetic data.
+// See USAGE below for flags.
+const fs = require('fs');
+const path = require('path');
+const { performance } = require('perf_hooks');
+
+const { loadWorkerFunctions } = require('./worker-loader.js');
+const synthetic = require('./synthetic-data.js');
+
+const ROOT_DIR = path.join(__dirname, '..');
+const DecisionContractUtils = require(path.join(ROOT_DIR, 'decision-contract.js'));
+const ResponseStorageUtils = require(path.join(ROOT_DIR, 'response-storage.js'));
+
+const USAGE = [
+  'Usage:',
+  '  node bench/bench-hot-paths.js [--sizes 1000,10000,50000] [--iterations 3] [--only outbox]',
+  '                                [--save bench-baseline.json] [--compare bench-baseline.json]',
+  '                                [--threshold 0.15]',
+  'Run with `node --expose-gc` for steadier heap numbers.'
+].join('\n');
+
+const DEFAULT_SIZES = [1000, 10000, 50000];
+const DEFAULT_ITERATIONS = 3;
+const DEFAULT_THRESHOLD = 0.15;
+const UPSERT_SAMPLE_LIMIT = 50;
+// Matching cost is per conversation, so large sizes only add samples; cap them to keep runs short.
+const PROMPT_MATCH_CONVERSATION_LIMIT = 250;
+
+function parseArgs(argv) {
+  const options = {
+    sizes: DEFAULT_SIZES,
+    iterations: DEFAULT_ITERATIONS,
+    only: '',
+    save: '',
+    compare: '',
+    threshold: DEFAULT_THRESHOLD
+  };
+  for (let i = 0; i < argv.length; i += 1) {
+    const arg = argv[i];
+    const value = argv[i + 1];
+    if (arg === '--sizes') {
+      options.sizes = String(value || '')
+        .split(',')
+        .map((item) => Number.parseInt(item, 10))
+        .filter((item) => Number.isInteger(item) && item > 0);
+      i += 1;
+    } else if (arg === '--iterations') {
+      options.iterations = Math.max(1, Number.parseInt(value, 10) || DEFAULT_ITERATIONS);
+      i += 1;
+    } else if (arg === '--only') {
+      options.only = String(value || '').trim();
+      i += 1;
+    } else if (arg === '--save') {
+      options.save = String(value || '').trim();
+      i += 1;
+    } else if (arg === '--compare') {
+      options.compare = String(value || '').trim();
+      i += 1;
+    } else if (arg === '--threshold') {
+      const parsed = Number.parseFloat(value);
+      options.threshold = Number.isFinite(parsed) && parsed > 0 ? parsed : DEFAULT_THRESHOLD;
+      i += 1;
+    } else if (arg === '--help' || arg === '-h') {
+      options.help = true;
+    } else {
+      throw new Error(`Unknown argument: ${arg}`);
+    }
+  }
+  if (options.sizes.length === 0) {
+    throw new Error('--sizes needs at least one positive integer');
+  }
+  return options;
+}
+
+function createMemoryStorageArea() {
+  const data = new Map();
+  return {
+    async get(keys) {
+      if (keys === null || keys === undefined) {
+        return Object.fromEntries(data.entries());
+      }
+      const list = typeof keys === 'string'
+        ? [keys]
+        : (Array.isArray(keys) ? keys : Object.keys(keys));
+      const result = {};
+      list.forEach((key) => {
+        if (data.has(key)) {
+          result[key] = structuredClone(data.get(key));
+        } else if (keys && typeof keys === 'object' && !Array.isArray(keys) && keys[key] !== undefined) {
+          result[key] = keys[key];
+        }
+      });
+      return result;
+    },
+    async set(items) {
+      Object.entries(items || {}).forEach(([key, value]) => {
+        data.set(key, structuredClone(value));
+      });
+    },
+    async remove(keys) {
+      (Array.isArray(keys) ? keys : [keys]).forEach((key) => data.delete(key));
+    }
+  };
+}
+
+function percentile(values, ratio) {
+  if (values.length === 0) return 0;
+  const sorted = values.slice().sort((left, right) => left - right);
+  const index = Math.min(sorted.length - 1, Math.max(0, Math.ceil(sorted.length * ratio) - 1));
+  return sorted[index];
+}
+
+function collectGarbage() {
+  if (typeof global.gc === 'function') {
+    global.gc();
+  }
+}
+
+function buildCases(worker) {
+  const fn = worker.functions;
+  return [
+    {
+      name: 'decision.validateDecisionContractText',
+      mode: 'each',
+      setup: (size) => synthetic.generateResponses(size, 11).map((response) => response.text),
+      run: (text) => DecisionContractUtils.validateDecisionContractText(text)
+    },
+    {
+      name: 'responses.mergeResponseCollections',
+      mode: 'batch',
+      setup: (size) => {
+        const responses = synthetic.generateResponses(size, 12);
+        const overlap = Math.floor(size / 2);
+        return {
+          items: size,
+          primary: responses.slice(0, size - overlap),
+          secondary: responses.slice(size - overlap * 2)
+        };
+      },
+      run: (input) => ResponseStorageUtils.mergeResponseCollections(input.primary, input.secondary, DecisionContractUtils)
+    },
+    {
+      name: 'responses.readCanonicalResponses',
+      mode: 'batch',
+      setup: async (size) => {
+        const storage = { local: createMemoryStorageArea(), session: null };
+        await ResponseStorageUtils.writeCanonicalResponses(
+          synthetic.generateResponses(size, 13),
+          storage,
+          { decisionUtils: DecisionContractUtils }
+        );
+        return { items: size, storage };
+      },
+      run: (input) => ResponseStorageUtils.readCanonicalResponses(input.storage, DecisionContractUtils)
+    },
+    {
+      name: 'responses.upsertCanonicalResponse',
+      mode: 'each',
+      setup: async (size) => {
+        const storage = { local: createMemoryStorageArea(), session: null };
+        await ResponseStorageUtils.writeCanonicalResponses(
+          synthetic.generateResponses(size, 14),
+          storage,
+          { decisionUtils: DecisionContractUtils }
+        );
+        // Upsert cost depends on the store size, not on how many upserts are timed.
+        const upserts = synthetic.generateResponses(Math.min(size, UPSERT_SAMPLE_LIMIT), 15);
+        return upserts.map((response) => ({ response, storage }));
+      },
+      run: (input) => ResponseStorageUtils.upsertCanonicalResponse(input.response, input.storage, DecisionContractUtils)
+    },
+    {
+      name: 'process.normalizeProcessRecord',
+      mode: 'each',
+      setup: (size) => synthetic.generateProcesses(size, 21),
+      run: (record) => fn.normalizeProcessRecord(record)
+    },
+    {
+      name: 'process.pruneProcessRecords',
+      mode: 'batch',
+      setup: (size) => ({ items: size, records: synthetic.generateProcesses(size, 22) }),
+      run: (input) => fn.pruneProcessRecords(input.records)
+    },
+    {
+      name: 'outbox.sanitizeWatchlistOutbox',
+      mode: 'batch',
+      setup: (size) => ({ items: size, outbox: synthetic.generateOutboxItems(size, 31) }),
+      run: (input) => fn.sanitizeWatchlistOutbox(input.outbox)
+    },
+    {
+      name: 'outbox.sortWatchlistOutboxForFlush',
+      mode: 'batch',
+      setup: (size) => ({
+        items: size,
+        outbox: synthetic.generateOutboxItems(size, 32),
+        now: 1760000000000 + size * 500
+      }),
+      run: (input) => fn.sortWatchlistOutboxForFlush(input.outbox, input.now)
+    },
+    {
+      name: 'prompts.resolveCompanyPromptAssignments',
+      mode: 'each',
+      setup: (size) => {
+        const prompts = fn.parsePromptChainText(fs.readFileSync(path.join(ROOT_DIR, 'prompts-company.txt'), 'utf8'));
+        const catalog = fn.getCompanyPromptMatchCatalog(prompts, 'sha256:bench');
+        return synthetic.generateConversationMessages(prompts, size, 41)
+          .slice(0, PROMPT_MATCH_CONVERSATION_LIMIT)
+          .map((messages) => ({
+            messages,
+            catalog,
+            items: messages.length
+          }));
+      },
+      run: (input) => fn.resolveCompanyPromptAssignments(input.messages, input.catalog.records, {
+        index: input.catalog.index
+      })
+    },
+    {
+      name: 'problemLog.sanitizeProblemLogEntry',
+      mode: 'each',
+      setup: (size) => synthetic.generateProblemLogEntries(size, 51),
+      run: (entry) => fn.sanitizeProblemLogEntry(entry)
+    }
+  ];
+}
+
+async function runCase(benchCase, size, iterations) {
+  collectGarbage();
+  const input = await benchCase.setup(size);
+  const inputs = benchCase.mode === 'each' ? input : [input];
+  const itemsPerPass = inputs.reduce((sum, item) => (
+    sum + (item && Number.isInteger(item.items) ? item.items : 1)
+  ), 0);
+
+  // One untimed pass lets the JIT settle and fills any caches the worker would have warm.
+  for (const item of inputs) {
+    await benchCase.run(item);
+  }
+
+  collectGarbage();
+  const heapBefore = process.memoryUsage().heapUsed;
+  let peakHeap = heapBefore;
+  const samples = [];
+  let totalMs = 0;
+  for (let iteration = 0; iteration < iterations; iteration += 1) {
+    for (const item of inputs) {
+      const startedAt = performance.now();
+      const result = benchCase.run(item);
+      if (result && typeof result.then === 'function') {
+        await result;
+      }
+      const elapsed = performance.now() - startedAt;
+      samples.push(elapsed);
+      totalMs += elapsed;
+    }
+    peakHeap = Math.max(peakHeap, process.memoryUsage().heapUsed);
+  }
+  collectGarbage();
+  const heapAfter = process.memoryUsage().heapUsed;
+
+  const totalItems = itemsPerPass * iterations;
+  return {
+    name: benchCase.name,
+    size,
+    mode: benchCase.mode,
+    items: totalItems,
+    totalMs: Number(totalMs.toFixed(3)),
+    opsPerSec: totalMs > 0 ? Math.round(totalItems / (totalMs / 1000)) : 0,
+    p95Ms: Number(percentile(samples, 0.95).toFixed(4)),
+    maxMs: Number(Math.max(...samples).toFixed(4)),
+    heapPeakDeltaMb: Number(((peakHeap - heapBefore) / (1024 * 1024)).toFixed(2)),
+    heapRetainedDeltaMb: Number(((heapAfter - heapBefore) / (1024 * 1024)).toFixed(2))
+  };
+}
+
+function formatRow(columns, widths) {
+  return columns.map((column, index) => (
+    index === 0 ? String(column).padEnd(widths[index]) : String(column).padStart(widths[index])
+  )).join('  ');
+}
+
+function printResults(results, comparison) {
+  const header = ['case', 'size', 'items', 'ops/s', 'p95 ms', 'max ms', 'heap peak MB', 'heap kept MB'];
+  if (comparison) header.push('vs baseline');
+  const rows = results.map((result) => {
+    const row = [
+      result.name,
+      result.size,
+      result.items,
+      result.opsPerSec,
+      result.p95Ms,
+      result.maxMs,
+      result.heapPeakDeltaMb,
+      result.heapRetainedDeltaMb
+    ];
+    if (comparison) {
+      const entry = comparison.get(`${result.name}@${result.size}`);
+      row.push(entry ? `${entry.deltaPct >= 0 ? '+' : ''}${entry.deltaPct.toFixed(1)}%${entry.regressed ? ' !' : ''}` : 'n/a');
+    }
+    return row;
+  });
+  const widths = header.map((column, index) => Math.max(
+    String(column).length,
+    ...rows.map((row) => String(row[index]).length)
+  ));
+  console.log(formatRow(header, widths));
+  console.log(widths.map((width) => '-'.repeat(width)).join('  '));
+  rows.forEach((row) => console.log(formatRow(row, widths)));
+}
+
+function compareWithBaseline(results, baseline, threshold) {
+  const previous = new Map(
+    (Array.isArray(baseline?.results) ? baseline.results : [])
+      .map((result) => [`${result.name}@${result.size}`, result])
+  );
+  const comparison = new Map();
+  results.forEach((result) => {
+    const key = `${result.name}@${result.size}`;
+    const before = previous.get(key);
+    if (!before || !(before.opsPerSec > 0)) return;
+    const deltaPct = ((result.opsPerSec - before.opsPerSec) / before.opsPerSec) * 100;
+    comparison.set(key, {
+      deltaPct,
+      regressed: deltaPct < -threshold * 100
+    });
+  });
+  return comparison;
+}
+
+async function main() {
+  const options = parseArgs(process.argv.slice(2));
+  if (options.help) {
+    console.log(USAGE);
+    return;
+  }
+
+  const worker = loadWorkerFunctions([
+    'normalizeProcessRecord',
+    'pruneProcessRecords',
+    'sanitizeWatchlistOutbox',
+    'sortWatchlistOutboxForFlush',
+    'parsePromptChainText',
+    'getCompanyPromptMatchCatalog',
+    'resolveCompanyPromptAssignments',
+    'sanitizeProblemLogEntry'
+  ]);
+  const cases = buildCases(worker).filter((benchCase) => !options.only || benchCase.name.includes(options.only));
+  if (cases.length === 0) {
+    throw new Error(`No benchmark case matches --only ${options.only}`);
+  }
+
+  console.log(`node ${process.version}, ${options.iterations} iteration(s), gc ${typeof global.gc === 'function' ? 'exposed' : 'not exposed'}`);
+  const results = [];
+  for (const size of options.sizes) {
+    for (const benchCase of cases) {
+      results.push(await runCase(benchCase, size, options.iterations));
+    }
+  }
+
+  let comparison = null;
+  if (options.compare) {
+    const baseline = JSON.parse(fs.readFileSync(options.compare, 'utf8'));
+    comparison = compareWithBaseline(results, baseline, options.threshold);
+  }
+  printResults(results, comparison);
+
+  if (options.save) {
+    fs.writeFileSync(options.save, `${JSON.stringify({
+      generatedAt: new Date().toISOString(),
+      node: process.version,
+      iterations: options.iterations,
+      results
+    }, null, 2)}\n`);
+    console.log(`Saved ${results.length} result(s) to ${options.save}`);
+  }
+
+  if (comparison) {
+    const regressions = Array.from(comparison.entries()).filter(([, entry]) => entry.regressed);
+    if (regressions.length > 0) {
+      console.error(`${regressions.length} case(s) regressed by more than ${(options.threshold * 100).toFixed(0)}%: ${regressions.map(([key]) => key).join(', ')}`);
+      process.exitCode = 1;
+    }
+  }
+}
+
+main().catch((error) => {
+  console.error(error && error.stack ? error.stack : error);
+  process.exitCode = 1;
+});
@@ -0,0 +1,188 @@
+// Deterministic synthetic fixtures for the hot-path benchmarks. Every generator takes a count and
+// a seed so two runs (or two branches) measure exactly the same inputs.
+
+const COMPANIES = [
+  'Alpha Robotics', 'Beta Materials', 'Gamma Logistics', 'Delta Semiconductors', 'Epsilon Foods',
+  'Zeta Payments', 'Eta Biotech', 'Theta Energy', 'Iota Software', 'Kappa Retail'
+];
+const SECTORS = ['Technology', 'Industrials', 'Healthcare', 'Energy', 'Consumer'];
+const PROCESS_STATUSES = ['running', 'running', 'completed', 'failed', 'stopped', 'queued'];
+const PROCESS_REASONS = ['', '', 'textarea_not_found', 'response_timeout', 'rate_limited'];
+const PROBLEM_LOG_LEVELS = ['info', 'warn', 'error'];
+const PROBLEM_LOG_SOURCES = ['save-response', 'watchlist-flush', 'chatgpt-monitor', 'remote-runner'];
+const ARTICLE_SENTENCE = 'The company reported record quarterly revenue and raised guidance for next year. ';
+
+function createRandom(seed = 1) {
+  let state = seed >>> 0;
+  return function mulberry32() {
+    state = (state + 0x6D2B79F5) >>> 0;
+    let t = state;
+    t = Math.imul(t ^ (t >>> 15), t | 1);
+    t ^= t + Math.imul(t ^ (t >>> 7), t | 61);
+    return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+  };
+}
+
+function pick(random, values) {
+  return values[Math.floor(random() * values.length)];
+}
+
+function buildDecisionLine(role, company, random) {
+  const composite = (3 + random() * 2).toFixed(1);
+  const entryScore = (5 + random() * 5).toFixed(1);
+  const sector = pick(random, SECTORS);
+  return [
+    '2026-03-20',
+    pick(random, ['WATCH', 'BUY', 'AVOID']),
+    role,
+    company,
+    'THESIS_SOURCE synthetic',
+    `${company} thesis text`,
+    `Bear_TOTAL: ${Math.floor(random() * 20)}`,
+    `Base_TOTAL: ${20 + Math.floor(random() * 20)}`,
+    `Bull_TOTAL: ${40 + Math.floor(random() * 20)}`,
+    `VOI: backlog > 10%, Fals: churn > 5%, Primary risk: pricing reset, Composite: ${composite}/5.0, EntryScore: ${entryScore}/10, Sizing: 3%`,
+    sector,
+    sector,
+    'Software',
+    'Subscription',
+    'USA',
+    'USD',
+    'FQ:8,TE:7,CM:9,VS:6,TQ:7,PP:8,CP:5,CD:7,NO:8,MR:6'
+  ].join('; ');
+}
+
+function buildDecisionContractText(random, index) {
+  const company = `${pick(random, COMPANIES)} ${index}`;
+  return [
+    buildDecisionLine('PRIMARY', company, random),
+    buildDecisionLine('SECONDARY', `${pick(random, COMPANIES)} ${index + 1}`, random)
+  ].join('\n');
+}
+
+function generateResponses(count, seed = 1) {
+  const random = createRandom(seed);
+  const baseTs = 1760000000000;
+  const responses = [];
+  for (let index = 0; index < count; index += 1) {
+    responses.push({
+      responseId: `resp-${seed}-${index}`,
+      runId: `run-${seed}-${Math.floor(index / 3)}`,
+      text: buildDecisionContractText(random, index),
+      timestamp: baseTs + index * 1000,
+      source: `https://news.example.com/articles/${index}`,
+      analysisType: random() < 0.9 ? 'company' : 'portfolio',
+      conversationUrl: `https://chatgpt.com/c/${seed}-${Math.floor(index / 3)}`,
+      stage: { index: 11, name: 'Stage 12' }
+    });
+  }
+  return responses;
+}
+
+function generateProcesses(count, seed = 2) {
+  const random = createRandom(seed);
+  const baseTs = 1760000000000;
+  const processes = [];
+  for (let index = 0; index < count; index += 1) {
+    const startedAt = baseTs + index * 5000;
+    const totalPrompts = 16;
+    const currentPrompt = 1 + Math.floor(random() * totalPrompts);
+    processes.push({
+      id: `run-${seed}-${index}`,
+      title: `${pick(random, COMPANIES)} analysis`,
+      analysisType: 'company',
+      status: pick(random, PROCESS_STATUSES),
+      reason: pick(random, PROCESS_REASONS),
+      statusText: random() < 0.1 ? 'Continue button visible' : `Prompt ${currentPrompt}/${totalPrompts}`,
+      currentPrompt,
+      totalPrompts,
+      stageIndex: currentPrompt - 1,
+      stageName: `Stage ${currentPrompt}`,
+      startedAt,
+      timestamp: startedAt + Math.floor(random() * 600000),
+      chatUrl: `https://chatgpt.com/c/${seed}-${index}`,
+      sourceUrl: `https://news.example.com/articles/${index}`
+    });
+  }
+  return processes;
+}
+
+function generateOutboxItems(count, seed = 3) {
+  const random = createRandom(seed);
+  const baseTs = 1760000000000;
+  const items = [];
+  for (let index = 0; index < count; index += 1) {
+    // Roughly one in ten items re-queues an earlier response so dedup/merge paths run too.
+    const responseIndex = random() < 0.1 && index > 0 ? Math.floor(random() * index) : index;
+    const accepted = random() < 0.4;
+    items.push({
+      payload: {
+        responseId: `resp-${seed}-${responseIndex}`,
+        runId: `run-${seed}-${Math.floor(responseIndex / 3)}`,
+        source: 'company',
+        text: buildDecisionContractText(random, responseIndex),
+        timestamp: baseTs + responseIndex * 1000
+      },
+      queuedAt: baseTs + index * 1000,
+      attemptCount: Math.floor(random() * 4),
+      nextAttemptAt: random() < 0.5 ? 0 : baseTs + index * 1000 + Math.floor(random() * 120000),
+      lastError: random() < 0.2 ? 'http_503' : '',
+      deliveryAcceptedAt: accepted ? baseTs + index * 1000 + 500 : 0,
+      deliveryEventId: accepted ? 1000 + index : '',
+      verifyState: accepted ? pick(random, ['pending', 'confirmed', 'missing']) : '',
+      verifyAttemptCount: accepted ? Math.floor(random() * 3) : 0
+    });
+  }
+  return items;
+}
+
+function generateProblemLogEntries(count, seed = 4) {
+  const random = createRandom(seed);
+  const baseTs = 1760000000000;
+  const entries = [];
+  for (let index = 0; index < count; index += 1) {
+    const level = pick(random, PROBLEM_LOG_LEVELS);
+    entries.push({
+      timestamp: baseTs + index * 750,
+      level,
+      runId: `run-${seed}-${Math.floor(index / 8)}`,
+      source: pick(random, PROBLEM_LOG_SOURCES),
+      title: level === 'error' ? 'Save response failed' : 'Watchlist flush',
+      message: `${level} while processing prompt ${1 + (index % 16)}: ${ARTICLE_SENTENCE.repeat(1 + (index % 4))}`,
+      reason: level === 'error' ? 'response_timeout' : '',
+      stageName: `Stage ${1 + (index % 16)}`,
+      url: `https://chatgpt.com/c/${seed}-${Math.floor(index / 8)}`
+    });
+  }
+  return entries;
+}
+
+// Builds conversations of `messagesPerConversation` user messages that follow the prompt chain, with
+// an occasional free-form nudge ("continue") the matcher has to skip.
+function generateConversationMessages(prompts, count, seed = 5, messagesPerConversation = 40) {
+  const random = createRandom(seed);
+  const article = ARTICLE_SENTENCE.repeat(20);
+  const fill = (prompt) => prompt.replace(/\{\{\s*(?:articlecontent|article)\s*\}\}/gi, article);
+  const conversations = [];
+  let produced = 0;
+  while (produced < count) {
+    const size = Math.min(messagesPerConversation, count - produced);
+    const messages = [];
+    for (let index = 0; index < size; index += 1) {
+      messages.push(random() < 0.08 ? 'continue please' : fill(prompts[index % prompts.length]));
+    }
+    conversations.push(messages);
+    produced += size;
+  }
+  return conversations;
+}
+
+module.exports = {
+  createRandom,
+  buildDecisionContractText,
+  generateResponses,
+  generateProcesses,
+  generateOutboxItems,
+  generateProblemLogEntries,
+  generateConversationMessages
+};
@@ -0,0 +1,200 @@
+// Loads top-level functions from background.js into a vm context together with every top-level
+// function, const and let they reference (transitively), so benchmarks run the real worker code.
+const fs = require('fs');
+const path = require('path');
+const vm = require('vm');
+
+const ROOT_DIR = path.join(__dirname, '..');
+const BACKGROUND_PATH = path.join(ROOT_DIR, 'background.js');
+const DECLARATION_PATTERN = /^(?:async\s+function\s*\*?|function\s*\*?|const|let)\s+([A-Za-z_$][\w$]*)/gm;
+const IDENTIFIER_PATTERN = /[A-Za-z_$][\w$]*/g;
+const REGEX_PREFIX_PATTERN = /(?:^|[(,=:[!&|?{};+\-*%<>~^]|\breturn|\btypeof|\bcase)\s*$/;
+
+function skipRegexLiteral(source, startIndex) {
+  let inClass = false;
+  for (let i = startIndex + 1; i < source.length; i += 1) {
+    const char = source[i];
+    if (char === '\\') {
+      i += 1;
+      continue;
+    }
+    if (char === '\n') break;
+    if (inClass) {
+      if (char === ']') inClass = false;
+      continue;
+    }
+    if (char === '[') {
+      inClass = true;
+      continue;
+    }
+    if (char === '/') return i;
+  }
+  return startIndex;
+}
+
+function scanToDeclarationEnd(source, startIndex, isFunction) {
+  let depth = 0;
+  let sawBody = false;
+  let inSingle = false;
+  let inDouble = false;
+  let inTemplate = false;
+  let inLineComment = false;
+  let inBlockComment = false;
+  let escaped = false;
+
+  for (let i = startIndex; i < source.length; i += 1) {
+    const char = source[i];
+    const next = source[i + 1];
+
+    if (inLineComment) {
+      if (char === '\n') inLineComment = false;
+      continue;
+    }
+    if (inBlockComment) {
+      if (char === '*' && next === '/') {
+        inBlockComment = false;
+        i += 1;
+      }
+      continue;
+    }
+    if (inSingle || inDouble || inTemplate) {
+      if (!escaped && char === '\\') {
+        escaped = true;
+        continue;
+      }
+      if (!escaped && ((inSingle && char === '\'') || (inDouble && char === '"') || (inTemplate && char === '`'))) {
+        inSingle = false;
+        inDouble = false;
+        inTemplate = false;
+      }
+      escaped = false;
+      continue;
+    }
+
+    if (char === '/' && next === '/') {
+      inLineComment = true;
+      i += 1;
+      continue;
+    }
+    if (char === '/' && next === '*') {
+      inBlockComment = true;
+      i += 1;
+      continue;
+    }
+    if (char === '/' && REGEX_PREFIX_PATTERN.test(source.slice(Math.max(startIndex, i - 16), i))) {
+      i = skipRegexLiteral(source, i);
+      continue;
+    }
+    if (char === '\'') {
+      inSingle = true;
+      continue;
+    }
+    if (char === '"') {
+      inDouble = true;
+      continue;
+    }
+    if (char === '`') {
+      inTemplate = true;
+      continue;
+    }
+
+    if (char === '{' || char === '(' || char === '[') {
+      depth += 1;
+      if (char === '{' && isFunction) sawBody = true;
+      continue;
+    }
+    if (char === '}' || char === ')' || char === ']') {
+      depth -= 1;
+      if (isFunction && sawBody && depth === 0 && char === '}') {
+        return i + 1;
+      }
+      continue;
+    }
+    if (!isFunction && depth === 0 && char === ';') {
+      return i + 1;
+    }
+  }
+  throw new Error(`Declaration end not found at offset ${startIndex}`);
+}
+
+function indexTopLevelDeclarations(source) {
+  const declarations = new Map();
+  DECLARATION_PATTERN.lastIndex = 0;
+  let match = DECLARATION_PATTERN.exec(source);
+  while (match) {
+    const name = match[1];
+    if (!declarations.has(name)) {
+      declarations.set(name, {
+        name,
+        start: match.index,
+        isFunction: !/^(?:const|let)\b/.test(match[0])
+      });
+    }
+    match = DECLARATION_PATTERN.exec(source);
+  }
+  return declarations;
+}
+
+function collectWorkerDeclarations(source, declarations, entryNames) {
+  const selected = new Map();
+  const pending = entryNames.slice();
+  while (pending.length > 0) {
+    const name = pending.pop();
+    if (selected.has(name)) continue;
+    const declaration = declarations.get(name);
+    if (!declaration) {
+      throw new Error(`Top-level declaration not found in background.js: ${name}`);
+    }
+    const end = scanToDeclarationEnd(source, declaration.start, declaration.isFunction);
+    const text = source.slice(declaration.start, end);
+    selected.set(name, { ...declaration, text });
+    const identifiers = new Set(text.match(IDENTIFIER_PATTERN) || []);
+    identifiers.forEach((identifier) => {
+      if (identifier !== name && declarations.has(identifier) && !selected.has(identifier)) {
+        pending.push(identifier);
+      }
+    });
+  }
+  return Array.from(selected.values()).sort((left, right) => left.start - right.start);
+}
+
+function loadWorkerFunctions(entryNames, globals = {}) {
+  const source = fs.readFileSync(BACKGROUND_PATH, 'utf8');
+  const declarations = indexTopLevelDeclarations(source);
+  const selected = collectWorkerDeclarations(source, declarations, entryNames);
+  const context = {
+    console,
+    URL,
+    TextEncoder,
+    structuredClone,
+    setTimeout,
+    clearTimeout,
+    chrome: {
+      runtime: { id: 'bench', getManifest: () => ({ version: 'bench' }) },
+      storage: {
+        local: { get: async () => ({}), set: async () => {}, remove: async () => {} },
+        session: { get: async () => ({}), set: async () => {}, remove: async () => {} }
+      }
+    },
+    ProcessContractUtils: require(path.join(ROOT_DIR, 'process-contract.js')),
+    DecisionContractUtils: require(path.join(ROOT_DIR, 'decision-contract.js')),
+    ResponseStorageUtils: require(path.join(ROOT_DIR, 'response-storage.js')),
+    ...globals
+  };
+  vm.createContext(context);
+  // One script so top-level const/let bindings are shared the same way they are in the worker.
+  const exportsLine = `({ ${entryNames.join(', ')} })`;
+  const script = `${selected.map((declaration) => declaration.text).join('\n\n')}\n${exportsLine};`;
+  const exported = vm.runInContext(script, context, { filename: 'background.js' });
+  return {
+    context,
+    functions: exported,
+    declarationCount: selected.length
+  };
+}
+
+module.exports = {
+  indexTopLevelDeclarations,
+  collectWorkerDeclarations,
+  loadWorkerFunctions
+};
@@ -138,18 +138,41 @@
     return '';
   }
 
+  function hashText(text) {
+    const source = String(text || '');
+    let hash = 2166136261;
+    for (let index = 0; index < source.length; index += 1) {
+      hash ^= source.charCodeAt(index);
+      hash = Math.imul(hash, 16777619);
+    }
+    return (hash >>> 0).toString(36);
+  }
+
+  function resolveResponseContentKey(response) {
+    if (!response || typeof response !== 'object') return '';
+    // Stored records carry a contract-version + full-text hash; older ones fall back to
+    // length + head/tail so a long Stage 12 text is never hashed on every reload.
+    const contractHash = normalizeText(response.decisionContractHash);
+    if (contractHash) return contractHash;
+    const text = typeof response.text === 'string' ? response.text : '';
+    return `${text.length.toString(36)}:${hashText(text.slice(0, 256))}:${hashText(text.slice(-256))}`;
+  }
+
   function resolveCacheKey(response) {
     if (!response || typeof response !== 'object') return '';
     const responseId = normalizeText(response.responseId);
     const timestamp = Number.isInteger(response.timestamp) ? response.timestamp : 0;
     const source = normalizeText(response.source);
-    if (responseId || timestamp) return `${responseId}|${timestamp}`;
-    return `${source}|${normalizeText(response.text).slice(0, 120)}`;
+    const contentKey = resolveResponseContentKey(response);
+    if (responseId || timestamp) return `${responseId}|${timestamp}|${contentKey}`;
+    return `${source}|${contentKey}`;
   }
 
   function setCachedState(key, value) {
     if (!key) return value;
-    if (stage12ViewCache.size >= CACHE_LIMIT) {
+    if (stage12ViewCache.has(key)) {
+      stage12ViewCache.delete(key);
+    } else if (stage12ViewCache.size >= CACHE_LIMIT) {
       const oldestKey = stage12ViewCache.keys().next().value;
       if (oldestKey) stage12ViewCache.delete(oldestKey);
     }
@@ -259,7 +282,10 @@
   function buildValidatedStage12State(response, decisionUtils) {
     const cacheKey = resolveCacheKey(response);
     if (cacheKey && stage12ViewCache.has(cacheKey)) {
-      return stage12ViewCache.get(cacheKey);
+      const cached = stage12ViewCache.get(cacheKey);
+      stage12ViewCache.delete(cacheKey);
+      stage12ViewCache.set(cacheKey, cached);
+      return cached;
     }
 
     const text = normalizeText(response?.text);
@@ -488,26 +514,19 @@
     return safeLocaleCompare(left?.company, right?.company);
   }
 
-  function buildMarketRowsFromResponses(responses, decisionUtils) {
-    const dedupedRows = new Map();
-    (Array.isArray(responses) ? responses : []).forEach((response) => {
-      if ((response?.analysisType || 'company') !== 'company') return;
-      const state = buildValidatedStage12State(response, decisionUtils);
-      if (!state || !state.hasDecisionRecord) return;
-      if (state.status === 'invalid') return;
-
-      state.records.forEach((record) => {
-        if (!record || typeof record !== 'object') return;
-        if (state.status === 'current' || state.status === 'shortfall' || state.status === 'legacy') {
-          const row = buildMarketRow(record, state);
-          if (!row.company) return;
-          const existing = dedupedRows.get(row.key);
-          dedupedRows.set(row.key, pickPreferredMarketRow(row, existing, decisionUtils));
-        }
-      });
-    });
+  function buildResponseMarketRows(response, decisionUtils) {
+    if ((response?.analysisType || 'company') !== 'company') return [];
+    const state = buildValidatedStage12State(response, decisionUtils);
+    if (!state || !state.hasDecisionRecord) return [];
+    if (state.status !== 'current' && state.status !== 'shortfall' && state.status !== 'legacy') return [];
 
-    const rows = Array.from(dedupedRows.values());
+    return state.records
+      .filter((record) => record && typeof record === 'object')
+      .map((record) => buildMarketRow(record, state))
+      .filter((row) => row.company);
+  }
+
+  function sortAndRankMarketRows(rows, decisionUtils) {
     rows.sort((left, right) => compareMarketRowsDefault(left, right, decisionUtils));
     rows.forEach((row, index) => {
       row.baseRank = index + 1;
@@ -515,6 +534,135 @@
     return rows;
   }
 
+  function buildMarketRowsFromResponses(responses, decisionUtils) {
+    const dedupedRows = new Map();
+    (Array.isArray(responses) ? responses : []).forEach((response) => {
+      buildResponseMarketRows(response, decisionUtils).forEach((row) => {
+        const existing = dedupedRows.get(row.key);
+        dedupedRows.set(row.key, pickPreferredMarketRow(row, existing, decisionUtils));
+      });
+    });
+
+    return sortAndRankMarketRows(Array.from(dedupedRows.values()), decisionUtils);
+  }
+
+  function createMarketRowStore(decisionUtils) {
+    // responseKey -> { viewKey, order, rows }; rows stay memoized until the response content changes.
+    const entries = new Map();
+    const contributorsByRowKey = new Map();
+    const preferredByRowKey = new Map();
+    let rows = [];
+    let version = 0;
+
+    function attachRows(responseKey, entryRows, dirtyRowKeys) {
+      entryRows.forEach((row) => {
+        dirtyRowKeys.add(row.key);
+        if (!contributorsByRowKey.has(row.key)) {
+          contributorsByRowKey.set(row.key, new Set());
+        }
+        contributorsByRowKey.get(row.key).add(responseKey);
+      });
+    }
+
+    function detachRows(responseKey, entryRows, dirtyRowKeys) {
+      entryRows.forEach((row) => {
+        dirtyRowKeys.add(row.key);
+        const contributors = contributorsByRowKey.get(row.key);
+        if (!contributors) return;
+        contributors.delete(responseKey);
+        if (contributors.size === 0) contributorsByRowKey.delete(row.key);
+      });
+    }
+
+    function resolvePreferredRow(rowKey) {
+      const contributors = contributorsByRowKey.get(rowKey);
+      if (!contributors) return null;
+      let preferred = null;
+      Array.from(contributors)
+        .map((responseKey) => entries.get(responseKey))
+        .filter(Boolean)
+        .sort((left, right) => left.order - right.order)
+        .forEach((entry) => {
+          entry.rows.forEach((row) => {
+            if (row.key === rowKey) {
+              preferred = pickPreferredMarketRow(row, preferred, decisionUtils);
+            }
+          });
+        });
+      return preferred;
+    }
+
+    function update(responses) {
+      const seen = new Set();
+      const dirtyRowKeys = new Set();
+      const stats = { added: 0, updated: 0, removed: 0, reused: 0 };
+
+      (Array.isArray(responses) ? responses : []).forEach((response, order) => {
+        if (!response || typeof response !== 'object') return;
+        let responseKey = normalizeText(response.responseId) || resolveCacheKey(response);
+        if (seen.has(responseKey)) responseKey = `${responseKey}#${order}`;
+        seen.add(responseKey);
+
+        const viewKey = `${normalizeText(response.analysisType, 'company')}|${resolveCacheKey(response)}`;
+        const existing = entries.get(responseKey);
+        if (existing && existing.viewKey === viewKey) {
+          existing.order = order;
+          stats.reused += 1;
+          return;
+        }
+        if (existing) {
+          detachRows(responseKey, existing.rows, dirtyRowKeys);
+          stats.updated += 1;
+        } else {
+          stats.added += 1;
+        }
+        const entryRows = buildResponseMarketRows(response, decisionUtils);
+        entries.set(responseKey, { viewKey, order, rows: entryRows });
+        attachRows(responseKey, entryRows, dirtyRowKeys);
+      });
+
+      Array.from(entries.keys()).forEach((responseKey) => {
+        if (seen.has(responseKey)) return;
+        detachRows(responseKey, entries.get(responseKey).rows, dirtyRowKeys);
+        entries.delete(responseKey);
+        stats.removed += 1;
+      });
+
+      let changed = false;
+      dirtyRowKeys.forEach((rowKey) => {
+        const preferred = resolvePreferredRow(rowKey);
+        if (preferredByRowKey.get(rowKey) === preferred) return;
+        changed = true;
+        if (preferred) {
+          preferredByRowKey.set(rowKey, preferred);
+        } else {
+          preferredByRowKey.delete(rowKey);
+        }
+      });
+
+      if (changed) {
+        rows = sortAndRankMarketRows(Array.from(preferredByRowKey.values()), decisionUtils);
+        version += 1;
+      }
+      return { rows, version, changed, stats };
+    }
+
+    function clear() {
+      entries.clear();
+      contributorsByRowKey.clear();
+      preferredByRowKey.clear();
+      rows = [];
+      version += 1;
+    }
+
+    return {
+      update,
+      clear,
+      getRows: () => rows,
+      getVersion: () => version
+    };
+  }
+
   function clearStage12ViewCache() {
     stage12ViewCache.clear();
   }
@@ -522,6 +670,9 @@
   return {
     buildValidatedStage12State,
     buildMarketRowsFromResponses,
+    buildResponseMarketRows,
+    createMarketRowStore,
+    resolveResponseViewKey: resolveCacheKey,
     buildStage12PairSummary,
     pickPreferredMarketRow,
     compareMarketRowsDefault,
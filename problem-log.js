@@ -13,6 +13,13 @@ const dispatchHealthStatus = document.getElementById('dispatch-health-status');
 const dispatchHealthMain = document.getElementById('dispatch-health-main');
 const dispatchHealthDetail = document.getElementById('dispatch-health-detail');
 const dispatchHealthRefreshBtn = document.getElementById('dispatch-health-refresh-btn');
+const profilerBtn = document.getElementById('profiler-btn');
+const profilerPanel = document.getElementById('profiler-panel');
+const profilerSummary = document.getElementById('profiler-summary');
+const profilerToggleBtn = document.getElementById('profiler-toggle-btn');
+const profilerResetBtn = document.getElementById('profiler-reset-btn');
+const profilerTimingsBody = document.getElementById('profiler-timings-body');
+const profilerStorageBody = document.getElementById('profiler-storage-body');
 
 let lastEntries = [];
 let autoRefreshTimer = null;
@@ -21,6 +28,8 @@ let dispatchHealthInFlight = false;
 let dispatchHealthSnapshot = null;
 let currentSupportId = '';
 let currentViewMode = 'local';
+let profilerSnapshot = null;
+let profilerInFlight = false;
 
 function summarizeClientErrorValue(rawValue) {
   if (typeof ProblemLogUiUtils.summarizeClientErrorValue === 'function') {
@@ -233,6 +242,90 @@ async function refreshDispatchHealthStatus(forceReload = false) {
   }
 }
 
+function formatProfilerNumber(value, digits = 2) {
+  return Number.isFinite(value) ? value.toFixed(digits) : '-';
+}
+
+function renderProfilerPlaceholder(body, columns, text) {
+  const row = document.createElement('tr');
+  const cell = document.createElement('td');
+  cell.colSpan = columns;
+  cell.className = 'placeholder';
+  cell.textContent = text;
+  row.appendChild(cell);
+  body.appendChild(row);
+}
+
+function renderProfiler(profile) {
+  if (!profilerPanel || !profilerTimingsBody || !profilerStorageBody) return;
+  const enabled = profile?.enabled === true;
+  const timings = Array.isArray(profile?.timings) ? profile.timings : [];
+  const storage = Array.isArray(profile?.storage) ? profile.storage : [];
+  const totals = profile?.totals && typeof profile.totals === 'object' ? profile.totals : {};
+  if (profilerSummary) {
+    profilerSummary.textContent = [
+      `Profiler: ${enabled ? 'wlaczony' : 'wylaczony'}`,
+      enabled && Number.isInteger(profile?.startedAt) ? `od ${formatDateTime(profile.startedAt)}` : '',
+      `storage: odczyty=${totals.reads || 0} (${formatProfilerNumber((totals.readBytes || 0) / 1024, 1)} KB), zapisy=${totals.writes || 0} (${formatProfilerNumber((totals.writeBytes || 0) / 1024, 1)} KB)`
+    ].filter(Boolean).join(' | ');
+  }
+  if (profilerToggleBtn) {
+    profilerToggleBtn.textContent = enabled ? 'Wylacz' : 'Wlacz';
+    profilerToggleBtn.disabled = profilerInFlight;
+  }
+  if (profilerResetBtn) {
+    profilerResetBtn.disabled = profilerInFlight;
+  }
+
+  profilerTimingsBody.innerHTML = '';
+  if (timings.length === 0) {
+    renderProfilerPlaceholder(profilerTimingsBody, 6, enabled ? 'Brak pomiarow.' : 'Wlacz profiler, aby zbierac pomiary.');
+  }
+  timings.forEach((entry) => {
+    const row = document.createElement('tr');
+    appendCell(row, entry.name);
+    appendCell(row, String(entry.calls || 0), 'num');
+    appendCell(row, formatProfilerNumber(entry.totalMs), 'num');
+    appendCell(row, formatProfilerNumber(entry.avgMs, 3), 'num');
+    appendCell(row, formatProfilerNumber(entry.p95Ms, 3), 'num');
+    appendCell(row, formatProfilerNumber(entry.maxMs, 3), 'num');
+    profilerTimingsBody.appendChild(row);
+  });
+
+  profilerStorageBody.innerHTML = '';
+  if (storage.length === 0) {
+    renderProfilerPlaceholder(profilerStorageBody, 5, enabled ? 'Brak operacji storage.' : '-');
+  }
+  storage.slice(0, 40).forEach((entry) => {
+    const row = document.createElement('tr');
+    appendCell(row, `${entry.area}:${entry.key}`);
+    appendCell(row, String(entry.reads || 0), 'num');
+    appendCell(row, formatProfilerNumber((entry.readBytes || 0) / 1024, 1), 'num');
+    appendCell(row, String(entry.writes || 0), 'num');
+    appendCell(row, formatProfilerNumber((entry.writeBytes || 0) / 1024, 1), 'num');
+    profilerStorageBody.appendChild(row);
+  });
+}
+
+async function refreshProfiler(message = { type: 'GET_RUNTIME_PROFILE' }) {
+  if (profilerInFlight) return profilerSnapshot;
+  profilerInFlight = true;
+  try {
+    const response = await sendRuntimeMessage(message);
+    if (!response?.success) {
+      throw new Error(response?.error || 'runtime_profile_failed');
+    }
+    profilerSnapshot = response.profile || null;
+    return profilerSnapshot;
+  } catch (error) {
+    setStatus(`Blad profilera: ${error?.message || String(error)}`, true);
+    return profilerSnapshot;
+  } finally {
+    profilerInFlight = false;
+    renderProfiler(profilerSnapshot);
+  }
+}
+
 function formatDateTime(ts) {
   if (!Number.isInteger(ts) || ts <= 0) return '-';
   try {
@@ -502,6 +595,36 @@ if (dispatchHealthRefreshBtn) {
   });
 }
 
+if (profilerBtn) {
+  profilerBtn.addEventListener('click', () => {
+    if (!profilerPanel) return;
+    profilerPanel.hidden = !profilerPanel.hidden;
+    if (!profilerPanel.hidden) {
+      void refreshProfiler();
+    }
+  });
+}
+
+if (profilerToggleBtn) {
+  profilerToggleBtn.addEventListener('click', () => {
+    void refreshProfiler({
+      type: 'SET_RUNTIME_PROFILER_ENABLED',
+      enabled: profilerSnapshot?.enabled !== true,
+      reset: true
+    });
+  });
+}
+
+if (profilerResetBtn) {
+  profilerResetBtn.addEventListener('click', () => {
+    void refreshProfiler({
+      type: 'SET_RUNTIME_PROFILER_ENABLED',
+      enabled: profilerSnapshot?.enabled === true,
+      reset: true
+    });
+  });
+}
+
 if (copyBtn) {
   copyBtn.addEventListener('click', async () => {
     try {
@@ -530,6 +653,9 @@ if (chrome?.runtime?.onMessage?.addListener) {
 installProblemLogRuntimeProblemLogging();
 
 autoRefreshTimer = setInterval(() => {
+  if (profilerPanel && !profilerPanel.hidden && profilerSnapshot?.enabled === true) {
+    void refreshProfiler();
+  }
   if (currentViewMode === 'remote') {
     void refreshRemoteProblemLogs({ silent: true });
   } else {
@@ -778,6 +778,107 @@
     };
   }
 
+  function isSameProcessFieldValue(left, right) {
+    if (left === right) return true;
+    if (!left || !right || typeof left !== 'object' || typeof right !== 'object') return false;
+    try {
+      return JSON.stringify(left) === JSON.stringify(right);
+    } catch {
+      return false;
+    }
+  }
+
+  function buildProcessRecordPatch(previousRecord = null, nextRecord = null) {
+    const previous = previousRecord && typeof previousRecord === 'object' ? previousRecord : {};
+    const next = nextRecord && typeof nextRecord === 'object' ? nextRecord : {};
+    const set = {};
+    const unset = [];
+    Object.keys(next).forEach((key) => {
+      if (!Object.prototype.hasOwnProperty.call(previous, key) || !isSameProcessFieldValue(previous[key], next[key])) {
+        set[key] = next[key];
+      }
+    });
+    Object.keys(previous).forEach((key) => {
+      if (!Object.prototype.hasOwnProperty.call(next, key)) unset.push(key);
+    });
+    if (Object.keys(set).length === 0 && unset.length === 0) return null;
+    return { set, unset };
+  }
+
+  function applyProcessRecordPatch(record = null, patch = null) {
+    const base = record && typeof record === 'object' ? record : {};
+    const set = patch?.set && typeof patch.set === 'object' ? patch.set : {};
+    const next = { ...base, ...set };
+    (Array.isArray(patch?.unset) ? patch.unset : []).forEach((key) => {
+      delete next[key];
+    });
+    return next;
+  }
+
+  // Applies a PROCESSES_UPDATE delta ({ epoch, baseVersion, version, order, records, patches,
+  // queuePositions }) to a locally held snapshot. Returns ok=false when the local copy cannot be
+  // brought forward safely, in which case the caller should pull a fresh snapshot.
+  function applyProcessRegistryDelta(records = [], delta = null, options = {}) {
+    if (!delta || typeof delta !== 'object') {
+      return { ok: false, reason: 'missing_delta', records: [] };
+    }
+    const localEpoch = normalizeText(options?.epoch);
+    if (!localEpoch || normalizeText(delta.epoch) !== localEpoch) {
+      return { ok: false, reason: 'epoch_changed', records: [] };
+    }
+    const localVersion = normalizeNonNegativeInteger(options?.version, -1);
+    const baseVersion = normalizeNonNegativeInteger(delta.baseVersion, -1);
+    const targetVersion = normalizeNonNegativeInteger(delta.version, -1);
+    if (localVersion < 0 || baseVersion < 0 || localVersion < baseVersion || localVersion > targetVersion) {
+      return { ok: false, reason: 'version_diverged', records: [] };
+    }
+
+    const byId = new Map();
+    (Array.isArray(records) ? records : []).forEach((record) => {
+      if (!record || typeof record !== 'object' || !record.id) return;
+      if ('queuePosition' in record) {
+        const { queuePosition: _queuePosition, ...rest } = record;
+        byId.set(String(record.id), rest);
+        return;
+      }
+      byId.set(String(record.id), record);
+    });
+    (Array.isArray(delta.records) ? delta.records : []).forEach((record) => {
+      if (record && typeof record === 'object' && record.id) {
+        byId.set(String(record.id), record);
+      }
+    });
+    const patches = Array.isArray(delta.patches) ? delta.patches : [];
+    for (const patch of patches) {
+      const id = normalizeText(patch?.id);
+      const current = id ? byId.get(id) : null;
+      if (!current) {
+        return { ok: false, reason: 'record_missing', records: [] };
+      }
+      if (Number.isInteger(patch.recordVersion) && current.version === patch.recordVersion) continue;
+      if (current.version !== patch.baseRecordVersion) {
+        return { ok: false, reason: 'record_version_mismatch', records: [] };
+      }
+      byId.set(id, applyProcessRecordPatch(current, patch));
+    }
+
+    const queuePositions = delta.queuePositions && typeof delta.queuePositions === 'object'
+      ? delta.queuePositions
+      : {};
+    const order = Array.isArray(delta.order) ? delta.order : Array.from(byId.keys());
+    const nextRecords = [];
+    for (const rawId of order) {
+      const id = String(rawId || '');
+      const record = byId.get(id);
+      if (!record) {
+        return { ok: false, reason: 'record_missing', records: [] };
+      }
+      const queuePosition = normalizePositiveInteger(queuePositions[id], null);
+      nextRecords.push(queuePosition ? { ...record, queuePosition } : record);
+    }
+    return { ok: true, reason: '', records: nextRecords };
+  }
+
   function getProcessContract(process = {}) {
     const lifecycleStatus = isForceStoppedRecord(process)
       ? 'stopped'
@@ -817,8 +918,11 @@
     LIFECYCLE_STATUSES,
     PHASES,
     PERFORMANCE_PHASE_STALL_THRESHOLDS_MS,
+    applyProcessRecordPatch,
+    applyProcessRegistryDelta,
     buildOperatorStatusText,
     buildProcessPerformanceSnapshot,
+    buildProcessRecordPatch,
     buildStageProgressLabel,
     defaultPhaseForLifecycle,
     deriveActionRequiredFromLegacy,
@@ -22,6 +22,7 @@ let activeProcessesCache = [];
 let allProcessesCache = [];
 let analysisQueueSnapshot = null;
 let processSnapshotVersion = 0;
+let processRegistryEpoch = '';
 let queueSnapshotVersion = 0;
 let lastSignature = '';
 let lastHistorySignature = '';
@@ -45,6 +46,7 @@ const processCompanySnapshotInFlight = new Map();
 const PROCESS_AUDIT_CACHE_TTL_MS = 45_000;
 const PROCESS_COMPANY_SNAPSHOT_TTL_MS = 60_000;
 const PROCESS_MONITOR_STORAGE_KEY = 'process_monitor_state';
+const PROCESS_MONITOR_DELTA_STORAGE_KEY = 'process_monitor_delta';
 const ANALYSIS_QUEUE_STORAGE_KEY = 'analysis_queue_state';
 const MONITOR_UI_TICK_MS = 10_000;
 const DISPATCH_HEALTH_TICK_MS = 60_000;
@@ -74,12 +76,38 @@ void initializeMonitor();
 chrome.runtime.onMessage.addListener((message) => {
   if (message.type === 'PROCESSES_UPDATE') {
     lastPushUpdateAt = Date.now();
-    if (Number.isInteger(message?.version)) processSnapshotVersion = message.version;
     if (Number.isInteger(message?.queueVersion)) queueSnapshotVersion = message.queueVersion;
+    if (message.delta) {
+      const processes = applyProcessRegistryDeltaLocally(message.delta);
+      if (!processes) {
+        scheduleProcessRefresh('delta_diverged', 0);
+        return;
+      }
+      applyProcessesUpdate(processes, { queue: message.queue || null });
+      return;
+    }
+    if (Number.isInteger(message?.version)) processSnapshotVersion = message.version;
+    if (typeof message?.epoch === 'string') processRegistryEpoch = message.epoch;
     applyProcessesUpdate(message.processes, { queue: message.queue || null });
   }
 });
 
+// Brings the local snapshot forward with a registry delta; returns null when versions diverged
+// and the caller has to pull again.
+function applyProcessRegistryDeltaLocally(delta) {
+  if (typeof ProcessContractUtils?.applyProcessRegistryDelta !== 'function') return null;
+  const result = ProcessContractUtils.applyProcessRegistryDelta(allProcessesCache, delta, {
+    epoch: processRegistryEpoch,
+    version: processSnapshotVersion
+  });
+  if (!result.ok) {
+    console.info('[panel] Process delta rejected, resyncing:', result.reason);
+    return null;
+  }
+  processSnapshotVersion = delta.version;
+  return result.records;
+}
+
 function shouldRunFallbackRefresh() {
   if (!lastPushUpdateAt) return true;
   return (Date.now() - lastPushUpdateAt) > 10_000;
@@ -135,7 +163,10 @@ async function runScheduledProcessRefresh(reason = 'manual') {
 if (chrome?.storage?.onChanged?.addListener) {
   chrome.storage.onChanged.addListener((changes, areaName) => {
     if (areaName !== 'local' || !changes || typeof changes !== 'object') return;
-    if (!changes[PROCESS_MONITOR_STORAGE_KEY] && !changes[ANALYSIS_QUEUE_STORAGE_KEY]) return;
+    const processKeysChanged = !!(changes[PROCESS_MONITOR_STORAGE_KEY] || changes[PROCESS_MONITOR_DELTA_STORAGE_KEY]);
+    if (!processKeysChanged && !changes[ANALYSIS_QUEUE_STORAGE_KEY]) return;
+    // Registry flushes are followed by a PROCESSES_UPDATE push; only queue changes need a pull then.
+    if (!changes[ANALYSIS_QUEUE_STORAGE_KEY] && (Date.now() - lastPushUpdateAt) < 2_000) return;
     scheduleProcessRefresh('storage_changed', 100);
   });
 }
@@ -1524,6 +1555,7 @@ function updateSummaryPanels(allProcesses, activeProcesses, historyProcesses) {
       `Najstarszy aktywny: ${formatRelativeTime(oldestActiveTs)}`,
       `Priorytety aktywnych: P1=${priorityCounts.P1}, P2=${priorityCounts.P2}, P3=${priorityCounts.P3}, P4=${priorityCounts.P4}`,
       `Kolejka scheduler: sloty=${queueSlots}/${queueMax}, zywe_okna=${queueLiveSlots}/${queueMax}, startujace=${queueStartingSlots}, oczekuje=${queueSize}`,
+      `Adaptacyjny limit slotow: ${formatQueueConcurrencySummary(queue)}`,
       stageInfo
     ];
     if (consistencyIssues.length > 0) {
@@ -1541,6 +1573,28 @@ function updateSummaryPanels(allProcesses, activeProcesses, historyProcesses) {
   }
 }
 
+function formatQueueConcurrencySummary(queue) {
+  const concurrency = queue?.concurrency && typeof queue.concurrency === 'object' ? queue.concurrency : null;
+  if (!concurrency) return 'brak danych';
+  const parts = [
+    `cel=${concurrency.target}/${concurrency.maxSlots}`,
+    `powod=${concurrency.lastReason || '-'}`,
+    `limity=${concurrency.rateLimitCount || 0}`,
+    `ukonczone_1h=${concurrency.completedLastHour || 0}`
+  ];
+  if (Number.isInteger(concurrency.probeHeldUntil) && concurrency.probeHeldUntil > Date.now()) {
+    parts.push(`wstrzymane_do=${new Date(concurrency.probeHeldUntil).toLocaleTimeString()}`);
+  }
+  const etas = Array.isArray(queue?.jobEtas) ? queue.jobEtas : [];
+  const lastEta = etas.reduce((maxValue, entry) => (
+    Number.isInteger(entry?.etaAt) && entry.etaAt > maxValue ? entry.etaAt : maxValue
+  ), 0);
+  if (lastEta > 0) {
+    parts.push(`koniec_kolejki~${new Date(lastEta).toLocaleTimeString()}`);
+  }
+  return parts.join(', ');
+}
+
 function getStorageAreas() {
   return typeof ResponseStorageUtils.getStorageAreas === 'function'
     ? ResponseStorageUtils.getStorageAreas()
@@ -2633,15 +2687,29 @@ async function openProcessWindow(process) {
   return false;
 }
 
-async function refreshProcesses() {
-  const response = await sendRuntimeMessage({ type: 'GET_PROCESSES' });
+async function refreshProcesses(options = {}) {
+  const incremental = options?.full !== true && !!processRegistryEpoch;
+  const response = await sendRuntimeMessage(
+    incremental
+      ? { type: 'GET_PROCESSES', sinceVersion: processSnapshotVersion, epoch: processRegistryEpoch }
+      : { type: 'GET_PROCESSES' }
+  );
   if (response?.ok === false) {
     console.warn('[panel] GET_PROCESSES failed:', response.errorMessage || response.errorCode || response.error);
     return [];
   }
 
-  if (Number.isInteger(response?.version)) processSnapshotVersion = response.version;
   if (Number.isInteger(response?.queueVersion)) queueSnapshotVersion = response.queueVersion;
+  if (response?.delta) {
+    const processes = applyProcessRegistryDeltaLocally(response.delta);
+    if (!processes) {
+      return refreshProcesses({ full: true });
+    }
+    await applyProcessesUpdate(processes, { queue: response?.queue || null });
+    return processes;
+  }
+  if (Number.isInteger(response?.version)) processSnapshotVersion = response.version;
+  processRegistryEpoch = typeof response?.epoch === 'string' ? response.epoch : '';
   const processes = Array.isArray(response?.processes) ? response.processes : [];
   await applyProcessesUpdate(processes, { queue: response?.queue || null });
   return processes;
@@ -6,6 +6,11 @@
   }
 })(typeof globalThis !== 'undefined' ? globalThis : this, function createResponseStorageUtils(root) {
   const RESPONSE_STORAGE_KEY = 'responses';
+  const RESPONSE_INDEX_STORAGE_KEY = 'responses_index';
+  const RESPONSE_RECORD_KEY_PREFIX = 'responses_record:';
+  const RESPONSE_STORE_VERSION = 1;
+  const DECISION_SUMMARY_CACHE_LIMIT = 4000;
+  const decisionSummaryCaches = new WeakMap();
 
   function normalizeText(value, fallback = '') {
     const text = typeof value === 'string' ? value.trim() : '';
@@ -92,6 +97,30 @@
     };
   }
 
+  function buildDecisionContractHash(text, decisionUtils) {
+    const source = typeof text === 'string' ? text : '';
+    const utils = resolveDecisionUtils(decisionUtils);
+    const contractVersion = normalizeText(utils?.CONTRACT_VERSION, 'unknown');
+    return `${contractVersion}|${stableHash(source)}${source.length.toString(36)}`;
+  }
+
+  function getDecisionSummaryCache(utils) {
+    let cache = decisionSummaryCaches.get(utils);
+    if (!cache) {
+      cache = new Map();
+      decisionSummaryCaches.set(utils, cache);
+    }
+    return cache;
+  }
+
+  function rememberDecisionSummary(cache, contractHash, summary) {
+    if (cache.has(contractHash)) cache.delete(contractHash);
+    cache.set(contractHash, summary);
+    if (cache.size > DECISION_SUMMARY_CACHE_LIMIT) {
+      cache.delete(cache.keys().next().value);
+    }
+  }
+
   function buildDecisionContractSummaryForResponse(response, decisionUtils) {
     const normalizedResponse = response && typeof response === 'object' ? response : null;
     if (!normalizedResponse) return null;
@@ -103,7 +132,30 @@
     if (!utils || typeof utils.buildDecisionContractSummary !== 'function') {
       return normalizeDecisionContractSummary(normalizedResponse.decisionContract);
     }
-    return normalizeDecisionContractSummary(utils.buildDecisionContractSummary(normalizedResponse.text || ''));
+
+    // Parsing a Stage 12 text is the expensive part of normalization; summaries are
+    // keyed by contract version + content hash, both in memory and on the stored record.
+    const contractHash = buildDecisionContractHash(normalizedResponse.text || '', utils);
+    const cache = getDecisionSummaryCache(utils);
+    if (cache.has(contractHash)) {
+      return normalizeDecisionContractSummary(cache.get(contractHash));
+    }
+    const summary = normalizedResponse.decisionContractHash === contractHash && normalizedResponse.decisionContract
+      ? normalizeDecisionContractSummary(normalizedResponse.decisionContract)
+      : normalizeDecisionContractSummary(utils.buildDecisionContractSummary(normalizedResponse.text || ''));
+    if (summary) {
+      rememberDecisionSummary(cache, contractHash, summary);
+    }
+    return normalizeDecisionContractSummary(summary);
+  }
+
+  function setDecisionContractHash(record, decisionUtils) {
+    const utils = resolveDecisionUtils(decisionUtils);
+    if (record.decisionContract && (record.analysisType || 'company') === 'company' && utils) {
+      record.decisionContractHash = buildDecisionContractHash(record.text || '', utils);
+    } else {
+      delete record.decisionContractHash;
+    }
   }
 
   function normalizeResponseRecord(response, decisionUtils) {
@@ -148,6 +200,7 @@
     } else {
       delete normalized.decisionContract;
     }
+    setDecisionContractHash(normalized, decisionUtils);
 
     return normalized;
   }
@@ -275,6 +328,7 @@
     if (decisionContract) {
       merged.decisionContract = decisionContract;
     }
+    setDecisionContractHash(merged, decisionUtils);
 
     return merged;
   }
@@ -354,13 +408,13 @@
   }
 
   function findMatchingResponse(responses, candidate) {
-    const keys = buildResponseIdentityKeys(candidate);
-    if (keys.length === 0) return null;
+    const keys = new Set(buildResponseIdentityKeys(candidate));
+    if (keys.size === 0) return null;
     const safeResponses = Array.isArray(responses) ? responses : [];
     for (let index = 0; index < safeResponses.length; index += 1) {
       const response = safeResponses[index];
       const responseKeys = buildResponseIdentityKeys(response);
-      if (responseKeys.some((key) => keys.includes(key))) {
+      if (responseKeys.some((key) => keys.has(key))) {
         return response;
       }
     }
@@ -383,100 +437,350 @@
     await area.remove([key]);
   }
 
-  async function readCanonicalResponses(storageOverride = null, decisionUtils) {
-    const { local, session } = getStorageAreas(storageOverride);
-    const [localResponses, sessionResponses] = await Promise.all([
-      readStorageArray(local, RESPONSE_STORAGE_KEY),
+  function buildResponseRecordStorageKey(recordId) {
+    return `${RESPONSE_RECORD_KEY_PREFIX}${recordId}`;
+  }
+
+  function isResponseStorageChange(changes) {
+    if (!changes || typeof changes !== 'object') return false;
+    if (changes[RESPONSE_INDEX_STORAGE_KEY] || changes[RESPONSE_STORAGE_KEY]) return true;
+    return Object.keys(changes).some((key) => key.startsWith(RESPONSE_RECORD_KEY_PREFIX));
+  }
+
+  function generateResponseRecordId() {
+    if (root?.crypto?.randomUUID) {
+      return root.crypto.randomUUID();
+    }
+    return `${Date.now().toString(36)}_${Math.random().toString(36).slice(2, 10)}`;
+  }
+
+  function createEmptyResponseIndex() {
+    return {
+      version: RESPONSE_STORE_VERSION,
+      revision: 0,
+      updatedAt: 0,
+      order: [],
+      records: {},
+      identity: {}
+    };
+  }
+
+  function normalizeResponseIndex(rawIndex) {
+    if (!rawIndex || typeof rawIndex !== 'object' || rawIndex.version !== RESPONSE_STORE_VERSION) {
+      return createEmptyResponseIndex();
+    }
+    const records = rawIndex.records && typeof rawIndex.records === 'object' ? rawIndex.records : {};
+    return {
+      version: RESPONSE_STORE_VERSION,
+      revision: Number.isInteger(rawIndex.revision) ? rawIndex.revision : 0,
+      updatedAt: Number.isInteger(rawIndex.updatedAt) ? rawIndex.updatedAt : 0,
+      order: Array.isArray(rawIndex.order)
+        ? rawIndex.order.filter((recordId) => typeof recordId === 'string' && records[recordId])
+        : [],
+      records,
+      identity: rawIndex.identity && typeof rawIndex.identity === 'object' ? rawIndex.identity : {}
+    };
+  }
+
+  function findIndexedRecordId(index, keys) {
+    for (let position = 0; position < keys.length; position += 1) {
+      const recordId = index.identity[keys[position]];
+      if (typeof recordId === 'string' && index.records[recordId]) {
+        return recordId;
+      }
+    }
+    return '';
+  }
+
+  function registerIndexedRecord(index, recordId, record, keys) {
+    const existing = index.records[recordId];
+    const mergedKeys = Array.from(new Set([
+      ...(Array.isArray(existing?.keys) ? existing.keys : []),
+      ...keys
+    ]));
+    if (!existing) {
+      index.order.push(recordId);
+    }
+    index.records[recordId] = {
+      keys: mergedKeys,
+      timestamp: Number.isInteger(record?.timestamp) ? record.timestamp : 0
+    };
+    mergedKeys.forEach((key) => {
+      index.identity[key] = recordId;
+    });
+  }
+
+  function unregisterIndexedRecord(index, recordId) {
+    const existing = index.records[recordId];
+    if (!existing) return;
+    delete index.records[recordId];
+    index.order = index.order.filter((value) => value !== recordId);
+    (Array.isArray(existing.keys) ? existing.keys : []).forEach((key) => {
+      if (index.identity[key] === recordId) {
+        delete index.identity[key];
+      }
+    });
+  }
+
+  async function readResponseRecords(area, recordIds) {
+    const records = new Map();
+    const ids = Array.from(new Set((Array.isArray(recordIds) ? recordIds : []).filter(Boolean)));
+    if (!area || typeof area.get !== 'function' || ids.length === 0) return records;
+    const result = await area.get(ids.map((recordId) => buildResponseRecordStorageKey(recordId)));
+    ids.forEach((recordId) => {
+      const record = result?.[buildResponseRecordStorageKey(recordId)];
+      if (record && typeof record === 'object') {
+        records.set(recordId, record);
+      }
+    });
+    return records;
+  }
+
+  async function readResponseStoreState(local, session) {
+    const [localState, legacySession] = await Promise.all([
+      local && typeof local.get === 'function'
+        ? local.get([RESPONSE_INDEX_STORAGE_KEY, RESPONSE_STORAGE_KEY])
+        : Promise.resolve({}),
       readStorageArray(session, RESPONSE_STORAGE_KEY)
     ]);
-    return mergeResponseCollections(localResponses, sessionResponses, decisionUtils);
+    return {
+      index: normalizeResponseIndex(localState?.[RESPONSE_INDEX_STORAGE_KEY]),
+      legacyLocal: Array.isArray(localState?.[RESPONSE_STORAGE_KEY]) ? localState[RESPONSE_STORAGE_KEY] : [],
+      legacySession
+    };
   }
 
-  async function writeCanonicalResponses(responses, storageOverride = null, options = {}) {
-    const { local, session } = getStorageAreas(storageOverride);
-    const safeResponses = Array.isArray(responses) ? cloneJson(responses, []) : [];
+  async function findOrphanResponseRecordIds(local, index) {
+    if (!local || typeof local.getKeys !== 'function') return [];
+    const keys = await local.getKeys();
+    return (Array.isArray(keys) ? keys : [])
+      .filter((key) => typeof key === 'string' && key.startsWith(RESPONSE_RECORD_KEY_PREFIX))
+      .map((key) => key.slice(RESPONSE_RECORD_KEY_PREFIX.length))
+      .filter((recordId) => recordId && !index.records[recordId]);
+  }
+
+  // Folds responses into the indexed store in memory. Only records whose identity keys
+  // hit the index are read back from storage; everything else is O(1) per response.
+  async function mergeIntoResponseStore(index, responses, local, decisionUtils) {
+    const candidates = [];
+    (Array.isArray(responses) ? responses : []).forEach((response) => {
+      const normalized = normalizeResponseRecord(response, decisionUtils);
+      if (!normalized) {
+        candidates.push(null);
+        return;
+      }
+      const keys = buildResponseIdentityKeys(normalized);
+      candidates.push(keys.length > 0 ? { normalized, keys } : null);
+    });
+
+    const matchedIds = candidates
+      .map((candidate) => (candidate ? findIndexedRecordId(index, candidate.keys) : ''))
+      .filter(Boolean);
+    const pending = new Map();
+    const storedRecords = await readResponseRecords(local, matchedIds);
+
+    const recordIds = candidates.map((candidate) => {
+      if (!candidate) return '';
+      const { normalized, keys } = candidate;
+      const recordId = findIndexedRecordId(index, keys);
+      const current = recordId ? (pending.get(recordId) || storedRecords.get(recordId) || null) : null;
+      if (!current) {
+        const nextId = recordId || generateResponseRecordId();
+        pending.set(nextId, normalized);
+        registerIndexedRecord(index, nextId, normalized, keys);
+        return nextId;
+      }
+      const chosen = choosePreferredResponse(current, normalized, decisionUtils);
+      pending.set(recordId, chosen);
+      registerIndexedRecord(index, recordId, chosen, [
+        ...buildResponseIdentityKeys(current),
+        ...keys,
+        ...buildResponseIdentityKeys(chosen)
+      ]);
+      return recordId;
+    });
+
+    return { pending, recordIds };
+  }
+
+  async function commitResponseStore(index, pending, storage, options = {}) {
+    const { local, session } = storage;
+    index.revision += 1;
+    index.updatedAt = Date.now();
+    const patch = { [RESPONSE_INDEX_STORAGE_KEY]: index };
+    pending.forEach((record, recordId) => {
+      patch[buildResponseRecordStorageKey(recordId)] = record;
+    });
+    const removedKeys = Array.isArray(options.removeKeys) ? options.removeKeys : [];
+
     const tasks = [];
-    if (local) {
-      tasks.push(writeStorageArray(local, RESPONSE_STORAGE_KEY, safeResponses));
+    if (local && typeof local.set === 'function') {
+      tasks.push(local.set(patch));
+      if (removedKeys.length > 0 && typeof local.remove === 'function') {
+        tasks.push(local.remove(removedKeys));
+      }
     }
     if (session) {
-      if (options.mirrorToSession === true) {
-        tasks.push(writeStorageArray(session, RESPONSE_STORAGE_KEY, safeResponses));
+      if (options.mirrorToSession === true && typeof session.set === 'function') {
+        tasks.push(session.set(patch));
       } else if (options.clearSession !== false) {
         tasks.push(removeStorageKey(session, RESPONSE_STORAGE_KEY));
       }
     }
     await Promise.all(tasks);
-    return safeResponses;
   }
 
-  function shouldRewriteStorage(rawLocalResponses, rawSessionResponses, canonicalResponses) {
-    const currentLocal = cloneJson(Array.isArray(rawLocalResponses) ? rawLocalResponses : [], []);
-    const currentSession = cloneJson(Array.isArray(rawSessionResponses) ? rawSessionResponses : [], []);
-    const canonical = cloneJson(Array.isArray(canonicalResponses) ? canonicalResponses : [], []);
-    return JSON.stringify(currentLocal) !== JSON.stringify(canonical)
-      || currentSession.length > 0;
+  async function readCanonicalResponses(storageOverride = null, decisionUtils) {
+    const { local, session } = getStorageAreas(storageOverride);
+    const state = await readResponseStoreState(local, session);
+    const storedRecords = await readResponseRecords(local, state.index.order);
+    const stored = state.index.order
+      .map((recordId) => storedRecords.get(recordId))
+      .filter(Boolean);
+    if (state.legacyLocal.length === 0 && state.legacySession.length === 0) {
+      return stored;
+    }
+    return mergeResponseCollections(stored.concat(state.legacyLocal), state.legacySession, decisionUtils);
+  }
+
+  async function readCanonicalResponseCount(storageOverride = null) {
+    const { local, session } = getStorageAreas(storageOverride);
+    const state = await readResponseStoreState(local, session);
+    return state.index.order.length + state.legacyLocal.length + state.legacySession.length;
+  }
+
+  async function findCanonicalResponse(candidate, storageOverride = null) {
+    const keys = buildResponseIdentityKeys(candidate);
+    if (keys.length === 0) return null;
+    const { local } = getStorageAreas(storageOverride);
+    if (!local || typeof local.get !== 'function') return null;
+    const result = await local.get([RESPONSE_INDEX_STORAGE_KEY]);
+    const index = normalizeResponseIndex(result?.[RESPONSE_INDEX_STORAGE_KEY]);
+    const recordId = findIndexedRecordId(index, keys);
+    if (!recordId) return null;
+    const records = await readResponseRecords(local, [recordId]);
+    return records.get(recordId) || null;
+  }
+
+  async function writeCanonicalResponses(responses, storageOverride = null, options = {}) {
+    const { local, session } = getStorageAreas(storageOverride);
+    const state = await readResponseStoreState(local, session);
+    const index = createEmptyResponseIndex();
+    index.revision = state.index.revision;
+    const { pending } = await mergeIntoResponseStore(index, responses, null, options.decisionUtils);
+    const staleKeys = state.index.order
+      .filter((recordId) => !index.records[recordId])
+      .map((recordId) => buildResponseRecordStorageKey(recordId));
+    if (state.legacyLocal.length > 0) {
+      staleKeys.push(RESPONSE_STORAGE_KEY);
+    }
+    await commitResponseStore(index, pending, { local, session }, { ...options, removeKeys: staleKeys });
+    return index.order.map((recordId) => pending.get(recordId)).filter(Boolean);
   }
 
   async function migrateLegacyResponseStorage(storageOverride = null, decisionUtils, options = {}) {
     const { local, session } = getStorageAreas(storageOverride);
-    const [rawLocalResponses, rawSessionResponses] = await Promise.all([
-      readStorageArray(local, RESPONSE_STORAGE_KEY),
-      readStorageArray(session, RESPONSE_STORAGE_KEY)
-    ]);
-    const canonicalResponses = mergeResponseCollections(rawLocalResponses, rawSessionResponses, decisionUtils);
-    const shouldRewrite = shouldRewriteStorage(rawLocalResponses, rawSessionResponses, canonicalResponses);
-    if (shouldRewrite) {
-      await writeCanonicalResponses(canonicalResponses, { local, session }, options);
+    const state = await readResponseStoreState(local, session);
+    const orphanIds = await findOrphanResponseRecordIds(local, state.index);
+    if (state.legacyLocal.length === 0 && state.legacySession.length === 0 && orphanIds.length === 0) {
+      return {
+        responseCount: state.index.order.length,
+        migratedLocalCount: 0,
+        migratedSessionCount: 0,
+        repairedRecordCount: 0,
+        rewritten: false
+      };
+    }
+
+    // Shards written by a context that lost the index race are re-linked through identity keys.
+    const orphanRecords = await readResponseRecords(local, orphanIds);
+    const legacyResponses = mergeResponseCollections(state.legacyLocal, state.legacySession, decisionUtils);
+    const index = state.index;
+    const { pending } = await mergeIntoResponseStore(
+      index,
+      Array.from(orphanRecords.values()).concat(legacyResponses),
+      local,
+      decisionUtils
+    );
+    const removeKeys = orphanIds
+      .filter((recordId) => !index.records[recordId])
+      .map((recordId) => buildResponseRecordStorageKey(recordId));
+    if (state.legacyLocal.length > 0) {
+      removeKeys.push(RESPONSE_STORAGE_KEY);
     }
+    await commitResponseStore(index, pending, { local, session }, { ...options, removeKeys });
     return {
-      responses: canonicalResponses,
-      migratedSessionCount: Array.isArray(rawSessionResponses) ? rawSessionResponses.length : 0,
-      rewritten: shouldRewrite
+      responseCount: index.order.length,
+      migratedLocalCount: state.legacyLocal.length,
+      migratedSessionCount: state.legacySession.length,
+      repairedRecordCount: orphanIds.length,
+      rewritten: true
     };
   }
 
   async function upsertCanonicalResponse(response, storageOverride = null, decisionUtils, options = {}) {
     const { local, session } = getStorageAreas(storageOverride);
-    const [rawLocalResponses, rawSessionResponses] = await Promise.all([
-      readStorageArray(local, RESPONSE_STORAGE_KEY),
-      readStorageArray(session, RESPONSE_STORAGE_KEY)
-    ]);
-    const merged = mergeResponseCollections(rawLocalResponses, rawSessionResponses, decisionUtils);
-    const nextResponses = mergeResponseCollections(merged, [response], decisionUtils);
-    await writeCanonicalResponses(nextResponses, { local, session }, options);
+    const state = await readResponseStoreState(local, session);
+    const index = state.index;
+    const legacyResponses = state.legacyLocal.length > 0 || state.legacySession.length > 0
+      ? mergeResponseCollections(state.legacyLocal, state.legacySession, decisionUtils)
+      : [];
+    const { pending, recordIds } = await mergeIntoResponseStore(
+      index,
+      legacyResponses.concat([response]),
+      local,
+      decisionUtils
+    );
+    await commitResponseStore(index, pending, { local, session }, {
+      ...options,
+      removeKeys: state.legacyLocal.length > 0 ? [RESPONSE_STORAGE_KEY] : []
+    });
+    const recordId = recordIds[recordIds.length - 1] || '';
     return {
-      responses: nextResponses,
-      savedResponse: findMatchingResponse(nextResponses, response),
+      recordId,
+      responseCount: index.order.length,
+      savedResponse: recordId ? pending.get(recordId) || null : null,
       rewritten: true
     };
   }
 
   async function clearCanonicalResponses(storageOverride = null) {
     const { local, session } = getStorageAreas(storageOverride);
+    const state = await readResponseStoreState(local, session);
+    const orphanIds = await findOrphanResponseRecordIds(local, state.index);
+    const removeKeys = [
+      RESPONSE_INDEX_STORAGE_KEY,
+      RESPONSE_STORAGE_KEY,
+      ...state.index.order.concat(orphanIds).map((recordId) => buildResponseRecordStorageKey(recordId))
+    ];
     const tasks = [];
-    if (local) {
-      tasks.push(writeStorageArray(local, RESPONSE_STORAGE_KEY, []));
+    if (local && typeof local.remove === 'function') {
+      tasks.push(local.remove(removeKeys));
     }
-    if (session) {
-      tasks.push(writeStorageArray(session, RESPONSE_STORAGE_KEY, []));
+    if (session && typeof session.remove === 'function') {
+      tasks.push(session.remove(removeKeys));
     }
     await Promise.all(tasks);
   }
 
   return {
+    RESPONSE_INDEX_STORAGE_KEY,
+    RESPONSE_RECORD_KEY_PREFIX,
     RESPONSE_STORAGE_KEY,
     buildDecisionContractSummaryForResponse,
     buildResponseIdentityKeys,
     choosePreferredResponse,
     clearCanonicalResponses,
     computeResponseRichness,
+    findCanonicalResponse,
     findMatchingResponse,
     getStorageAreas,
+    isResponseStorageChange,
     mergeResponseCollections,
     migrateLegacyResponseStorage,
     normalizeResponseRecord,
     normalizeResponseTextForHash,
+    readCanonicalResponseCount,
     readCanonicalResponses,
     stableHash,
     upsertCanonicalResponse,
@@ -44,6 +44,25 @@ let lastLoadedResponses = [];
 let scheduledResponsesReloadTimer = null;
 let responsesReloadInFlight = false;
 let responsesReloadQueued = false;
+let responseViewIndex = new Map();
+let responseViewEntries = [];
+let responseViewIndexSource = null;
+let responseViewIndexVersion = 0;
+let companyResponseViewCache = null;
+let companyQueryMatcherCache = null;
+let marketRowsVersion = 0;
+let marketRowsRenderedVersion = -1;
+let marketViewCache = null;
+let marketSectorCountsCache = null;
+let companyResponsesWindow = null;
+let marketRowsWindow = null;
+const marketRowStore = typeof DecisionViewModelUtils.createMarketRowStore === 'function'
+  ? DecisionViewModelUtils.createMarketRowStore(DecisionContractUtils)
+  : null;
+const TEXT_SORT_COLLATOR = new Intl.Collator('pl', { sensitivity: 'base' });
+const RESPONSE_ITEM_ESTIMATED_HEIGHT_PX = 180;
+const MARKET_ROW_ESTIMATED_HEIGHT_PX = 44;
+const WINDOWED_RENDER_OVERSCAN_PX = 1200;
 
 // Clipboard copy counters (in-memory per tab open).
 const clipboardCounters = {
@@ -74,6 +93,13 @@ function makeResponseKey(response) {
   return ResponseStorageUtils.buildResponseIdentityKeys(response).join('|');
 }
 
+function isResponseStorageChange(changes) {
+  if (typeof ResponseStorageUtils.isResponseStorageChange === 'function') {
+    return ResponseStorageUtils.isResponseStorageChange(changes);
+  }
+  return !!changes?.[RESPONSE_STORAGE_KEY];
+}
+
 function mergeResponses(primary, secondary) {
   return typeof ResponseStorageUtils.mergeResponseCollections === 'function'
     ? ResponseStorageUtils.mergeResponseCollections(primary, secondary, DecisionContractUtils)
@@ -295,6 +321,114 @@ function responseMatchesCompanyQuery(response, query) {
   return fallbackHaystack.includes(normalizeFuzzyText(normalizedQuery));
 }
 
+function resolveResponseViewKey(response) {
+  if (typeof DecisionViewModelUtils.resolveResponseViewKey === 'function') {
+    return DecisionViewModelUtils.resolveResponseViewKey(response);
+  }
+  const text = typeof response?.text === 'string' ? response.text : '';
+  const timestamp = Number.isInteger(response?.timestamp) ? response.timestamp : 0;
+  return `${normalizeMarketText(response?.responseId)}|${timestamp}|${text.length}`;
+}
+
+function buildResponseIndexEntry(response, key) {
+  const sourceInfo = describeResponseSource(response);
+  return {
+    key,
+    response,
+    analysisType: response?.analysisType || 'company',
+    sourceSortKey: sourceInfo.sortKey,
+    sourceRaw: sourceInfo.raw,
+    companyEntries: buildResponseCompanyEntries(response),
+    // Folded source+text is only needed for responses without Stage 12 companies.
+    fallbackHaystack: null
+  };
+}
+
+function getResponseIndexEntry(response) {
+  const key = resolveResponseViewKey(response);
+  const existing = responseViewIndex.get(key);
+  if (existing) {
+    existing.response = response;
+    return existing;
+  }
+  const entry = buildResponseIndexEntry(response, key);
+  responseViewIndex.set(key, entry);
+  return entry;
+}
+
+// Reuses index entries of unchanged responses; only added or edited responses are re-derived.
+function syncResponseViewIndex(responses) {
+  const safeResponses = Array.isArray(responses) ? responses : [];
+  if (responseViewIndexSource === safeResponses) return responseViewEntries;
+
+  const previousEntries = responseViewEntries;
+  const nextIndex = new Map();
+  let changed = previousEntries.length !== safeResponses.length;
+  const entries = safeResponses.map((response, index) => {
+    let key = resolveResponseViewKey(response);
+    if (nextIndex.has(key)) key = `${key}#${index}`;
+    let entry = responseViewIndex.get(key);
+    if (entry) {
+      entry.response = response;
+    } else {
+      entry = buildResponseIndexEntry(response, key);
+    }
+    nextIndex.set(key, entry);
+    if (previousEntries[index] !== entry) changed = true;
+    return entry;
+  });
+
+  responseViewIndex = nextIndex;
+  responseViewEntries = entries;
+  responseViewIndexSource = safeResponses;
+  if (changed) responseViewIndexVersion += 1;
+  return entries;
+}
+
+function createCompanyQueryMatcher(query) {
+  const normalizedQuery = normalizeMarketText(query);
+  const foldedQuery = normalizeFuzzyText(normalizedQuery);
+  const tokenScores = new Map();
+  const rowResults = new Map();
+
+  // Rows and responses share a small vocabulary, so results are keyed by search text, not by row.
+  function matchRow(row) {
+    if (!normalizedQuery) return { matched: true, score: 0 };
+    const signature = `${row?.companyFuzzy || ''}|${row?.tickerFuzzy || ''}|${row?.searchHaystack || ''}`;
+    let result = rowResults.get(signature);
+    if (!result) {
+      result = scoreCompanyQueryAgainstRow(normalizedQuery, row, tokenScores);
+      rowResults.set(signature, result);
+    }
+    return result;
+  }
+
+  function matchEntry(entry) {
+    if (!normalizedQuery) return true;
+    if (entry.companyEntries.length > 0) {
+      return entry.companyEntries.some((companyEntry) => matchRow(companyEntry).matched);
+    }
+    if (entry.fallbackHaystack === null) {
+      entry.fallbackHaystack = normalizeFuzzyText(`${entry.response?.source || ''} ${entry.response?.text || ''}`);
+    }
+    return entry.fallbackHaystack.includes(foldedQuery);
+  }
+
+  return {
+    query: normalizedQuery,
+    matchRow,
+    matchEntry
+  };
+}
+
+function getCompanyQueryMatcher(query) {
+  const normalizedQuery = normalizeMarketText(query);
+  if (!companyQueryMatcherCache || companyQueryMatcherCache.query !== normalizedQuery) {
+    companyQueryMatcherCache = createCompanyQueryMatcher(normalizedQuery);
+  }
+  return companyQueryMatcherCache;
+}
+
 function buildResponseCardHeaderModel(response) {
   const sourceInfo = describeResponseSource(response);
   const companyEntries = buildResponseCompanyEntries(response);
@@ -324,8 +458,9 @@ function filterResponsesByAnalysisType(responses, analysisType, companyQuery = m
   const filtered = Array.isArray(responses)
     ? responses.filter((response) => (response.analysisType || 'company') === analysisType)
     : [];
-  if (analysisType !== 'company') return filtered;
-  return filtered.filter((response) => responseMatchesCompanyQuery(response, companyQuery));
+  if (analysisType !== 'company' || !normalizeMarketText(companyQuery)) return filtered;
+  const matcher = getCompanyQueryMatcher(companyQuery);
+  return filtered.filter((response) => matcher.matchEntry(getResponseIndexEntry(response)));
 }
 
 function flattenResponseTextForExport(text) {
@@ -550,7 +685,7 @@ function describeResponseSource(response) {
 }
 
 function compareTextForSort(left, right) {
-  return String(left || '').localeCompare(String(right || ''), 'pl', { sensitivity: 'base' });
+  return TEXT_SORT_COLLATOR.compare(String(left || ''), String(right || ''));
 }
 
 function compareByTimestampDesc(left, right) {
@@ -566,31 +701,35 @@ function normalizeCompanySortMode(value) {
   return 'latest';
 }
 
-function sortCompanyResponses(responses) {
-  const safe = Array.isArray(responses) ? responses.slice() : [];
+function sortCompanyResponseEntries(entries) {
+  const safe = Array.isArray(entries) ? entries.slice() : [];
   const mode = normalizeCompanySortMode(companySortMode);
 
   safe.sort((left, right) => {
     if (mode === 'source_asc' || mode === 'source_desc') {
-      const leftSource = describeResponseSource(left);
-      const rightSource = describeResponseSource(right);
-      const sourceDiff = compareTextForSort(leftSource.sortKey, rightSource.sortKey);
+      const sourceDiff = compareTextForSort(left.sourceSortKey, right.sourceSortKey);
       if (sourceDiff !== 0) {
         return mode === 'source_desc' ? -sourceDiff : sourceDiff;
       }
     }
 
-    const tsDiff = compareByTimestampDesc(left, right);
+    const tsDiff = compareByTimestampDesc(left.response, right.response);
     if (tsDiff !== 0) return tsDiff;
 
-    const leftSourceRaw = describeResponseSource(left).raw;
-    const rightSourceRaw = describeResponseSource(right).raw;
-    return compareTextForSort(leftSourceRaw, rightSourceRaw);
+    return compareTextForSort(left.sourceRaw, right.sourceRaw);
   });
 
   return safe;
 }
 
+function sortCompanyResponses(responses) {
+  const entries = (Array.isArray(responses) ? responses : []).map((response) => ({
+    ...getResponseIndexEntry(response),
+    response
+  }));
+  return sortCompanyResponseEntries(entries).map((entry) => entry.response);
+}
+
 function getSortedResponsesForAnalysis(responses, analysisType) {
   const safe = Array.isArray(responses) ? responses.slice() : [];
   const normalizedType = normalizeSourceText(analysisType, 'company').toLowerCase();
@@ -638,12 +777,6 @@ function ensureResponseStorageReady() {
   return responseStorageReady;
 }
 
-function clearStage12ViewCache() {
-  if (typeof DecisionViewModelUtils.clearStage12ViewCache === 'function') {
-    DecisionViewModelUtils.clearStage12ViewCache();
-  }
-}
-
 async function readResponsesFromStorage() {
   return typeof ResponseStorageUtils.readCanonicalResponses === 'function'
     ? ResponseStorageUtils.readCanonicalResponses(getStorageAreas(), DecisionContractUtils)
@@ -860,12 +993,11 @@ async function copyAllByTypeWithLink(analysisType, button) {
 async function loadResponses() {
   try {
     console.log('[loadResponses] Wczytuję odpowiedzi z storage...');
-    clearStage12ViewCache();
     await ensureResponseStorageReady();
     const responses = await readResponsesFromStorage();
     lastLoadedResponses = Array.isArray(responses) ? responses.slice() : [];
     
-    console.log(`[loadResponses] Wczytano ${responses.length} odpowiedzi:`, responses);
+    console.log(`[loadResponses] Wczytano ${responses.length} odpowiedzi`);
     
     renderResponses(responses);
     loadMarketData(responses);
@@ -883,7 +1015,8 @@ function renderResponses(responses) {
   console.log(`[renderResponses] Renderuję ${safeResponses.length} odpowiedzi`);
   
   // Starsze odpowiedzi bez analysisType domyślnie 'company'
-  const companyResponses = filterResponsesByAnalysisType(safeResponses, 'company');
+  syncResponseViewIndex(safeResponses);
+  const companyResponses = getCompanyResponseView();
   
   console.log(`   Company: ${companyResponses.length}`);
   
@@ -942,18 +1075,208 @@ function updateCompanyEmptyState(query) {
   companyEmptyStateBody.textContent = `Nie znaleziono raportów pasujących do: ${normalizedQuery}`;
 }
 
-// Funkcja renderująca odpowiedzi w danej sekcji
-function renderResponsesInSection(listElement, responses) {
-  const sortedResponses = sortCompanyResponses(responses);
-  
-  // Wyczyść listę
-  listElement.innerHTML = '';
-  
-  // Renderuj każdą odpowiedź
-  sortedResponses.forEach((response) => {
-    const item = createResponseItem(response);
-    listElement.appendChild(item);
-  });
+function getCompanyResponseView() {
+  const query = normalizeMarketText(marketFilters.companyQuery);
+  const cacheKey = `${responseViewIndexVersion}|${normalizeCompanySortMode(companySortMode)}|${query}`;
+  if (companyResponseViewCache?.key === cacheKey) return companyResponseViewCache.entries;
+
+  const matcher = getCompanyQueryMatcher(query);
+  const filtered = responseViewEntries.filter((entry) => entry.analysisType === 'company' && matcher.matchEntry(entry));
+  const entries = sortCompanyResponseEntries(filtered);
+  companyResponseViewCache = { key: cacheKey, entries };
+  return entries;
+}
+
+// Renders only the items around the viewport; spacers keep the scroll height of the full list.
+function createWindowedRenderer(options = {}) {
+  const container = options.container || null;
+  const estimatedItemHeight = Number.isFinite(options.estimatedItemHeight) && options.estimatedItemHeight > 0
+    ? options.estimatedItemHeight
+    : 100;
+  const overscanPx = Number.isFinite(options.overscanPx) && options.overscanPx >= 0
+    ? options.overscanPx
+    : WINDOWED_RENDER_OVERSCAN_PX;
+  const getItemKey = options.getItemKey;
+  const getItemSignature = typeof options.getItemSignature === 'function' ? options.getItemSignature : () => '';
+  const state = {
+    items: [],
+    heights: new Map(),
+    rendered: new Map(),
+    topSpacer: null,
+    bottomSpacer: null,
+    frameId: null,
+    listening: false
+  };
+  const resizeObserver = typeof ResizeObserver === 'function'
+    ? new ResizeObserver(() => scheduleRender())
+    : null;
+
+  function getItemHeight(item) {
+    const height = state.heights.get(getItemKey(item));
+    return Number.isFinite(height) && height > 0 ? height : estimatedItemHeight;
+  }
+
+  function sumHeights(from, to) {
+    let total = 0;
+    for (let index = from; index < to; index += 1) {
+      total += getItemHeight(state.items[index]);
+    }
+    return total;
+  }
+
+  function ensureSpacers() {
+    if (!state.topSpacer) {
+      state.topSpacer = options.createSpacer();
+      state.bottomSpacer = options.createSpacer();
+    }
+    if (state.topSpacer.parentNode !== container) {
+      container.insertBefore(state.topSpacer, container.firstChild);
+    }
+    if (state.bottomSpacer.parentNode !== container) {
+      container.appendChild(state.bottomSpacer);
+    }
+  }
+
+  function computeRange() {
+    const rect = container.getBoundingClientRect();
+    const viewportHeight = window.innerHeight || document.documentElement?.clientHeight || 0;
+    const windowTop = -rect.top - overscanPx;
+    const windowBottom = -rect.top + viewportHeight + overscanPx;
+    let offset = 0;
+    let start = -1;
+    let end = state.items.length;
+    for (let index = 0; index < state.items.length; index += 1) {
+      if (offset >= windowBottom) {
+        end = index;
+        break;
+      }
+      const height = getItemHeight(state.items[index]);
+      if (start < 0 && offset + height > windowTop) start = index;
+      offset += height;
+    }
+    return { start: start < 0 ? end : start, end };
+  }
+
+  function measureRenderedHeights(nodes, keys) {
+    nodes.forEach((node, index) => {
+      // The distance to the next sibling includes list gaps and margins, which offsetHeight misses.
+      const nextNode = index + 1 < nodes.length ? nodes[index + 1] : state.bottomSpacer;
+      const height = nextNode && nextNode.offsetParent && nextNode.offsetParent === node.offsetParent
+        ? nextNode.offsetTop - node.offsetTop
+        : node.offsetHeight;
+      if (height > 0) state.heights.set(keys[index], height);
+    });
+  }
+
+  function render() {
+    state.frameId = null;
+    if (!container) return;
+    ensureSpacers();
+
+    const { start, end } = computeRange();
+    const nextRendered = new Map();
+    const nodes = [];
+    const keys = [];
+    for (let index = start; index < end; index += 1) {
+      const item = state.items[index];
+      const key = getItemKey(item);
+      const signature = getItemSignature(item);
+      const cached = state.rendered.get(key);
+      const reusable = cached && cached.item === item && cached.signature === signature;
+      const node = reusable ? cached.node : options.renderItem(item);
+      if (!reusable && resizeObserver) resizeObserver.observe(node);
+      nextRendered.set(key, { item, signature, node });
+      nodes.push(node);
+      keys.push(key);
+    }
+
+    state.rendered.forEach((entry, key) => {
+      if (nextRendered.get(key)?.node === entry.node) return;
+      if (resizeObserver) resizeObserver.unobserve(entry.node);
+      entry.node.remove();
+    });
+    state.rendered = nextRendered;
+
+    let cursor = state.topSpacer;
+    nodes.forEach((node) => {
+      if (cursor.nextSibling !== node) container.insertBefore(node, cursor.nextSibling);
+      cursor = node;
+    });
+    if (cursor.nextSibling !== state.bottomSpacer) {
+      container.insertBefore(state.bottomSpacer, cursor.nextSibling);
+    }
+
+    measureRenderedHeights(nodes, keys);
+    state.topSpacer.style.height = `${Math.round(sumHeights(0, start))}px`;
+    state.bottomSpacer.style.height = `${Math.round(sumHeights(end, state.items.length))}px`;
+  }
+
+  function scheduleRender() {
+    if (state.frameId !== null) return;
+    state.frameId = typeof requestAnimationFrame === 'function'
+      ? requestAnimationFrame(render)
+      : setTimeout(render, 16);
+  }
+
+  function listen() {
+    if (state.listening || typeof window?.addEventListener !== 'function') return;
+    window.addEventListener('scroll', scheduleRender, { passive: true });
+    window.addEventListener('resize', scheduleRender);
+    state.listening = true;
+  }
+
+  function setItems(items) {
+    state.items = Array.isArray(items) ? items : [];
+    const liveKeys = new Set(state.items.map((item) => getItemKey(item)));
+    Array.from(state.heights.keys()).forEach((key) => {
+      if (!liveKeys.has(key)) state.heights.delete(key);
+    });
+    listen();
+    render();
+  }
+
+  return {
+    setItems,
+    render,
+    scheduleRender,
+    getRenderedCount: () => state.rendered.size
+  };
+}
+
+function createWindowedListSpacer() {
+  const spacer = document.createElement('div');
+  spacer.className = 'virtual-spacer';
+  spacer.setAttribute('aria-hidden', 'true');
+  return spacer;
+}
+
+function createWindowedTableSpacer() {
+  const spacer = document.createElement('tr');
+  spacer.className = 'virtual-spacer';
+  spacer.setAttribute('aria-hidden', 'true');
+  const cell = document.createElement('td');
+  cell.colSpan = marketSortableHeaders.length || 11;
+  spacer.appendChild(cell);
+  return spacer;
+}
+
+function getCompanyResponsesWindow() {
+  if (!companyResponsesWindow) {
+    companyResponsesWindow = createWindowedRenderer({
+      container: companyResponsesList,
+      estimatedItemHeight: RESPONSE_ITEM_ESTIMATED_HEIGHT_PX,
+      getItemKey: (entry) => entry.key,
+      renderItem: (entry) => createResponseItem(entry.response),
+      createSpacer: createWindowedListSpacer
+    });
+  }
+  return companyResponsesWindow;
+}
+
+// Funkcja renderująca odpowiedzi w danej sekcji (lista jest już przefiltrowana i posortowana)
+function renderResponsesInSection(listElement, entries) {
+  if (listElement !== companyResponsesList) return;
+  getCompanyResponsesWindow().setItems(entries);
 }
 
 // Funkcja tworząca element odpowiedzi
@@ -1243,7 +1566,7 @@ function scoreTokenSimilarity(query, token) {
   return Math.round(130 + similarity * 90);
 }
 
-function scoreCompanyQueryAgainstRow(query, row) {
+function scoreCompanyQueryAgainstRow(query, row, tokenScores = null) {
   const normalizedQuery = normalizeFuzzyText(query);
   if (!normalizedQuery) {
     return {
@@ -1269,14 +1592,25 @@ function scoreCompanyQueryAgainstRow(query, row) {
     bestScore = Math.max(bestScore, 195);
   }
 
+  const scoreToken = (token, rowToken) => {
+    if (!tokenScores) return scoreTokenSimilarity(token, rowToken);
+    const cacheKey = `${token} ${rowToken}`;
+    let score = tokenScores.get(cacheKey);
+    if (score === undefined) {
+      score = scoreTokenSimilarity(token, rowToken);
+      tokenScores.set(cacheKey, score);
+    }
+    return score;
+  };
+
   const evaluateSingle = (token) => {
     let localBest = Number.NEGATIVE_INFINITY;
     rowTokens.forEach((rowToken) => {
-      const score = scoreTokenSimilarity(token, rowToken);
+      const score = scoreToken(token, rowToken);
       if (score > localBest) localBest = score;
     });
     if (ticker) {
-      const tickerScore = scoreTokenSimilarity(token, ticker);
+      const tickerScore = scoreToken(token, ticker);
       if (tickerScore > localBest) localBest = tickerScore;
     }
     return localBest;
@@ -1300,7 +1634,7 @@ function scoreCompanyQueryAgainstRow(query, row) {
 }
 
 function safeLocaleCompare(left, right) {
-  return String(left || '').localeCompare(String(right || ''), 'pl', { sensitivity: 'base' });
+  return TEXT_SORT_COLLATOR.compare(String(left || ''), String(right || ''));
 }
 
 function extractTickerFromCompany(companyLabel) {
@@ -1441,6 +1775,10 @@ function sortMarketRows(rows) {
   const source = Array.isArray(rows) ? rows.slice() : [];
   const sortKey = normalizeMarketText(marketSortState?.key, 'rank');
   const direction = marketSortState?.direction === 'desc' ? 'desc' : 'asc';
+  // Market rows arrive ranked, and filtering keeps their order.
+  if (sortKey === 'rank') {
+    return direction === 'desc' ? source.reverse() : source;
+  }
 
   source.sort((left, right) => {
     const leftValue = getMarketSortValue(left, sortKey);
@@ -1483,9 +1821,10 @@ function getActiveMarketFilterLabels() {
 
 function applyMarketFilters(rows) {
   const source = Array.isArray(rows) ? rows : [];
+  const matcher = getCompanyQueryMatcher(marketFilters.companyQuery);
   return source.filter((row) => {
     if (marketFilters.companyQuery) {
-      const match = scoreCompanyQueryAgainstRow(marketFilters.companyQuery, row);
+      const match = matcher.matchRow(row);
       if (!match.matched) return false;
     }
     if (marketFilters.sector && normalizeMarketToken(row?.sector) !== normalizeMarketToken(marketFilters.sector)) {
@@ -1552,6 +1891,24 @@ function createMarketFilterChip(columnKey, rawValue, emptyFallback = '-') {
   return button;
 }
 
+function getMarketSectorCounts() {
+  if (marketSectorCountsCache?.version === marketRowsVersion) return marketSectorCountsCache.sectors;
+  const counters = new Map();
+  marketRows.forEach((row) => {
+    const sector = getNormalizedFilterValue(row?.sector);
+    if (!sector) return;
+    counters.set(sector, (counters.get(sector) || 0) + 1);
+  });
+
+  const sectors = Array.from(counters.entries()).sort((left, right) => {
+    const countDiff = right[1] - left[1];
+    if (countDiff !== 0) return countDiff;
+    return safeLocaleCompare(left[0], right[0]);
+  });
+  marketSectorCountsCache = { version: marketRowsVersion, sectors };
+  return sectors;
+}
+
 function renderMarketSectorButtons() {
   if (!marketSectorFilters) return;
   marketSectorFilters.innerHTML = '';
@@ -1570,20 +1927,7 @@ function renderMarketSectorButtons() {
   });
   marketSectorFilters.appendChild(allButton);
 
-  const counters = new Map();
-  marketRows.forEach((row) => {
-    const sector = getNormalizedFilterValue(row?.sector);
-    if (!sector) return;
-    counters.set(sector, (counters.get(sector) || 0) + 1);
-  });
-
-  const sectors = Array.from(counters.entries()).sort((left, right) => {
-    const countDiff = right[1] - left[1];
-    if (countDiff !== 0) return countDiff;
-    return safeLocaleCompare(left[0], right[0]);
-  });
-
-  sectors.forEach(([sector, count]) => {
+  getMarketSectorCounts().forEach(([sector, count]) => {
     const button = document.createElement('button');
     button.type = 'button';
     button.className = 'market-filter-btn';
@@ -1598,77 +1942,92 @@ function renderMarketSectorButtons() {
   });
 }
 
-function renderMarketRows(rows) {
-  if (!marketTableBody) return;
-  marketTableBody.innerHTML = '';
-
-  rows.forEach((row) => {
-    const tr = document.createElement('tr');
-
-    const rank = document.createElement('td');
-    rank.textContent = String(row.baseRank || '-');
-
-    const company = document.createElement('td');
-    const companyName = document.createElement('button');
-    companyName.type = 'button';
-    companyName.className = 'market-company-link';
-    companyName.textContent = row.company || '-';
-    companyName.title = 'Pokaż raporty dla tej spółki';
-    companyName.addEventListener('click', () => {
-      activateCompanyQuery(row.company || row.ticker);
-    });
-    company.appendChild(companyName);
-    const badgeMeta = describeDecisionContractBadge({
-      status: row.contractStatus,
-      issueCodes: row.contractIssueCodes
-    }, { compact: true });
-    if (badgeMeta) {
-      const badge = document.createElement('div');
-      badge.className = badgeMeta.className;
-      badge.textContent = badgeMeta.text;
-      company.appendChild(badge);
-    }
-
-    const ticker = document.createElement('td');
-    ticker.textContent = row.ticker || '-';
-
-    const decisionStatus = document.createElement('td');
-    decisionStatus.textContent = row.decisionStatus || '-';
-
-    const role = document.createElement('td');
-    role.textContent = row.role || '-';
-
-    const composite = document.createElement('td');
-    composite.textContent = row.compositeText || '-';
+function createMarketRowElement(row) {
+  const tr = document.createElement('tr');
 
-    const sizing = document.createElement('td');
-    sizing.textContent = row.sizingText || '-';
+  const rank = document.createElement('td');
+  rank.textContent = String(row.baseRank || '-');
 
-    const sector = document.createElement('td');
-    sector.appendChild(createMarketFilterChip('sector', row.sector));
-
-    const region = document.createElement('td');
-    region.textContent = row.region || '-';
-
-    const currency = document.createElement('td');
-    currency.textContent = row.currency || '-';
-
-    const date = document.createElement('td');
-    date.textContent = formatMarketDate(row.decisionTs, row.decisionDateRaw);
-
-    tr.appendChild(rank);
-    tr.appendChild(company);
-    tr.appendChild(ticker);
-    tr.appendChild(decisionStatus);
-    tr.appendChild(role);
-    tr.appendChild(composite);
-    tr.appendChild(sizing);
-    tr.appendChild(sector);
-    tr.appendChild(region);
-    tr.appendChild(currency);
-    tr.appendChild(date);
-    marketTableBody.appendChild(tr);
+  const company = document.createElement('td');
+  const companyName = document.createElement('button');
+  companyName.type = 'button';
+  companyName.className = 'market-company-link';
+  companyName.textContent = row.company || '-';
+  companyName.title = 'Pokaż raporty dla tej spółki';
+  companyName.addEventListener('click', () => {
+    activateCompanyQuery(row.company || row.ticker);
   });
+  company.appendChild(companyName);
+  const badgeMeta = describeDecisionContractBadge({
+    status: row.contractStatus,
+    issueCodes: row.contractIssueCodes
+  }, { compact: true });
+  if (badgeMeta) {
+    const badge = document.createElement('div');
+    badge.className = badgeMeta.className;
+    badge.textContent = badgeMeta.text;
+    company.appendChild(badge);
+  }
+
+  const ticker = document.createElement('td');
+  ticker.textContent = row.ticker || '-';
+
+  const decisionStatus = document.createElement('td');
+  decisionStatus.textContent = row.decisionStatus || '-';
+
+  const role = document.createElement('td');
+  role.textContent = row.role || '-';
+
+  const composite = document.createElement('td');
+  composite.textContent = row.compositeText || '-';
+
+  const sizing = document.createElement('td');
+  sizing.textContent = row.sizingText || '-';
+
+  const sector = document.createElement('td');
+  sector.appendChild(createMarketFilterChip('sector', row.sector));
+
+  const region = document.createElement('td');
+  region.textContent = row.region || '-';
+
+  const currency = document.createElement('td');
+  currency.textContent = row.currency || '-';
+
+  const date = document.createElement('td');
+  date.textContent = formatMarketDate(row.decisionTs, row.decisionDateRaw);
+
+  tr.appendChild(rank);
+  tr.appendChild(company);
+  tr.appendChild(ticker);
+  tr.appendChild(decisionStatus);
+  tr.appendChild(role);
+  tr.appendChild(composite);
+  tr.appendChild(sizing);
+  tr.appendChild(sector);
+  tr.appendChild(region);
+  tr.appendChild(currency);
+  tr.appendChild(date);
+  return tr;
+}
+
+function getMarketRowsWindow() {
+  if (!marketRowsWindow) {
+    marketRowsWindow = createWindowedRenderer({
+      container: marketTableBody,
+      estimatedItemHeight: MARKET_ROW_ESTIMATED_HEIGHT_PX,
+      getItemKey: (row) => row.key,
+      // Rank and the active sector chip are the only row markup that changes without a new row object.
+      getItemSignature: (row) => `${row.baseRank}|${normalizeMarketToken(marketFilters.sector)}`,
+      renderItem: createMarketRowElement,
+      createSpacer: createWindowedTableSpacer
+    });
+  }
+  return marketRowsWindow;
+}
+
+function renderMarketRows(rows) {
+  if (!marketTableBody) return;
+  getMarketRowsWindow().setItems(rows);
 }
 
 function hideMarketSuggestions() {
@@ -1682,9 +2041,10 @@ function hideMarketSuggestions() {
 function buildMarketCompanySuggestions(query, limit = 8) {
   const normalizedQuery = normalizeMarketText(query);
   if (!normalizedQuery) return [];
+  const matcher = getCompanyQueryMatcher(normalizedQuery);
   const byKey = new Map();
   marketRows.forEach((row) => {
-    const match = scoreCompanyQueryAgainstRow(normalizedQuery, row);
+    const match = matcher.matchRow(row);
     if (!match.matched) return;
     const key = row.companyKey || row.key;
     const existing = byKey.get(key);
@@ -1792,11 +2152,30 @@ function activateCompanyQuery(value) {
   });
 }
 
+function getMarketRowsView() {
+  const cacheKey = [
+    marketRowsVersion,
+    normalizeMarketText(marketFilters.companyQuery),
+    normalizeMarketToken(marketFilters.sector),
+    normalizeMarketText(marketSortState?.key, 'rank'),
+    marketSortState?.direction === 'desc' ? 'desc' : 'asc'
+  ].join('|');
+  if (marketViewCache?.key === cacheKey) return marketViewCache;
+
+  const filtered = applyMarketFilters(marketRows);
+  marketViewCache = {
+    key: cacheKey,
+    filtered,
+    sorted: sortMarketRows(filtered)
+  };
+  return marketViewCache;
+}
+
 function renderMarketTable() {
   if (!marketStatus || !marketTable || !marketTableBody) return;
 
   if (marketRows.length === 0) {
-    marketTableBody.innerHTML = '';
+    renderMarketRows([]);
     marketTable.style.display = 'none';
     if (marketToolbar) marketToolbar.hidden = true;
     hideMarketSuggestions();
@@ -1806,8 +2185,8 @@ function renderMarketTable() {
     return;
   }
 
-  const filtered = applyMarketFilters(marketRows);
-  const sorted = sortMarketRows(filtered);
+  const { filtered, sorted } = getMarketRowsView();
+  if (sorted.length > 0) marketTable.style.display = 'table';
   renderMarketRows(sorted);
 
   renderMarketSectorButtons();
@@ -1974,16 +2353,23 @@ async function loadMarketData(responsesOverride = null) {
     responses = await readResponsesFromStorage();
   }
 
-  marketRows = buildMarketRowsFromResponses(responses);
+  // The row store memoizes rows per response content, so unchanged reloads skip the table entirely.
+  if (marketRowStore) {
+    const result = marketRowStore.update(responses);
+    if (result.version === marketRowsRenderedVersion) return;
+    marketRows = result.rows;
+    marketRowsVersion = result.version;
+  } else {
+    marketRows = buildMarketRowsFromResponses(responses);
+    marketRowsVersion += 1;
+  }
   renderMarketTable();
+  marketRowsRenderedVersion = marketRowsVersion;
 }
 
 chrome.storage.onChanged.addListener((changes, namespace) => {
-  console.log('[responses.js] Storage changed:', { namespace, changes });
-  if ((namespace === 'local' || namespace === 'session') && changes[RESPONSE_STORAGE_KEY]) {
-    console.log('[responses.js] Responses changed, reloading...');
-    console.log(`   Old length: ${changes[RESPONSE_STORAGE_KEY].oldValue?.length || 0}`);
-    console.log(`   New length: ${changes[RESPONSE_STORAGE_KEY].newValue?.length || 0}`);
+  if ((namespace === 'local' || namespace === 'session') && isResponseStorageChange(changes)) {
+    console.log('[responses.js] Responses changed, reloading...', { namespace, keys: Object.keys(changes || {}) });
     scheduleLoadResponses('storage_changed', 100);
   }
 });
@@ -3,6 +3,7 @@ const fs = require('fs');
 const path = require('path');
 const vm = require('vm');
 const ProcessContractUtils = require('./process-contract.js');
+const { createPinnedAnalysisQueueConcurrency } = require('./test-support/analysis-queue-concurrency.js');
 
 const backgroundPath = path.join(__dirname, 'background.js');
 const backgroundSource = fs.readFileSync(backgroundPath, 'utf8');
@@ -695,6 +696,7 @@ function buildScenarioContext() {
     ]),
     analysisQueueReconcileInProgress: false,
     analysisQueueReconcileRequested: false,
+    ...createPinnedAnalysisQueueConcurrency(() => context),
     analysisQueueState: {
       waitingJobs: [],
       activeJobs: [],
@@ -748,6 +750,7 @@ function buildScenarioContext() {
 
   const functionNames = [
     'getAnalysisQueueJobPriority',
+    'getAnalysisQueueJobRemainingPrompts',
     'compareAnalysisQueueJobs',
     'sortAnalysisQueueWaitingJobs',
     'normalizeAnalysisTypeForPromptChain',
@@ -778,6 +781,14 @@ function buildScenarioContext() {
     'collectAnalysisQueueActiveProcesses',
     'getAnalysisQueueStatusSnapshot',
     'resolveAnalysisQueueReleaseDecision',
+    'createAnalysisQueueConcurrencyState',
+    'sanitizeAnalysisQueueConcurrencyState',
+    'isAnalysisQueuePromptLatencyDegraded',
+    'resolveAnalysisQueueSlotTarget',
+    'getAnalysisQueueSlotTarget',
+    'estimateAnalysisQueuePromptMs',
+    'estimateAnalysisQueueJobEtas',
+    'buildAnalysisQueueConcurrencySnapshot',
     'reconcileAnalysisQueueState'
   ];
   return loadScenarioFunctions(scenarioContext, functionNames);
@@ -3,6 +3,7 @@ const fs = require('fs');
 const path = require('path');
 const vm = require('vm');
 const ProcessContractUtils = require('./process-contract.js');
+const { createPinnedAnalysisQueueConcurrency } = require('./test-support/analysis-queue-concurrency.js');
 
 const backgroundPath = path.join(__dirname, 'background.js');
 const backgroundSource = fs.readFileSync(backgroundPath, 'utf8');
@@ -236,6 +237,8 @@ async function main() {
     ]),
     analysisQueueReconcileInProgress: false,
     analysisQueueReconcileRequested: false,
+    ANALYSIS_QUEUE_MAX_CONCURRENT: 7,
+    ...createPinnedAnalysisQueueConcurrency(() => context),
     analysisQueueState: {
       waitingJobs: [],
       activeJobs: [],
@@ -325,6 +328,7 @@ async function main() {
   vm.createContext(context);
   const functionNames = [
     'getAnalysisQueueJobPriority',
+    'getAnalysisQueueJobRemainingPrompts',
     'compareAnalysisQueueJobs',
     'sortAnalysisQueueWaitingJobs',
     'normalizeProcessLifecycleStatus',
@@ -342,6 +346,14 @@ async function main() {
     'getAnalysisQueueCompletionTimestamp',
     'resolveAnalysisQueueDispatchDeadlineAt',
     'resolveAnalysisQueueReleaseDecision',
+    'createAnalysisQueueConcurrencyState',
+    'sanitizeAnalysisQueueConcurrencyState',
+    'isAnalysisQueuePromptLatencyDegraded',
+    'resolveAnalysisQueueSlotTarget',
+    'getAnalysisQueueSlotTarget',
+    'estimateAnalysisQueuePromptMs',
+    'estimateAnalysisQueueJobEtas',
+    'buildAnalysisQueueConcurrencySnapshot',
     'reconcileAnalysisQueueState'
   ];
   for (const functionName of functionNames) {
@@ -3,6 +3,7 @@ const fs = require('fs');
 const path = require('path');
 const vm = require('vm');
 const ProcessContractUtils = require('./process-contract.js');
+const { createPinnedAnalysisQueueConcurrency } = require('./test-support/analysis-queue-concurrency.js');
 
 const backgroundPath = path.join(__dirname, 'background.js');
 const backgroundSource = fs.readFileSync(backgroundPath, 'utf8');
@@ -261,6 +262,7 @@ function buildPriorityContext() {
     ]),
     analysisQueueReconcileInProgress: false,
     analysisQueueReconcileRequested: false,
+    ...createPinnedAnalysisQueueConcurrency(() => context),
     analysisQueueState: {
       waitingJobs: [],
       activeJobs: [],
@@ -345,6 +347,7 @@ function buildPriorityContext() {
     'normalizeComposerThinkingEffort',
     'sanitizeAnalysisQueueJob',
     'getAnalysisQueueJobPriority',
+    'getAnalysisQueueJobRemainingPrompts',
     'compareAnalysisQueueJobs',
     'sortAnalysisQueueWaitingJobs',
     'sanitizeAnalysisQueueState',
@@ -375,6 +378,16 @@ function buildPriorityContext() {
     'collectAnalysisQueueActiveProcesses',
     'getAnalysisQueueStatusSnapshot',
     'resolveAnalysisQueueReleaseDecision',
+    'createAnalysisQueueConcurrencyState',
+    'sanitizeAnalysisQueueConcurrencyState',
+    'isAnalysisQueuePromptLatencyDegraded',
+    'recordAnalysisQueueRateLimit',
+    'recordAnalysisQueuePromptGap',
+    'resolveAnalysisQueueSlotTarget',
+    'getAnalysisQueueSlotTarget',
+    'estimateAnalysisQueuePromptMs',
+    'estimateAnalysisQueueJobEtas',
+    'buildAnalysisQueueConcurrencySnapshot',
     'reconcileAnalysisQueueState'
   ];
 
@@ -474,10 +487,124 @@ async function testReconcileKeepsArticleFifoWithoutResumes() {
   );
 }
 
+function testSortPrefersResumesClosestToCompletion() {
+  const context = buildPriorityContext();
+  const state = context.sanitizeAnalysisQueueState({
+    waitingJobs: [
+      createArticleJob('article-1', 1, 100, 1),
+      { ...createResumeJob('resume-early', 2, 200, 101, 2), totalPrompts: 10 },
+      { ...createResumeJob('resume-late', 3, 300, 102, 8), totalPrompts: 10 },
+      createResumeJob('resume-unknown', 4, 400, 103, 5)
+    ],
+    activeJobs: [],
+    lastSequence: 4
+  });
+
+  assert.deepStrictEqual(
+    clone(state.waitingJobs.map((job) => job.runId)),
+    ['resume-late', 'resume-early', 'resume-unknown', 'article-1'],
+    'Resumes with fewer remaining prompts should start first; unknown progress keeps FIFO.'
+  );
+}
+
+function testSlotTargetBacksOffOnRateLimitAndProbesBackUp() {
+  const context = buildPriorityContext();
+  const start = 1_700_000_000_000;
+  let state = context.createAnalysisQueueConcurrencyState();
+  assert.strictEqual(state.target, 7);
+
+  state = context.recordAnalysisQueueRateLimit(state, start);
+  assert.strictEqual(state.target, 3, 'A rate limit should halve the slot target.');
+  state = context.recordAnalysisQueueRateLimit(state, start + 5000);
+  assert.strictEqual(state.target, 3, 'Simultaneous rate-limit hits should back off only once.');
+  assert.strictEqual(state.rateLimitCount, 2);
+
+  const saturated = { waitingCount: 4, occupiedSlots: 3, overdueDispatchCount: 0 };
+  let result = context.resolveAnalysisQueueSlotTarget(state, saturated, start + 6 * 60 * 1000);
+  assert.strictEqual(result.changed, false, 'Probing must wait out the rate-limit hold.');
+
+  result = context.resolveAnalysisQueueSlotTarget(state, saturated, start + 11 * 60 * 1000);
+  assert.strictEqual(result.changed, true);
+  assert.strictEqual(result.state.target, 4);
+  assert.strictEqual(result.state.lastReason, 'probe');
+
+  const again = context.resolveAnalysisQueueSlotTarget(result.state, { ...saturated, occupiedSlots: 4 }, start + 12 * 60 * 1000);
+  assert.strictEqual(again.changed, false, 'Probes should be spaced by the probe interval.');
+
+  const idle = context.resolveAnalysisQueueSlotTarget(result.state, { waitingCount: 0, occupiedSlots: 4 }, start + 20 * 60 * 1000);
+  assert.strictEqual(idle.changed, false, 'An unsaturated queue gives no evidence that more slots help.');
+
+  const overdue = context.resolveAnalysisQueueSlotTarget(
+    result.state,
+    { ...saturated, occupiedSlots: 4, overdueDispatchCount: 1 },
+    start + 20 * 60 * 1000
+  );
+  assert.strictEqual(overdue.changed, false, 'Overdue dispatch deadlines should hold the target.');
+
+  let slowed = result.state;
+  for (let index = 0; index < 5; index += 1) {
+    slowed = context.recordAnalysisQueuePromptGap(slowed, 60000, start + index);
+  }
+  for (let index = 0; index < 10; index += 1) {
+    slowed = context.recordAnalysisQueuePromptGap(slowed, 300000, start + 100 + index);
+  }
+  const degraded = context.resolveAnalysisQueueSlotTarget(slowed, saturated, start + 30 * 60 * 1000);
+  assert.strictEqual(degraded.changed, true);
+  assert.strictEqual(degraded.state.target, 3, 'Sustained prompt slowdowns should shed one slot.');
+  assert.strictEqual(degraded.state.lastReason, 'latency_degraded');
+}
+
+async function testStatusSnapshotReportsSlotTargetAndEtas() {
+  const context = buildPriorityContext();
+  const now = Date.now();
+  context.analysisQueueState = {
+    waitingJobs: [
+      { ...createResumeJob('resume-1', 2, now - 1000, 101, 6), totalPrompts: 10 }
+    ],
+    activeJobs: [
+      createArticleJob('active-1', 1, now - 5000, 1)
+    ],
+    maxConcurrent: 1,
+    lastSequence: 2
+  };
+  context.processRegistry.set('active-1', {
+    id: 'active-1',
+    status: 'running',
+    lifecycleStatus: 'running',
+    totalPrompts: 10,
+    currentPrompt: 8,
+    performanceTelemetry: {
+      promptTimings: { count: 8, gapCount: 4, totalGapMs: 400000, maxGapMs: 100000, lastGapMs: 100000 }
+    }
+  });
+  context.analysisQueueConcurrencyState = {
+    target: 1,
+    lastIncreaseAt: now,
+    promptGapEwmaMs: 50000
+  };
+  context.ensureAnalysisQueueConcurrencyReady = async () => context.analysisQueueConcurrencyState;
+
+  const snapshot = await context.getAnalysisQueueStatusSnapshot();
+  assert.strictEqual(snapshot.slotTarget, 1);
+  assert.strictEqual(snapshot.concurrency.target, 1);
+  const etas = clone(snapshot.jobEtas);
+  assert.deepStrictEqual(
+    etas.map((entry) => [entry.runId, entry.state, entry.position, entry.remainingPrompts, entry.etaMs]),
+    [
+      ['active-1', 'active', null, 3, 300000],
+      ['resume-1', 'waiting', 1, 4, 500000]
+    ],
+    'Active ETA uses the job prompt pace; waiting jobs queue behind the slot that frees first.'
+  );
+}
+
 async function main() {
   testSanitizeRestoresPriorityOrderAndLastSequence();
   await testReconcileStartsResumesBeforeArticles();
   await testReconcileKeepsArticleFifoWithoutResumes();
+  testSortPrefersResumesClosestToCompletion();
+  testSlotTargetBacksOffOnRateLimitAndProbesBackUp();
+  await testStatusSnapshotReportsSlotTargetAndEtas();
   console.log('analysis queue priority test: ok');
 }
 
@@ -0,0 +1,361 @@
+const assert = require('assert');
+const fs = require('fs');
+const path = require('path');
+const vm = require('vm');
+
+const backgroundPath = path.join(__dirname, 'background.js');
+const backgroundSource = fs.readFileSync(backgroundPath, 'utf8');
+
+function extractFunctionSource(source, functionName) {
+  const pattern = new RegExp(`(?:async\\s+)?function\\s+${functionName}\\s*\\(`);
+  const match = pattern.exec(source);
+  if (!match) {
+    throw new Error(`Function not found: ${functionName}`);
+  }
+  const startIndex = match.index;
+  const paramsStart = source.indexOf('(', match.index);
+  if (paramsStart < 0) {
+    throw new Error(`Function params not found: ${functionName}`);
+  }
+
+  let parenDepth = 0;
+  let inSingle = false;
+  let inDouble = false;
+  let inTemplate = false;
+  let inLineComment = false;
+  let inBlockComment = false;
+  let escaped = false;
+  let braceStart = -1;
+
+  for (let i = paramsStart; i < source.length; i += 1) {
+    const char = source[i];
+    const next = source[i + 1];
+
+    if (inLineComment) {
+      if (char === '\n') inLineComment = false;
+      continue;
+    }
+    if (inBlockComment) {
+      if (char === '*' && next === '/') {
+        inBlockComment = false;
+        i += 1;
+      }
+      continue;
+    }
+    if (inSingle) {
+      if (!escaped && char === '\\') {
+        escaped = true;
+        continue;
+      }
+      if (!escaped && char === '\'') inSingle = false;
+      escaped = false;
+      continue;
+    }
+    if (inDouble) {
+      if (!escaped && char === '\\') {
+        escaped = true;
+        continue;
+      }
+      if (!escaped && char === '"') inDouble = false;
+      escaped = false;
+      continue;
+    }
+    if (inTemplate) {
+      if (!escaped && char === '\\') {
+        escaped = true;
+        continue;
+      }
+      if (!escaped && char === '`') inTemplate = false;
+      escaped = false;
+      continue;
+    }
+
+    if (char === '/' && next === '/') {
+      inLineComment = true;
+      i += 1;
+      continue;
+    }
+    if (char === '/' && next === '*') {
+      inBlockComment = true;
+      i += 1;
+      continue;
+    }
+    if (char === '\'') {
+      inSingle = true;
+      continue;
+    }
+    if (char === '"') {
+      inDouble = true;
+      continue;
+    }
+    if (char === '`') {
+      inTemplate = true;
+      continue;
+    }
+
+    if (char === '(') {
+      parenDepth += 1;
+      continue;
+    }
+    if (char === ')') {
+      parenDepth -= 1;
+      if (parenDepth === 0) {
+        braceStart = source.indexOf('{', i);
+        break;
+      }
+    }
+  }
+
+  if (braceStart < 0) {
+    throw new Error(`Function body not found: ${functionName}`);
+  }
+
+  let depth = 0;
+  inSingle = false;
+  inDouble = false;
+  inTemplate = false;
+  inLineComment = false;
+  inBlockComment = false;
+  escaped = false;
+
+  for (let i = braceStart; i < source.length; i += 1) {
+    const char = source[i];
+    const next = source[i + 1];
+
+    if (inLineComment) {
+      if (char === '\n') inLineComment = false;
+      continue;
+    }
+    if (inBlockComment) {
+      if (char === '*' && next === '/') {
+        inBlockComment = false;
+        i += 1;
+      }
+      continue;
+    }
+    if (inSingle) {
+      if (!escaped && char === '\\') {
+        escaped = true;
+        continue;
+      }
+      if (!escaped && char === '\'') inSingle = false;
+      escaped = false;
+      continue;
+    }
+    if (inDouble) {
+      if (!escaped && char === '\\') {
+        escaped = true;
+        continue;
+      }
+      if (!escaped && char === '"') inDouble = false;
+      escaped = false;
+      continue;
+    }
+    if (inTemplate) {
+      if (!escaped && char === '\\') {
+        escaped = true;
+        continue;
+      }
+      if (!escaped && char === '`') inTemplate = false;
+      escaped = false;
+      continue;
+    }
+
+    if (char === '/' && next === '/') {
+      inLineComment = true;
+      i += 1;
+      continue;
+    }
+    if (char === '/' && next === '*') {
+      inBlockComment = true;
+      i += 1;
+      continue;
+    }
+    if (char === '\'') {
+      inSingle = true;
+      continue;
+    }
+    if (char === '"') {
+      inDouble = true;
+      continue;
+    }
+    if (char === '`') {
+      inTemplate = true;
+      continue;
+    }
+
+    if (char === '{') depth += 1;
+    if (char === '}') {
+      depth -= 1;
+      if (depth === 0) {
+        return source.slice(startIndex, i + 1);
+      }
+    }
+  }
+
+  throw new Error(`Function end not found: ${functionName}`);
+}
+
+function createFakeElement(matches = []) {
+  const element = {
+    nodeType: 1,
+    textContent: '',
+    closest(selector) {
+      return matches.includes(selector) ? element : null;
+    },
+    matches(selector) {
+      return matches.includes(selector);
+    },
+    querySelector() {
+      return null;
+    }
+  };
+  return element;
+}
+
+function createWatcherHarness({ withObserver = true } = {}) {
+  const observers = [];
+  class FakeMutationObserver {
+    constructor(callback) {
+      this.callback = callback;
+      this.connected = false;
+      observers.push(this);
+    }
+
+    observe(root, options) {
+      this.root = root;
+      this.options = options;
+      this.connected = true;
+    }
+
+    disconnect() {
+      this.connected = false;
+    }
+  }
+  const context = {
+    console,
+    Date,
+    Math,
+    Array,
+    String,
+    Number,
+    Promise,
+    setTimeout,
+    clearTimeout,
+    document: { body: createFakeElement() },
+    ...(withObserver ? { MutationObserver: FakeMutationObserver } : {})
+  };
+  vm.createContext(context);
+  vm.runInContext(extractFunctionSource(backgroundSource, 'createChatResponseDomWatcher'), context);
+  const emit = (records) => {
+    const active = observers.filter((observer) => observer.connected);
+    active.forEach((observer) => observer.callback(records));
+  };
+  return { context, observers, emit };
+}
+
+const assistantSelector = '[data-message-author-role="assistant"]';
+
+async function testStreamingUpdatesVersionWithoutWakingStabilityWaits() {
+  const { context, observers, emit } = createWatcherHarness();
+  const watcher = context.createChatResponseDomWatcher({ idleDisconnectMs: 200 });
+  assert.strictEqual(watcher.observing, true);
+  assert.strictEqual(observers.length, 1);
+  assert.strictEqual(observers[0].options.characterData, true);
+
+  const assistantElement = createFakeElement([assistantSelector]);
+  const textNode = { nodeType: 3, data: 'Hello world', parentElement: assistantElement };
+  const versionBefore = watcher.getAssistantVersion();
+
+  let woke = false;
+  const waitPromise = watcher.waitForChange(80).then(() => { woke = true; });
+  emit([{ type: 'characterData', target: textNode, oldValue: 'Hello' }]);
+  await new Promise((resolve) => setTimeout(resolve, 10));
+  assert.strictEqual(woke, false, 'assistant streaming must not wake a stability wait');
+  assert.ok(watcher.getAssistantVersion() > versionBefore);
+  assert.strictEqual(watcher.getStats().appendedChars, 6);
+  await waitPromise;
+
+  const versionAfterText = watcher.getAssistantVersion();
+  emit([{ type: 'characterData', target: textNode, oldValue: 'Hello world' }]);
+  assert.strictEqual(watcher.getAssistantVersion(), versionAfterText, 'unchanged text is not streaming');
+
+  const startedAt = Date.now();
+  const assistantWait = watcher.waitForChange(1000, { wakeOnAssistant: true });
+  emit([{ type: 'childList', target: assistantElement, addedNodes: [{ nodeType: 3, textContent: 'abc' }], removedNodes: [] }]);
+  await assistantWait;
+  assert.ok(Date.now() - startedAt < 500, 'wakeOnAssistant waits resolve on streaming');
+  watcher.disconnect();
+}
+
+async function testUiMutationsWakeWaitersAndCounterIsIgnored() {
+  const { context, observers, emit } = createWatcherHarness();
+  const watcher = context.createChatResponseDomWatcher({ idleDisconnectMs: 200 });
+  const counterElement = createFakeElement(['#economist-prompt-counter']);
+  const stopButton = createFakeElement();
+
+  let woke = false;
+  const waitPromise = watcher.waitForChange(120).then(() => { woke = true; });
+  emit([{ type: 'childList', target: counterElement, addedNodes: [], removedNodes: [] }]);
+  await new Promise((resolve) => setTimeout(resolve, 10));
+  assert.strictEqual(woke, false, 'own counter updates must not wake the wait loop');
+  assert.strictEqual(watcher.getStats().uiMutationCount, 0);
+
+  const startedAt = Date.now();
+  emit([{ type: 'attributes', target: stopButton, attributeName: 'aria-label' }]);
+  await waitPromise;
+  assert.ok(Date.now() - startedAt < 100, 'UI transitions wake the wait immediately');
+  assert.strictEqual(watcher.getStats().uiMutationCount, 1);
+
+  const versionBefore = watcher.getAssistantVersion();
+  const turn = createFakeElement([assistantSelector]);
+  emit([{ type: 'childList', target: createFakeElement(), addedNodes: [turn], removedNodes: [] }]);
+  assert.ok(watcher.getAssistantVersion() > versionBefore, 'a newly inserted assistant turn counts as transcript change');
+
+  await new Promise((resolve) => setTimeout(resolve, 250));
+  assert.strictEqual(observers[0].connected, false, 'observer disconnects after idle period');
+  const reconnectVersion = watcher.getAssistantVersion();
+  await watcher.waitForChange(10);
+  assert.ok(observers.some((observer) => observer.connected), 'waiting reconnects the observer');
+  assert.ok(watcher.getAssistantVersion() > reconnectVersion, 'reconnect invalidates cached text');
+  watcher.disconnect();
+}
+
+async function testFallbackPollsWithoutObserver() {
+  const { context } = createWatcherHarness({ withObserver: false });
+  const watcher = context.createChatResponseDomWatcher();
+  assert.strictEqual(watcher.observing, false);
+  const first = watcher.getAssistantVersion();
+  assert.notStrictEqual(watcher.getAssistantVersion(), first, 'without observer every read is treated as changed');
+  const startedAt = Date.now();
+  await watcher.waitForChange(30);
+  assert.ok(Date.now() - startedAt >= 20);
+}
+
+function testWaitLoopsUseWatcher() {
+  const start = backgroundSource.indexOf('async function injectToChat(');
+  const end = backgroundSource.indexOf('\nfunction sleep(', start);
+  const injectSource = backgroundSource.slice(start, end);
+  const guardSource = extractFunctionSource(injectSource, 'waitForChatGptGenerationFinishedBeforeNextPrompt');
+  const responseSource = extractFunctionSource(injectSource, 'waitForResponse');
+  [guardSource, responseSource].forEach((source) => {
+    assert.match(source, /createChatResponseDomWatcher\(\)/);
+    assert.match(source, /responseDomWatcher\.waitForChange\(/);
+    assert.doesNotMatch(source, /setTimeout\(resolve, 500\)\);\n    \}\n  \}$/);
+  });
+  assert.match(guardSource, /phase: 'generation_finish_guard'/);
+  assert.match(responseSource, /emitResponseWaitHeartbeat\('response_wait_phase2'/);
+}
+
+async function main() {
+  await testStreamingUpdatesVersionWithoutWakingStabilityWaits();
+  await testUiMutationsWakeWaitersAndCounterIsIgnored();
+  await testFallbackPollsWithoutObserver();
+  testWaitLoopsUseWatcher();
+  console.log('chat response dom watcher test: ok');
+}
+
+main().catch((error) => {
+  console.error(error);
+  process.exit(1);
+});
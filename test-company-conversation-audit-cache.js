@@ -0,0 +1,439 @@
+const assert = require('assert');
+const fs = require('fs');
+const path = require('path');
+const vm = require('vm');
+
+const backgroundPath = path.join(__dirname, 'background.js');
+const backgroundSource = fs.readFileSync(backgroundPath, 'utf8');
+
+function extractFunctionSource(source, functionName) {
+  const pattern = new RegExp(`(?:async\\s+)?function\\s+${functionName}\\s*\\(`);
+  const match = pattern.exec(source);
+  if (!match) {
+    throw new Error(`Function not found: ${functionName}`);
+  }
+  const startIndex = match.index;
+  const paramsStart = source.indexOf('(', match.index);
+  if (paramsStart < 0) {
+    throw new Error(`Function params not found: ${functionName}`);
+  }
+
+  let parenDepth = 0;
+  let inSingle = false;
+  let inDouble = false;
+  let inTemplate = false;
+  let inLineComment = false;
+  let inBlockComment = false;
+  let escaped = false;
+  let braceStart = -1;
+
+  for (let i = paramsStart; i < source.length; i += 1) {
+    const char = source[i];
+    const next = source[i + 1];
+
+    if (inLineComment) {
+      if (char === '\n') inLineComment = false;
+      continue;
+    }
+    if (inBlockComment) {
+      if (char === '*' && next === '/') {
+        inBlockComment = false;
+        i += 1;
+      }
+      continue;
+    }
+    if (inSingle) {
+      if (!escaped && char === '\\') {
+        escaped = true;
+        continue;
+      }
+      if (!escaped && char === '\'') inSingle = false;
+      escaped = false;
+      continue;
+    }
+    if (inDouble) {
+      if (!escaped && char === '\\') {
+        escaped = true;
+        continue;
+      }
+      if (!escaped && char === '"') inDouble = false;
+      escaped = false;
+      continue;
+    }
+    if (inTemplate) {
+      if (!escaped && char === '\\') {
+        escaped = true;
+        continue;
+      }
+      if (!escaped && char === '`') inTemplate = false;
+      escaped = false;
+      continue;
+    }
+
+    if (char === '/' && next === '/') {
+      inLineComment = true;
+      i += 1;
+      continue;
+    }
+    if (char === '/' && next === '*') {
+      inBlockComment = true;
+      i += 1;
+      continue;
+    }
+    if (char === '\'') {
+      inSingle = true;
+      continue;
+    }
+    if (char === '"') {
+      inDouble = true;
+      continue;
+    }
+    if (char === '`') {
+      inTemplate = true;
+      continue;
+    }
+
+    if (char === '(') {
+      parenDepth += 1;
+      continue;
+    }
+    if (char === ')') {
+      parenDepth -= 1;
+      if (parenDepth === 0) {
+        braceStart = source.indexOf('{', i);
+        break;
+      }
+    }
+  }
+
+  if (braceStart < 0) {
+    throw new Error(`Function body not found: ${functionName}`);
+  }
+
+  let depth = 0;
+  inSingle = false;
+  inDouble = false;
+  inTemplate = false;
+  inLineComment = false;
+  inBlockComment = false;
+  escaped = false;
+
+  for (let i = braceStart; i < source.length; i += 1) {
+    const char = source[i];
+    const next = source[i + 1];
+
+    if (inLineComment) {
+      if (char === '\n') inLineComment = false;
+      continue;
+    }
+    if (inBlockComment) {
+      if (char === '*' && next === '/') {
+        inBlockComment = false;
+        i += 1;
+      }
+      continue;
+    }
+    if (inSingle) {
+      if (!escaped && char === '\\') {
+        escaped = true;
+        continue;
+      }
+      if (!escaped && char === '\'') inSingle = false;
+      escaped = false;
+      continue;
+    }
+    if (inDouble) {
+      if (!escaped && char === '\\') {
+        escaped = true;
+        continue;
+      }
+      if (!escaped && char === '"') inDouble = false;
+      escaped = false;
+      continue;
+    }
+    if (inTemplate) {
+      if (!escaped && char === '\\') {
+        escaped = true;
+        continue;
+      }
+      if (!escaped && char === '`') inTemplate = false;
+      escaped = false;
+      continue;
+    }
+
+    if (char === '/' && next === '/') {
+      inLineComment = true;
+      i += 1;
+      continue;
+    }
+    if (char === '/' && next === '*') {
+      inBlockComment = true;
+      i += 1;
+      continue;
+    }
+    if (char === '\'') {
+      inSingle = true;
+      continue;
+    }
+    if (char === '"') {
+      inDouble = true;
+      continue;
+    }
+    if (char === '`') {
+      inTemplate = true;
+      continue;
+    }
+
+    if (char === '{') depth += 1;
+    if (char === '}') {
+      depth -= 1;
+      if (depth === 0) {
+        return source.slice(startIndex, i + 1);
+      }
+    }
+  }
+
+  throw new Error(`Function end not found: ${functionName}`);
+}
+
+const promptsText = fs.readFileSync(path.join(__dirname, 'prompts-company.txt'), 'utf8');
+
+// Regex literals with quotes/backticks confuse extractFunctionSource; these are all top-level functions.
+function extractTopLevelFunctionSource(source, functionName) {
+  const match = new RegExp(`\\n(?:async\\s+)?function\\s+${functionName}\\s*\\(`).exec(source);
+  if (!match) {
+    throw new Error(`Function not found: ${functionName}`);
+  }
+  const endIndex = source.indexOf('\n}\n', match.index + 1);
+  return source.slice(match.index + 1, endIndex + 2);
+}
+
+function clone(value) {
+  return JSON.parse(JSON.stringify(value));
+}
+
+function createMatchContext(overrides = {}) {
+  const context = {
+    console,
+    Map,
+    Set,
+    Date,
+    Math,
+    Object,
+    Array,
+    Number,
+    String,
+    JSON,
+    RegExp,
+    URL,
+    SIGNATURE_SENTENCE_LIMIT: 2,
+    SIGNATURE_COMPARE_LIMIT: 220,
+    COMPANY_PROMPT_MATCH_MIN_SCORE: 180,
+    COMPANY_PROMPT_MATCH_MAX_TOKENS: 1800,
+    COMPANY_PROMPT_MATCH_PREFIX_KEY_LENGTH: 70,
+    COMPANY_PROMPT_MATCH_SUFFIX_KEY_LENGTH: 50,
+    COMPANY_CONVERSATION_AUDIT_CACHE_LIMIT: 2,
+    SOURCE_TEXT_PLACEHOLDER_REGEX: /\{\{\s*(?:articlecontent|article)\s*\}\}/gi,
+    CHAT_GPT_HOSTS: new Set(['chatgpt.com']),
+    STAGE_NAMES_COMPANY: [],
+    PROMPTS_COMPANY: [],
+    companyPromptMatchCatalogCache: null,
+    companyConversationAuditCache: new Map(),
+    ...overrides
+  };
+  vm.createContext(context);
+  const separatorStart = backgroundSource.indexOf('const PROMPT_SEPARATOR_TOKEN_SOURCE');
+  const separatorEnd = backgroundSource.indexOf('function parsePromptChainText', separatorStart);
+  vm.runInContext(
+    backgroundSource.slice(separatorStart, separatorEnd).replace(/^const /gm, 'var '),
+    context,
+    { filename: 'background.js' }
+  );
+  [
+    'parsePromptChainText',
+    'sanitizePromptChainSnapshot',
+    'buildPromptChainHashKey',
+    'compactWhitespace',
+    'normalizeSentenceSignature',
+    'extractLastTwoSentences',
+    'extractLeadingSentences',
+    'sharedPrefixLength',
+    'extractSentenceWindowSignature',
+    'tokenizeForCompanyPromptMatch',
+    'normalizeCompanyPromptTemplate',
+    'buildCompanyPromptMatchRecords',
+    'buildCompanyPromptMatchIndex',
+    'collectCompanyPromptMatchCandidates',
+    'getCompanyPromptMatchCatalog',
+    'buildConversationMessageMatchFeatures',
+    'signaturesOverlap',
+    'computeCompanyPromptMatchScore',
+    'hasStrongCompanyPromptSignal',
+    'hasUnindexedCompanyPromptSignal',
+    'scoreCompanyPromptMatchRow',
+    'resolveCompanyPromptAssignments',
+    'normalizeChatConversationUrl',
+    'getCompanyConversationAuditCacheKey',
+    'rememberCompanyConversationAudit',
+    'scanCompanyConversationForAudit'
+  ].forEach((name) => {
+    vm.runInContext(extractTopLevelFunctionSource(backgroundSource, name), context, { filename: 'background.js' });
+  });
+  context.PROMPTS_COMPANY = context.parsePromptChainText(promptsText);
+  context.STAGE_NAMES_COMPANY = context.PROMPTS_COMPANY.map((_, index) => `Stage ${index + 1}`);
+  return context;
+}
+
+function buildConversation(prompts) {
+  const article = 'Alpha Robotics reported record quarterly revenue and raised guidance for next year. '
+    .repeat(20);
+  const fill = (prompt) => prompt.replace(/\{\{\s*(?:articlecontent|article)\s*\}\}/gi, article);
+  return [
+    ...prompts.slice(0, 6).map(fill),
+    'continue please',
+    ...prompts.slice(6).map(fill),
+    fill(prompts[0]),
+    fill(prompts[1])
+  ];
+}
+
+function summarizeAssignments(result) {
+  return clone(result.assignments).map((entry) => ({
+    matched: entry.matched,
+    promptNumber: entry.promptNumber || null,
+    runId: entry.runId,
+    score: entry.score || null
+  }));
+}
+
+function testIndexedScoringMatchesFullScoring() {
+  const context = createMatchContext();
+  const catalog = context.getCompanyPromptMatchCatalog(context.PROMPTS_COMPANY, 'sha256:test');
+  assert.strictEqual(context.getCompanyPromptMatchCatalog(context.PROMPTS_COMPANY, 'sha256:test'), catalog);
+  assert.notStrictEqual(context.getCompanyPromptMatchCatalog(context.PROMPTS_COMPANY, 'sha256:other'), catalog);
+
+  const messages = buildConversation(context.PROMPTS_COMPANY);
+  const full = context.resolveCompanyPromptAssignments(messages, catalog.records);
+  const indexed = context.resolveCompanyPromptAssignments(messages, catalog.records, { index: catalog.index });
+  assert.deepStrictEqual(summarizeAssignments(indexed), summarizeAssignments(full));
+
+  const matchedPrompts = summarizeAssignments(indexed).filter((entry) => entry.matched).map((entry) => entry.promptNumber);
+  assert.deepStrictEqual(matchedPrompts, [...context.PROMPTS_COMPANY.map((_, index) => index + 1), 1, 2]);
+
+  const candidateCounts = messages.map((text) => (
+    context.collectCompanyPromptMatchCandidates(context.buildConversationMessageMatchFeatures(text), catalog.index).size
+  ));
+  assert.ok(
+    candidateCounts.some((count) => count > 0 && count < catalog.records.length),
+    'the index should narrow candidates for at least some messages'
+  );
+
+  const reused = context.resolveCompanyPromptAssignments(messages, catalog.records, {
+    index: catalog.index,
+    scoreRows: indexed.scoreRows
+  });
+  assert.strictEqual(reused.scoreRows[0], indexed.scoreRows[0], 'known score rows are reused without rescoring');
+}
+
+function testBodyOverlapPromptIsNotPrunedByIndex() {
+  const context = createMatchContext();
+  // Prompt 1 reaches the minimum score through distinctive tokens alone; prompt 2 shares no index
+  // key with the message and only matches through an overlapping body signature.
+  const records = context.buildCompanyPromptMatchRecords([
+    'Alphabet bravado charlie deltoid echoing foxtrot golfing. Sentence two here.',
+    'Red box one. Blue cup two. Do it now. Act fast. Then stop here.'
+  ]);
+  const index = context.buildCompanyPromptMatchIndex(records);
+  const message = 'Golfing foxtrot echoing deltoid charlie bravado alphabet. All is well. So we do it now. Act fast. Then stop here. Ok bye.';
+  const features = context.buildConversationMessageMatchFeatures(message);
+
+  assert.deepStrictEqual(Array.from(context.collectCompanyPromptMatchCandidates(features, index)), [0]);
+  const fullRow = records.map((record) => context.computeCompanyPromptMatchScore(features, record));
+  assert.deepStrictEqual(clone(fullRow[1].signals), ['body_overlap']);
+  assert.ok(fullRow[0].score >= 180 && fullRow[0].score < fullRow[1].score);
+
+  const indexedRow = context.scoreCompanyPromptMatchRow(features, records, index);
+  assert.deepStrictEqual(indexedRow.map((entry) => entry.score), fullRow.map((entry) => entry.score));
+
+  // After a message answering prompt 1, the body-overlap message is the next prompt in the chain.
+  const conversation = ['Alphabet bravado charlie deltoid echoing foxtrot golfing. Sentence two here.', message];
+  const full = context.resolveCompanyPromptAssignments(conversation, records);
+  const indexed = context.resolveCompanyPromptAssignments(conversation, records, { index });
+  assert.deepStrictEqual(summarizeAssignments(indexed), summarizeAssignments(full));
+  assert.deepStrictEqual(summarizeAssignments(indexed).map((entry) => entry.promptNumber), [1, 2]);
+}
+
+async function testConversationCursorReusesCachedPrefix() {
+  const scanCalls = [];
+  const responses = [];
+  const context = createMatchContext({
+    readFullConversationFromTab: async (tabId, options) => {
+      scanCalls.push({ tabId, cursor: options.cursor ? clone(options.cursor) : null });
+      return responses.shift();
+    }
+  });
+  const catalog = context.getCompanyPromptMatchCatalog(context.PROMPTS_COMPANY, 'sha256:test');
+  const messages = buildConversation(context.PROMPTS_COMPANY);
+  const url = 'https://chatgpt.com/c/abc';
+  const meta = (text) => ({ text, hasAssistantReplyAfter: true, assistantReplyLength: 10 });
+  const firstCursor = { usersBefore: 17, assistantsBefore: 17, messagesBefore: 34, anchor: ['a', 'b', 'c'] };
+
+  responses.push({
+    success: true,
+    count: 20,
+    cursorMatched: false,
+    messageOffset: 0,
+    cursor: firstCursor,
+    messages: messages.slice(0, 20),
+    messageMeta: messages.slice(0, 20).map(meta)
+  });
+  const first = await context.scanCompanyConversationForAudit(7, url, { catalogKey: catalog.key, transferUserMetaLimit: 1200 });
+  assert.strictEqual(first.cursorReused, false);
+  assert.strictEqual(scanCalls[0].cursor, null);
+  const firstResult = context.resolveCompanyPromptAssignments(first.scanned.messages, catalog.records, {
+    index: catalog.index,
+    scoreRows: first.scoreRows
+  });
+  first.remember(firstResult.scoreRows);
+
+  responses.push({
+    success: true,
+    count: messages.length,
+    cursorMatched: true,
+    messageOffset: 17,
+    cursor: { ...firstCursor, usersBefore: messages.length - 3 },
+    messages: messages.slice(17),
+    messageMeta: messages.slice(17).map(meta)
+  });
+  const second = await context.scanCompanyConversationForAudit(7, url, { catalogKey: catalog.key, transferUserMetaLimit: 1200 });
+  assert.deepStrictEqual(scanCalls[1].cursor, firstCursor, 'the stored cursor is sent back to the page');
+  assert.strictEqual(second.cursorReused, true);
+  assert.strictEqual(second.scanned.messages.length, messages.length);
+  assert.strictEqual(second.scanned.messages[20], messages[20]);
+  assert.ok(second.scanned.messages[0].length <= 181, 'cached prefix keeps only preview-sized text');
+  assert.ok(second.scoreRows.slice(0, 17).every(Boolean), 'prefix rows come from the cache');
+  assert.ok(second.scoreRows.slice(17).every((row) => row === null), 'only messages after the anchor are rescored');
+
+  const secondResult = context.resolveCompanyPromptAssignments(second.scanned.messages, catalog.records, {
+    index: catalog.index,
+    scoreRows: second.scoreRows
+  });
+  const fullResult = context.resolveCompanyPromptAssignments(messages, catalog.records);
+  assert.deepStrictEqual(summarizeAssignments(secondResult), summarizeAssignments(fullResult));
+
+  responses.push({ success: true, count: 1, cursorMatched: false, messageOffset: 0, cursor: null, messages: ['x'], messageMeta: [{}] });
+  await context.scanCompanyConversationForAudit(7, url, { catalogKey: 'other-catalog', transferUserMetaLimit: 1200 });
+  assert.strictEqual(scanCalls[2].cursor, null, 'a prompt catalog change invalidates the cursor');
+}
+
+async function main() {
+  testIndexedScoringMatchesFullScoring();
+  testBodyOverlapPromptIsNotPrunedByIndex();
+  await testConversationCursorReusesCachedPrefix();
+  console.log('company conversation audit cache test: ok');
+}
+
+main().catch((error) => {
+  console.error(error);
+  process.exit(1);
+});
@@ -167,10 +167,101 @@ function testValidatedStage12StateStructuredV2() {
   assert.strictEqual(state.primaryRecord.sector, 'Technologia');
 }
 
+function stripRowForCompare(row) {
+  return {
+    key: row.key,
+    responseId: row.responseId,
+    compositeText: row.compositeText,
+    sizingText: row.sizingText,
+    baseRank: row.baseRank
+  };
+}
+
+function testMarketRowStoreAppliesResponseDiffs() {
+  const makeResponse = (responseId, timestamp, lines) => ({
+    responseId,
+    timestamp,
+    analysisType: 'company',
+    source: `${responseId} source`,
+    text: lines.join('\n')
+  });
+  const responses = [
+    makeResponse('resp-a', 1_710_000_000_000, [
+      makeCurrent16Line('PRIMARY', 'Alpha Corp (ALFA)', { composite: '4.2/5.0' }),
+      makeCurrent16Line('SECONDARY', 'Beta Corp (BETA)', { composite: '3.1/5.0' })
+    ]),
+    makeResponse('resp-b', 1_710_000_100_000, [
+      makeCurrent16Line('PRIMARY', 'Alpha Corp (ALFA)', { composite: '3.9/5.0' }),
+      makeCurrent16Line('SECONDARY', 'Beta Corp (BETA)', { composite: '2.9/5.0' })
+    ]),
+    makeResponse('resp-c', 1_710_000_200_000, [
+      makeCurrent16Line('PRIMARY', 'Gamma Corp (GAMM)', { composite: '4.8/5.0' }),
+      makeCurrent16Line('SECONDARY', 'Beta Corp (BETA)', { composite: '2.5/5.0' })
+    ])
+  ];
+
+  const store = DecisionViewModelUtils.createMarketRowStore(DecisionContractUtils);
+  const first = store.update(responses);
+  assert.strictEqual(first.changed, true);
+  assert.deepStrictEqual(first.stats, { added: 3, updated: 0, removed: 0, reused: 0 });
+  assert.deepStrictEqual(
+    first.rows.map(stripRowForCompare),
+    DecisionViewModelUtils.buildMarketRowsFromResponses(responses, DecisionContractUtils).map(stripRowForCompare)
+  );
+  const alphaRow = first.rows.find((row) => row.key === 'alpha corp (alfa)|alfa|primary');
+  assert.strictEqual(alphaRow.responseId, 'resp-a');
+
+  // Fresh objects with identical content are reused without rebuilding rows.
+  const reloaded = store.update(responses.map((response) => ({ ...response })));
+  assert.strictEqual(reloaded.changed, false);
+  assert.strictEqual(reloaded.rows, first.rows);
+  assert.deepStrictEqual(reloaded.stats, { added: 0, updated: 0, removed: 0, reused: 3 });
+
+  // Editing one response only re-resolves the rows it contributes to.
+  const edited = responses.slice();
+  edited[1] = makeResponse('resp-b', 1_710_000_100_000, [
+    makeCurrent16Line('PRIMARY', 'Alpha Corp (ALFA)', { composite: '4.9/5.0' }),
+    makeCurrent16Line('SECONDARY', 'Beta Corp (BETA)', { composite: '2.9/5.0' })
+  ]);
+  const afterEdit = store.update(edited);
+  assert.strictEqual(afterEdit.changed, true);
+  assert.deepStrictEqual(afterEdit.stats, { added: 0, updated: 1, removed: 0, reused: 2 });
+  assert.strictEqual(afterEdit.rows.find((row) => row.key === alphaRow.key).responseId, 'resp-b');
+  assert.strictEqual(afterEdit.rows.find((row) => row.key.startsWith('gamma')), first.rows.find((row) => row.key.startsWith('gamma')));
+  assert.deepStrictEqual(
+    afterEdit.rows.map(stripRowForCompare),
+    DecisionViewModelUtils.buildMarketRowsFromResponses(edited, DecisionContractUtils).map(stripRowForCompare)
+  );
+
+  const afterRemoval = store.update(edited.slice(0, 2));
+  assert.deepStrictEqual(afterRemoval.stats, { added: 0, updated: 0, removed: 1, reused: 2 });
+  assert.strictEqual(afterRemoval.rows.some((row) => row.key.startsWith('gamma')), false);
+  assert.deepStrictEqual(afterRemoval.rows.map((row) => row.baseRank), afterRemoval.rows.map((_, index) => index + 1));
+}
+
+function testStage12ViewCacheFollowsResponseContent() {
+  const base = {
+    responseId: 'resp-cache',
+    timestamp: 1_710_000_300_000,
+    text: makeCurrent16Line('PRIMARY', 'Delta Corp (DELT)')
+  };
+  const first = DecisionViewModelUtils.buildValidatedStage12State(base, DecisionContractUtils);
+  const edited = DecisionViewModelUtils.buildValidatedStage12State({
+    ...base,
+    text: makeCurrent16Line('PRIMARY', 'Epsilon Corp (EPSI)')
+  }, DecisionContractUtils);
+
+  assert.strictEqual(DecisionViewModelUtils.buildValidatedStage12State({ ...base }, DecisionContractUtils), first);
+  assert.strictEqual(first.primaryRecord.company, 'Delta Corp (DELT)');
+  assert.strictEqual(edited.primaryRecord.company, 'Epsilon Corp (EPSI)');
+}
+
 function main() {
   testValidatedStage12StateCurrentAndLegacy();
   testMarketRowDedupPrefersHigherContractScoreThenSignal();
   testValidatedStage12StateStructuredV2();
+  testMarketRowStoreAppliesResponseDiffs();
+  testStage12ViewCacheFollowsResponseContent();
   console.log('test-decision-view-model.js: ok');
 }
 
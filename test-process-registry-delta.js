@@ -0,0 +1,481 @@
+const assert = require('assert');
+const fs = require('fs');
+const path = require('path');
+const vm = require('vm');
+
+const backgroundPath = path.join(__dirname, 'background.js');
+const backgroundSource = fs.readFileSync(backgroundPath, 'utf8');
+
+function extractFunctionSource(source, functionName) {
+  const pattern = new RegExp(`(?:async\\s+)?function\\s+${functionName}\\s*\\(`);
+  const match = pattern.exec(source);
+  if (!match) {
+    throw new Error(`Function not found: ${functionName}`);
+  }
+  const startIndex = match.index;
+  const paramsStart = source.indexOf('(', match.index);
+  if (paramsStart < 0) {
+    throw new Error(`Function params not found: ${functionName}`);
+  }
+
+  let parenDepth = 0;
+  let inSingle = false;
+  let inDouble = false;
+  let inTemplate = false;
+  let inLineComment = false;
+  let inBlockComment = false;
+  let escaped = false;
+  let braceStart = -1;
+
+  for (let i = paramsStart; i < source.length; i += 1) {
+    const char = source[i];
+    const next = source[i + 1];
+
+    if (inLineComment) {
+      if (char === '\n') inLineComment = false;
+      continue;
+    }
+    if (inBlockComment) {
+      if (char === '*' && next === '/') {
+        inBlockComment = false;
+        i += 1;
+      }
+      continue;
+    }
+    if (inSingle) {
+      if (!escaped && char === '\\') {
+        escaped = true;
+        continue;
+      }
+      if (!escaped && char === '\'') inSingle = false;
+      escaped = false;
+      continue;
+    }
+    if (inDouble) {
+      if (!escaped && char === '\\') {
+        escaped = true;
+        continue;
+      }
+      if (!escaped && char === '"') inDouble = false;
+      escaped = false;
+      continue;
+    }
+    if (inTemplate) {
+      if (!escaped && char === '\\') {
+        escaped = true;
+        continue;
+      }
+      if (!escaped && char === '`') inTemplate = false;
+      escaped = false;
+      continue;
+    }
+
+    if (char === '/' && next === '/') {
+      inLineComment = true;
+      i += 1;
+      continue;
+    }
+    if (char === '/' && next === '*') {
+      inBlockComment = true;
+      i += 1;
+      continue;
+    }
+    if (char === '\'') {
+      inSingle = true;
+      continue;
+    }
+    if (char === '"') {
+      inDouble = true;
+      continue;
+    }
+    if (char === '`') {
+      inTemplate = true;
+      continue;
+    }
+
+    if (char === '(') {
+      parenDepth += 1;
+      continue;
+    }
+    if (char === ')') {
+      parenDepth -= 1;
+      if (parenDepth === 0) {
+        braceStart = source.indexOf('{', i);
+        break;
+      }
+    }
+  }
+
+  if (braceStart < 0) {
+    throw new Error(`Function body not found: ${functionName}`);
+  }
+
+  let depth = 0;
+  inSingle = false;
+  inDouble = false;
+  inTemplate = false;
+  inLineComment = false;
+  inBlockComment = false;
+  escaped = false;
+
+  for (let i = braceStart; i < source.length; i += 1) {
+    const char = source[i];
+    const next = source[i + 1];
+
+    if (inLineComment) {
+      if (char === '\n') inLineComment = false;
+      continue;
+    }
+    if (inBlockComment) {
+      if (char === '*' && next === '/') {
+        inBlockComment = false;
+        i += 1;
+      }
+      continue;
+    }
+    if (inSingle) {
+      if (!escaped && char === '\\') {
+        escaped = true;
+        continue;
+      }
+      if (!escaped && char === '\'') inSingle = false;
+      escaped = false;
+      continue;
+    }
+    if (inDouble) {
+      if (!escaped && char === '\\') {
+        escaped = true;
+        continue;
+      }
+      if (!escaped && char === '"') inDouble = false;
+      escaped = false;
+      continue;
+    }
+    if (inTemplate) {
+      if (!escaped && char === '\\') {
+        escaped = true;
+        continue;
+      }
+      if (!escaped && char === '`') inTemplate = false;
+      escaped = false;
+      continue;
+    }
+
+    if (char === '/' && next === '/') {
+      inLineComment = true;
+      i += 1;
+      continue;
+    }
+    if (char === '/' && next === '*') {
+      inBlockComment = true;
+      i += 1;
+      continue;
+    }
+    if (char === '\'') {
+      inSingle = true;
+      continue;
+    }
+    if (char === '"') {
+      inDouble = true;
+      continue;
+    }
+    if (char === '`') {
+      inTemplate = true;
+      continue;
+    }
+
+    if (char === '{') depth += 1;
+    if (char === '}') {
+      depth -= 1;
+      if (depth === 0) {
+        return source.slice(startIndex, i + 1);
+      }
+    }
+  }
+
+  throw new Error(`Function end not found: ${functionName}`);
+}
+
+const ProcessContractUtils = require('./process-contract.js');
+
+function clone(value) {
+  return JSON.parse(JSON.stringify(value));
+}
+
+function createRegistryHarness(initialRecords = []) {
+  const storageWrites = [];
+  const messages = [];
+  const context = {
+    console,
+    Map,
+    Set,
+    Date,
+    Math,
+    Object,
+    Array,
+    Number,
+    String,
+    JSON,
+    ProcessContractUtils,
+    PROCESS_HISTORY_LIMIT: 3,
+    PROCESS_MONITOR_STORAGE_KEY: 'process_monitor_state',
+    PROCESS_MONITOR_DELTA_STORAGE_KEY: 'process_monitor_delta',
+    PROCESS_REGISTRY_DELTA_COMPACT_LIMIT: 2,
+    processRegistry: new Map(),
+    processRegistryEpoch: 'epoch-test',
+    processRegistryChangeVersionById: new Map(),
+    processRegistryPublishedById: new Map(),
+    processRegistryStoredDeltaIds: new Set(),
+    processRegistryVersion: 0,
+    processSnapshotVersion: 0,
+    processRegistryDeltaFloorVersion: 0,
+    processRegistryPersistedVersion: 0,
+    processRegistryCompactedVersion: 0,
+    analysisQueueState: { waitingJobs: [] },
+    analysisQueueVersion: 1,
+    isClosedProcessStatus: (status) => ['completed', 'failed', 'stopped'].includes(status),
+    problemLogLastSignatureByRunId: new Map(),
+    processLogLastEmitTsByRunId: new Map(),
+    processStaleWarnLastEmitTsByRunId: new Map(),
+    finalPromptRecoveryLastAttemptAtByRunId: new Map(),
+    finalPromptRecoveryInFlight: new Set(),
+    logger: { event() {} },
+    ensureProcessRegistryReady: async () => {},
+    normalizeProcessRecord: (record) => ({ ...record }),
+    mergeProcessConversationUrls: () => {},
+    buildProcessProblemLogEntry: (runId, record) => ({ runId, signature: `${record.status}|${record.statusText || ''}` }),
+    shouldEmitProcessProblemHeartbeat: () => false,
+    appendProblemLog: async (entry) => entry,
+    observeAnalysisQueueConcurrencySignals: async () => {},
+    scheduleCompletedProcessPersistenceRetry: () => {},
+    scheduleProcessWindowCloseRetry: () => {},
+    requestAnalysisQueueReconcile: () => {},
+    handleManualPdfBatchProcessUpdate: async () => {},
+    logProcessTransition: () => {},
+    shouldFlushProcessUpdateImmediately: () => false,
+    scheduleProcessRegistryFlush: async () => {},
+    getAnalysisQueueStatusSnapshot: async () => ({ version: 1 }),
+    applyQueuePositionsToProcesses: (records) => {
+      const positions = context.buildProcessQueuePositionMap();
+      return records.map((record) => (positions.has(record.id) ? { ...record, queuePosition: positions.get(record.id) } : record));
+    },
+    chrome: {
+      storage: {
+        local: {
+          async set(patch) {
+            storageWrites.push(clone(patch));
+          }
+        }
+      },
+      runtime: {
+        async sendMessage(message) {
+          messages.push(clone(message));
+        }
+      }
+    }
+  };
+  vm.createContext(context);
+  [
+    'orderProcessRecords',
+    'mergeStoredProcessRegistryDelta',
+    'markProcessRegistryChanged',
+    'persistProcessRegistry',
+    'buildProcessQueuePositionMap',
+    'buildProcessRegistryDelta',
+    'broadcastProcessUpdate',
+    'normalizeProcessLifecycleStatus',
+    'normalizeProcessPhase',
+    'normalizeProcessActionRequired',
+    'deriveProcessActionRequired',
+    'upsertProcess'
+  ].forEach((name) => {
+    vm.runInContext(extractFunctionSource(backgroundSource, name), context);
+  });
+  vm.runInContext(`
+    this.upsert = (record) => {
+      const previous = processRegistry.get(record.id);
+      const next = { ...(previous || {}), ...record, version: ((previous && previous.version) || 0) + 1 };
+      processRegistry.set(record.id, next);
+      markProcessRegistryChanged(record.id);
+      return next;
+    };
+    this.flush = async () => {
+      const baseVersion = processSnapshotVersion;
+      await persistProcessRegistry();
+      await broadcastProcessUpdate({ reason: 'test', baseVersion });
+    };
+    this.state = () => ({
+      version: processRegistryVersion,
+      snapshotVersion: processSnapshotVersion
+    });
+  `, context);
+  initialRecords.forEach((record) => context.upsert(record));
+  return { context, storageWrites, messages };
+}
+
+function stripQueuePositions(records) {
+  return records.map(({ queuePosition: _queuePosition, ...rest }) => rest);
+}
+
+async function testFlushWritesDeltaUntilCompaction() {
+  const { context, storageWrites } = createRegistryHarness([
+    { id: 'run-a', status: 'running', startedAt: 100, timestamp: 100 },
+    { id: 'run-b', status: 'running', startedAt: 200, timestamp: 200 }
+  ]);
+  await context.flush();
+  assert.deepStrictEqual(Object.keys(storageWrites[0]), ['process_monitor_delta']);
+  assert.deepStrictEqual(Object.keys(storageWrites[0].process_monitor_delta.records).sort(), ['run-a', 'run-b']);
+  assert.deepStrictEqual(storageWrites[0].process_monitor_delta.order, ['run-b', 'run-a']);
+
+  context.upsert({ id: 'run-c', status: 'running', startedAt: 300, timestamp: 300 });
+  await context.flush();
+  const compacted = storageWrites[1];
+  assert.ok(Array.isArray(compacted.process_monitor_state), 'delta past the limit should rewrite the full snapshot');
+  assert.strictEqual(compacted.process_monitor_state.length, 3);
+  assert.deepStrictEqual(compacted.process_monitor_delta.records, {});
+
+  context.upsert({ id: 'run-a', currentPrompt: 4 });
+  await context.flush();
+  const delta = storageWrites[2].process_monitor_delta;
+  assert.deepStrictEqual(Object.keys(storageWrites[2]), ['process_monitor_delta']);
+  assert.deepStrictEqual(Object.keys(delta.records), ['run-a']);
+  const restored = context.mergeStoredProcessRegistryDelta(compacted.process_monitor_state, delta);
+  assert.strictEqual(restored.find((record) => record.id === 'run-a').currentPrompt, 4);
+}
+
+async function testBroadcastPatchesApplyToMonitorSnapshot() {
+  const { context, messages } = createRegistryHarness([
+    { id: 'run-a', status: 'running', startedAt: 100, timestamp: 100, statusText: 'Prompt 1' },
+    { id: 'run-b', status: 'running', startedAt: 200, timestamp: 200 }
+  ]);
+  await context.flush();
+  const first = messages[0];
+  assert.strictEqual(first.epoch, 'epoch-test');
+  assert.strictEqual(first.delta.records.length, 2, 'records unknown to monitors are sent whole');
+  let monitor = ProcessContractUtils.applyProcessRegistryDelta([], first.delta, { epoch: 'epoch-test', version: 0 });
+  assert.strictEqual(monitor.ok, true);
+  let monitorVersion = first.version;
+
+  context.upsert({ id: 'run-a', statusText: 'Prompt 2', currentPrompt: 2 });
+  context.analysisQueueState.waitingJobs = [{ runId: 'run-b' }];
+  await context.flush();
+  const second = messages[1];
+  assert.strictEqual(second.delta.records.length, 0);
+  assert.strictEqual(second.delta.patches.length, 1);
+  assert.deepStrictEqual(Object.keys(second.delta.patches[0].set).sort(), ['currentPrompt', 'statusText', 'version']);
+  monitor = ProcessContractUtils.applyProcessRegistryDelta(monitor.records, second.delta, {
+    epoch: 'epoch-test',
+    version: monitorVersion
+  });
+  assert.strictEqual(monitor.ok, true);
+  monitorVersion = second.version;
+  const expected = context.orderProcessRecords(Array.from(context.processRegistry.values()));
+  assert.deepStrictEqual(clone(stripQueuePositions(monitor.records)), clone(expected));
+  assert.strictEqual(monitor.records.find((record) => record.id === 'run-b').queuePosition, 1);
+
+  const diverged = ProcessContractUtils.applyProcessRegistryDelta(monitor.records, second.delta, {
+    epoch: 'epoch-test',
+    version: monitorVersion + 5
+  });
+  assert.strictEqual(diverged.ok, false);
+  assert.strictEqual(diverged.reason, 'version_diverged');
+  const otherEpoch = ProcessContractUtils.applyProcessRegistryDelta(monitor.records, second.delta, {
+    epoch: 'epoch-old',
+    version: monitorVersion
+  });
+  assert.strictEqual(otherEpoch.reason, 'epoch_changed');
+}
+
+async function testPullDeltaSinceVersionAndHistoryTrim() {
+  const { context } = createRegistryHarness([
+    { id: 'run-a', status: 'completed', startedAt: 100, timestamp: 100 },
+    { id: 'run-b', status: 'completed', startedAt: 200, timestamp: 200 },
+    { id: 'run-c', status: 'completed', startedAt: 300, timestamp: 300 }
+  ]);
+  await context.flush();
+  const snapshot = context.orderProcessRecords(Array.from(context.processRegistry.values()));
+  const sinceVersion = context.state().version;
+
+  context.upsert({ id: 'run-d', status: 'completed', startedAt: 400, timestamp: 400 });
+  await context.flush();
+  assert.strictEqual(context.processRegistry.has('run-a'), false, 'history beyond the limit is trimmed');
+
+  const records = context.orderProcessRecords(Array.from(context.processRegistry.values()));
+  const pull = context.buildProcessRegistryDelta(records, sinceVersion);
+  assert.deepStrictEqual(clone(pull.records.map((record) => record.id)), ['run-d']);
+  assert.deepStrictEqual(clone(pull.order), ['run-d', 'run-c', 'run-b']);
+  const applied = ProcessContractUtils.applyProcessRegistryDelta(snapshot, pull, {
+    epoch: 'epoch-test',
+    version: sinceVersion
+  });
+  assert.strictEqual(applied.ok, true);
+  assert.deepStrictEqual(clone(applied.records.map((record) => record.id)), ['run-d', 'run-c', 'run-b']);
+
+  context.processRegistryDeltaFloorVersion = sinceVersion + 1;
+  assert.strictEqual(context.buildProcessRegistryDelta(records, sinceVersion), null);
+}
+
+async function testFlushDuringUpsertAwaitStillDeliversRecord() {
+  const { context, messages } = createRegistryHarness([
+    { id: 'run-a', status: 'running', startedAt: 100, timestamp: 100, statusText: 'Prompt 1' }
+  ]);
+  await context.flush();
+  let monitor = ProcessContractUtils.applyProcessRegistryDelta([], messages[0].delta, { epoch: 'epoch-test', version: 0 });
+  let monitorVersion = messages[0].version;
+
+  let releaseProblemLog = null;
+  let problemLogStarted = null;
+  const problemLogPending = new Promise((resolve) => {
+    problemLogStarted = resolve;
+  });
+  context.appendProblemLog = (entry) => {
+    problemLogStarted();
+    return new Promise((resolve) => {
+      releaseProblemLog = () => resolve(entry);
+    });
+  };
+
+  const upsert = context.upsertProcess('run-a', { statusText: 'Prompt 2', currentPrompt: 2, timestamp: 200 });
+  await problemLogPending;
+  // Another update flushes the registry while upsertProcess is still waiting on the problem log.
+  await context.flush();
+  releaseProblemLog();
+  await upsert;
+  await context.flush();
+
+  messages.slice(1).forEach((message) => {
+    assert.ok(message.delta, 'incremental broadcasts should stay on the delta path');
+    monitor = ProcessContractUtils.applyProcessRegistryDelta(monitor.records, message.delta, {
+      epoch: 'epoch-test',
+      version: monitorVersion
+    });
+    assert.strictEqual(monitor.ok, true);
+    monitorVersion = message.version;
+  });
+  const record = monitor.records.find((item) => item.id === 'run-a');
+  assert.strictEqual(record.statusText, 'Prompt 2', 'monitor must receive the update stored after the await');
+  assert.strictEqual(record.currentPrompt, 2);
+}
+
+function testRecordPatchHelpers() {
+  const previous = { id: 'x', version: 1, kpi: { a: 1 }, reason: 'old' };
+  const next = { id: 'x', version: 2, kpi: { a: 1 }, statusText: 'new' };
+  const patch = ProcessContractUtils.buildProcessRecordPatch(previous, next);
+  assert.deepStrictEqual(patch, { set: { version: 2, statusText: 'new' }, unset: ['reason'] });
+  assert.deepStrictEqual(ProcessContractUtils.applyProcessRecordPatch(previous, patch), next);
+  assert.strictEqual(ProcessContractUtils.buildProcessRecordPatch(next, { ...next }), null);
+}
+
+async function main() {
+  testRecordPatchHelpers();
+  await testFlushWritesDeltaUntilCompaction();
+  await testBroadcastPatchesApplyToMonitorSnapshot();
+  await testPullDeltaSinceVersionAndHistoryTrim();
+  await testFlushDuringUpsertAwaitStillDeliversRecord();
+  console.log('process registry delta test: ok');
+}
+
+main().catch((error) => {
+  console.error(error);
+  process.exit(1);
+});
@@ -258,6 +258,7 @@ vm.createContext(context);
   'trimProcessAuditText',
   'buildProcessCompletionAudit',
   'normalizeProcessRecord',
+  'buildProcessQueuePositionMap',
   'applyQueuePositionsToProcesses'
 ].forEach((functionName) => {
   vm.runInContext(extractFunctionSource(backgroundSource, functionName), context, {
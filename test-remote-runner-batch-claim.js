@@ -0,0 +1,364 @@
+const assert = require('assert');
+const fs = require('fs');
+const path = require('path');
+const vm = require('vm');
+
+const backgroundPath = path.join(__dirname, 'background.js');
+const backgroundSource = fs.readFileSync(backgroundPath, 'utf8');
+
+function extractFunctionSource(source, functionName) {
+  const pattern = new RegExp(`(?:async\\s+)?function\\s+${functionName}\\s*\\(`);
+  const match = pattern.exec(source);
+  if (!match) {
+    throw new Error(`Function not found: ${functionName}`);
+  }
+  const startIndex = match.index;
+  const paramsStart = source.indexOf('(', match.index);
+  if (paramsStart < 0) {
+    throw new Error(`Function params not found: ${functionName}`);
+  }
+
+  let parenDepth = 0;
+  let inSingle = false;
+  let inDouble = false;
+  let inTemplate = false;
+  let inLineComment = false;
+  let inBlockComment = false;
+  let escaped = false;
+  let braceStart = -1;
+
+  for (let i = paramsStart; i < source.length; i += 1) {
+    const char = source[i];
+    const next = source[i + 1];
+
+    if (inLineComment) {
+      if (char === '\n') inLineComment = false;
+      continue;
+    }
+    if (inBlockComment) {
+      if (char === '*' && next === '/') {
+        inBlockComment = false;
+        i += 1;
+      }
+      continue;
+    }
+    if (inSingle) {
+      if (!escaped && char === '\\') {
+        escaped = true;
+        continue;
+      }
+      if (!escaped && char === '\'') inSingle = false;
+      escaped = false;
+      continue;
+    }
+    if (inDouble) {
+      if (!escaped && char === '\\') {
+        escaped = true;
+        continue;
+      }
+      if (!escaped && char === '"') inDouble = false;
+      escaped = false;
+      continue;
+    }
+    if (inTemplate) {
+      if (!escaped && char === '\\') {
+        escaped = true;
+        continue;
+      }
+      if (!escaped && char === '`') inTemplate = false;
+      escaped = false;
+      continue;
+    }
+
+    if (char === '/' && next === '/') {
+      inLineComment = true;
+      i += 1;
+      continue;
+    }
+    if (char === '/' && next === '*') {
+      inBlockComment = true;
+      i += 1;
+      continue;
+    }
+    if (char === '\'') {
+      inSingle = true;
+      continue;
+    }
+    if (char === '"') {
+      inDouble = true;
+      continue;
+    }
+    if (char === '`') {
+      inTemplate = true;
+      continue;
+    }
+
+    if (char === '(') {
+      parenDepth += 1;
+      continue;
+    }
+    if (char === ')') {
+      parenDepth -= 1;
+      if (parenDepth === 0) {
+        braceStart = source.indexOf('{', i);
+        break;
+      }
+    }
+  }
+
+  if (braceStart < 0) {
+    throw new Error(`Function body not found: ${functionName}`);
+  }
+
+  let depth = 0;
+  inSingle = false;
+  inDouble = false;
+  inTemplate = false;
+  inLineComment = false;
+  inBlockComment = false;
+  escaped = false;
+
+  for (let i = braceStart; i < source.length; i += 1) {
+    const char = source[i];
+    const next = source[i + 1];
+
+    if (inLineComment) {
+      if (char === '\n') inLineComment = false;
+      continue;
+    }
+    if (inBlockComment) {
+      if (char === '*' && next === '/') {
+        inBlockComment = false;
+        i += 1;
+      }
+      continue;
+    }
+    if (inSingle) {
+      if (!escaped && char === '\\') {
+        escaped = true;
+        continue;
+      }
+      if (!escaped && char === '\'') inSingle = false;
+      escaped = false;
+      continue;
+    }
+    if (inDouble) {
+      if (!escaped && char === '\\') {
+        escaped = true;
+        continue;
+      }
+      if (!escaped && char === '"') inDouble = false;
+      escaped = false;
+      continue;
+    }
+    if (inTemplate) {
+      if (!escaped && char === '\\') {
+        escaped = true;
+        continue;
+      }
+      if (!escaped && char === '`') inTemplate = false;
+      escaped = false;
+      continue;
+    }
+
+    if (char === '/' && next === '/') {
+      inLineComment = true;
+      i += 1;
+      continue;
+    }
+    if (char === '/' && next === '*') {
+      inBlockComment = true;
+      i += 1;
+      continue;
+    }
+    if (char === '\'') {
+      inSingle = true;
+      continue;
+    }
+    if (char === '"') {
+      inDouble = true;
+      continue;
+    }
+    if (char === '`') {
+      inTemplate = true;
+      continue;
+    }
+
+    if (char === '{') depth += 1;
+    if (char === '}') {
+      depth -= 1;
+      if (depth === 0) {
+        return source.slice(startIndex, i + 1);
+      }
+    }
+  }
+
+  throw new Error(`Function end not found: ${functionName}`);
+}
+
+function createClaimContext(options = {}) {
+  const claimResponses = Array.isArray(options.claimResponses) ? options.claimResponses.slice() : [];
+  const context = {
+    console,
+    Promise,
+    getAnalysisQueueSlotTarget: () => 3,
+    ISKRA_REMOTE_RUNNER: {
+      claimBatchMax: 3,
+      claimWaitMs: 20000,
+      requestTimeoutMs: 15000
+    },
+    remoteRunnerClaimSupport: options.claimSupport || {
+      maxJobs: 1,
+      maxWaitMs: 0,
+      heartbeat: false,
+      jobHeartbeats: false
+    },
+    claimRequests: [],
+    enqueuedJobIds: [],
+    getStoredRemoteRunnerEnabled: async () => true,
+    getConfiguredRemoteRunnerIdentity: async () => ({
+      runnerId: 'runner-1'
+    }),
+    getRemoteRunnerLocalState: async () => ({
+      localBusy: false,
+      localQueueSize: Number.isInteger(options.localQueueSize) ? options.localQueueSize : 0,
+      queuedRemoteJob: null
+    }),
+    getAnalysisQueuePaused: async () => false,
+    claimRemoteJobViaApi: async (runnerId, claimOptions = {}) => {
+      context.claimRequests.push({ runnerId, ...claimOptions });
+      return claimResponses.shift() || {
+        success: true,
+        payload: {
+          claimed: false,
+          reason: 'queue_empty'
+        }
+      };
+    },
+    enqueueClaimedRemoteJob: async (job) => {
+      context.enqueuedJobIds.push(job.jobId);
+      return { success: true, jobId: `local-${job.jobId}` };
+    },
+    reportRemoteJobEnqueueFailure: async () => ({
+      error: 'enqueue_failed'
+    })
+  };
+
+  vm.createContext(context);
+  [
+    'rememberRemoteRunnerClaimSupport',
+    'resolveRemoteRunnerClaimCapacity',
+    'resolveRemoteRunnerClaimWaitMs',
+    'extractClaimedRemoteJobs',
+    'pollAndClaimRemoteJob'
+  ].forEach((functionName) => {
+    vm.runInContext(extractFunctionSource(backgroundSource, functionName), context, {
+      filename: 'background.js'
+    });
+  });
+  return context;
+}
+
+function buildRemoteJob(jobId) {
+  return {
+    jobId,
+    attemptId: `attempt-${jobId}`,
+    status: 'claimed'
+  };
+}
+
+async function testBatchClaimFillsFreeSlotsInOneRequest() {
+  const claimSupport = {
+    maxJobs: 10,
+    maxWaitMs: 25000,
+    heartbeat: true,
+    jobHeartbeats: true
+  };
+  const context = createClaimContext({
+    localQueueSize: 1,
+    claimSupport,
+    claimResponses: [
+      {
+        success: true,
+        payload: {
+          claimed: true,
+          heartbeatApplied: true,
+          job: buildRemoteJob('remote-1'),
+          jobs: [buildRemoteJob('remote-1'), buildRemoteJob('remote-2'), buildRemoteJob('remote-1')],
+          claimSupport
+        }
+      }
+    ]
+  });
+  const heartbeat = { runnerId: 'runner-1', freeSlots: 2 };
+
+  const result = await context.pollAndClaimRemoteJob({ origin: 'test', heartbeat });
+  assert.strictEqual(result.success, true);
+  assert.strictEqual(result.claimed, true);
+  assert.strictEqual(result.claimedCount, 2);
+  assert.strictEqual(result.freeSlots, 0);
+  assert.strictEqual(result.heartbeatApplied, true);
+  assert.deepStrictEqual(JSON.parse(JSON.stringify(context.enqueuedJobIds)), ['remote-1', 'remote-2']);
+  assert.strictEqual(context.claimRequests.length, 1, 'One batch claim should fill every free slot.');
+  assert.strictEqual(context.claimRequests[0].maxJobs, 2);
+  assert.strictEqual(context.claimRequests[0].waitMs, 20000, 'Client wait should stay under the service-worker idle limit.');
+  assert.strictEqual(context.claimRequests[0].timeoutMs, 35000);
+  assert.strictEqual(context.claimRequests[0].heartbeat, heartbeat);
+}
+
+async function testLegacyServerClaimsOneJobPerRequest() {
+  const context = createClaimContext({
+    claimResponses: [
+      { success: true, payload: { claimed: true, job: buildRemoteJob('remote-1') } },
+      { success: true, payload: { claimed: true, job: buildRemoteJob('remote-2') } }
+    ]
+  });
+
+  const result = await context.pollAndClaimRemoteJob({ origin: 'test-legacy' });
+  assert.strictEqual(result.success, true);
+  assert.strictEqual(result.claimedCount, 2);
+  assert.strictEqual(result.freeSlots, 1);
+  assert.strictEqual(result.job.jobId, 'remote-1');
+  assert.deepStrictEqual(JSON.parse(JSON.stringify(context.enqueuedJobIds)), ['remote-1', 'remote-2']);
+  assert.strictEqual(context.claimRequests.length, 3, 'Legacy servers are drained one claim at a time until empty.');
+  assert.ok(context.claimRequests.every((request) => request.waitMs === 0), 'Legacy servers must not be long-polled.');
+  assert.ok(context.claimRequests.every((request) => request.heartbeat === null));
+}
+
+async function testFullLocalQueueSkipsClaim() {
+  const context = createClaimContext({ localQueueSize: 3 });
+
+  const result = await context.pollAndClaimRemoteJob({ origin: 'test-busy' });
+  assert.strictEqual(result.success, true);
+  assert.strictEqual(result.skipped, true);
+  assert.strictEqual(result.reason, 'local_busy');
+  assert.strictEqual(context.claimRequests.length, 0);
+}
+
+async function testClaimSupportFallsBackToLegacyDefaults() {
+  const context = createClaimContext({
+    claimSupport: { maxJobs: 10, maxWaitMs: 25000, heartbeat: true, jobHeartbeats: true }
+  });
+
+  const support = context.rememberRemoteRunnerClaimSupport({ success: true, runner: {} });
+  assert.deepStrictEqual(JSON.parse(JSON.stringify(support)), {
+    maxJobs: 1,
+    maxWaitMs: 0,
+    heartbeat: false,
+    jobHeartbeats: false
+  });
+  assert.strictEqual(context.resolveRemoteRunnerClaimWaitMs(), 0);
+}
+
+async function main() {
+  await testBatchClaimFillsFreeSlotsInOneRequest();
+  await testLegacyServerClaimsOneJobPerRequest();
+  await testFullLocalQueueSkipsClaim();
+  await testClaimSupportFallsBackToLegacyDefaults();
+  console.log('remote runner batch claim test: ok');
+}
+
+main().catch((error) => {
+  console.error(error);
+  process.exit(1);
+});
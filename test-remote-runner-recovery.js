@@ -292,6 +292,8 @@ async function main() {
     'findActiveRemoteProcessRecord',
     'buildRemoteQueueJobLikeFromProcess',
     'getRemoteRunnerLocalState',
+    'collectLocalRemoteJobIds',
+    'recoverAssignedRemoteJobById',
     'recoverAssignedRemoteJob'
   ].forEach((functionName) => {
     vm.runInContext(extractFunctionSource(backgroundSource, functionName), context, {
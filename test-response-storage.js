@@ -23,6 +23,9 @@ function createStorageArea(initialState = {}) {
         delete state[key];
       });
     },
+    async getKeys() {
+      return Object.keys(state);
+    },
     snapshot() {
       return JSON.parse(JSON.stringify(state));
     }
@@ -151,11 +154,126 @@ async function testSessionMigrationWithoutUi() {
 
   const localState = local.snapshot();
   const sessionState = session.snapshot();
-  assert.strictEqual(result.responses.length, 1);
-  assert.strictEqual(localState.responses.length, 1);
-  assert.strictEqual(localState.responses[0].responseId, 'resp-migrate');
-  assert.ok(localState.responses[0].decisionContract);
+  const index = localState[ResponseStorageUtils.RESPONSE_INDEX_STORAGE_KEY];
+  assert.strictEqual(result.responseCount, 1);
+  assert.strictEqual(result.migratedSessionCount, 1);
+  assert.strictEqual(index.order.length, 1);
+  const record = localState[`${ResponseStorageUtils.RESPONSE_RECORD_KEY_PREFIX}${index.order[0]}`];
+  assert.strictEqual(record.responseId, 'resp-migrate');
+  assert.ok(record.decisionContract);
+  assert.strictEqual(index.identity['response:resp-migrate'], index.order[0]);
+  assert.strictEqual(localState.responses, undefined);
   assert.strictEqual(sessionState.responses, undefined);
+
+  const repeated = await ResponseStorageUtils.migrateLegacyResponseStorage(
+    { local, session },
+    DecisionContractUtils,
+    { clearSession: true }
+  );
+  assert.strictEqual(repeated.rewritten, false);
+}
+
+async function testUpsertWritesOnlyTouchedShard() {
+  const local = createStorageArea();
+  const session = createStorageArea();
+  const storage = { local, session };
+
+  await ResponseStorageUtils.upsertCanonicalResponse(
+    makeCompanyResponse({ responseId: 'resp-a', runId: 'run-a' }),
+    storage,
+    DecisionContractUtils
+  );
+  await ResponseStorageUtils.upsertCanonicalResponse(
+    makeCompanyResponse({ responseId: 'resp-b', runId: 'run-b', text: makeCurrent16Line('PRIMARY', 'Beta Corp') }),
+    storage,
+    DecisionContractUtils
+  );
+
+  const writes = [];
+  const trackingLocal = {
+    ...local,
+    async set(patch) {
+      writes.push(Object.keys(patch));
+      return local.set(patch);
+    }
+  };
+  const result = await ResponseStorageUtils.upsertCanonicalResponse(
+    makeCompanyResponse({ responseId: 'resp-a', runId: 'run-a', sourceUrl: 'https://example.test/a' }),
+    { local: trackingLocal, session },
+    DecisionContractUtils
+  );
+
+  assert.strictEqual(result.responseCount, 2);
+  assert.strictEqual(result.savedResponse.sourceUrl, 'https://example.test/a');
+  assert.strictEqual(writes.length, 1);
+  assert.deepStrictEqual(writes[0].sort(), [
+    ResponseStorageUtils.RESPONSE_INDEX_STORAGE_KEY,
+    `${ResponseStorageUtils.RESPONSE_RECORD_KEY_PREFIX}${result.recordId}`
+  ].sort());
+
+  const found = await ResponseStorageUtils.findCanonicalResponse({ responseId: 'resp-b' }, storage);
+  assert.strictEqual(found.runId, 'run-b');
+  assert.strictEqual(await ResponseStorageUtils.readCanonicalResponseCount(storage), 2);
+  const merged = await ResponseStorageUtils.readCanonicalResponses(storage, DecisionContractUtils);
+  assert.deepStrictEqual(merged.map((item) => item.responseId), ['resp-a', 'resp-b']);
+}
+
+async function testUpsertFoldsLegacyArrayAndRepairsOrphans() {
+  const local = createStorageArea({
+    responses: [makeCompanyResponse({ responseId: 'resp-legacy', runId: 'run-legacy' })],
+    [`${ResponseStorageUtils.RESPONSE_RECORD_KEY_PREFIX}orphan-1`]: makeCompanyResponse({
+      responseId: 'resp-orphan',
+      runId: 'run-orphan',
+      text: makeCurrent16Line('PRIMARY', 'Orphan Corp')
+    })
+  });
+  const session = createStorageArea();
+  const storage = { local, session };
+
+  await ResponseStorageUtils.upsertCanonicalResponse(
+    makeCompanyResponse({ responseId: 'resp-new', runId: 'run-new', text: makeCurrent16Line('PRIMARY', 'New Corp') }),
+    storage,
+    DecisionContractUtils
+  );
+  assert.strictEqual(local.snapshot().responses, undefined);
+  assert.strictEqual(await ResponseStorageUtils.readCanonicalResponseCount(storage), 2);
+
+  const repaired = await ResponseStorageUtils.migrateLegacyResponseStorage(storage, DecisionContractUtils);
+  assert.strictEqual(repaired.repairedRecordCount, 1);
+  const merged = await ResponseStorageUtils.readCanonicalResponses(storage, DecisionContractUtils);
+  assert.deepStrictEqual(
+    merged.map((item) => item.responseId).sort(),
+    ['resp-legacy', 'resp-new', 'resp-orphan']
+  );
+
+  await ResponseStorageUtils.clearCanonicalResponses(storage);
+  assert.deepStrictEqual(Object.keys(local.snapshot()), []);
+}
+
+async function testDecisionSummaryCachedByContentHash() {
+  let parseCount = 0;
+  const countingUtils = {
+    ...DecisionContractUtils,
+    buildDecisionContractSummary(text) {
+      parseCount += 1;
+      return DecisionContractUtils.buildDecisionContractSummary(text);
+    }
+  };
+  const response = makeCompanyResponse({ responseId: 'resp-cache' });
+  const first = ResponseStorageUtils.normalizeResponseRecord(response, countingUtils);
+  ResponseStorageUtils.mergeResponseCollections([first], [response], countingUtils);
+  ResponseStorageUtils.normalizeResponseRecord(first, countingUtils);
+  assert.strictEqual(parseCount, 1);
+  assert.ok(first.decisionContractHash);
+
+  const freshUtils = {
+    ...DecisionContractUtils,
+    buildDecisionContractSummary() {
+      throw new Error('stored summary should be reused');
+    }
+  };
+  const reused = ResponseStorageUtils.normalizeResponseRecord(JSON.parse(JSON.stringify(first)), freshUtils);
+  assert.strictEqual(reused.decisionContract.status, first.decisionContract.status);
 }
 
 async function main() {
@@ -164,6 +282,9 @@ async function main() {
   await testFallbackDedupeWithoutResponseId();
   await testCanonicalUpsertConvergesNormalAndEmergencyPaths();
   await testSessionMigrationWithoutUi();
+  await testUpsertWritesOnlyTouchedShard();
+  await testUpsertFoldsLegacyArrayAndRepairsOrphans();
+  await testDecisionSummaryCachedByContentHash();
   console.log('test-response-storage.js: ok');
 }
 
@@ -293,10 +293,213 @@ function testExportFlattensMultilineResponses() {
   assert.strictEqual(flattened, 'Line 1 ⏎ Line 2 Tabbed ⏎ Line 3');
 }
 
+function loadResponseIndexHelpers() {
+  const context = loadResponsesHelpers();
+  const source = fs.readFileSync(path.join(__dirname, 'responses.js'), 'utf8');
+  context.describeResponseSource = (response) => ({
+    display: response.source || '',
+    detail: '',
+    tag: '',
+    raw: response.source || '',
+    sortKey: (response.source || '').toLowerCase()
+  });
+  context.buildCount = 0;
+  const originalBuildEntries = context.buildResponseCompanyEntries;
+  context.DecisionViewModelUtils = {};
+  context.TEXT_SORT_COLLATOR = new Intl.Collator('pl', { sensitivity: 'base' });
+  context.responseViewIndex = new Map();
+  context.responseViewEntries = [];
+  context.responseViewIndexSource = null;
+  context.responseViewIndexVersion = 0;
+  context.companyResponseViewCache = null;
+  context.companyQueryMatcherCache = null;
+  context.companySortMode = 'latest';
+  context.marketFilters = { companyQuery: '', sector: '' };
+
+  [
+    'resolveResponseViewKey',
+    'buildResponseIndexEntry',
+    'getResponseIndexEntry',
+    'syncResponseViewIndex',
+    'createCompanyQueryMatcher',
+    'getCompanyQueryMatcher',
+    'compareTextForSort',
+    'compareByTimestampDesc',
+    'normalizeSourceText',
+    'normalizeCompanySortMode',
+    'sortCompanyResponseEntries',
+    'getCompanyResponseView'
+  ].forEach((functionName) => {
+    vm.runInContext(extractFunctionSource(source, functionName), context);
+  });
+  context.buildResponseCompanyEntries = (response) => {
+    context.buildCount += 1;
+    return originalBuildEntries(response);
+  };
+  return context;
+}
+
+function makeIndexedResponse(responseId, timestamp, company) {
+  return {
+    responseId,
+    timestamp,
+    analysisType: 'company',
+    source: `Source ${responseId}`,
+    text: `${company} report ${responseId}`,
+    stage12View: {
+      primaryRecord: { company, role: 'PRIMARY', decisionStatus: 'WATCH' },
+      secondaryRecord: null
+    }
+  };
+}
+
+function testResponseViewIndexReusesUnchangedEntries() {
+  const context = loadResponseIndexHelpers();
+  const responses = [
+    makeIndexedResponse('a', 100, 'Nvidia (NVDA)'),
+    makeIndexedResponse('b', 300, 'ASML Holding (ASML)'),
+    makeIndexedResponse('c', 200, 'Nvidia (NVDA)')
+  ];
+
+  context.syncResponseViewIndex(responses);
+  assert.strictEqual(context.buildCount, 3);
+  assert.deepStrictEqual(context.getCompanyResponseView().map((entry) => entry.response.responseId), ['b', 'c', 'a']);
+
+  context.marketFilters.companyQuery = 'nvdia';
+  const filtered = context.getCompanyResponseView();
+  assert.deepStrictEqual(filtered.map((entry) => entry.response.responseId), ['c', 'a']);
+  assert.strictEqual(context.getCompanyResponseView(), filtered);
+
+  const versionBefore = context.responseViewIndexVersion;
+  const reloaded = responses.map((response) => ({ ...response }));
+  reloaded[1] = { ...makeIndexedResponse('b', 300, 'ASML Holding (ASML)'), text: 'Edited ASML report' };
+  context.syncResponseViewIndex(reloaded);
+  assert.strictEqual(context.buildCount, 4);
+  assert.strictEqual(context.responseViewIndexVersion, versionBefore + 1);
+  assert.strictEqual(context.responseViewEntries[0].response, reloaded[0]);
+
+  context.syncResponseViewIndex(reloaded.map((response) => ({ ...response })));
+  assert.strictEqual(context.buildCount, 4);
+  assert.strictEqual(context.responseViewIndexVersion, versionBefore + 1);
+}
+
+class FakeElement {
+  constructor(height = 0) {
+    this.children = [];
+    this.parentNode = null;
+    this.fixedHeight = height;
+    this.style = {};
+  }
+
+  get firstChild() {
+    return this.children[0] || null;
+  }
+
+  get nextSibling() {
+    if (!this.parentNode) return null;
+    const siblings = this.parentNode.children;
+    return siblings[siblings.indexOf(this) + 1] || null;
+  }
+
+  get offsetParent() {
+    return this.parentNode;
+  }
+
+  get offsetHeight() {
+    return this.fixedHeight || Number.parseInt(this.style.height || '0', 10) || 0;
+  }
+
+  get offsetTop() {
+    if (!this.parentNode) return 0;
+    const siblings = this.parentNode.children;
+    let top = 0;
+    for (const sibling of siblings) {
+      if (sibling === this) break;
+      top += sibling.offsetHeight;
+    }
+    return top;
+  }
+
+  insertBefore(node, reference) {
+    if (node.parentNode) node.remove();
+    const index = reference ? this.children.indexOf(reference) : -1;
+    if (index < 0) {
+      this.children.push(node);
+    } else {
+      this.children.splice(index, 0, node);
+    }
+    node.parentNode = this;
+    return node;
+  }
+
+  appendChild(node) {
+    return this.insertBefore(node, null);
+  }
+
+  remove() {
+    if (!this.parentNode) return;
+    const siblings = this.parentNode.children;
+    siblings.splice(siblings.indexOf(this), 1);
+    this.parentNode = null;
+  }
+}
+
+function testWindowedRendererRendersOnlyVisibleItems() {
+  const source = fs.readFileSync(path.join(__dirname, 'responses.js'), 'utf8');
+  const container = new FakeElement();
+  let containerTop = 0;
+  container.getBoundingClientRect = () => ({ top: containerTop });
+  let renderCalls = 0;
+  const context = {
+    window: { innerHeight: 600 },
+    document: {},
+    WINDOWED_RENDER_OVERSCAN_PX: 0,
+    setTimeout,
+    Map,
+    Set
+  };
+  vm.createContext(context);
+  vm.runInContext(extractFunctionSource(source, 'createWindowedRenderer'), context);
+
+  const items = Array.from({ length: 1000 }, (_, index) => ({ id: `item-${index}` }));
+  const renderer = context.createWindowedRenderer({
+    container,
+    estimatedItemHeight: 50,
+    overscanPx: 0,
+    getItemKey: (item) => item.id,
+    renderItem: (item) => {
+      renderCalls += 1;
+      const node = new FakeElement(50);
+      node.itemId = item.id;
+      return node;
+    },
+    createSpacer: () => new FakeElement()
+  });
+
+  renderer.setItems(items);
+  assert.strictEqual(renderer.getRenderedCount(), 12);
+  assert.strictEqual(renderCalls, 12);
+  assert.strictEqual(container.children.length, 14);
+  assert.strictEqual(container.children[container.children.length - 1].style.height, `${988 * 50}px`);
+
+  containerTop = -5000;
+  renderer.render();
+  const rendered = container.children.slice(1, -1).map((node) => node.itemId);
+  assert.strictEqual(rendered[0], 'item-100');
+  assert.strictEqual(rendered[rendered.length - 1], 'item-111');
+  assert.strictEqual(container.children[0].style.height, '5000px');
+
+  containerTop = -5100;
+  renderer.render();
+  assert.strictEqual(renderCalls, 24 + 2, 'scrolling by two rows should only build the two new rows');
+}
+
 function main() {
   testCompanyHelpersFollowStage12Companies();
   testCompanyQueryFallsBackToSourceAndText();
   testExportFlattensMultilineResponses();
+  testResponseViewIndexReusesUnchangedEntries();
+  testWindowedRendererRendersOnlyVisibleItems();
   console.log('test-responses-company-browser.js: ok');
 }
 
@@ -0,0 +1,340 @@
+const assert = require('assert');
+const fs = require('fs');
+const path = require('path');
+const vm = require('vm');
+
+const backgroundPath = path.join(__dirname, 'background.js');
+const backgroundSource = fs.readFileSync(backgroundPath, 'utf8');
+
+function extractFunctionSource(source, functionName) {
+  const pattern = new RegExp(`(?:async\\s+)?function\\s+${functionName}\\s*\\(`);
+  const match = pattern.exec(source);
+  if (!match) {
+    throw new Error(`Function not found: ${functionName}`);
+  }
+  const startIndex = match.index;
+  const paramsStart = source.indexOf('(', match.index);
+  if (paramsStart < 0) {
+    throw new Error(`Function params not found: ${functionName}`);
+  }
+
+  let parenDepth = 0;
+  let inSingle = false;
+  let inDouble = false;
+  let inTemplate = false;
+  let inLineComment = false;
+  let inBlockComment = false;
+  let escaped = false;
+  let braceStart = -1;
+
+  for (let i = paramsStart; i < source.length; i += 1) {
+    const char = source[i];
+    const next = source[i + 1];
+
+    if (inLineComment) {
+      if (char === '\n') inLineComment = false;
+      continue;
+    }
+    if (inBlockComment) {
+      if (char === '*' && next === '/') {
+        inBlockComment = false;
+        i += 1;
+      }
+      continue;
+    }
+    if (inSingle) {
+      if (!escaped && char === '\\') {
+        escaped = true;
+        continue;
+      }
+      if (!escaped && char === '\'') inSingle = false;
+      escaped = false;
+      continue;
+    }
+    if (inDouble) {
+      if (!escaped && char === '\\') {
+        escaped = true;
+        continue;
+      }
+      if (!escaped && char === '"') inDouble = false;
+      escaped = false;
+      continue;
+    }
+    if (inTemplate) {
+      if (!escaped && char === '\\') {
+        escaped = true;
+        continue;
+      }
+      if (!escaped && char === '`') inTemplate = false;
+      escaped = false;
+      continue;
+    }
+
+    if (char === '/' && next === '/') {
+      inLineComment = true;
+      i += 1;
+      continue;
+    }
+    if (char === '/' && next === '*') {
+      inBlockComment = true;
+      i += 1;
+      continue;
+    }
+    if (char === '\'') {
+      inSingle = true;
+      continue;
+    }
+    if (char === '"') {
+      inDouble = true;
+      continue;
+    }
+    if (char === '`') {
+      inTemplate = true;
+      continue;
+    }
+
+    if (char === '(') {
+      parenDepth += 1;
+      continue;
+    }
+    if (char === ')') {
+      parenDepth -= 1;
+      if (parenDepth === 0) {
+        braceStart = source.indexOf('{', i);
+        break;
+      }
+    }
+  }
+
+  if (braceStart < 0) {
+    throw new Error(`Function body not found: ${functionName}`);
+  }
+
+  let depth = 0;
+  inSingle = false;
+  inDouble = false;
+  inTemplate = false;
+  inLineComment = false;
+  inBlockComment = false;
+  escaped = false;
+
+  for (let i = braceStart; i < source.length; i += 1) {
+    const char = source[i];
+    const next = source[i + 1];
+
+    if (inLineComment) {
+      if (char === '\n') inLineComment = false;
+      continue;
+    }
+    if (inBlockComment) {
+      if (char === '*' && next === '/') {
+        inBlockComment = false;
+        i += 1;
+      }
+      continue;
+    }
+    if (inSingle) {
+      if (!escaped && char === '\\') {
+        escaped = true;
+        continue;
+      }
+      if (!escaped && char === '\'') inSingle = false;
+      escaped = false;
+      continue;
+    }
+    if (inDouble) {
+      if (!escaped && char === '\\') {
+        escaped = true;
+        continue;
+      }
+      if (!escaped && char === '"') inDouble = false;
+      escaped = false;
+      continue;
+    }
+    if (inTemplate) {
+      if (!escaped && char === '\\') {
+        escaped = true;
+        continue;
+      }
+      if (!escaped && char === '`') inTemplate = false;
+      escaped = false;
+      continue;
+    }
+
+    if (char === '/' && next === '/') {
+      inLineComment = true;
+      i += 1;
+      continue;
+    }
+    if (char === '/' && next === '*') {
+      inBlockComment = true;
+      i += 1;
+      continue;
+    }
+    if (char === '\'') {
+      inSingle = true;
+      continue;
+    }
+    if (char === '"') {
+      inDouble = true;
+      continue;
+    }
+    if (char === '`') {
+      inTemplate = true;
+      continue;
+    }
+
+    if (char === '{') depth += 1;
+    if (char === '}') {
+      depth -= 1;
+      if (depth === 0) {
+        return source.slice(startIndex, i + 1);
+      }
+    }
+  }
+
+  throw new Error(`Function end not found: ${functionName}`);
+}
+
+function createProfilerContext() {
+  const storageData = {
+    runtime_profiler_enabled: false,
+    process_monitor_state: [{ id: 'run-1', status: 'running' }]
+  };
+  const context = {
+    console,
+    Date,
+    Math,
+    Map,
+    Promise,
+    JSON,
+    performance: { now: () => context.clock },
+    clock: 0,
+    RUNTIME_PROFILER_STORAGE_KEY: 'runtime_profiler_enabled',
+    RUNTIME_PROFILER_SAMPLE_LIMIT: 4,
+    RUNTIME_PROFILER_HOT_PATHS: [
+      ['DecisionContractUtils', 'validateDecisionContractText'],
+      ['', 'normalizeProcessRecord'],
+      ['', 'missingHotPath']
+    ],
+    runtimeProfilerEnabled: false,
+    runtimeProfilerReady: null,
+    runtimeProfilerStartedAt: null,
+    runtimeProfilerTimings: new Map(),
+    runtimeProfilerStorage: new Map(),
+    runtimeProfilerRestoreHooks: [],
+    DecisionContractUtils: {
+      validateDecisionContractText: async (text) => {
+        context.clock += 7;
+        return { ok: text === 'valid' };
+      }
+    },
+    chrome: {
+      storage: {
+        local: {
+          get: async (keys) => {
+            const result = {};
+            (Array.isArray(keys) ? keys : [keys]).forEach((key) => {
+              if (key in storageData) result[key] = storageData[key];
+            });
+            return result;
+          },
+          set: async (items) => {
+            Object.assign(storageData, items);
+          }
+        }
+      }
+    }
+  };
+  vm.createContext(context);
+  vm.runInContext(`function normalizeProcessRecord(record) {
+    clock += record.cost;
+    if (record.fail) throw new Error('bad_record');
+    return { id: record.id };
+  }`, context);
+  [
+    'createRuntimeProfilerTimingEntry',
+    'recordRuntimeProfilerTiming',
+    'estimateRuntimeProfilerBytes',
+    'recordRuntimeProfilerStorage',
+    'wrapRuntimeProfilerFunction',
+    'wrapRuntimeProfilerStorageArea',
+    'installRuntimeProfilerHooks',
+    'uninstallRuntimeProfilerHooks',
+    'resetRuntimeProfiler',
+    'setRuntimeProfilerEnabled',
+    'ensureRuntimeProfilerReady',
+    'buildRuntimeProfilerSnapshot'
+  ].forEach((functionName) => {
+    vm.runInContext(extractFunctionSource(backgroundSource, functionName), context, {
+      filename: 'background.js'
+    });
+  });
+  return { context, storageData };
+}
+
+async function testProfilerRecordsHotPathTimingsAndStorageBytes() {
+  const { context, storageData } = createProfilerContext();
+  const originalNormalize = context.normalizeProcessRecord;
+  const originalGet = context.chrome.storage.local.get;
+
+  assert.strictEqual(await context.ensureRuntimeProfilerReady(), false);
+  assert.strictEqual(context.normalizeProcessRecord, originalNormalize, 'Disabled profiler must not wrap hot paths.');
+
+  await context.setRuntimeProfilerEnabled(true);
+  assert.strictEqual(storageData.runtime_profiler_enabled, true);
+  assert.notStrictEqual(context.normalizeProcessRecord, originalNormalize);
+  context.resetRuntimeProfiler();
+
+  [1, 2, 3, 4, 10].forEach((cost, index) => {
+    vm.runInContext(`normalizeProcessRecord({ id: 'run-${index}', cost: ${cost} })`, context);
+  });
+  assert.throws(() => vm.runInContext(`normalizeProcessRecord({ id: 'bad', cost: 5, fail: true })`, context), /bad_record/);
+  await context.DecisionContractUtils.validateDecisionContractText('valid');
+  await context.chrome.storage.local.get(['process_monitor_state']);
+  await context.chrome.storage.local.set({ process_monitor_state: [{ id: 'run-1' }, { id: 'run-2' }] });
+
+  const profile = JSON.parse(JSON.stringify(context.buildRuntimeProfilerSnapshot()));
+  assert.strictEqual(profile.enabled, true);
+  const normalizeTiming = profile.timings.find((entry) => entry.name === 'normalizeProcessRecord');
+  assert.deepStrictEqual(
+    [normalizeTiming.calls, normalizeTiming.errors, normalizeTiming.totalMs, normalizeTiming.maxMs, normalizeTiming.p95Ms],
+    [6, 1, 25, 10, 10],
+    'Timings should include failed calls; p95 is taken from the bounded sample window.'
+  );
+  const validateTiming = profile.timings.find((entry) => entry.name === 'DecisionContractUtils.validateDecisionContractText');
+  assert.strictEqual(validateTiming.totalMs, 7, 'Async hot paths should be timed until they settle.');
+  assert.deepStrictEqual(profile.storage.map((entry) => [entry.key, entry.reads, entry.writes]), [
+    ['process_monitor_state', 1, 1]
+  ]);
+  const storageEntry = profile.storage[0];
+  assert.strictEqual(storageEntry.readBytes, JSON.stringify([{ id: 'run-1', status: 'running' }]).length);
+  assert.strictEqual(storageEntry.writeBytes, JSON.stringify([{ id: 'run-1' }, { id: 'run-2' }]).length);
+
+  await context.setRuntimeProfilerEnabled(false);
+  assert.strictEqual(context.normalizeProcessRecord, originalNormalize, 'Disabling should restore the original functions.');
+  assert.strictEqual(context.chrome.storage.local.get, originalGet);
+  assert.strictEqual(context.buildRuntimeProfilerSnapshot().timings.length, 0);
+}
+
+async function testProfilerRestoresEnabledStateOnBoot() {
+  const { context, storageData } = createProfilerContext();
+  storageData.runtime_profiler_enabled = true;
+
+  assert.strictEqual(await context.ensureRuntimeProfilerReady(), true);
+  vm.runInContext(`normalizeProcessRecord({ id: 'run-1', cost: 2 })`, context);
+  const profile = context.buildRuntimeProfilerSnapshot();
+  assert.strictEqual(profile.timings[0].name, 'normalizeProcessRecord');
+  assert.strictEqual(profile.timings[0].calls, 1);
+}
+
+async function main() {
+  await testProfilerRecordsHotPathTimingsAndStorageBytes();
+  await testProfilerRestoresEnabledStateOnBoot();
+  console.log('runtime profiler test: ok');
+}
+
+main().catch((error) => {
+  console.error(error);
+  process.exit(1);
+});
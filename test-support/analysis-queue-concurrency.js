@@ -0,0 +1,57 @@
+// Shared fixture for the analysis queue tests. The adaptive concurrency config is read from
+// background.js so tests never carry a stale copy, and the slot target is pinned to the scenario's
+// analysisQueueState.maxConcurrent so slot math stays deterministic.
+const fs = require('fs');
+const path = require('path');
+const vm = require('vm');
+
+const backgroundSource = fs.readFileSync(path.join(__dirname, '..', 'background.js'), 'utf8');
+
+function extractTopLevelObjectLiteral(source, constName) {
+  const match = new RegExp(`^const\\s+${constName}\\s*=\\s*\\{`, 'm').exec(source);
+  if (!match) {
+    throw new Error(`Constant not found: ${constName}`);
+  }
+  const startIndex = match.index + match[0].length - 1;
+  let depth = 0;
+  for (let i = startIndex; i < source.length; i += 1) {
+    if (source[i] === '{') depth += 1;
+    if (source[i] === '}') {
+      depth -= 1;
+      if (depth === 0) {
+        return source.slice(startIndex, i + 1);
+      }
+    }
+  }
+  throw new Error(`Constant end not found: ${constName}`);
+}
+
+function loadAnalysisQueueConcurrencyConfig() {
+  return vm.runInNewContext(`(${extractTopLevelObjectLiteral(backgroundSource, 'ANALYSIS_QUEUE_CONCURRENCY')})`);
+}
+
+// Returns context entries for the concurrency globals; `getContext` resolves the vm context lazily
+// because the stubs are defined inside the context literal they belong to.
+function createPinnedAnalysisQueueConcurrency(getContext) {
+  return {
+    ANALYSIS_QUEUE_CONCURRENCY: loadAnalysisQueueConcurrencyConfig(),
+    analysisQueueConcurrencyState: null,
+    ensureAnalysisQueueConcurrencyReady: async () => {
+      const context = getContext();
+      context.analysisQueueConcurrencyState = {
+        target: context.analysisQueueState.maxConcurrent,
+        lastIncreaseAt: Date.now()
+      };
+      return context.analysisQueueConcurrencyState;
+    },
+    commitAnalysisQueueConcurrencyState: (state) => {
+      getContext().analysisQueueConcurrencyState = state;
+      return state;
+    }
+  };
+}
+
+module.exports = {
+  loadAnalysisQueueConcurrencyConfig,
+  createPinnedAnalysisQueueConcurrency
+};
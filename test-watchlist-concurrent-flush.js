@@ -0,0 +1,538 @@
+const assert = require('assert');
+const fs = require('fs');
+const path = require('path');
+const vm = require('vm');
+
+const backgroundPath = path.join(__dirname, 'background.js');
+const backgroundSource = fs.readFileSync(backgroundPath, 'utf8');
+
+function extractFunctionSource(source, functionName) {
+  const pattern = new RegExp(`(?:async\\s+)?function\\s+${functionName}\\s*\\(`);
+  const match = pattern.exec(source);
+  if (!match) {
+    throw new Error(`Function not found: ${functionName}`);
+  }
+  const startIndex = match.index;
+  const paramsStart = source.indexOf('(', match.index);
+  if (paramsStart < 0) {
+    throw new Error(`Function params not found: ${functionName}`);
+  }
+
+  let parenDepth = 0;
+  let inSingle = false;
+  let inDouble = false;
+  let inTemplate = false;
+  let inLineComment = false;
+  let inBlockComment = false;
+  let escaped = false;
+  let braceStart = -1;
+
+  for (let i = paramsStart; i < source.length; i += 1) {
+    const char = source[i];
+    const next = source[i + 1];
+
+    if (inLineComment) {
+      if (char === '\n') inLineComment = false;
+      continue;
+    }
+    if (inBlockComment) {
+      if (char === '*' && next === '/') {
+        inBlockComment = false;
+        i += 1;
+      }
+      continue;
+    }
+    if (inSingle) {
+      if (!escaped && char === '\\') {
+        escaped = true;
+        continue;
+      }
+      if (!escaped && char === '\'') inSingle = false;
+      escaped = false;
+      continue;
+    }
+    if (inDouble) {
+      if (!escaped && char === '\\') {
+        escaped = true;
+        continue;
+      }
+      if (!escaped && char === '"') inDouble = false;
+      escaped = false;
+      continue;
+    }
+    if (inTemplate) {
+      if (!escaped && char === '\\') {
+        escaped = true;
+        continue;
+      }
+      if (!escaped && char === '`') inTemplate = false;
+      escaped = false;
+      continue;
+    }
+
+    if (char === '/' && next === '/') {
+      inLineComment = true;
+      i += 1;
+      continue;
+    }
+    if (char === '/' && next === '*') {
+      inBlockComment = true;
+      i += 1;
+      continue;
+    }
+    if (char === '\'') {
+      inSingle = true;
+      continue;
+    }
+    if (char === '"') {
+      inDouble = true;
+      continue;
+    }
+    if (char === '`') {
+      inTemplate = true;
+      continue;
+    }
+
+    if (char === '(') {
+      parenDepth += 1;
+      continue;
+    }
+    if (char === ')') {
+      parenDepth -= 1;
+      if (parenDepth === 0) {
+        braceStart = source.indexOf('{', i);
+        break;
+      }
+    }
+  }
+
+  if (braceStart < 0) {
+    throw new Error(`Function body not found: ${functionName}`);
+  }
+
+  let depth = 0;
+  inSingle = false;
+  inDouble = false;
+  inTemplate = false;
+  inLineComment = false;
+  inBlockComment = false;
+  escaped = false;
+
+  for (let i = braceStart; i < source.length; i += 1) {
+    const char = source[i];
+    const next = source[i + 1];
+
+    if (inLineComment) {
+      if (char === '\n') inLineComment = false;
+      continue;
+    }
+    if (inBlockComment) {
+      if (char === '*' && next === '/') {
+        inBlockComment = false;
+        i += 1;
+      }
+      continue;
+    }
+    if (inSingle) {
+      if (!escaped && char === '\\') {
+        escaped = true;
+        continue;
+      }
+      if (!escaped && char === '\'') inSingle = false;
+      escaped = false;
+      continue;
+    }
+    if (inDouble) {
+      if (!escaped && char === '\\') {
+        escaped = true;
+        continue;
+      }
+      if (!escaped && char === '"') inDouble = false;
+      escaped = false;
+      continue;
+    }
+    if (inTemplate) {
+      if (!escaped && char === '\\') {
+        escaped = true;
+        continue;
+      }
+      if (!escaped && char === '`') inTemplate = false;
+      escaped = false;
+      continue;
+    }
+
+    if (char === '/' && next === '/') {
+      inLineComment = true;
+      i += 1;
+      continue;
+    }
+    if (char === '/' && next === '*') {
+      inBlockComment = true;
+      i += 1;
+      continue;
+    }
+    if (char === '\'') {
+      inSingle = true;
+      continue;
+    }
+    if (char === '"') {
+      inDouble = true;
+      continue;
+    }
+    if (char === '`') {
+      inTemplate = true;
+      continue;
+    }
+
+    if (char === '{') depth += 1;
+    if (char === '}') {
+      depth -= 1;
+      if (depth === 0) {
+        return source.slice(startIndex, i + 1);
+      }
+    }
+  }
+
+  throw new Error(`Function end not found: ${functionName}`);
+}
+
+function truncateDispatchLogText(value, maxLength = 200) {
+  const safe = typeof value === 'string' ? value.trim() : '';
+  if (!safe) return '';
+  if (!Number.isInteger(maxLength) || maxLength <= 0 || safe.length <= maxLength) return safe;
+  return `${safe.slice(0, Math.max(0, maxLength - 3))}...`;
+}
+
+function createContext(fetchImpl) {
+  const context = {
+    console,
+    Date,
+    Promise,
+    URL,
+    Map,
+    AbortController,
+    setTimeout,
+    clearTimeout,
+    WATCHLIST_DISPATCH: {
+      enabled: true,
+      verifyEnabled: true,
+      verifyTimeoutMs: 12000,
+      flushConcurrency: 4,
+      flushMaxInFlightPerHost: 2,
+      verifyBatchEnabled: true,
+      verifyBatchMaxItems: 3,
+      verifyBatchUnsupportedTtlMs: 60000
+    },
+    watchlistVerifyBatchUnsupportedUntil: 0,
+    logs: [],
+    history: [],
+    processUpdates: [],
+    singleVerifyCalls: [],
+    normalizeWatchlistEventId: (value) => {
+      if (typeof value === 'string') return value.trim();
+      if (Number.isInteger(value)) return String(value);
+      return '';
+    },
+    buildCopyTrace: (runId = '', responseId = '') => `${runId || 'no-run'}/${responseId || 'no-response'}`,
+    buildWatchlistVerifyUrlCandidates: () => ['https://iskierka-watchlist.duckdns.org/api/v1/intake/economist-response/verify'],
+    buildWatchlistVerifyPayload: (payload, item) => ({
+      responseId: payload?.responseId || '',
+      eventId: item?.deliveryEventId || ''
+    }),
+    resolveWatchlistDispatchConfiguration: async () => ({
+      ok: true,
+      intakeUrl: 'https://iskierka-watchlist.duckdns.org/api/v1/intake/economist-response',
+      keyId: 'extension-primary',
+      secret: 'secret'
+    }),
+    generateWatchlistNonce: () => 'nonce',
+    sha256HexForDispatch: async () => 'body-hash',
+    buildWatchlistCanonicalString: () => 'canonical',
+    hmacSha256Hex: async () => 'signature',
+    emitWatchlistDispatchProcessLog: (level, code, message, details) => {
+      context.logs.push({ level, code, message, details });
+    },
+    appendWatchlistDispatchHistory: async (entry) => {
+      context.history.push(entry);
+    },
+    updateProcessDispatchAfterSendSuccess: async (runId, responseId, details) => {
+      context.processUpdates.push({ runId, responseId, details });
+      return true;
+    },
+    verifyWatchlistDispatchDelivery: async (item) => {
+      context.singleVerifyCalls.push(item.payload.responseId);
+      return { success: true, pending: false, state: 'verified', reason: 'verified' };
+    },
+    truncateDispatchLogText,
+    createDispatchTimeoutError: (timeoutMs) => new Error(`timeout ${timeoutMs}`),
+    fetch: fetchImpl
+  };
+  vm.createContext(context);
+  [
+    'normalizeWatchlistVerifyState',
+    'isWatchlistVerificationPendingState',
+    'isWatchlistVerificationTerminalState',
+    'resolveWatchlistFlushConcurrency',
+    'resolveWatchlistFlushHostKey',
+    'createWatchlistFlushBudget',
+    'runWatchlistFlushPool',
+    'isWatchlistProblemLogPayload',
+    'getWatchlistVerifyEntryItem',
+    'isWatchlistVerifyBatchUnsupportedStatus',
+    'settleWatchlistVerifyPayload',
+    'postSignedWatchlistVerifyRequest',
+    'verifyWatchlistDispatchDeliveryBatch',
+    'verifyWatchlistOutboxEntries'
+  ].forEach((functionName) => {
+    vm.runInContext(extractFunctionSource(backgroundSource, functionName), context, {
+      filename: 'background.js'
+    });
+  });
+  return context;
+}
+
+function makeEntry(responseId, host = 'iskierka-watchlist.duckdns.org') {
+  return {
+    trace: `run-${responseId}/${responseId}`,
+    item: {
+      deliveryAcceptedAt: Date.now(),
+      deliveryEventId: `evt-${responseId}`,
+      deliveryIntakeUrl: `https://${host}/api/v1/intake/economist-response`,
+      payload: {
+        responseId,
+        runId: `run-${responseId}`
+      }
+    }
+  };
+}
+
+async function testPoolRespectsConcurrencyAndHostLimits() {
+  const context = createContext(async () => {
+    throw new Error('fetch not expected');
+  });
+  let active = 0;
+  let peak = 0;
+  const activeByHost = new Map();
+  let peakPerHost = 0;
+  const started = [];
+  const entries = [
+    { id: 'a1', host: 'a' },
+    { id: 'a2', host: 'a' },
+    { id: 'a3', host: 'a' },
+    { id: 'b1', host: 'b' },
+    { id: 'b2', host: 'b' },
+    { id: 'c1', host: 'c' }
+  ];
+
+  await context.runWatchlistFlushPool(entries, async (entry) => {
+    started.push(entry.id);
+    active += 1;
+    activeByHost.set(entry.host, (activeByHost.get(entry.host) || 0) + 1);
+    peak = Math.max(peak, active);
+    peakPerHost = Math.max(peakPerHost, activeByHost.get(entry.host));
+    await new Promise((resolve) => setTimeout(resolve, 10));
+    activeByHost.set(entry.host, activeByHost.get(entry.host) - 1);
+    active -= 1;
+    entry.done = true;
+  }, {
+    concurrency: 3,
+    maxPerHost: 2,
+    getHost: (entry) => entry.host
+  });
+
+  assert.strictEqual(entries.every((entry) => entry.done), true, 'Pool should run every entry.');
+  assert.strictEqual(peak, 3, 'Pool should fill all concurrency slots.');
+  assert.strictEqual(peakPerHost, 2, 'Pool should never exceed the per-host in-flight limit.');
+  assert.deepStrictEqual(started.slice(0, 3), ['a1', 'a2', 'b1'], 'Saturated hosts should be skipped, not reorder the rest.');
+
+  const budgeted = [{ id: 'x' }, { id: 'y' }];
+  let calls = 0;
+  await context.runWatchlistFlushPool(budgeted, async () => {
+    calls += 1;
+  }, {
+    concurrency: 2,
+    shouldStart: (entry) => entry.id === 'x'
+  });
+  assert.strictEqual(calls, 1);
+  assert.strictEqual(budgeted[1].budgetSkipped, true, 'Entries not started within budget should be flagged.');
+}
+
+async function testSendAndVerifyPoolsShareOneBudget() {
+  const context = createContext(async () => {
+    throw new Error('fetch not expected');
+  });
+  context.WATCHLIST_DISPATCH.verifyBatchEnabled = false;
+  let active = 0;
+  let peak = 0;
+  const track = async (label, calls) => {
+    calls.push(label);
+    active += 1;
+    peak = Math.max(peak, active);
+    await new Promise((resolve) => setTimeout(resolve, 10));
+    active -= 1;
+  };
+  const verifyCalls = [];
+  context.verifyWatchlistDispatchDelivery = async (item) => {
+    await track(item.payload.responseId, verifyCalls);
+    return { success: true, pending: false, state: 'verified', reason: 'verified' };
+  };
+  const sendCalls = [];
+  const host = context.resolveWatchlistFlushHostKey('https://iskierka-watchlist.duckdns.org/api/v1/intake/economist-response');
+  const budget = context.createWatchlistFlushBudget({
+    concurrency: context.WATCHLIST_DISPATCH.flushConcurrency,
+    maxPerHost: context.WATCHLIST_DISPATCH.flushMaxInFlightPerHost
+  });
+  const verifyEntries = [makeEntry('resp-1'), makeEntry('resp-2'), makeEntry('resp-3')];
+
+  await Promise.all([
+    context.runWatchlistFlushPool(['send-1', 'send-2', 'send-3'], (id) => track(id, sendCalls), {
+      budget,
+      getHost: () => host
+    }),
+    context.verifyWatchlistOutboxEntries(verifyEntries, { budget })
+  ]);
+
+  assert.strictEqual(sendCalls.length, 3, 'Send pool should run every entry.');
+  assert.strictEqual(verifyCalls.length, 3, 'Verify pool should run every entry.');
+  assert.strictEqual(peak, 2, 'Send and verify together should stay within flushMaxInFlightPerHost for one host.');
+  assert.strictEqual(budget.active, 0);
+  assert.strictEqual(budget.pumps.size, 0, 'Finished pools should detach from the shared budget.');
+}
+
+async function testPendingItemsVerifiedInOneBatchCall() {
+  const requests = [];
+  const context = createContext(async (url, init) => {
+    const body = JSON.parse(init.body);
+    requests.push(body);
+    return {
+      ok: true,
+      status: 200,
+      headers: { get: () => 'req-batch' },
+      json: async () => ({
+        success: true,
+        results: body.items.map((item) => (
+          item.responseId === 'resp-2'
+            ? { response_id: item.responseId, success: false, state: 'materialization_pending' }
+            : { response_id: item.responseId, success: true, state: 'verified', event_id: 42 }
+        ))
+      })
+    };
+  });
+  const entries = [makeEntry('resp-1'), makeEntry('resp-2'), makeEntry('resp-3')];
+
+  await context.verifyWatchlistOutboxEntries(entries);
+
+  assert.strictEqual(requests.length, 1, 'Three pending items should share one verify request.');
+  assert.deepStrictEqual(requests[0].items.map((item) => item.responseId), ['resp-1', 'resp-2', 'resp-3']);
+  assert.strictEqual(entries[0].verifyResult.success, true);
+  assert.strictEqual(entries[0].verifyResult.requestId, 'req-batch');
+  assert.strictEqual(entries[1].verifyResult.pending, true);
+  assert.strictEqual(entries[1].verifyResult.state, 'materialization_pending');
+  assert.strictEqual(entries[2].verifyResult.success, true);
+  assert.strictEqual(context.processUpdates.length, 2, 'Verified batch items should confirm process dispatch state.');
+  assert.strictEqual(context.singleVerifyCalls.length, 0);
+}
+
+async function testBatchFallsBackToPerItemVerify() {
+  let fetchCalls = 0;
+  const context = createContext(async () => {
+    fetchCalls += 1;
+    return {
+      ok: false,
+      status: 422,
+      headers: { get: () => '' },
+      text: async () => 'responseId required'
+    };
+  });
+  const entries = [
+    makeEntry('resp-1'),
+    makeEntry('resp-2'),
+    {
+      ...makeEntry('plog-1'),
+      item: {
+        ...makeEntry('plog-1').item,
+        payload: { schema: 'iskra.problem_log.v1', responseId: 'plog-1' }
+      }
+    }
+  ];
+
+  await context.verifyWatchlistOutboxEntries(entries);
+
+  assert.strictEqual(fetchCalls, 1, 'Unsupported batch endpoint should be probed once.');
+  assert.deepStrictEqual(context.singleVerifyCalls.slice().sort(), ['plog-1', 'resp-1', 'resp-2']);
+  assert.ok(context.watchlistVerifyBatchUnsupportedUntil > Date.now(), 'Batch verify should back off after rejection.');
+  assert.strictEqual(entries.every((entry) => entry.verifyResult?.success === true), true);
+
+  await context.verifyWatchlistOutboxEntries([makeEntry('resp-4'), makeEntry('resp-5')]);
+  assert.strictEqual(fetchCalls, 1, 'Batch verify should stay disabled during the back-off window.');
+}
+
+async function testTransientBatchFailureKeepsBatchVerifyEnabled() {
+  let fetchCalls = 0;
+  const context = createContext(async () => {
+    fetchCalls += 1;
+    return {
+      ok: false,
+      status: 503,
+      headers: { get: () => '' },
+      text: async () => 'upstream unavailable'
+    };
+  });
+  const entries = [makeEntry('resp-1'), makeEntry('resp-2')];
+
+  await context.verifyWatchlistOutboxEntries(entries);
+
+  assert.strictEqual(fetchCalls, 1);
+  assert.strictEqual(context.watchlistVerifyBatchUnsupportedUntil, 0, 'A 503 must not disable batch verify.');
+  assert.strictEqual(context.singleVerifyCalls.length, 0, 'A failing server should not get a per-item verify burst.');
+  entries.forEach((entry) => {
+    assert.strictEqual(entry.verifyResult.success, false);
+    assert.strictEqual(entry.verifyResult.pending, true, 'Items should retry on their verify backoff.');
+    assert.strictEqual(entry.verifyResult.status, 503);
+    assert.strictEqual(entry.verifyResult.eventId, entry.item.deliveryEventId);
+  });
+
+  context.fetch = async () => {
+    fetchCalls += 1;
+    const error = new Error('dispatch_timeout_after_12000ms');
+    error.name = 'TimeoutError';
+    throw error;
+  };
+  const timedOut = [makeEntry('resp-3'), makeEntry('resp-4')];
+  await context.verifyWatchlistOutboxEntries(timedOut);
+  assert.strictEqual(fetchCalls, 2, 'Batch verify should still be used on the next flush.');
+  assert.strictEqual(context.watchlistVerifyBatchUnsupportedUntil, 0, 'A timeout must not disable batch verify.');
+  assert.strictEqual(context.singleVerifyCalls.length, 0);
+  assert.strictEqual(timedOut.every((entry) => entry.verifyResult.reason === 'timeout'), true);
+}
+
+async function testBatchWithoutResultsDisablesBatchVerify() {
+  const context = createContext(async () => ({
+    ok: true,
+    status: 200,
+    headers: { get: () => '' },
+    json: async () => ({ success: true })
+  }));
+  const entries = [makeEntry('resp-1'), makeEntry('resp-2')];
+
+  await context.verifyWatchlistOutboxEntries(entries);
+
+  assert.ok(context.watchlistVerifyBatchUnsupportedUntil > Date.now(), 'A response without results means the endpoint has no batch support.');
+  assert.deepStrictEqual(context.singleVerifyCalls.slice().sort(), ['resp-1', 'resp-2']);
+}
+
+async function main() {
+  await testPoolRespectsConcurrencyAndHostLimits();
+  await testSendAndVerifyPoolsShareOneBudget();
+  await testPendingItemsVerifiedInOneBatchCall();
+  await testBatchFallsBackToPerItemVerify();
+  await testTransientBatchFailureKeepsBatchVerifyEnabled();
+  await testBatchWithoutResultsDisablesBatchVerify();
+
+  console.log('watchlist concurrent flush test: ok');
+}
+
+main().catch((error) => {
+  console.error(error?.stack || error?.message || String(error));
+  process.exitCode = 1;
+});
@@ -268,6 +268,9 @@ function loadVerifyHelpers(context) {
     'normalizeWatchlistVerifyState',
     'isWatchlistVerificationPendingState',
     'isWatchlistVerificationTerminalState',
+    'isWatchlistProblemLogPayload',
+    'postSignedWatchlistVerifyRequest',
+    'settleWatchlistVerifyPayload',
     'verifyWatchlistDispatchDelivery'
   ].forEach((functionName) => {
     vm.runInContext(extractFunctionSource(backgroundSource, functionName), context, {